@@ -13,6 +13,7 @@ from rest_framework.reverse import reverse
 import credentials.apps.catalog.api
 from credentials.apps.api.accreditors import Accreditor
 from credentials.apps.catalog.models import CourseRun
+from credentials.apps.core.utils import update_or_create_if_changed
 from credentials.apps.credentials.constants import UserCredentialStatus
 from credentials.apps.credentials.models import (
     CourseCertificate,
@@ -281,10 +282,17 @@ class UserGradeSerializer(serializers.ModelSerializer):
 
         # Support updating or creating when posting to a grade endpoint, since clients don't necessarily know the
         # resource ID to use and we don't need to make them care.
-        grade, _ = UserGrade.objects.update_or_create(
+        # Grades are only written when they change, and older grades (by the LMS update time) don't overwrite newer
+        # ones.
+        lms_last_updated_at = validated_data.get("lms_last_updated_at")
+        grade, _ = update_or_create_if_changed(
+            UserGrade,
+            validated_data,
+            is_stale=lambda stored: bool(
+                lms_last_updated_at and stored.lms_last_updated_at and lms_last_updated_at < stored.lms_last_updated_at
+            ),
             username=username,
             course_run=course_run,
-            defaults=validated_data,
         )
 
         logger.info(
@@ -296,6 +304,34 @@ class UserGradeSerializer(serializers.ModelSerializer):
         return grade
 
 
+class BulkUserGradeSerializer(serializers.ModelSerializer):
+    """
+    Serializer for the items of bulk grade requests. Course runs are kept as keys, to be resolved for the whole batch.
+    """
+
+    course_run = serializers.CharField()
+
+    class Meta:
+        model = UserGrade
+        fields = (
+            "username",
+            "course_run",
+            "letter_grade",
+            "percent_grade",
+            "verified",
+            "lms_last_updated_at",
+        )
+        # grades are upserted, see `UserGradeSerializer`
+        validators = []
+
+    def to_internal_value(self, data):
+        # The LMS sometimes gives us None for the letter grade, see `UserGradeSerializer.is_valid`.
+        if isinstance(data, dict) and data.get("letter_grade", "") is None:
+            data = {**data, "letter_grade": ""}
+
+        return super().to_internal_value(data)
+
+
 class CourseCertificateSerializer(serializers.ModelSerializer):
     course_run = CourseRunField(read_only=True)
 
@@ -1,11 +1,14 @@
+import datetime
 import json
 from decimal import Decimal
 from unittest import mock
 
 import ddt
+from django.contrib.auth import get_user_model
 from django.contrib.auth.models import Permission
 from django.core.exceptions import ObjectDoesNotExist
-from django.test import TestCase
+from django.core.management import call_command
+from django.test import TestCase, override_settings
 from django.urls import reverse
 from django.utils import timezone
 from rest_framework.renderers import JSONRenderer
@@ -21,6 +24,7 @@ from credentials.apps.api.v2.serializers import (
 )
 from credentials.apps.api.v2.views import CredentialRateThrottle
 from credentials.apps.catalog.tests.factories import CourseFactory, CourseRunFactory, ProgramFactory
+from credentials.apps.core.models import UsernameReplacementJob
 from credentials.apps.core.tests.factories import USER_PASSWORD, UserFactory
 from credentials.apps.core.tests.mixins import SiteMixin
 from credentials.apps.credentials.models import UserCredential
@@ -36,6 +40,7 @@ from credentials.apps.records.tests.factories import UserGradeFactory
 JSON_CONTENT_TYPE = "application/json"
 LOGGER_NAME = "credentials.apps.credentials.issuers"
 LOGGER_NAME_SERIALIZER = "credentials.apps.api.v2.serializers"
+User = get_user_model()
 
 
 @ddt.ddt
@@ -534,6 +539,56 @@ class GradeViewSetTests(SiteMixin, APITestCase):
         self.assertEqual(grade.letter_grade, "B")
         self.assertDictEqual(response.data, self.serialize_user_grade(grade))
 
+    def test_bulk(self):
+        bulk_path = reverse("api:v2:grades-bulk")
+        grade = UserGradeFactory(course_run=self.course_run, username=self.user.username, letter_grade="C")
+        data = [
+            {**self.data, "username": self.user.username, "letter_grade": None},
+            self.data,
+            {**self.data, "course_run": "course-v1:unknown+run"},
+            {**self.data, "percent_grade": "not-a-grade"},
+        ]
+
+        # Verify users without the add permission are denied access
+        self.assert_access_denied(self.user, "post", bulk_path, data=data)
+
+        self.authenticate_user(self.user)
+        self.add_user_permission(self.user, "add_usergrade")
+        response = self.client.post(bulk_path, data=json.dumps(data), content_type=JSON_CONTENT_TYPE)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(
+            [(result["username"], result["status"]) for result in response.data],
+            [
+                (self.user.username, "updated"),
+                ("test_user", "created"),
+                ("test_user", "failed"),
+                ("test_user", "failed"),
+            ],
+        )
+        self.assertEqual(
+            response.data[2]["errors"], {"course_run": ["No CourseRun exists for key [course-v1:unknown+run]"]}
+        )
+        self.assertIn("percent_grade", response.data[3]["errors"])
+        grade.refresh_from_db()
+        self.assertEqual(grade.letter_grade, "")
+        self.assertEqual(UserGrade.objects.get(username="test_user").percent_grade, Decimal("0.9"))
+
+    def test_bulk_invalid_request(self):
+        bulk_path = reverse("api:v2:grades-bulk")
+        self.authenticate_user(self.user)
+        self.add_user_permission(self.user, "add_usergrade")
+
+        response = self.client.post(bulk_path, data=json.dumps(self.data), content_type=JSON_CONTENT_TYPE)
+        self.assertEqual(response.status_code, 400)
+
+        with mock.patch("credentials.apps.api.v2.views.GradeViewSet.bulk_max_size", 1):
+            response = self.client.post(
+                bulk_path, data=json.dumps([self.data, self.data]), content_type=JSON_CONTENT_TYPE
+            )
+        self.assertEqual(response.status_code, 400)
+        self.assertFalse(UserGrade.objects.exists())
+
     @ddt.data(True, False)
     def test_create_with_logging_decorator_enabled(self, decorator_enabled):
         """
@@ -604,6 +659,23 @@ class GradeViewSetTests(SiteMixin, APITestCase):
         grade.refresh_from_db()
         self.assertEqual(grade.lms_last_updated_at, last_updated_at)
 
+    def test_create_with_stale_grade(self):
+        """Verify that grades updated in the LMS before the stored ones don't overwrite them."""
+        last_updated_at = timezone.now()
+        grade = UserGradeFactory(course_run=self.course_run, letter_grade="B", lms_last_updated_at=last_updated_at)
+        self.authenticate_user(self.user)
+        self.add_user_permission(self.user, "add_usergrade")
+
+        data = self.serialize_user_grade(grade)
+        data["letter_grade"] = "C"
+        data["lms_last_updated_at"] = last_updated_at - datetime.timedelta(minutes=1)
+        response = self.client.post(self.list_path, data=JSONRenderer().render(data), content_type=JSON_CONTENT_TYPE)
+
+        self.assertEqual(response.status_code, 201)
+        grade.refresh_from_db()
+        self.assertEqual(grade.letter_grade, "B")
+        self.assertDictEqual(response.data, self.serialize_user_grade(grade))
+
 
 @ddt.ddt
 class ThrottlingTests(TestCase):
@@ -705,3 +777,39 @@ class UsernameReplacementViewTests(JwtMixin, APITestCase):
         self.assertEqual(user.full_name, "")
         self.assertEqual(user.first_name, "")
         self.assertEqual(user.last_name, "")
+
+    @override_settings(USERNAME_REPLACEMENT={"ASYNC_THRESHOLD": 2})
+    def test_large_request_is_processed_in_background(self):
+        """Verify large requests are replaced by a background job, which status is polled."""
+        users = UserFactory.create_batch(3)
+        username_mappings = [{user.username: user.username + "_new"} for user in users]
+
+        response = self.call_api(self.service_user, {"username_mappings": username_mappings})
+
+        self.assertEqual(response.status_code, 202)
+        self.assertFalse(User.objects.filter(username__endswith="_new").exists())
+        status_url = response.data["status_url"]
+        headers = self.build_jwt_headers(self.service_user)
+        response = self.client.get(status_url, **headers)
+        self.assertEqual(response.data["state"], UsernameReplacementJob.PENDING)
+
+        call_command("process_username_replacement_jobs")
+
+        response = self.client.get(status_url, **headers)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.data["state"], UsernameReplacementJob.COMPLETED)
+        self.assertEqual(response.data["successful_replacements"], username_mappings)
+        self.assertEqual(response.data["failed_replacements"], [])
+        self.assertEqual(response.data["replacement_counts"]["core.user"], 3)
+        self.assertEqual(User.objects.filter(username__endswith="_new").count(), 3)
+        # only the outcome is kept, the requested mappings are cleared
+        self.assertEqual(UsernameReplacementJob.objects.get().username_mappings, [])
+
+    def test_job_status_auth(self):
+        """Verify the job status endpoint only works with the service worker"""
+        job = UsernameReplacementJob.objects.create(username_mappings=[])
+        url = reverse("api:v2:replace_usernames_status", kwargs={"job_id": job.uuid})
+
+        self.assertEqual(self.client.get(url).status_code, 401)
+        self.assertEqual(self.client.get(url, **self.build_jwt_headers(UserFactory())).status_code, 403)
+        self.assertEqual(self.client.get(url, **self.build_jwt_headers(self.service_user)).status_code, 200)
@@ -8,7 +8,14 @@ from credentials.apps.api.v2 import views
 # endpoints, per:
 # https://openedx.atlassian.net/wiki/spaces/AC/pages/18350757/edX+REST+API+Conventions
 
-urlpatterns = [path("replace_usernames/", views.UsernameReplacementView.as_view(), name="replace_usernames")]
+urlpatterns = [
+    path("replace_usernames/", views.UsernameReplacementView.as_view(), name="replace_usernames"),
+    path(
+        "replace_usernames/<uuid:job_id>/",
+        views.UsernameReplacementStatusView.as_view(),
+        name="replace_usernames_status",
+    ),
+]
 
 router = DefaultRouter()
 # URLs can not have hyphen as it is not currently supported by slumber
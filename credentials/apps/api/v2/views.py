@@ -1,11 +1,12 @@
 import logging
 
-from django.apps import apps
-from django.db import transaction
 from django.db.models import Q
+from django.shortcuts import get_object_or_404
+from django.urls import reverse
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
 from rest_framework import mixins, permissions, status, viewsets
-from rest_framework.exceptions import Throttled
+from rest_framework.decorators import action
+from rest_framework.exceptions import Throttled, ValidationError
 from rest_framework.response import Response
 from rest_framework.throttling import ScopedRateThrottle
 from rest_framework.views import APIView, exception_handler
@@ -14,12 +15,18 @@ from credentials.apps.api.v2.decorators import log_incoming_request
 from credentials.apps.api.v2.filters import UserCredentialFilter
 from credentials.apps.api.v2.permissions import CanReplaceUsername, UserCredentialPermissions
 from credentials.apps.api.v2.serializers import (
+    BulkUserGradeSerializer,
     CourseCertificateSerializer,
     UserCredentialCreationSerializer,
     UserCredentialSerializer,
     UserGradeSerializer,
 )
+from credentials.apps.core.db_routing import read_replica
+from credentials.apps.core.models import UsernameReplacementJob
+from credentials.apps.core.query_budget import query_budget
+from credentials.apps.core.username_replacement import get_username_replacement_config, replace_usernames
 from credentials.apps.credentials.models import CourseCertificate, UserCredential
+from credentials.apps.records.grades import GradeUpsertStatus, upsert_user_grades
 from credentials.apps.records.models import UserGrade
 
 log = logging.getLogger(__name__)
@@ -64,6 +71,9 @@ class CredentialRateThrottle(ScopedRateThrottle):
         return super().allow_request(request, view)
 
 
+# the service clients read the credentials they have just written
+@read_replica(token_clients=False)
+@query_budget(60)
 class CredentialViewSet(viewsets.ModelViewSet):
     filterset_class = UserCredentialFilter
     lookup_field = "uuid"
@@ -139,12 +149,14 @@ class CredentialViewSet(viewsets.ModelViewSet):
 
 
 # A write-only endpoint for now
+@query_budget(25)
 class GradeViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets.GenericViewSet):
     permission_classes = (UserCredentialPermissions,)
     serializer_class = UserGradeSerializer
     throttle_classes = (CredentialRateThrottle,)
     throttle_scope = "grade_view"
     queryset = UserGrade.objects.all()
+    bulk_max_size = 1000
 
     @log_incoming_request
     def create(self, request, *args, **kwargs):
@@ -161,6 +173,52 @@ class GradeViewSet(mixins.CreateModelMixin, mixins.UpdateModelMixin, viewsets.Ge
         """Update a grade."""
         return super().update(request, *args, **kwargs)
 
+    @action(detail=False, methods=["post"], url_path="bulk", serializer_class=BulkUserGradeSerializer)
+    def bulk(self, request, *args, **kwargs):
+        """
+        Create or update a batch of grades.
+
+        POST: /api/v2/grades/bulk/
+
+        The request body is a list of grades (the fields of the grade endpoint). Grades which aren't newer than the
+        stored ones (by `lms_last_updated_at`) are skipped.
+
+        Returns:
+            response(list): a result per grade, in the order of the request:
+                [{"username": "edx", "course_run": "course-v1:edX+DemoX+Demo_Course", "status": "updated"}, ...]
+                the status is one of "created", "updated", "skipped" or "failed" (with "errors").
+        """
+        if not isinstance(request.data, list):
+            raise ValidationError({"non_field_errors": ["Expected a list of grades."]})
+        if len(request.data) > self.bulk_max_size:
+            raise ValidationError({"non_field_errors": [f"At most {self.bulk_max_size} grades can be sent at once."]})
+
+        results = [None] * len(request.data)
+        valid_indices, valid_grades = [], []
+        for index, item in enumerate(request.data):
+            serializer = self.get_serializer(data=item)
+            if serializer.is_valid():
+                valid_indices.append(index)
+                valid_grades.append(serializer.validated_data)
+            else:
+                results[index] = {"status": GradeUpsertStatus.FAILED, "errors": serializer.errors}
+
+        for index, (grade_status, error) in zip(valid_indices, upsert_user_grades(request.site, valid_grades)):
+            results[index] = {"status": grade_status}
+            if error:
+                results[index]["errors"] = {"course_run": [error]}
+
+        return Response(
+            [
+                (
+                    {"username": item.get("username"), "course_run": item.get("course_run"), **result}
+                    if isinstance(item, dict)
+                    else result
+                )
+                for item, result in zip(request.data, results)
+            ]
+        )
+
 
 class UsernameReplacementView(APIView):
     """
@@ -204,46 +262,40 @@ class UsernameReplacementView(APIView):
                 {"old_username_2": "new_username_2"}
             ]
         }
+
+        Requests with more mappings than the `USERNAME_REPLACEMENT["ASYNC_THRESHOLD"]` setting are processed in
+        background: the request returns a 202 with the job ID and the URL to poll its status from.
+
+        {
+            "job_id": "<uuid>",
+            "status_url": "/api/v2/replace_usernames/<uuid>/"
+        }
         """
-        # (model_name, column_name)
-        MODELS_WITH_USERNAME = (
-            ("core.user", "username"),
-            ("credentials.usercredential", "username"),
-            ("records.usergrade", "username"),
-        )
         username_mappings = request.data.get("username_mappings")
 
-        replacement_locations = self._load_models(MODELS_WITH_USERNAME)
-
         if not self._has_valid_schema(username_mappings):
             return Response(status=status.HTTP_400_BAD_REQUEST)
 
-        successful_replacements, failed_replacements = [], []
-
-        for username_pair in username_mappings:
-            current_username = list(username_pair.keys())[0]
-            new_username = list(username_pair.values())[0]
-            successfully_replaced = self._replace_username_for_all_models(
-                current_username, new_username, replacement_locations
+        # large requests are processed in background, their outcome is polled from the job status endpoint
+        if len(username_mappings) > get_username_replacement_config()["ASYNC_THRESHOLD"]:
+            job = UsernameReplacementJob.objects.create(username_mappings=username_mappings)
+            return Response(
+                status=status.HTTP_202_ACCEPTED,
+                data={
+                    "job_id": str(job.uuid),
+                    "status_url": reverse("api:v2:replace_usernames_status", kwargs={"job_id": job.uuid}),
+                },
             )
-            if successfully_replaced:
-                successful_replacements.append({current_username: new_username})
-            else:
-                failed_replacements.append({current_username: new_username})
+
+        result = replace_usernames(username_mappings)
         return Response(
             status=status.HTTP_200_OK,
-            data={"successful_replacements": successful_replacements, "failed_replacements": failed_replacements},
+            data={
+                "successful_replacements": result["successful_replacements"],
+                "failed_replacements": result["failed_replacements"],
+            },
         )
 
-    def _load_models(self, models_with_fields):
-        """Takes tuples that contain a model path and returns the list with a loaded version of the model"""
-        try:
-            replacement_locations = [(apps.get_model(model), column) for (model, column) in models_with_fields]
-        except LookupError:
-            log.exception("Unable to load models for username replacement")
-            raise
-        return replacement_locations
-
     def _has_valid_schema(self, post_data):
         """Verifies the data is a list of objects with a single key:value pair"""
         if not isinstance(post_data, list):
@@ -253,46 +305,31 @@ class UsernameReplacementView(APIView):
                 return False
         return True
 
-    def _replace_username_for_all_models(self, current_username, new_username, replacement_locations):
-        """
-        Replaces current_username with new_username for all (model, column) pairs in replacement locations.
-        Returns if it was successful or not. Usernames that don't exist in this service will be treated as
-        a success because no work needs to be done changing their username.
-        """
-        try:
-            with transaction.atomic():
-                num_rows_changed = 0
-                for model, column in replacement_locations:
-                    update_kwargs = {column: new_username}
-                    # Clear PII fields for user retirement to match LMS retirement pattern
-                    if model._meta.label_lower == "core.user" and column == "username":
-                        update_kwargs["full_name"] = ""
-                        update_kwargs["first_name"] = ""
-                        update_kwargs["last_name"] = ""
-                    num_rows_changed += model.objects.filter(**{column: current_username}).update(**update_kwargs)
-        except Exception as exc:
-            log.exception(
-                "Unable to change username from %s to %s. Failed on table %s because %s",
-                current_username,
-                new_username,
-                model.__class__.__name__,
-                exc,
-            )
-            return False
-        if num_rows_changed == 0:
-            log.info(
-                "Unable to change username from %s to %s because %s doesn't exist.",
-                current_username,
-                new_username,
-                current_username,
-            )
-        else:
-            log.info(
-                "Successfully changed username from %s to %s.",
-                current_username,
-                new_username,
-            )
-        return True
+
+class UsernameReplacementStatusView(APIView):
+    """
+    Returns the status of a username replacement job (see `UsernameReplacementView`).
+
+    **GET Response Values**
+
+        {
+            "job_id": "<uuid>",
+            "state": "pending" | "running" | "completed" | "failed",
+            "successful_replacements": [{"old_username_1": "new_username_1"}],
+            "failed_replacements": [{"old_username_2": "new_username_2"}],
+            "replacement_counts": {"core.user": 1, "credentials.usercredential": 2, ...}
+        }
+
+    Replacements and counts are returned once the job is completed, processed jobs are deleted after the retention
+    period (USERNAME_REPLACEMENT setting).
+    """
+
+    authentication_classes = (JwtAuthentication,)
+    permission_classes = (permissions.IsAuthenticated, CanReplaceUsername)
+
+    def get(self, request, job_id):
+        job = get_object_or_404(UsernameReplacementJob, uuid=job_id)
+        return Response(data={"job_id": str(job.uuid), "state": job.state, **job.result})
 
 
 class CourseCertificateViewSet(
@@ -1,4 +1,5 @@
 import logging
+from functools import partial
 
 from attrs import asdict
 from django.conf import settings
@@ -9,6 +10,7 @@ from credentials.apps.badges.accredible.exceptions import AccredibleError
 from credentials.apps.badges.accredible.utils import get_accredible_api_base_url
 from credentials.apps.badges.base_api_client import BaseBadgeProviderClient
 from credentials.apps.badges.models import AccredibleAPIConfig, AccredibleGroup
+from credentials.apps.badges.sync import BadgeTemplatesDiff, run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -42,6 +44,9 @@ class AccredibleAPIClient(BaseBadgeProviderClient):
         except AccredibleAPIConfig.DoesNotExist:
             raise AccredibleError(f"AccredibleAPIConfig with the id {self.api_config_id} does not exist!")
 
+    def _get_account_id(self):
+        return self.api_config_id
+
     def _get_base_api_url(self) -> str:
         return get_accredible_api_base_url(settings)
 
@@ -87,12 +92,16 @@ class AccredibleAPIClient(BaseBadgeProviderClient):
         """
         return self.perform_request("patch", f"credentials/{badge_id}", asdict(data))
 
-    def sync_groups(self, site_id: int) -> int:
+    def sync_groups(self, site_id: int, groups_data: dict = None) -> int:
         """
         Pull all groups for a given Accredible API config.
 
+        Only new and changed groups are written (their design images are fetched concurrently),
+        groups which are not present anymore are deleted.
+
         Args:
             site_id (int): ID of the site.
+            groups_data (dict): optional pre-fetched groups (see `fetch_all_groups`).
 
         Returns:
             int: Number of groups synchronized
@@ -103,24 +112,42 @@ class AccredibleAPIClient(BaseBadgeProviderClient):
             logger.error(f"Site with the id {site_id} does not exist!")
             raise
 
-        groups_data = self.fetch_all_groups()
+        if groups_data is None:
+            groups_data = self.fetch_all_groups()
         raw_groups = groups_data.get("groups", [])
 
-        all_group_ids = [group.get("id") for group in raw_groups]
-        AccredibleGroup.objects.exclude(id__in=all_group_ids).delete()
-
-        for raw_group in raw_groups:
-            AccredibleGroup.objects.update_or_create(
-                id=raw_group.get("id"),
-                api_config=self.api_config,
-                defaults={
-                    "site": site,
-                    "name": raw_group.get("course_name"),
-                    "description": raw_group.get("course_description"),
-                    "icon": self.fetch_design_image(raw_group.get("primary_design_id")),
-                    "created": raw_group.get("created_at"),
-                    "state": AccredibleGroup.STATES.active,
-                },
-            )
+        diff = BadgeTemplatesDiff(
+            AccredibleGroup.objects.filter(api_config=self.api_config),
+            "id",
+            {raw_group.get("id"): raw_group for raw_group in raw_groups},
+        )
+
+        design_images = {}
+        for group_id, (image_url, error) in run_concurrently(
+            {
+                group_id: partial(self.fetch_design_image, diff.raw_items[group_id].get("primary_design_id"))
+                for group_id in [*diff.created, *diff.changed]
+            }
+        ).items():
+            if error:
+                raise error
+            design_images[group_id] = image_url
+
+        def build_fields(group_id):
+            raw_group = diff.raw_items[group_id]
+            return {
+                "site": site,
+                "name": raw_group.get("course_name"),
+                "description": raw_group.get("course_description"),
+                "icon": design_images[group_id],
+                "created": raw_group.get("created_at"),
+                "state": AccredibleGroup.STATES.active,
+            }
+
+        diff.apply(
+            build_fields,
+            create_fields={"api_config": self.api_config},
+            on_missing=lambda queryset: queryset.delete(),
+        )
 
         return len(raw_groups)
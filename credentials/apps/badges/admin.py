@@ -5,6 +5,8 @@ Admin section configuration.
 from django.contrib import admin, messages
 from django.contrib.sites.shortcuts import get_current_site
 from django.core.management import call_command
+from django.db.models import Count, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
 from django.http import HttpResponseRedirect
 from django.urls import reverse
 from django.utils.html import format_html
@@ -37,6 +39,7 @@ from credentials.apps.badges.models import (
     PenaltyDataRule,
 )
 from credentials.apps.badges.toggles import is_badges_enabled
+from credentials.apps.core.admin import ScalableChangeListAdminMixin
 
 ADMIN_CHANGE_VIEW_REVERSE_NAMES = {
     CredlyBadgeTemplate.ORIGIN: "admin:badges_credlybadgetemplate_change",
@@ -474,7 +477,18 @@ class BadgePenaltyAdmin(admin.ModelAdmin):
         return super().response_change(request, obj)
 
 
-class BadgeProgressAdmin(admin.ModelAdmin):
+def _count_groups(requirements):
+    """
+    Subquery counting the groups of the requirements (requirements without a group make up one group).
+    """
+    return Subquery(
+        requirements.values("template")
+        .annotate(count=Count(Coalesce("blend", Value("")), distinct=True))
+        .values("count")
+    )
+
+
+class BadgeProgressAdmin(ScalableChangeListAdminMixin, admin.ModelAdmin):
     """
     Badge template progress admin setup.
     """
@@ -499,27 +513,42 @@ class BadgeProgressAdmin(admin.ModelAdmin):
         "complete",
         "ratio",
     )
+    search_fields = ("^username",)
+
+    def get_queryset(self, request):
+        """
+        Precomputes the groups counts of the progress ratio (see `BadgeProgress.ratio`) for all listed records.
+        """
+        requirements = BadgeRequirement.objects.filter(template=OuterRef("template"))
+        return (
+            super()
+            .get_queryset(request)
+            .annotate(
+                groups_count=_count_groups(requirements),
+                fulfilled_groups_count=_count_groups(requirements.filter(fulfillments__progress=OuterRef("pk"))),
+            )
+        )
 
     @admin.display(boolean=True)
     def complete(self, obj):
         """
         Identifies if all requirements are already fulfilled.
-
-        NOTE: (performance) dynamic evaluation.
         """
-        return obj.completed
+        return self.ratio(obj) == 1.00
 
     def ratio(self, obj):
         """
         Displays progress value.
         """
-        return obj.ratio
+        if not obj.groups_count:
+            return 0.00
+        return round((obj.fulfilled_groups_count or 0) / obj.groups_count, 2)
 
     def has_add_permission(self, request):
         return False
 
 
-class CredlyBadgeAdmin(admin.ModelAdmin):
+class CredlyBadgeAdmin(ScalableChangeListAdminMixin, admin.ModelAdmin):
     """
     Credly badge admin setup.
     """
@@ -537,8 +566,8 @@ class CredlyBadgeAdmin(admin.ModelAdmin):
         "state",
     )
     search_fields = (
-        "username",
-        "external_uuid",
+        "^username",
+        "=external_uuid",
     )
     readonly_fields = (
         "credential_id",
@@ -549,6 +578,9 @@ class CredlyBadgeAdmin(admin.ModelAdmin):
         "external_uuid",
     )
 
+    def get_queryset(self, request):
+        return super().get_queryset(request).prefetch_related("credential")
+
     def has_add_permission(self, request):
         return False
 
@@ -1,14 +1,77 @@
 import logging
+import threading
+import time
 from abc import ABC, abstractmethod
 from urllib.parse import urljoin
 
 import requests
+from django.conf import settings
+from edx_django_utils.monitoring import accumulate, increment
+from requests.adapters import HTTPAdapter
 from requests.exceptions import HTTPError
+from urllib3.util.retry import Retry
 
 from .exceptions import BadgeProviderError
 
 logger = logging.getLogger(__name__)
 
+DEFAULT_CLIENTS_CONFIG = {
+    "POOL_SIZE": 10,
+    "RETRIES": 3,
+    "BACKOFF_FACTOR": 0.5,
+}
+
+_sessions = {}
+_sessions_lock = threading.Lock()
+
+
+def get_clients_config():
+    """
+    Returns badge provider clients settings.
+    """
+
+    return {**DEFAULT_CLIENTS_CONFIG, **settings.BADGES_CONFIG.get("clients", {})}
+
+
+def get_session(provider_name, account_id=None):
+    """
+    Returns a shared (keep-alive, pooled) HTTP session for the badge provider account.
+
+    Idempotent requests are retried on connection errors and on the provider's throttling/server errors.
+    """
+
+    key = (provider_name, str(account_id))
+    with _sessions_lock:
+        session = _sessions.get(key)
+        if session is None:
+            config = get_clients_config()
+            adapter = HTTPAdapter(
+                pool_connections=config["POOL_SIZE"],
+                pool_maxsize=config["POOL_SIZE"],
+                max_retries=Retry(
+                    total=config["RETRIES"],
+                    backoff_factor=config["BACKOFF_FACTOR"],
+                    status_forcelist=(429, 500, 502, 503, 504),
+                    raise_on_status=False,
+                ),
+            )
+            session = requests.Session()
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            _sessions[key] = session
+    return session
+
+
+def close_session(provider_name, account_id=None):
+    """
+    Closes the shared HTTP session of the badge provider account (e.g. after its configuration change).
+    """
+
+    with _sessions_lock:
+        session = _sessions.pop((provider_name, str(account_id)), None)
+    if session is not None:
+        session.close()
+
 
 class BaseBadgeProviderClient(ABC):
     """
@@ -42,12 +105,38 @@ class BaseBadgeProviderClient(ABC):
         """
         url = urljoin(self.base_api_url, url_suffix)
         logger.debug(f"{self.PROVIDER_NAME} API: {method.upper()} {url}")
-        response = requests.request(
-            method.upper(), url, headers=self._get_headers(), json=data, timeout=self.REQUESTS_TIMEOUT
-        )
+        started_at = time.perf_counter()
+        try:
+            response = self.session.request(
+                method.upper(), url, headers=self._get_headers(), json=data, timeout=self.REQUESTS_TIMEOUT
+            )
+        finally:
+            self._record_request_time(time.perf_counter() - started_at)
         self._raise_for_error(response)
         return response.json()
 
+    @property
+    def session(self):
+        """
+        Shared HTTP session for the provider's account (see `_get_account_id`).
+        """
+        return get_session(self.PROVIDER_NAME, self._get_account_id())
+
+    def _get_account_id(self):
+        """
+        Returns the provider's account identifier HTTP sessions are shared by.
+        """
+        return None
+
+    def _record_request_time(self, duration):
+        """
+        Reports the provider request duration (seconds) to monitoring.
+        """
+        metric_prefix = f"badges_{self.PROVIDER_NAME.lower()}"
+        increment(f"{metric_prefix}_requests")
+        accumulate(f"{metric_prefix}_request_time", duration)
+        logger.debug(f"{self.PROVIDER_NAME} API: request took {duration:.3f}s")
+
     def _raise_for_error(self, response):
         """
         Raises a CredlyAPIError if the response status code indicates an error.
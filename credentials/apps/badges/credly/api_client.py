@@ -1,21 +1,37 @@
 import base64
 import logging
 import time
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from urllib.parse import urljoin
 
 import requests  # pylint: disable=unused-import
 from attrs import asdict
 from django.conf import settings
 from django.contrib.sites.models import Site
+from edx_django_utils.cache import RequestCache
 
-from credentials.apps.badges.base_api_client import BaseBadgeProviderClient
+from credentials.apps.badges.base_api_client import BaseBadgeProviderClient, close_session
 from credentials.apps.badges.credly.exceptions import CredlyError
 from credentials.apps.badges.credly.utils import get_credly_api_base_url
 from credentials.apps.badges.models import CredlyBadgeTemplate, CredlyOrganization
+from credentials.apps.badges.sync import BadgeTemplatesDiff
 
 logger = logging.getLogger(__name__)
 
+CREDENTIALS_CACHE_NAMESPACE = "badges.credly.credentials"
+
+
+def get_credentials_cache_key(organization_id):
+    return f"badges.credly.organization.{organization_id}.api_key"
+
+
+def clear_credentials_cache(organization_id):
+    """
+    Drops cached Credly Organization credentials and its shared HTTP session.
+    """
+    RequestCache(CREDENTIALS_CACHE_NAMESPACE).delete(get_credentials_cache_key(organization_id))
+    close_session(CredlyAPIClient.PROVIDER_NAME, organization_id)
+
 
 class CredlyAPIClient(BaseBadgeProviderClient):
     """
@@ -36,16 +52,23 @@ class CredlyAPIClient(BaseBadgeProviderClient):
             organization_id (str, uuid): ID of the organization.
             api_key (str): optional ID of the organization.
         """
+        self.organization_id = organization_id
+
         if api_key is None:
-            self.organization = self._get_organization(organization_id)
-            api_key = self.organization.api_key
+            api_key = self._get_api_key(organization_id)
 
         self.api_key = api_key
-        self.organization_id = organization_id
 
     def _get_base_api_url(self):
         return urljoin(get_credly_api_base_url(settings), f"organizations/{self.organization_id}/")
 
+    def _get_account_id(self):
+        return self.organization_id
+
+    @cached_property
+    def organization(self):
+        return self._get_organization(self.organization_id)
+
     def _get_organization(self, organization_id):
         """
         Check if Credly Organization with provided ID exists.
@@ -56,6 +79,23 @@ class CredlyAPIClient(BaseBadgeProviderClient):
         except CredlyOrganization.DoesNotExist:
             raise CredlyError(f"CredlyOrganization with the uuid {organization_id} does not exist!")
 
+    def _get_api_key(self, organization_id):
+        """
+        Returns Credly Organization API key (cached, see `clear_credentials_cache`).
+
+        The API key is a secret: it is only cached for the request (or the management command run), never in the
+        shared cache.
+        """
+        request_cache = RequestCache(CREDENTIALS_CACHE_NAMESPACE)
+        cache_key = get_credentials_cache_key(organization_id)
+        cached_response = request_cache.get_cached_response(cache_key)
+        if cached_response.is_found:
+            return cached_response.value
+
+        api_key = self.organization.api_key
+        request_cache.set(cache_key, api_key)
+        return api_key
+
     def _get_headers(self):
         """
         Returns the headers for making API requests to Credly.
@@ -85,10 +125,13 @@ class CredlyAPIClient(BaseBadgeProviderClient):
     def fetch_badge_templates(self):
         """
         Fetches the badge templates from the Credly API.
+
+        Transient network failures are retried for the failed page only, so pagination is resumed
+        from the page it stopped on.
         """
         results = []
         url = f"badge_templates/?filter=state::{CredlyBadgeTemplate.STATES.active}"
-        response = self.perform_request("get", url)
+        response = self._fetch_page(url)
         results.extend(response.get("data", []))
 
         metadata = response.get("metadata", {})
@@ -105,22 +148,21 @@ class CredlyAPIClient(BaseBadgeProviderClient):
 
             time.sleep(0.2)
 
-            for attempt in range(3):
-                try:
-                    response = self.perform_request("get", next_page_url)
-                    break
-                except (requests.Timeout, requests.ConnectionError) as exc:
-                    sleep_time = 0.5 * (2**attempt)
-                    time.sleep(sleep_time)
-
-                    if attempt == 2:
-                        raise CredlyError(f"Failed to fetch page due to network error: {exc}")
-
+            response = self._fetch_page(next_page_url)
             results.extend(response.get("data", []))
             next_page_url = response.get("metadata", {}).get("next_page_url")
 
         return {"data": results}
 
+    def _fetch_page(self, url):
+        """
+        Fetches a single listing page (network errors are retried by the shared HTTP session, see `get_session`).
+        """
+        try:
+            return self.perform_request("get", url)
+        except (requests.Timeout, requests.ConnectionError) as exc:
+            raise CredlyError(f"Failed to fetch page due to network error: {exc}")
+
     def fetch_event_information(self, event_id):
         """
         Fetches the event information from the Credly API.
@@ -149,12 +191,16 @@ class CredlyAPIClient(BaseBadgeProviderClient):
         """
         return self.perform_request("put", f"badges/{badge_id}/revoke/", data=data)
 
-    def sync_organization_badge_templates(self, site_id):
+    def sync_organization_badge_templates(self, site_id, badge_templates_data=None):
         """
         Pull active badge templates for a given Credly Organization.
 
+        Only new and changed badge templates are written, templates which are not active anymore
+        are archived and deactivated.
+
         Args:
             site_id (int): ID of the site.
+            badge_templates_data (dict): optional pre-fetched badge templates (see `fetch_badge_templates`).
 
         Returns:
             int | None: processed items.
@@ -165,20 +211,33 @@ class CredlyAPIClient(BaseBadgeProviderClient):
             logger.error(f"Site with the id {site_id} does not exist!")
             raise
 
-        badge_templates_data = self.fetch_badge_templates()
+        if badge_templates_data is None:
+            badge_templates_data = self.fetch_badge_templates()
         raw_badge_templates = badge_templates_data.get("data", [])
 
-        for raw_badge_template in raw_badge_templates:
-            CredlyBadgeTemplate.objects.update_or_create(
-                uuid=raw_badge_template.get("id"),
-                organization=self.organization,
-                defaults={
-                    "site": site,
-                    "name": raw_badge_template.get("name"),
-                    "state": raw_badge_template.get("state"),
-                    "description": raw_badge_template.get("description"),
-                    "icon": raw_badge_template.get("image_url"),
-                },
-            )
+        diff = BadgeTemplatesDiff(
+            CredlyBadgeTemplate.objects.filter(organization=self.organization),
+            "uuid",
+            {raw_badge_template.get("id"): raw_badge_template for raw_badge_template in raw_badge_templates},
+        )
+
+        def build_fields(template_id):
+            raw_badge_template = diff.raw_items[template_id]
+            return {
+                "site": site,
+                "name": raw_badge_template.get("name"),
+                "state": raw_badge_template.get("state"),
+                "description": raw_badge_template.get("description"),
+                "icon": raw_badge_template.get("image_url"),
+            }
+
+        diff.apply(
+            build_fields,
+            create_fields={"organization": self.organization},
+            # the content hash is cleared, so that the template is synchronized again if it reappears unchanged
+            on_missing=lambda queryset: queryset.update(
+                state=CredlyBadgeTemplate.STATES.archived, is_active=False, content_hash=""
+            ),
+        )
 
         return len(raw_badge_templates)
@@ -1,17 +1,32 @@
 import logging
+import uuid
+from datetime import timedelta
+from functools import partial
 
 from django.contrib.sites.shortcuts import get_current_site
+from django.db import transaction
+from django.db.models import Q
 from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.dateparse import parse_datetime
 from rest_framework import status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from ..models import CredlyBadgeTemplate, CredlyOrganization
+from ..models import CredlyBadgeTemplate, CredlyOrganization, CredlyWebhookEvent
+from ..sync import run_concurrently
 from .api_client import CredlyAPIClient
 
 logger = logging.getLogger(__name__)
 
 
+def get_badge_template_from_data(data):
+    """
+    Returns the badge template of the Credly event information.
+    """
+    return data.get("data", {}).get("badge_template", {})
+
+
 class CredlyWebhook(APIView):
     """
     Public API (webhook endpoint) to handle incoming Credly updates.
@@ -23,6 +38,12 @@ class CredlyWebhook(APIView):
     authentication_classes = []
     permission_classes = []
 
+    EVENT_HANDLERS = {
+        "badge_template.created": "handle_badge_template_created_event",
+        "badge_template.changed": "handle_badge_template_changed_event",
+        "badge_template.deleted": "handle_badge_template_deleted_event",
+    }
+
     def post(self, request):
         """
         Handle incoming update events from the Credly service.
@@ -35,41 +56,51 @@ class CredlyWebhook(APIView):
             - badge_template.deleted
 
         - tries to recognize Credly Organization context;
-        - validates event type and its payload;
-        - performs corresponding item (badge template) updates;
+        - validates event type and id;
+        - persists the event for background processing (see `process_webhook_events`);
+
+        Event details are never taken from the webhook payload: they are fetched from the Credly API
+        during processing, so only events known to Credly are applied.
 
         Returned statuses:
             - 204
+            - 400
             - 404
         """
-        credly_api_client = CredlyAPIClient(request.data.get("organization_id"))
-
-        event_info_response = credly_api_client.fetch_event_information(request.data.get("id"))
         event_type = request.data.get("event_type")
 
-        if event_type == "badge_template.created":
-            self.handle_badge_template_created_event(request, event_info_response)
-        elif event_type == "badge_template.changed":
-            self.handle_badge_template_changed_event(request, event_info_response)
-        elif event_type == "badge_template.deleted":
-            self.handle_badge_template_deleted_event(request, event_info_response)
-        else:
+        if event_type not in self.EVENT_HANDLERS:
             logger.error(f"Unknown event type: {event_type}")
+            return Response(status=status.HTTP_204_NO_CONTENT)
 
-        return Response(status=status.HTTP_204_NO_CONTENT)
+        try:
+            event_id = uuid.UUID(str(request.data.get("id")))
+        except ValueError:
+            logger.error(f"Invalid Credly webhook event id: {request.data.get('id')}")
+            return Response(status=status.HTTP_400_BAD_REQUEST)
 
-    @staticmethod
-    def _get_badge_template_from_data(data):
-        badge_template = data.get("data", {}).get("badge_template", {})
-        return badge_template
+        organization = get_object_or_404(CredlyOrganization, uuid=request.data.get("organization_id"))
+
+        # Credly retries deliveries, the same event is stored once
+        CredlyWebhookEvent.objects.get_or_create(
+            event_id=event_id,
+            defaults={
+                "organization": organization,
+                "site": get_current_site(request),
+                "event_type": event_type,
+                "occurred_at": parse_datetime(request.data.get("occurred_at") or ""),
+            },
+        )
+
+        return Response(status=status.HTTP_204_NO_CONTENT)
 
     @staticmethod
-    def handle_badge_template_created_event(request, data):
+    def handle_badge_template_created_event(site, data):
         """
         Create a new badge template.
         """
 
-        badge_template = CredlyWebhook._get_badge_template_from_data(data)
+        badge_template = get_badge_template_from_data(data)
         owner = badge_template.get("owner", {})
 
         organization = get_object_or_404(CredlyOrganization, uuid=owner.get("id"))
@@ -78,7 +109,7 @@ class CredlyWebhook(APIView):
             uuid=badge_template.get("id"),
             organization=organization,
             defaults={
-                "site": get_current_site(request),
+                "site": site,
                 "name": badge_template.get("name"),
                 "state": badge_template.get("state"),
                 "description": badge_template.get("description"),
@@ -87,12 +118,12 @@ class CredlyWebhook(APIView):
         )
 
     @staticmethod
-    def handle_badge_template_changed_event(request, data):
+    def handle_badge_template_changed_event(site, data):
         """
         Change the badge template.
         """
 
-        badge_template = CredlyWebhook._get_badge_template_from_data(data)
+        badge_template = get_badge_template_from_data(data)
         owner = badge_template.get("owner", {})
 
         organization = get_object_or_404(CredlyOrganization, uuid=owner.get("id"))
@@ -101,7 +132,7 @@ class CredlyWebhook(APIView):
             uuid=badge_template.get("id"),
             organization=organization,
             defaults={
-                "site": get_current_site(request),
+                "site": site,
                 "name": badge_template.get("name"),
                 "state": badge_template.get("state"),
                 "description": badge_template.get("description"),
@@ -116,11 +147,92 @@ class CredlyWebhook(APIView):
             ).update(is_active=False)
 
     @staticmethod
-    def handle_badge_template_deleted_event(request, data):
+    def handle_badge_template_deleted_event(site, data):
         """
         Deletes the badge template by provided uuid.
         """
         CredlyBadgeTemplate.objects.filter(
-            uuid=CredlyWebhook._get_badge_template_from_data(data).get("id"),
-            site=get_current_site(request),
+            uuid=get_badge_template_from_data(data).get("id"),
+            site=site,
         ).delete()
+
+
+def process_webhook_events(batch_size=100, max_attempts=5, retry_delay=60):
+    """
+    Processes a batch of pending Credly webhook events.
+
+    - fetches events information concurrently, with a single API client per Credly Organization;
+    - coalesces events of the same badge template: only the latest one is applied;
+    - applies the events in a single transaction (each event in its own savepoint).
+
+    Events which failed to be fetched or applied (with any error) are retried up to `max_attempts` times, with an
+    exponential backoff (`retry_delay` seconds after the first attempt, then twice as long after each attempt), then
+    they are failed (dead-lettered): they are not processed anymore, and don't block the following events.
+
+    Returns:
+        int: successfully processed events count (0 once no due event is left, or if all the events failed).
+    """
+    now = timezone.now()
+    events = list(
+        CredlyWebhookEvent.objects.filter(
+            Q(next_attempt_at__isnull=True) | Q(next_attempt_at__lte=now),
+            state=CredlyWebhookEvent.STATES.pending,
+        )
+        .select_related("organization", "site")
+        .order_by("occurred_at", "id")[:batch_size]
+    )
+    if not events:
+        return 0
+
+    api_clients = {
+        event.organization_id: CredlyAPIClient(event.organization.uuid, event.organization.api_key) for event in events
+    }
+    fetched = run_concurrently(
+        {
+            event.id: partial(api_clients[event.organization_id].fetch_event_information, str(event.event_id))
+            for event in events
+        }
+    )
+
+    def fail(event, error):
+        event.attempts += 1
+        event.error = str(error)
+        event.next_attempt_at = now + timedelta(seconds=retry_delay * 2 ** (event.attempts - 1))
+        if event.attempts >= max_attempts:
+            event.state = CredlyWebhookEvent.STATES.failed
+        logger.error(f"Credly webhook event {event} processing failed (attempt {event.attempts}): {error}")
+
+    latest_events = {}
+    for event in events:
+        data, error = fetched[event.id]
+        if error:
+            fail(event, error)
+            continue
+
+        try:
+            template_id = get_badge_template_from_data(data).get("id")
+        except Exception as exc:  # pylint: disable=broad-except
+            fail(event, exc)
+            continue
+        # the events without a badge template can't be coalesced
+        coalescing_key = template_id or event.event_id
+        coalesced = latest_events.get(coalescing_key)
+        if coalesced:
+            coalesced[0].state = CredlyWebhookEvent.STATES.processed
+            logger.info(f"Credly webhook event {coalesced[0]} is coalesced with {event}")
+        latest_events[coalescing_key] = (event, data)
+
+    with transaction.atomic():
+        for event, data in latest_events.values():
+            handler = getattr(CredlyWebhook, CredlyWebhook.EVENT_HANDLERS[event.event_type])
+            try:
+                with transaction.atomic():
+                    handler(event.site, data)
+            except Exception as exc:  # pylint: disable=broad-except
+                fail(event, exc)
+                continue
+            event.state = CredlyWebhookEvent.STATES.processed
+
+        CredlyWebhookEvent.objects.bulk_update(events, ["state", "attempts", "next_attempt_at", "error"])
+
+    return sum(event.state == CredlyWebhookEvent.STATES.processed for event in events)
@@ -29,6 +29,7 @@ from credentials.apps.badges.models import (
 )
 from credentials.apps.badges.signals.signals import notify_badge_awarded, notify_badge_revoked
 from credentials.apps.core.api import get_user_by_username
+from credentials.apps.core.timing import timed_stage
 from credentials.apps.credentials.constants import UserCredentialStatus
 from credentials.apps.credentials.issuers import AbstractCredentialIssuer
 
@@ -157,7 +158,8 @@ class CredlyBadgeTemplateIssuer(BadgeTemplateIssuer):
 
         try:
             credly_api = CredlyAPIClient(badge_template.organization.uuid)
-            response = credly_api.issue_badge(credly_badge_data)
+            with timed_stage("credly_api"):
+                response = credly_api.issue_badge(credly_badge_data)
         except BadgeProviderError:
             user_credential.state = "error"
             user_credential.save()
@@ -254,7 +256,8 @@ class AccredibleBadgeTemplateIssuer(BadgeTemplateIssuer):
 
         try:
             accredible_api = AccredibleAPIClient(group.api_config.id)
-            response = accredible_api.issue_badge(accredible_badge_data)
+            with timed_stage("accredible_api"):
+                response = accredible_api.issue_badge(accredible_badge_data)
         except BadgeProviderError:
             user_credential.state = "error"
             user_credential.save()
@@ -0,0 +1,48 @@
+import logging
+
+from django.core.management.base import BaseCommand
+
+from credentials.apps.badges.credly.webhooks import process_webhook_events
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    help = "Process pending Credly webhook events"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch_size", type=int, default=100, help="Number of events processed at once.")
+        parser.add_argument(
+            "--max_attempts", type=int, default=5, help="Number of processing attempts before an event is failed."
+        )
+        parser.add_argument(
+            "--retry_delay",
+            type=int,
+            default=60,
+            help="Seconds before a failed event is retried, doubled after each attempt.",
+        )
+
+    def handle(self, *args, **options):
+        """
+        Process pending Credly webhook events in batches until the queue is drained, or until a batch fails entirely
+        (e.g. during a Credly outage, the failed events are retried by the next runs).
+
+        Usage:
+            ./manage.py process_credly_webhook_events
+            ./manage.py process_credly_webhook_events --batch_size 500
+        """
+        batch_size = options.get("batch_size")
+        max_attempts = options.get("max_attempts")
+        retry_delay = options.get("retry_delay")
+
+        total = 0
+        while True:
+            # the failed events are not due before their retry delay, so each batch holds new events
+            processed_items = process_webhook_events(
+                batch_size=batch_size, max_attempts=max_attempts, retry_delay=retry_delay
+            )
+            total += processed_items
+            if not processed_items:
+                break
+
+        logger.info(f"...completed! Processed {total} Credly webhook events.")
@@ -2,6 +2,7 @@ from django.core.management.base import BaseCommand
 
 from credentials.apps.badges.accredible.api_client import AccredibleAPIClient
 from credentials.apps.badges.models import AccredibleAPIConfig
+from credentials.apps.badges.sync import run_concurrently
 
 
 class Command(BaseCommand):
@@ -45,10 +46,29 @@ class Command(BaseCommand):
                 "API Config ID wasn't provided: syncing groups for all configs - " f"{api_configs_to_sync}",
             )
 
-        for api_config in AccredibleAPIConfig.objects.filter(id__in=api_configs_to_sync):
-            accredible_api_client = AccredibleAPIClient(api_config.id)
-            processed_items = accredible_api_client.sync_groups(site_id)
+        accredible_api_clients = {
+            api_config.id: AccredibleAPIClient(api_config.id)
+            for api_config in AccredibleAPIConfig.objects.filter(id__in=api_configs_to_sync)
+        }
+
+        # groups of all configs are fetched concurrently, then applied one by one
+        fetched = run_concurrently(
+            {api_config_id: client.fetch_all_groups for api_config_id, client in accredible_api_clients.items()}
+        )
+
+        errors = []
+        for api_config_id, (groups_data, error) in fetched.items():
+            if error:
+                self.stderr.write(f"API Config {api_config_id}: failed to fetch groups - {error}")
+                errors.append(error)
+                continue
+
+            processed_items = accredible_api_clients[api_config_id].sync_groups(site_id, groups_data=groups_data)
 
             self.stdout.write(f"API Config {api_config_id}: got {processed_items} groups.")
 
+        # a failed config doesn't stop the others, the first error is re-raised after all configs are processed
+        if errors:
+            raise errors[0]
+
         self.stdout.write("...completed!")
@@ -4,6 +4,7 @@ from django.core.management.base import BaseCommand
 
 from credentials.apps.badges.credly.api_client import CredlyAPIClient
 from credentials.apps.badges.models import CredlyOrganization
+from credentials.apps.badges.sync import run_concurrently
 
 logger = logging.getLogger(__name__)
 
@@ -19,6 +20,9 @@ class Command(BaseCommand):
         """
         Sync badge templates for a specific organization or all organizations.
 
+        Organizations are fetched concurrently, a failed organization doesn't stop the others
+        (the first error is re-raised after all organizations are processed).
+
         Usage:
             site_id=1
             org_id=c117c179-81b1-4f7e-a3a1-e6ae30568c13
@@ -46,10 +50,29 @@ class Command(BaseCommand):
                 f"{organizations_to_sync}",
             )
 
-        for organization_id in organizations_to_sync:
-            credly_api = CredlyAPIClient(organization_id)
-            processed_items = credly_api.sync_organization_badge_templates(site_id)
+        credly_api_clients = {
+            organization_id: CredlyAPIClient(organization_id) for organization_id in organizations_to_sync
+        }
+
+        # badge templates of all organizations are fetched concurrently, then applied one by one
+        fetched = run_concurrently(
+            {organization_id: client.fetch_badge_templates for organization_id, client in credly_api_clients.items()}
+        )
+
+        errors = []
+        for organization_id, (badge_templates_data, error) in fetched.items():
+            if error:
+                logger.error(f"Organization {organization_id}: failed to fetch badge templates - {error}")
+                errors.append(error)
+                continue
+
+            processed_items = credly_api_clients[organization_id].sync_organization_badge_templates(
+                site_id, badge_templates_data=badge_templates_data
+            )
 
             logger.info(f"Organization {organization_id}: got {processed_items} badge templates.")
 
+        if errors:
+            raise errors[0]
+
         logger.info("...completed!")
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.11 on 2026-10-19 09:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("badges", "0002_accredibleapiconfig_accrediblebadge_and_more"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="badgetemplate",
+            name="content_hash",
+            field=models.CharField(
+                blank=True, default="", help_text="Synchronized content hash (auto-managed).", max_length=64
+            ),
+        ),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.11 on 2026-10-19 10:02
+
+import django.db.models.deletion
+import django_extensions.db.fields
+import model_utils.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("badges", "0003_badgetemplate_content_hash"),
+        ("sites", "0002_alter_domain_unique"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CredlyWebhookEvent",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+                ("event_id", models.UUIDField(help_text="Credly event identifier.", unique=True)),
+                ("event_type", models.CharField(help_text="Credly event type.", max_length=255)),
+                ("occurred_at", models.DateTimeField(blank=True, help_text="Credly event timestamp.", null=True)),
+                (
+                    "state",
+                    model_utils.fields.StatusField(
+                        choices=[("pending", "pending"), ("processed", "processed"), ("failed", "failed")],
+                        default="pending",
+                        help_text="Processing state (auto-managed).",
+                        max_length=100,
+                        no_check_for_status=True,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0, help_text="Processing attempts count.")),
+                ("error", models.TextField(blank=True, default="", help_text="The latest processing error.")),
+                (
+                    "organization",
+                    models.ForeignKey(
+                        help_text="Credly Organization the event belongs to.",
+                        on_delete=django.db.models.deletion.CASCADE,
+                        to="badges.credlyorganization",
+                    ),
+                ),
+                ("site", models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to="sites.site")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["state", "occurred_at"], name="badges_cred_state_dc43f8_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 5.2.11 on 2026-10-19 12:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("badges", "0004_credlywebhookevent"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="badgeprogress",
+            name="username",
+            field=models.CharField(db_index=True, max_length=255),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.11 on 2026-10-19 15:12
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("badges", "0005_badgeprogress_username_index"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="credlywebhookevent",
+            name="next_attempt_at",
+            field=models.DateTimeField(
+                blank=True, help_text="The event is not processed again before this time (auto-managed).", null=True
+            ),
+        ),
+    ]
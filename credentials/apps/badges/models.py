@@ -8,6 +8,7 @@ import uuid
 from urllib.parse import urljoin
 
 from django.conf import settings
+from django.contrib.sites.models import Site
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from django_extensions.db.models import TimeStampedModel
@@ -95,6 +96,12 @@ class BadgeTemplate(AbstractCredential):
         help_text=_("Synchronized state (auto-managed)."),
         null=True,
     )
+    content_hash = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text=_("Synchronized content hash (auto-managed)."),
+    )
 
     def __str__(self):
         return self.name
@@ -502,7 +509,7 @@ class BadgeProgress(models.Model):
     - user-centric;
     """
 
-    username = models.CharField(max_length=255)
+    username = models.CharField(max_length=255, db_index=True)
     template = models.ForeignKey(
         BadgeTemplate,
         models.SET_NULL,
@@ -700,6 +707,45 @@ class CredlyBadge(UserCredential):
         return self.external_uuid and (self.state in self.ISSUING_STATES)
 
 
+class CredlyWebhookEvent(TimeStampedModel):
+    """
+    Incoming Credly webhook event.
+
+    Webhook events are persisted on receipt and processed in background
+    (see `process_credly_webhook_events` management command).
+    """
+
+    STATES = Choices("pending", "processed", "failed")
+
+    event_id = models.UUIDField(unique=True, help_text=_("Credly event identifier."))
+    organization = models.ForeignKey(
+        CredlyOrganization,
+        on_delete=models.CASCADE,
+        help_text=_("Credly Organization the event belongs to."),
+    )
+    site = models.ForeignKey(Site, on_delete=models.CASCADE)
+    event_type = models.CharField(max_length=255, help_text=_("Credly event type."))
+    occurred_at = models.DateTimeField(null=True, blank=True, help_text=_("Credly event timestamp."))
+    state = StatusField(
+        choices_name="STATES",
+        help_text=_("Processing state (auto-managed)."),
+        default=STATES.pending,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0, help_text=_("Processing attempts count."))
+    next_attempt_at = models.DateTimeField(
+        null=True, blank=True, help_text=_("The event is not processed again before this time (auto-managed).")
+    )
+    error = models.TextField(blank=True, default="", help_text=_("The latest processing error."))
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["state", "occurred_at"]),
+        ]
+
+    def __str__(self):
+        return f"{self.event_type} ({self.event_id})"
+
+
 class AccredibleAPIConfig(TimeStampedModel):
     """
     Accredible API configuration.
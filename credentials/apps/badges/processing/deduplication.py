@@ -0,0 +1,135 @@
+"""
+Badging events idempotency layer.
+
+Event bus replays and LMS retries may deliver the same badging event many times. Every copy would otherwise
+go through user identification, requirements discovery and rules evaluation again.
+
+Two kinds of repeated events are recognized:
+    - duplicates: the very same event (same metadata id and same payload) delivered again;
+    - coalesced: a new event (different metadata id) whose payload is identical to the latest processed
+      event of the same type for the same user.
+"""
+
+import hashlib
+import json
+import logging
+
+import attr
+from django.conf import settings
+from django.core.cache import cache
+from edx_django_utils.monitoring import increment
+
+from credentials.apps.badges.utils import get_user_data
+
+logger = logging.getLogger(__name__)
+
+CACHE_KEY_PREFIX = "badges.events"
+DEFAULT_DUPLICATE_TTL = 60 * 60
+DEFAULT_COALESCE_TTL = 60
+
+
+def get_deduplication_settings():
+    """
+    Returns badging events deduplication settings (time-to-live values, in seconds).
+    """
+
+    config = settings.BADGES_CONFIG.get("deduplication", {})
+    return {
+        "DUPLICATE_TTL": config.get("DUPLICATE_TTL", DEFAULT_DUPLICATE_TTL),
+        "COALESCE_TTL": config.get("COALESCE_TTL", DEFAULT_COALESCE_TTL),
+    }
+
+
+def get_payload_hash(event_payload):
+    """
+    Calculates a stable hash for the event payload.
+    """
+
+    data = attr.asdict(event_payload) if attr.has(event_payload) else event_payload
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def get_user_key(event_payload):
+    """
+    Returns a user identifier from the event payload without touching the database.
+    """
+
+    user_data = get_user_data(event_payload)
+    if not user_data:
+        return None
+    if user_data.pii and user_data.pii.username:
+        return user_data.pii.username
+    return user_data.id
+
+
+class EventDeduplicator:
+    """
+    Marks badging events as seen and recognizes repeated ones.
+
+    State is kept in the Django cache, so it is bounded by the cache backend limits and expires
+    according to the configured time-to-live values.
+    """
+
+    def __init__(self, event_type, event_payload, event_metadata):
+        self.event_type = event_type
+        self.payload_hash = get_payload_hash(event_payload)
+        self.event_id = str(event_metadata.id)
+        self.user_key = get_user_key(event_payload)
+        self.settings = get_deduplication_settings()
+
+    @property
+    def duplicate_key(self):
+        return f"{CACHE_KEY_PREFIX}.seen.{self.event_id}.{self.payload_hash}"
+
+    @property
+    def coalesce_key(self):
+        return f"{CACHE_KEY_PREFIX}.latest.{self.event_type}.{self.user_key}"
+
+    def is_duplicate(self):
+        """
+        Marks the event as seen, returns True if it has already been seen.
+        """
+
+        return not cache.add(self.duplicate_key, True, self.settings["DUPLICATE_TTL"])
+
+    def is_coalesced(self):
+        """
+        Remembers the event as the latest for (user, event type), returns True if the latest one was the same.
+
+        Only the latest payload is compared, so a changed state in between (e.g. passing -> failing -> passing)
+        is always processed.
+        """
+
+        if self.user_key is None or not self.settings["COALESCE_TTL"]:
+            return False
+
+        if cache.get(self.coalesce_key) == self.payload_hash:
+            return True
+
+        cache.set(self.coalesce_key, self.payload_hash, self.settings["COALESCE_TTL"])
+        return False
+
+    def forget(self):
+        """
+        Drops the event marks, so its redelivery will be processed again.
+        """
+
+        cache.delete_many([self.duplicate_key, self.coalesce_key])
+
+    def should_skip(self):
+        """
+        Checks whether the event processing should be skipped, reporting the reason to monitoring.
+        """
+
+        if self.is_duplicate():
+            increment("badges_event_duplicates")
+            logger.info(f"BADGES: skipping duplicate event {self.event_type} ({self.event_id})")
+            return True
+
+        if self.is_coalesced():
+            increment("badges_event_coalesced")
+            logger.info(f"BADGES: coalescing repeated event {self.event_type} ({self.event_id}) for {self.user_key}")
+            return True
+
+        return False
@@ -5,39 +5,65 @@ Main processing logic.
 import logging
 
 from credentials.apps.badges.exceptions import BadgesProcessingError
+from credentials.apps.badges.processing.deduplication import EventDeduplicator
 from credentials.apps.badges.processing.progression import process_requirements
 from credentials.apps.badges.processing.regression import process_penalties
 from credentials.apps.badges.utils import extract_payload, get_user_data
 from credentials.apps.core.api import get_or_create_user_from_event_data
+from credentials.apps.core.query_budget import query_budget
+from credentials.apps.core.timing import timed_operation, timed_stage
 
 logger = logging.getLogger(__name__)
 
 
+@query_budget(40, name="badges_process_event")
 def process_event(sender, **kwargs):
     """
     Badge templates configuration interpreter.
 
     Responsibilities:
+        - skips duplicate and repeated events (when event metadata is available);
         - identifies a target User based on event's payload ("whose action");
         - runs badges progressive pipeline (requirements processing);
         - runs badges regressive pipeline (penalties processing);
     """
 
+    with timed_operation("badges_event"):
+        return _process_event(sender, **kwargs)
+
+
+def _process_event(sender, **kwargs):
     event_type = sender.event_type
+    event_metadata = kwargs.get("metadata")
+
+    deduplicator = None
+    if event_metadata is not None and extract_payload(kwargs) is not None:
+        deduplicator = EventDeduplicator(event_type, extract_payload(kwargs), event_metadata)
+        with timed_stage("deduplication"):
+            if deduplicator.should_skip():
+                return None
 
     try:
         # user identification
-        username = identify_user(event_type=event_type, event_payload=extract_payload(kwargs))
+        with timed_stage("user_identification"):
+            username = identify_user(event_type=event_type, event_payload=extract_payload(kwargs))
 
         # requirements processing
-        process_requirements(event_type, username, extract_payload(kwargs))
+        with timed_stage("requirements"):
+            process_requirements(event_type, username, extract_payload(kwargs))
 
         # penalties processing
-        process_penalties(event_type, username, extract_payload(kwargs))
+        with timed_stage("penalties"):
+            process_penalties(event_type, username, extract_payload(kwargs))
 
     except BadgesProcessingError as error:
         logger.error(f"Badges processing error: {error}")
         return None
+    except Exception:
+        # let the event redelivery be processed again
+        if deduplicator:
+            deduplicator.forget()
+        raise
     return None
 
 
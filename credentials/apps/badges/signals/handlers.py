@@ -6,11 +6,13 @@ See:
 
 import logging
 
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 from openedx_events.tooling import OpenEdxPublicSignal, load_all_signals
 
+from credentials.apps.badges.credly.api_client import clear_credentials_cache
 from credentials.apps.badges.issuers import AccredibleBadgeTemplateIssuer, CredlyBadgeTemplateIssuer
-from credentials.apps.badges.models import AccredibleGroup, BadgeProgress, CredlyBadgeTemplate
+from credentials.apps.badges.models import AccredibleGroup, BadgeProgress, CredlyBadgeTemplate, CredlyOrganization
 from credentials.apps.badges.processing.generic import process_event
 from credentials.apps.badges.signals import (
     BADGE_PROGRESS_COMPLETE,
@@ -98,3 +100,13 @@ def handle_badge_regression(sender, username, badge_template_id, origin, **kwarg
         CredlyBadgeTemplateIssuer().revoke(badge_template_id, username)
     elif origin == AccredibleGroup.ORIGIN:
         AccredibleBadgeTemplateIssuer().revoke(badge_template_id, username)
+
+
+@receiver(post_save, sender=CredlyOrganization)
+@receiver(post_delete, sender=CredlyOrganization)
+def handle_credly_organization_change(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    """
+    Drops cached credentials (and HTTP session) of the changed Credly Organization.
+    """
+
+    clear_credentials_cache(instance.uuid)
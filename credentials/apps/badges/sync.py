@@ -0,0 +1,139 @@
+"""
+Badge templates synchronization helpers.
+
+Provider listings are fetched concurrently for all configured providers' accounts and then applied
+to the existing badge templates based on their content hash:
+    - only new and changed templates are written;
+    - templates which are missing from a provider listing are handled in a single statement.
+"""
+
+import hashlib
+import json
+import logging
+from concurrent.futures import ThreadPoolExecutor
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SYNC_MAX_WORKERS = 4
+
+
+def get_sync_max_workers():
+    """
+    Returns the number of concurrent provider requests used during synchronization.
+    """
+
+    return settings.BADGES_CONFIG.get("sync", {}).get("MAX_WORKERS", DEFAULT_SYNC_MAX_WORKERS)
+
+
+def get_content_hash(data):
+    """
+    Calculates a stable hash for the provider's raw item data.
+    """
+
+    serialized = json.dumps(data, sort_keys=True, default=str)
+    return hashlib.sha256(serialized.encode("utf-8")).hexdigest()
+
+
+def run_concurrently(tasks, max_workers=None):
+    """
+    Runs callables concurrently.
+
+    NOTE: tasks must not use the database (threads don't share the database connection).
+
+    Parameters:
+        - tasks (dict): callables by keys.
+        - max_workers (int): optional number of threads.
+
+    Returns:
+        dict: (result, error) pairs by the tasks keys.
+    """
+
+    if not tasks:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=max_workers or get_sync_max_workers()) as executor:
+        futures = {key: executor.submit(task) for key, task in tasks.items()}
+
+    results = {}
+    for key, future in futures.items():
+        try:
+            results[key] = (future.result(), None)
+        except Exception as exc:  # pylint: disable=broad-except
+            results[key] = (None, exc)
+    return results
+
+
+class BadgeTemplatesDiff:
+    """
+    Compares a provider listing with the existing badge templates (a single query).
+
+    Parameters:
+        - queryset: existing badge templates of the provider's account.
+        - lookup_field (str): the template field which holds the provider's item ID.
+        - raw_items (dict): provider's raw items by their IDs.
+    """
+
+    def __init__(self, queryset, lookup_field, raw_items):
+        self.queryset = queryset
+        self.lookup_field = lookup_field
+        self.raw_items = {str(key): raw_item for key, raw_item in raw_items.items()}
+        self.hashes = {key: get_content_hash(raw_item) for key, raw_item in self.raw_items.items()}
+
+        existing = {str(getattr(template, lookup_field)): template for template in queryset}
+
+        self.created = [key for key in self.raw_items if key not in existing]
+        self.changed = {
+            key: template
+            for key, template in existing.items()
+            if key in self.raw_items and template.content_hash != self.hashes[key]
+        }
+        self.missing = [template.pk for key, template in existing.items() if key not in self.raw_items]
+        self.unchanged_count = len(self.raw_items) - len(self.created) - len(self.changed)
+
+    def apply(self, build_fields, create_fields, on_missing):
+        """
+        Writes new and changed templates and handles the missing ones.
+
+        Parameters:
+            - build_fields (callable): returns template field values for the provider's item ID.
+            - create_fields (dict): additional field values for new templates (e.g. the provider's account).
+            - on_missing (callable): handles the queryset of templates missing from the provider listing. The
+              templates which are kept must have their content hash cleared, otherwise they are considered unchanged
+              when they reappear.
+        """
+
+        model = self.queryset.model
+        now = timezone.now()
+
+        with transaction.atomic():
+            # NOTE: bulk creation is not supported for multi-table inherited badge templates.
+            for key in self.created:
+                model.objects.create(
+                    **{self.lookup_field: self.raw_items[key]["id"]},
+                    **create_fields,
+                    **build_fields(key),
+                    content_hash=self.hashes[key],
+                )
+
+            if self.changed:
+                fields = set()
+                for key, template in self.changed.items():
+                    values = build_fields(key)
+                    for field, value in values.items():
+                        setattr(template, field, value)
+                    template.content_hash = self.hashes[key]
+                    template.modified = now
+                    fields.update(values)
+                model.objects.bulk_update(self.changed.values(), [*fields, "content_hash", "modified"])
+
+            if self.missing:
+                on_missing(model.objects.filter(pk__in=self.missing))
+
+        logger.info(
+            f"BADGES: {model.__name__} sync - created: {len(self.created)}, changed: {len(self.changed)}, "
+            f"unchanged: {self.unchanged_count}, missing: {len(self.missing)}"
+        )
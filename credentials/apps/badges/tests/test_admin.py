@@ -0,0 +1,46 @@
+import uuid
+
+from django.contrib.admin.sites import AdminSite
+from django.contrib.sites.models import Site
+from django.test import RequestFactory, TestCase
+
+from credentials.apps.badges.admin import BadgeProgressAdmin
+from credentials.apps.badges.models import BadgeProgress, BadgeRequirement, BadgeTemplate, Fulfillment
+
+
+class BadgeProgressAdminTestCase(TestCase):
+    def setUp(self):
+        self.site = Site.objects.create(domain="test_domain", name="test_name")
+        self.badge_template = BadgeTemplate.objects.create(
+            uuid=uuid.uuid4(), name="test_template", state="draft", site=self.site
+        )
+        event_type = "org.openedx.learning.course.passing.status.updated.v1"
+        self.requirements = [
+            BadgeRequirement.objects.create(template=self.badge_template, event_type=event_type, blend="group1"),
+            BadgeRequirement.objects.create(template=self.badge_template, event_type=event_type, blend="group1"),
+            BadgeRequirement.objects.create(template=self.badge_template, event_type=event_type),
+        ]
+        self.model_admin = BadgeProgressAdmin(BadgeProgress, AdminSite())
+        self.request = RequestFactory().get("/")
+
+    def create_progress(self, username, fulfilled_requirements):
+        progress = BadgeProgress.objects.create(username=username, template=self.badge_template)
+        for requirement in fulfilled_requirements:
+            Fulfillment.objects.create(progress=progress, requirement=requirement, blend=requirement.blend)
+        return progress
+
+    def test_progress_columns(self):
+        self.create_progress("none", [])
+        self.create_progress("half", self.requirements[:2])
+        self.create_progress("complete", [self.requirements[0], self.requirements[2]])
+        BadgeProgress.objects.create(username="no-template")
+
+        # the progress of all listed records is computed at once:
+        with self.assertNumQueries(1):
+            progresses = list(self.model_admin.get_queryset(self.request).order_by("id"))
+            ratios = [self.model_admin.ratio(progress) for progress in progresses]
+            completes = [self.model_admin.complete(progress) for progress in progresses]
+
+        self.assertEqual(ratios, [progress.ratio for progress in progresses])
+        self.assertEqual(ratios, [0.0, 0.5, 1.0, 0.0])
+        self.assertEqual(completes, [False, False, True, False])
@@ -1,13 +1,17 @@
 from unittest import mock
 
+import requests
+import responses
 from attrs import asdict
 from django.test import TestCase
+from edx_django_utils.cache import RequestCache
 from faker import Faker
 from openedx_events.learning.data import BadgeData, BadgeTemplateData, UserData, UserPersonalData
 
 from credentials.apps.badges.credly.api_client import CredlyAPIClient
 from credentials.apps.badges.credly.exceptions import CredlyError
-from credentials.apps.badges.models import BadgeTemplate, CredlyOrganization
+from credentials.apps.badges.models import BadgeTemplate, CredlyBadgeTemplate, CredlyOrganization
+from credentials.apps.badges.sync import get_content_hash
 
 
 class CredlyApiClientTestCase(TestCase):
@@ -44,7 +48,7 @@ class CredlyApiClientTestCase(TestCase):
             )
 
     def test_perform_request(self):
-        with mock.patch("credentials.apps.badges.credly.api_client.requests.request") as mock_request:
+        with mock.patch.object(requests.Session, "request") as mock_request:
             mock_response = mock.Mock()
             mock_response.json.return_value = {"key": "value"}
             mock_request.return_value = mock_response
@@ -129,3 +133,140 @@ class CredlyApiClientTestCase(TestCase):
             badge_templates = BadgeTemplate.objects.all()
             self.assertEqual(badge_templates.count(), 2)
             self.assertEqual(badge_templates[0].name, "Badge Template 1")
+
+
+class CredlyApiClientSessionTestCase(TestCase):
+    def setUp(self):
+        self.organization = CredlyOrganization.objects.create(
+            uuid=Faker().uuid4(), api_key="test-api-key", name="test_organization"
+        )
+
+    def test_session_shared_by_organization(self):
+        other_organization = CredlyOrganization.objects.create(uuid=Faker().uuid4(), api_key="other-api-key")
+
+        session = CredlyAPIClient(self.organization.uuid).session
+
+        self.assertIs(CredlyAPIClient(self.organization.uuid).session, session)
+        self.assertIsNot(CredlyAPIClient(other_organization.uuid).session, session)
+
+    def test_session_retries(self):
+        adapter = CredlyAPIClient(self.organization.uuid).session.get_adapter("https://")
+
+        self.assertEqual(adapter.max_retries.total, 3)
+
+    def test_credentials_cached(self):
+        CredlyAPIClient(self.organization.uuid)
+
+        with self.assertNumQueries(0):
+            api_client = CredlyAPIClient(self.organization.uuid)
+
+        self.assertEqual(api_client.api_key, "test-api-key")
+
+    def test_credentials_not_shared(self):
+        CredlyAPIClient(self.organization.uuid)
+        RequestCache.clear_all_namespaces()
+
+        with self.assertNumQueries(1):
+            CredlyAPIClient(self.organization.uuid)
+
+    def test_credentials_cache_dropped_on_organization_change(self):
+        session = CredlyAPIClient(self.organization.uuid).session
+        self.organization.api_key = "new-api-key"
+        self.organization.save()
+
+        api_client = CredlyAPIClient(self.organization.uuid)
+
+        self.assertEqual(api_client.api_key, "new-api-key")
+        self.assertIsNot(api_client.session, session)
+
+
+class CredlyBadgeTemplatesSyncTestCase(TestCase):
+    """
+    Badge templates synchronization against a fake Credly API.
+    """
+
+    def setUp(self):
+        fake = Faker()
+        self.organization = CredlyOrganization.objects.create(
+            uuid=fake.uuid4(), api_key="test-api-key", name="test_organization"
+        )
+        self.api_client = CredlyAPIClient(self.organization.uuid)
+        self.base_url = f"https://sandbox-api.credly.com/v1/organizations/{self.organization.uuid}/"
+        self.raw_templates = [
+            {"id": fake.uuid4(), "name": f"Badge Template {i}", "state": "active", "description": "Description"}
+            for i in range(3)
+        ]
+
+    @responses.activate
+    @mock.patch("credentials.apps.badges.credly.api_client.time.sleep")
+    def test_fetch_badge_templates_pages(self, mock_sleep):
+        next_page_url = f"{self.base_url}badge_templates/?filter=state::active&page=2"
+        responses.add(
+            responses.GET,
+            f"{self.base_url}badge_templates/?filter=state::active",
+            json={"data": self.raw_templates[:2], "metadata": {"total_pages": 2, "next_page_url": next_page_url}},
+        )
+        responses.add(
+            responses.GET, next_page_url, json={"data": self.raw_templates[2:], "metadata": {"total_pages": 2}}
+        )
+
+        result = self.api_client.fetch_badge_templates()
+
+        self.assertEqual(result, {"data": self.raw_templates})
+        mock_sleep.assert_called_once()
+
+    @responses.activate
+    def test_fetch_badge_templates_network_error(self):
+        responses.add(
+            responses.GET, f"{self.base_url}badge_templates/?filter=state::active", body=requests.ConnectionError()
+        )
+
+        with self.assertRaises(CredlyError):
+            self.api_client.fetch_badge_templates()
+
+        # the failed requests are only retried by the shared HTTP session
+        self.assertEqual(len(responses.calls), 1)
+
+    def test_sync_writes_changes_only(self):
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates})
+        changed_templates = [dict(self.raw_templates[0], name="Changed"), *self.raw_templates[1:2]]
+
+        with mock.patch.object(CredlyBadgeTemplate.objects, "create") as mock_create, mock.patch.object(
+            CredlyBadgeTemplate.objects, "bulk_update"
+        ) as mock_bulk_update:
+            self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": changed_templates})
+
+        mock_create.assert_not_called()
+        updated_templates = list(mock_bulk_update.call_args.args[0])
+        self.assertEqual([template.name for template in updated_templates], ["Changed"])
+
+    def test_sync_deactivates_missing_templates(self):
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates})
+        CredlyBadgeTemplate.objects.update(is_active=True)
+
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates[1:]})
+
+        missing_template = CredlyBadgeTemplate.objects.get(uuid=self.raw_templates[0]["id"])
+        self.assertEqual(missing_template.state, CredlyBadgeTemplate.STATES.archived)
+        self.assertFalse(missing_template.is_active)
+        self.assertEqual(CredlyBadgeTemplate.objects.filter(is_active=True).count(), 2)
+
+    def test_sync_restores_reappearing_templates(self):
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates})
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates[1:]})
+
+        # the template is back, unchanged
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates})
+
+        template = CredlyBadgeTemplate.objects.get(uuid=self.raw_templates[0]["id"])
+        self.assertEqual(template.state, CredlyBadgeTemplate.STATES.active)
+        self.assertEqual(template.content_hash, get_content_hash(self.raw_templates[0]))
+
+    def test_sync_updates_changed_templates(self):
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": self.raw_templates})
+
+        changed_templates = [dict(self.raw_templates[0], name="Changed"), *self.raw_templates[1:]]
+        self.api_client.sync_organization_badge_templates(1, badge_templates_data={"data": changed_templates})
+
+        self.assertEqual(CredlyBadgeTemplate.objects.get(uuid=self.raw_templates[0]["id"]).name, "Changed")
+        self.assertEqual(CredlyBadgeTemplate.objects.count(), 3)
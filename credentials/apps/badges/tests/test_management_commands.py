@@ -4,6 +4,7 @@ import faker
 from django.core.management import call_command
 from django.test import TestCase
 
+from credentials.apps.badges.credly.exceptions import CredlyError
 from credentials.apps.badges.models import AccredibleAPIConfig, CredlyOrganization
 
 
@@ -25,7 +26,21 @@ class TestSyncOrganizationBadgeTemplatesCommand(TestCase):
     def test_handle_with_organization_id(self, mock_credly_api_client):
         call_command("sync_organization_badge_templates", "--organization_id", self.credly_organization.uuid)
         mock_credly_api_client.assert_called_once_with(self.credly_organization.uuid)
-        mock_credly_api_client.return_value.sync_organization_badge_templates.assert_called_once_with(1)
+        mock_credly_api_client.return_value.sync_organization_badge_templates.assert_called_once_with(
+            1, badge_templates_data=mock_credly_api_client.return_value.fetch_badge_templates.return_value
+        )
+
+    @mock.patch("credentials.apps.badges.management.commands.sync_organization_badge_templates.CredlyAPIClient")
+    def test_handle_failed_organization(self, mock_credly_api_client):
+        mock_credly_api_client.return_value.fetch_badge_templates.side_effect = [
+            CredlyError("failed"),
+            *[{"data": []}] * 5,
+        ]
+
+        with self.assertRaises(CredlyError):
+            call_command("sync_organization_badge_templates")
+
+        self.assertEqual(mock_credly_api_client.return_value.sync_organization_badge_templates.call_count, 5)
 
 
 class TestSyncAccredibleGroupsCommand(TestCase):
@@ -46,4 +61,6 @@ class TestSyncAccredibleGroupsCommand(TestCase):
     def test_handle_with_api_config_id(self, mock_accredible_api_client):
         call_command("sync_accredible_groups", "--api_config_id", self.api_config.id)
         mock_accredible_api_client.assert_called_once_with(1)
-        mock_accredible_api_client.return_value.sync_groups.assert_called_once_with(1)
+        mock_accredible_api_client.return_value.sync_groups.assert_called_once_with(
+            1, groups_data=mock_accredible_api_client.return_value.fetch_all_groups.return_value
+        )
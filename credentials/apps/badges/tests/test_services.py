@@ -1,10 +1,13 @@
 import uuid
 from unittest.mock import MagicMock, patch
 
+import attr
 from django.contrib.auth import get_user_model
 from django.contrib.sites.models import Site
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from opaque_keys.edx.keys import CourseKey
+from openedx_events.data import EventsMetadata
 from openedx_events.learning.data import CourseData, CoursePassingStatusData, UserData, UserPersonalData
 
 from credentials.apps.badges.exceptions import BadgesProcessingError
@@ -799,3 +802,68 @@ class TestProcessEvent(TestCase):
         with patch("credentials.apps.badges.processing.generic.logger.error") as mock_no_user_data:
             process_event(sender=self.sender, kwargs=event_payload)
             mock_no_user_data.assert_called_once()
+
+
+class TestProcessEventDeduplication(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.sender = MagicMock()
+        self.sender.event_type = COURSE_PASSING_EVENT
+        self.metadata = EventsMetadata(event_type=COURSE_PASSING_EVENT, minorversion=0)
+
+    def tearDown(self):
+        cache.clear()
+
+    @patch("credentials.apps.badges.processing.generic.process_requirements")
+    @patch("credentials.apps.badges.processing.generic.identify_user", return_value="test_username")
+    def test_duplicate_event_skipped(self, mock_identify_user, mock_process_requirements):
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=self.metadata)
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=self.metadata)
+
+        mock_identify_user.assert_called_once()
+        mock_process_requirements.assert_called_once()
+
+    @patch("credentials.apps.badges.processing.generic.process_requirements")
+    @patch("credentials.apps.badges.processing.generic.identify_user", return_value="test_username")
+    def test_repeated_event_coalesced(self, mock_identify_user, mock_process_requirements):
+        retry_metadata = EventsMetadata(event_type=COURSE_PASSING_EVENT, minorversion=0)
+
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=self.metadata)
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=retry_metadata)
+
+        mock_identify_user.assert_called_once()
+        mock_process_requirements.assert_called_once()
+
+    @patch("credentials.apps.badges.processing.generic.process_penalties")
+    @patch("credentials.apps.badges.processing.generic.process_requirements")
+    @patch("credentials.apps.badges.processing.generic.identify_user", return_value="test_username")
+    def test_changed_state_processed(self, mock_identify_user, *args):
+        not_passing_data = attr.evolve(COURSE_PASSING_DATA, is_passing=False)
+
+        for payload in (COURSE_PASSING_DATA, not_passing_data, COURSE_PASSING_DATA):
+            metadata = EventsMetadata(event_type=COURSE_PASSING_EVENT, minorversion=0)
+            process_event(sender=self.sender, course_passing_status=payload, metadata=metadata)
+
+        self.assertEqual(mock_identify_user.call_count, 3)
+
+    @patch("credentials.apps.badges.processing.generic.process_requirements")
+    @patch("credentials.apps.badges.processing.generic.identify_user", return_value="test_username")
+    def test_failed_event_redelivery_processed(self, mock_identify_user, mock_process_requirements):
+        mock_process_requirements.side_effect = [ValueError, None]
+
+        with self.assertRaises(ValueError):
+            process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=self.metadata)
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=self.metadata)
+
+        self.assertEqual(mock_identify_user.call_count, 2)
+
+    @override_settings(BADGES_CONFIG={"deduplication": {"COALESCE_TTL": 0}})
+    @patch("credentials.apps.badges.processing.generic.process_requirements")
+    @patch("credentials.apps.badges.processing.generic.identify_user", return_value="test_username")
+    def test_coalescing_disabled(self, mock_identify_user, *args):
+        retry_metadata = EventsMetadata(event_type=COURSE_PASSING_EVENT, minorversion=0)
+
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=self.metadata)
+        process_event(sender=self.sender, course_passing_status=COURSE_PASSING_DATA, metadata=retry_metadata)
+
+        self.assertEqual(mock_identify_user.call_count, 2)
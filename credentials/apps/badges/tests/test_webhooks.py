@@ -1,23 +1,16 @@
-from unittest.mock import MagicMock, patch
+from datetime import timedelta
+from unittest.mock import patch
 
+from django.contrib.sites.models import Site
+from django.core.management import call_command
 from django.test import TestCase
 from django.test.client import RequestFactory
 from faker import Faker
 
 from credentials.apps.badges.credly.api_client import CredlyAPIClient
+from credentials.apps.badges.credly.exceptions import CredlyError
 from credentials.apps.badges.credly.webhooks import CredlyWebhook
-from credentials.apps.badges.models import CredlyBadgeTemplate, CredlyOrganization
-
-
-def get_organization(self, organization_id):  # pylint: disable=unused-argument
-    organization = MagicMock(spec=CredlyOrganization)
-    organization.uuid = organization_id
-    organization.api_key = "test_api_key"
-    return organization
-
-
-def perform_request(self, method, endpoint, data=None):  # pylint: disable=unused-argument
-    return {"key": "value"}
+from credentials.apps.badges.models import CredlyBadgeTemplate, CredlyOrganization, CredlyWebhookEvent
 
 
 class CredlyWebhookTestCase(TestCase):
@@ -26,79 +19,63 @@ class CredlyWebhookTestCase(TestCase):
         self.fake = Faker()
         self.organization = CredlyOrganization.objects.create(uuid=self.fake.uuid4(), api_key="test_api_key")
 
-    @patch.object(CredlyAPIClient, "_get_organization", get_organization)
-    @patch.object(CredlyAPIClient, "perform_request", perform_request)
-    def test_webhook_created_event(self):
-        with patch(
-            "credentials.apps.badges.credly.webhooks.CredlyWebhook.handle_badge_template_created_event"
-        ) as mock_handle:
-            req = self.rf.post(
-                "/credly/webhook/",
-                data={
-                    "id": self.fake.uuid4(),
-                    "organization_id": self.organization.uuid,
-                    "event_type": "badge_template.created",
-                    "occurred_at": "2021-01-01T00:00:00Z",
-                },
-            )
-            res = CredlyWebhook.as_view()(req)
-            self.assertEqual(res.status_code, 204)
-            mock_handle.assert_called_once()
+    def _post_event(self, event_type, organization_id=None, event_id=None):
+        req = self.rf.post(
+            "/credly/webhook/",
+            data={
+                "id": event_id or self.fake.uuid4(),
+                "organization_id": organization_id or self.organization.uuid,
+                "event_type": event_type,
+                "occurred_at": "2021-01-01T00:00:00Z",
+            },
+        )
+        return CredlyWebhook.as_view()(req)
 
-    @patch.object(CredlyAPIClient, "_get_organization", get_organization)
-    @patch.object(CredlyAPIClient, "perform_request", perform_request)
-    def test_webhook_changed_event(self):
-        with patch(
-            "credentials.apps.badges.credly.webhooks.CredlyWebhook.handle_badge_template_changed_event"
-        ) as mock_handle:
-            req = self.rf.post(
-                "/credly/webhook/",
-                data={
-                    "id": self.fake.uuid4(),
-                    "organization_id": self.organization.uuid,
-                    "event_type": "badge_template.changed",
-                    "occurred_at": "2021-01-01T00:00:00Z",
-                },
-            )
-            res = CredlyWebhook.as_view()(req)
+    @patch.object(CredlyAPIClient, "perform_request")
+    def test_webhook_event_persisted(self, mock_perform_request):
+        for event_type in ("badge_template.created", "badge_template.changed", "badge_template.deleted"):
+            res = self._post_event(event_type)
             self.assertEqual(res.status_code, 204)
-            mock_handle.assert_called_once()
 
-    @patch.object(CredlyAPIClient, "_get_organization", get_organization)
-    @patch.object(CredlyAPIClient, "perform_request", perform_request)
-    def test_webhook_deleted_event(self):
-        with patch(
-            "credentials.apps.badges.credly.webhooks.CredlyWebhook.handle_badge_template_deleted_event"
-        ) as mock_handle:
-            req = self.rf.post(
-                "/credly/webhook/",
-                data={
-                    "id": self.fake.uuid4(),
-                    "organization_id": self.fake.uuid4(),
-                    "event_type": "badge_template.deleted",
-                    "occurred_at": "2021-01-01T00:00:00Z",
-                },
-            )
-            res = CredlyWebhook.as_view()(req)
-            self.assertEqual(res.status_code, 204)
-            mock_handle.assert_called_once()
+        mock_perform_request.assert_not_called()
+        self.assertEqual(
+            CredlyWebhookEvent.objects.filter(
+                organization=self.organization, state=CredlyWebhookEvent.STATES.pending
+            ).count(),
+            3,
+        )
+
+    def test_webhook_event_redelivered(self):
+        event_id = self.fake.uuid4()
+        self._post_event("badge_template.changed", event_id=event_id)
+        res = self._post_event("badge_template.changed", event_id=event_id)
+
+        self.assertEqual(res.status_code, 204)
+        self.assertEqual(CredlyWebhookEvent.objects.count(), 1)
+
+    def test_webhook_unknown_organization(self):
+        res = self._post_event("badge_template.changed", organization_id=self.fake.uuid4())
+
+        self.assertEqual(res.status_code, 404)
+        self.assertFalse(CredlyWebhookEvent.objects.exists())
+
+    def test_webhook_invalid_event_id(self):
+        for event_id in (None, "not-a-uuid"):
+            data = {"organization_id": self.organization.uuid, "event_type": "badge_template.changed"}
+            if event_id:
+                data["id"] = event_id
+            res = CredlyWebhook.as_view()(self.rf.post("/credly/webhook/", data=data))
+
+            self.assertEqual(res.status_code, 400)
+        self.assertFalse(CredlyWebhookEvent.objects.exists())
 
-    @patch.object(CredlyAPIClient, "_get_organization", get_organization)
-    @patch.object(CredlyAPIClient, "perform_request", perform_request)
     def test_webhook_nonexistent_event(self):
         with patch("credentials.apps.badges.credly.webhooks.logger.error") as mock_handle:
-            req = self.rf.post(
-                "/credly/webhookd/",
-                data={
-                    "id": self.fake.uuid4(),
-                    "organization_id": self.fake.uuid4(),
-                    "event_type": "unknown_event",
-                    "occurred_at": "2021-01-01T00:00:00Z",
-                },
-            )
-            CredlyWebhook.as_view()(req)
+            self._post_event("unknown_event")
             mock_handle.assert_called_once()
 
+        self.assertFalse(CredlyWebhookEvent.objects.exists())
+
     def test_handle_badge_template_deleted_event(self):
         request_data = {
             "organization_id": "test_organization_id",
@@ -115,8 +92,143 @@ class CredlyWebhookTestCase(TestCase):
                 }
             },
         }
-        request = self.rf.post("/credly/webhook/", data=request_data)
-
-        CredlyWebhook.handle_badge_template_deleted_event(request, request_data)
+        CredlyWebhook.handle_badge_template_deleted_event(Site.objects.get_current(), request_data)
 
         self.assertEqual(CredlyBadgeTemplate.objects.count(), 0)
+
+
+class ProcessCredlyWebhookEventsTestCase(TestCase):
+    def setUp(self):
+        self.fake = Faker()
+        self.site = Site.objects.get_current()
+        self.organization = CredlyOrganization.objects.create(uuid=self.fake.uuid4(), api_key="test_api_key")
+        self.template_id = self.fake.uuid4()
+
+    def _create_event(self, event_type, occurred_at):
+        return CredlyWebhookEvent.objects.create(
+            event_id=self.fake.uuid4(),
+            organization=self.organization,
+            site=self.site,
+            event_type=event_type,
+            occurred_at=occurred_at,
+        )
+
+    def _event_information(self, name, state="active"):
+        return {
+            "data": {
+                "badge_template": {
+                    "id": self.template_id,
+                    "owner": {"id": str(self.organization.uuid)},
+                    "name": name,
+                    "state": state,
+                    "description": "Test Description",
+                    "image_url": "http://example.com/image.png",
+                }
+            }
+        }
+
+    def test_process_events_coalesced(self):
+        created = self._create_event("badge_template.created", "2021-01-01T00:00:00Z")
+        changed = self._create_event("badge_template.changed", "2021-01-01T00:01:00Z")
+        information = {
+            str(created.event_id): self._event_information("Created"),
+            str(changed.event_id): self._event_information("Changed"),
+        }
+
+        with patch.object(CredlyAPIClient, "fetch_event_information", side_effect=information.get), patch.object(
+            CredlyWebhook, "handle_badge_template_created_event"
+        ) as mock_created_handler:
+            call_command("process_credly_webhook_events")
+
+        mock_created_handler.assert_not_called()
+        self.assertEqual(CredlyBadgeTemplate.objects.get(uuid=self.template_id).name, "Changed")
+        self.assertEqual(
+            CredlyWebhookEvent.objects.filter(state=CredlyWebhookEvent.STATES.processed).count(),
+            2,
+        )
+
+    def test_process_events_retried(self):
+        event = self._create_event("badge_template.created", "2021-01-01T00:00:00Z")
+
+        with patch.object(CredlyAPIClient, "fetch_event_information", side_effect=CredlyError("failed")):
+            call_command("process_credly_webhook_events", "--max_attempts", 2, "--retry_delay", 0)
+            event.refresh_from_db()
+            self.assertEqual(event.state, CredlyWebhookEvent.STATES.pending)
+
+            call_command("process_credly_webhook_events", "--max_attempts", 2, "--retry_delay", 0)
+
+        event.refresh_from_db()
+        self.assertEqual(event.state, CredlyWebhookEvent.STATES.failed)
+        self.assertEqual(event.attempts, 2)
+        self.assertFalse(CredlyBadgeTemplate.objects.exists())
+
+    def test_process_events_handler_error(self):
+        failing = self._create_event("badge_template.created", "2021-01-01T00:00:00Z")
+        created = self._create_event("badge_template.created", "2021-01-01T00:01:00Z")
+        information = {
+            str(failing.event_id): {"data": {"badge_template": {"id": self.fake.uuid4(), "owner": None}}},
+            str(created.event_id): self._event_information("Created"),
+        }
+
+        with patch.object(CredlyAPIClient, "fetch_event_information", side_effect=information.get):
+            call_command("process_credly_webhook_events", "--max_attempts", 2)
+            failing.refresh_from_db()
+            self.assertEqual(failing.state, CredlyWebhookEvent.STATES.pending)
+            self.assertEqual(failing.attempts, 1)
+
+            CredlyWebhookEvent.objects.update(next_attempt_at=None)
+            call_command("process_credly_webhook_events", "--max_attempts", 2)
+
+        failing.refresh_from_db()
+        self.assertEqual(failing.state, CredlyWebhookEvent.STATES.failed)
+        self.assertIn("NoneType", failing.error)
+        created.refresh_from_db()
+        self.assertEqual(created.state, CredlyWebhookEvent.STATES.processed)
+        self.assertEqual(CredlyBadgeTemplate.objects.get().name, "Created")
+
+    def test_process_events_retried_with_backoff(self):
+        event = self._create_event("badge_template.created", "2021-01-01T00:00:00Z")
+
+        with patch.object(CredlyAPIClient, "fetch_event_information", side_effect=CredlyError("failed")):
+            call_command("process_credly_webhook_events", "--retry_delay", 60)
+            event.refresh_from_db()
+            first_attempt_at = event.next_attempt_at - timedelta(seconds=60)
+
+            # the event isn't due yet
+            call_command("process_credly_webhook_events", "--retry_delay", 60)
+            event.refresh_from_db()
+            self.assertEqual(event.attempts, 1)
+
+            CredlyWebhookEvent.objects.update(next_attempt_at=first_attempt_at)
+            call_command("process_credly_webhook_events", "--retry_delay", 60)
+
+        event.refresh_from_db()
+        self.assertEqual(event.attempts, 2)
+        self.assertGreaterEqual(event.next_attempt_at - first_attempt_at, timedelta(seconds=120))
+        self.assertEqual(event.state, CredlyWebhookEvent.STATES.pending)
+
+    def test_process_events_stopped_on_outage(self):
+        events = [self._create_event("badge_template.created", f"2021-01-01T00:0{minute}:00Z") for minute in range(3)]
+
+        with patch.object(CredlyAPIClient, "fetch_event_information", side_effect=CredlyError("failed")):
+            call_command("process_credly_webhook_events", "--batch_size", 1, "--retry_delay", 0)
+
+        # the run stops after the first failed batch, instead of using up the attempts of the whole backlog
+        self.assertEqual([CredlyWebhookEvent.objects.get(id=event.id).attempts for event in events], [1, 0, 0])
+
+    def test_process_events_without_template_not_coalesced(self):
+        first = self._create_event("badge_template.changed", "2021-01-01T00:00:00Z")
+        second = self._create_event("badge_template.changed", "2021-01-01T00:01:00Z")
+
+        with patch.object(CredlyAPIClient, "fetch_event_information", return_value={"data": {}}), patch.object(
+            CredlyWebhook, "handle_badge_template_changed_event"
+        ) as mock_changed_handler:
+            call_command("process_credly_webhook_events")
+
+        self.assertEqual(mock_changed_handler.call_count, 2)
+        self.assertEqual(
+            CredlyWebhookEvent.objects.filter(
+                id__in=[first.id, second.id], state=CredlyWebhookEvent.STATES.processed
+            ).count(),
+            2,
+        )
@@ -7,6 +7,7 @@ from django.db import transaction
 
 from credentials.apps.catalog.data import PathwayStatus
 from credentials.apps.catalog.models import Course, CourseRun, Organization, Pathway, Program
+from credentials.apps.core.timing import timed_operation, timed_stage
 
 logger = logging.getLogger(__name__)
 
@@ -93,14 +94,15 @@ class CatalogDataSynchronizer:
                 console
         """
         logger.info(f"Copying catalog data for site {self.site.domain}")
-        # fetch organizations
-        self.fetch_resource(self.ORGANIZATION, self._parse_organization)
-        # fetch courses_and_course_runs
-        self.fetch_resource(self.COURSE, self._parse_course, extra_request_params={"include_hidden_course_runs": 1})
-        # fetch programs
-        self.fetch_resource(self.PROGRAM, self._parse_program)
-        # fetch pathways
-        self.fetch_resource(self.PATHWAY, self._parse_pathway)
+        with timed_operation("catalog_sync"):
+            # fetch organizations
+            self.fetch_resource(self.ORGANIZATION, self._parse_organization)
+            # fetch courses_and_course_runs
+            self.fetch_resource(self.COURSE, self._parse_course, extra_request_params={"include_hidden_course_runs": 1})
+            # fetch programs
+            self.fetch_resource(self.PROGRAM, self._parse_program)
+            # fetch pathways
+            self.fetch_resource(self.PATHWAY, self._parse_pathway)
         logger.info("Finished copying pathways.")
         return self._log_and_return_changes()
 
@@ -114,11 +116,13 @@ class CatalogDataSynchronizer:
         Returns:
             None
         """
-        for model_type, dataset in self.existing_data.items():
-            removed = self.existing_data_sets[model_type] - self.updated_data_sets[model_type]
-            if removed:
-                logger.info(f"Removing the following {model_type} UUIDs: {removed}")
-                dataset.filter(uuid__in=removed).delete()
+        with timed_operation("catalog_obsolete_data_removal"):
+            for model_type, dataset in self.existing_data.items():
+                removed = self.existing_data_sets[model_type] - self.updated_data_sets[model_type]
+                if removed:
+                    logger.info(f"Removing the following {model_type} UUIDs: {removed}")
+                    with timed_stage(model_type):
+                        dataset.filter(uuid__in=removed).delete()
 
     def fetch_resource(self, resource_name, parse_method, extra_request_params=None):
         """
@@ -138,15 +142,19 @@ class CatalogDataSynchronizer:
         resource_url = urljoin(self.catalog_api_url, f"{resource_name}/")
         next_page = 1
         while next_page:
-            response = self.api_client.get(
-                resource_url,
-                params=dict({"exclude_utm": 1, "page": next_page, "page_size": self.page_size}, **extra_request_params),
-            )
-            response.raise_for_status()
-            data = response.json()
-            for resource in data["results"]:
-                logger.info(f'Copying {resource_name} "{resource["uuid"]}"')
-                parse_method(resource)
+            with timed_stage(f"{resource_name}_api"):
+                response = self.api_client.get(
+                    resource_url,
+                    params=dict(
+                        {"exclude_utm": 1, "page": next_page, "page_size": self.page_size}, **extra_request_params
+                    ),
+                )
+                response.raise_for_status()
+                data = response.json()
+            with timed_stage(f"{resource_name}_parsing"):
+                for resource in data["results"]:
+                    logger.info(f'Copying {resource_name} "{resource["uuid"]}"')
+                    parse_method(resource)
 
             next_page = next_page + 1 if data["next"] else None
 
@@ -2,8 +2,13 @@
 
 from django.contrib import admin, messages
 from django.contrib.auth.admin import UserAdmin
+from django.core.paginator import Paginator
+from django.db import connection
+from django.db.models import QuerySet
+from django.utils.functional import cached_property
 from django.utils.translation import gettext_lazy as _
 
+from credentials.apps.core.api import clear_user_identity_cache
 from credentials.apps.core.forms import SiteConfigurationAdminForm
 from credentials.apps.core.models import SiteConfiguration, User
 
@@ -17,11 +22,16 @@ class ChangeUserStatusAdminMixin:
     * add_is_superuser_to_selected, remove_is_superuser_from_selected
     """
 
+    def update_selected(self, queryset, **kwargs):
+        """Update the selected entries, dropping their cached identities."""
+        clear_user_identity_cache(*queryset.values_list("username", flat=True))
+        queryset.update(**kwargs)
+
     @admin.action(description=_("Activate selected entries"))
     def activate_selected(self: admin.ModelAdmin, request, queryset):
         """Activate the selected entries."""
         count = queryset.count()
-        queryset.update(is_active=True)
+        self.update_selected(queryset, is_active=True)
         model_name = self.__class__.__name__
 
         if count == 1:
@@ -35,7 +45,7 @@ class ChangeUserStatusAdminMixin:
     def deactivate_selected(self: admin.ModelAdmin, request, queryset):
         """Deactivate the selected entries."""
         count = queryset.count()
-        queryset.update(is_active=False)
+        self.update_selected(queryset, is_active=False)
         model_name = self.__class__.__name__
 
         if count == 1:
@@ -49,7 +59,7 @@ class ChangeUserStatusAdminMixin:
     def add_is_staff_to_selected(self: admin.ModelAdmin, request, queryset):
         """Add is_staff to selected entries."""
         count = queryset.count()
-        queryset.update(is_staff=True)
+        self.update_selected(queryset, is_staff=True)
         model_name = self.__class__.__name__
 
         if count == 1:
@@ -63,7 +73,7 @@ class ChangeUserStatusAdminMixin:
     def remove_is_staff_from_selected(self: admin.ModelAdmin, request, queryset):
         """Remove is_staff from selected entries."""
         count = queryset.count()
-        queryset.update(is_staff=False)
+        self.update_selected(queryset, is_staff=False)
         model_name = self.__class__.__name__
 
         if count == 1:
@@ -77,7 +87,7 @@ class ChangeUserStatusAdminMixin:
     def add_is_superuser_to_selected(self: admin.ModelAdmin, request, queryset):
         """Add is_superuser to selected entries."""
         count = queryset.count()
-        queryset.update(is_superuser=True)
+        self.update_selected(queryset, is_superuser=True)
         model_name = self.__class__.__name__
 
         if count == 1:
@@ -91,7 +101,7 @@ class ChangeUserStatusAdminMixin:
     def remove_is_superuser_from_selected(self: admin.ModelAdmin, request, queryset):
         """Remove is_superuser from selected entries."""
         count = queryset.count()
-        queryset.update(is_superuser=False)
+        self.update_selected(queryset, is_superuser=False)
         model_name = self.__class__.__name__
         WARNING = (
             "NOTE: This only toggles the is_superuser status flag. "
@@ -108,6 +118,59 @@ class ChangeUserStatusAdminMixin:
         self.message_user(request, WARNING, level=messages.WARNING)
 
 
+class EstimatedCountPaginator(Paginator):
+    """
+    Paginator which counts the rows of big unfiltered tables from the database statistics (as an estimation).
+
+    An exact `COUNT(*)` scans the whole table, which takes too long for the tables with millions of rows. Filtered
+    changelists (searches and filters) are still counted exactly.
+    """
+
+    # smaller tables are counted exactly, their statistics may be outdated:
+    estimation_threshold = 100000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        if isinstance(queryset, QuerySet) and not queryset.query.where:
+            estimated_count = get_estimated_count(queryset.model)
+            if estimated_count is not None and estimated_count > self.estimation_threshold:
+                return estimated_count
+        return super().count
+
+
+def get_estimated_count(model):
+    """
+    Estimated rows count of the model table (from the database statistics), none if it isn't available.
+    """
+    db_table = model._meta.db_table
+    with connection.cursor() as cursor:
+        if connection.vendor == "mysql":
+            cursor.execute(
+                "SELECT TABLE_ROWS FROM information_schema.TABLES WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s",
+                [db_table],
+            )
+        elif connection.vendor == "postgresql":
+            cursor.execute("SELECT reltuples::bigint FROM pg_class WHERE relname = %s", [db_table])
+        else:
+            return None
+        row = cursor.fetchone()
+
+    return row[0] if row else None
+
+
+class ScalableChangeListAdminMixin:
+    """
+    Keeps the changelist latency of big tables flat: the rows are counted with the estimation (see
+    `EstimatedCountPaginator`) and the unfiltered total isn't counted for the filtered changelists.
+
+    Use prefix (`^`) or exact (`=`) lookups in `search_fields`, so the searches use the indices.
+    """
+
+    paginator = EstimatedCountPaginator
+    show_full_result_count = False
+
+
 @admin.register(User)
 class CustomUserAdmin(ChangeUserStatusAdminMixin, UserAdmin):
     """Admin configuration for the custom User model."""
@@ -128,6 +191,12 @@ class CustomUserAdmin(ChangeUserStatusAdminMixin, UserAdmin):
         (_("Important dates"), {"fields": ("last_login", "date_joined")}),
     )
 
+    def save_model(self, request, obj, form, change):
+        super().save_model(request, obj, form, change)
+        # the cached identity of the new username is dropped on save, the old one has to be dropped explicitly
+        if change and "username" in form.changed_data:
+            clear_user_identity_cache(form.initial["username"])
+
 
 @admin.register(SiteConfiguration)
 class SiteConfigurationAdmin(admin.ModelAdmin):
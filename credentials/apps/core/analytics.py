@@ -0,0 +1,90 @@
+"""
+Process-wide Segment analytics clients.
+
+Every Segment client starts its own consumer thread and queue, so a client is created once per write key (site) and
+shared by all the requests of the process. Events are uploaded in batches from a bounded queue: when the queue is full,
+events are dropped (and reported) instead of blocking the request.
+"""
+
+import logging
+import threading
+
+from django.conf import settings
+from edx_django_utils.monitoring import increment, set_custom_attribute
+from segment.analytics.client import Client as SegmentClient
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SEGMENT_CLIENT_CONFIG = {
+    "MAX_QUEUE_SIZE": 10000,
+    "UPLOAD_SIZE": 100,
+    "UPLOAD_INTERVAL": 0.5,
+    "SEND": True,
+}
+
+_clients = {}
+_clients_lock = threading.Lock()
+
+
+class PooledSegmentClient(SegmentClient):
+    """
+    Segment client which reports its queue depth and the dropped events to monitoring.
+    """
+
+    def _enqueue(self, msg):
+        queued, msg = super()._enqueue(msg)
+        set_custom_attribute("segment_queue_depth", self.queue.qsize())
+        if not queued:
+            increment("segment_events_dropped")
+        return queued, msg
+
+
+def get_segment_client_config():
+    """
+    Returns Segment clients configuration, see the `SEGMENT_CLIENT_CONFIG` setting.
+    """
+
+    return {**DEFAULT_SEGMENT_CLIENT_CONFIG, **getattr(settings, "SEGMENT_CLIENT_CONFIG", {})}
+
+
+def get_segment_client(write_key):
+    """
+    Returns the shared Segment client for the write key.
+
+    Arguments:
+        write_key (str): Segment write key of a site.
+
+    Returns:
+        PooledSegmentClient: or None if the write key is not configured.
+    """
+
+    if not write_key:
+        return None
+
+    with _clients_lock:
+        if write_key not in _clients:
+            config = get_segment_client_config()
+            _clients[write_key] = PooledSegmentClient(
+                write_key=write_key,
+                max_queue_size=config["MAX_QUEUE_SIZE"],
+                upload_size=config["UPLOAD_SIZE"],
+                upload_interval=config["UPLOAD_INTERVAL"],
+                send=config["SEND"],
+            )
+        return _clients[write_key]
+
+
+def shutdown_segment_clients():
+    """
+    Flushes the queued events and stops all the shared Segment clients (e.g. on the worker exit).
+    """
+
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        try:
+            client.shutdown()
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Failed to flush Segment events")
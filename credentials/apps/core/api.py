@@ -2,9 +2,14 @@
 Python APIs exposed by the core Django app.
 """
 
+import hashlib
 import logging
+from functools import partial
 
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.db import transaction
+from edx_django_utils.cache import TieredCache
 from openedx_events.learning.data import UserData
 
 User = get_user_model()
@@ -29,11 +34,46 @@ def get_user_by_username(username):
         return None
 
 
+def _get_user_identity_cache_key(username):
+    return "core.user.identity.{}".format(hashlib.md5(username.encode("utf8")).hexdigest())
+
+
+def _get_user_identity_hash(user_data):
+    identity = "|".join(
+        str(value)
+        for value in (
+            user_data.id,
+            user_data.pii.username,
+            user_data.pii.email,
+            user_data.pii.name,
+            user_data.is_active,
+        )
+    )
+    return hashlib.md5(identity.encode("utf8")).hexdigest()
+
+
+def clear_user_identity_cache(*usernames):
+    """
+    Utility function that drops the cached identities (see `get_or_create_user_from_event_data`) of the given users.
+    Must be called whenever a User is changed without model signals being sent (e.g. with `QuerySet.update()`).
+
+    Args:
+        usernames (String): The usernames of the User instances which cached identities should be dropped
+    """
+    for username in usernames:
+        TieredCache.delete_all_tiers(_get_user_identity_cache_key(username))
+
+
 def get_or_create_user_from_event_data(user_data):
     """
     Utility function to retrieve a User instance while processing event bus events. If the user does not exist, we will
     create a new User instance using data from the event the Credentials IDA is currently processing.
 
+    The resolved User instance is cached (both per request and in the shared cache) for the duration of
+    USER_IDENTITY_CACHE_TTL (in seconds) together with a hash of the event's user data. The cached instance is used
+    only while the incoming user data matches that hash, so events of the same learner don't hit the database again.
+    The instance is cached once the caller's transaction is committed, so a rolled back user is never served.
+
     Args:
         user_data (UserData): The learner's data extracted from the event bus event being processed
 
@@ -45,6 +85,12 @@ def get_or_create_user_from_event_data(user_data):
         logger.error("Received null or unexpected data type when attempting to retrieve User information")
         return None, None
 
+    cache_key = _get_user_identity_cache_key(user_data.pii.username)
+    identity_hash = _get_user_identity_hash(user_data)
+    cached_response = TieredCache.get_cached_response(cache_key)
+    if cached_response.is_found and cached_response.value["identity_hash"] == identity_hash:
+        return cached_response.value["user"], False
+
     try:
         # create the user if they don't exist, this follows similar behavior that our JWT authentication implements if
         # a user doesn't exist when we're making network calls across services
@@ -61,4 +107,14 @@ def get_or_create_user_from_event_data(user_data):
         user.email = user_data.pii.email
         user.save()
 
+    if settings.USER_IDENTITY_CACHE_TTL:
+        transaction.on_commit(
+            partial(
+                TieredCache.set_all_tiers,
+                cache_key,
+                {"user": user, "identity_hash": identity_hash},
+                settings.USER_IDENTITY_CACHE_TTL,
+            )
+        )
+
     return user, created
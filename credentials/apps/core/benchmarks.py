@@ -0,0 +1,206 @@
+"""
+Load benchmarks of the hot endpoints and event handlers, run against the scale data (see `scale_data`).
+
+Every benchmark is run a number of times in-process (with the Django test client for the endpoints), the latencies
+and the database query counts of the runs are reported. The event handlers write, their runs are rolled back.
+"""
+
+import logging
+import time
+
+from django.conf import settings
+from django.contrib.sites.models import Site
+from django.db import connection, transaction
+from django.test import Client, override_settings
+from django.test.utils import CaptureQueriesContext
+from opaque_keys.edx.keys import CourseKey
+
+from credentials.apps.badges.toggles import is_badges_enabled
+from credentials.apps.core.models import User
+from credentials.apps.core.scale_data import get_learner_username, get_site_domain
+from credentials.apps.core.utils import percentile
+from credentials.apps.credentials.constants import UserCredentialStatus
+from credentials.apps.credentials.models import ProgramCertificate, UserCredential
+from credentials.apps.verifiable_credentials.toggles import is_verifiable_credentials_enabled
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ITERATIONS = 20
+PERCENTILES = (50, 90, 99)
+
+
+class BenchmarkError(Exception):
+    """Raised when the benchmarks can't be run."""
+
+
+class BenchmarkContext:
+    """
+    The scale data the benchmarks are run against: a site of a seed and its learner with a program certificate.
+    """
+
+    def __init__(self, seed, site_index=0):
+        domain = get_site_domain(seed, site_index)
+        self.site = Site.objects.filter(domain=domain).first()
+        if self.site is None:
+            raise BenchmarkError(f"No scale data is generated for the seed [{seed}] (site [{domain}])")
+
+        self.user_credential = (
+            UserCredential.objects.filter(
+                username__startswith=get_learner_username(seed, site_index, ""),
+                program_credentials__site=self.site,
+                status=UserCredentialStatus.AWARDED,
+            )
+            .order_by("id")
+            .first()
+        )
+        if self.user_credential is None:
+            raise BenchmarkError(f"No program certificates are generated for the site [{domain}]")
+
+        self.learner = User.objects.get(username=self.user_credential.username)
+        self.program = (
+            ProgramCertificate.objects.select_related("program").get(pk=self.user_credential.credential_id).program
+        )
+        self.course_runs = list(self.program.course_runs.all())
+        self.staff, _ = User.objects.get_or_create(
+            username=f"scale_{seed}_staff", defaults={"is_staff": True, "is_superuser": True}
+        )
+
+        self.learner_client = Client(HTTP_HOST=domain)
+        self.learner_client.force_login(self.learner)
+        self.staff_client = Client(HTTP_HOST=domain)
+        self.staff_client.force_login(self.staff)
+
+
+def program_records_list(context):
+    return context.learner_client.get("/records/api/v1/program_records/")
+
+
+def program_record_detail(context):
+    return context.learner_client.get(f"/records/api/v1/program_records/{context.program.uuid}/")
+
+
+def bulk_learner_cert_status(context):
+    return context.staff_client.post(
+        "/api/credentials/v1/bulk_learner_cert_status/",
+        [{"username": context.learner.username, "course_runs": [course_run.key for course_run in context.course_runs]}],
+        content_type="application/json",
+    )
+
+
+def credentials_list(context):
+    return context.staff_client.get("/api/v2/credentials/", {"username": context.learner.username})
+
+
+def status_list(context):
+    # pylint: disable=import-outside-toplevel
+    from credentials.apps.verifiable_credentials.issuance.models import IssuanceLine
+
+    return context.learner_client.get(
+        f"/verifiable_credentials/api/v1/status-list/2021/v1/{IssuanceLine.resolve_issuer().issuer_id}/"
+    )
+
+
+def certificate_render(context):
+    return context.learner_client.get(f"/credentials/{context.user_credential.uuid.hex}/")
+
+
+def course_credential_update(context):
+    # pylint: disable=import-outside-toplevel
+    from credentials.apps.credentials.api import process_course_credential_update
+
+    with transaction.atomic():
+        process_course_credential_update(
+            context.learner, context.course_runs[0].key, "verified", UserCredentialStatus.REVOKED
+        )
+        transaction.set_rollback(True)
+
+
+def badges_course_passing_event(context):
+    # pylint: disable=import-outside-toplevel
+    from openedx_events.learning.data import CourseData, CoursePassingStatusData, UserData, UserPersonalData
+    from openedx_events.learning.signals import COURSE_PASSING_STATUS_UPDATED
+
+    from credentials.apps.badges.processing.generic import process_event
+
+    payload = CoursePassingStatusData(
+        is_passing=True,
+        course=CourseData(course_key=CourseKey.from_string(context.course_runs[0].key)),
+        user=UserData(
+            id=context.learner.id,
+            is_active=True,
+            pii=UserPersonalData(
+                username=context.learner.username, email=context.learner.email, name=context.learner.full_name
+            ),
+        ),
+    )
+    with transaction.atomic():
+        process_event(COURSE_PASSING_STATUS_UPDATED, course_passing_status=payload)
+        transaction.set_rollback(True)
+
+
+BENCHMARKS = {
+    "program_records_list": program_records_list,
+    "program_record_detail": program_record_detail,
+    "bulk_learner_cert_status": bulk_learner_cert_status,
+    "credentials_list": credentials_list,
+    "status_list": status_list,
+    "certificate_render": certificate_render,
+    "course_credential_update": course_credential_update,
+    "badges_course_passing_event": badges_course_passing_event,
+}
+
+
+def get_available_benchmarks():
+    names = list(BENCHMARKS)
+    if not is_verifiable_credentials_enabled():
+        names.remove("status_list")
+    if not is_badges_enabled():
+        names.remove("badges_course_passing_event")
+    return names
+
+
+def run_benchmarks(seed, site_index=0, names=None, iterations=DEFAULT_ITERATIONS):
+    """
+    Runs the benchmarks against the scale data of the seed.
+
+    Arguments:
+        seed (int): the scale data seed.
+        site_index (int): the scale data site.
+        names (list): benchmarks to run (see `BENCHMARKS`), all the available ones by default.
+        iterations (int): runs of every benchmark, the first (warm-up) run isn't measured.
+
+    Returns:
+        list: a dict per benchmark with the "name", the latency percentiles and the maximum (in milliseconds) and the
+            "queries" per run (the maximum).
+    """
+    unknown = set(names or []) - set(BENCHMARKS)
+    if unknown:
+        raise BenchmarkError(f"Unknown benchmarks: {sorted(unknown)}")
+
+    context = BenchmarkContext(seed, site_index)
+    results = []
+    with override_settings(ALLOWED_HOSTS=[context.site.domain, *settings.ALLOWED_HOSTS]):
+        for name in names or get_available_benchmarks():
+            benchmark = BENCHMARKS[name]
+            benchmark(context)
+
+            latencies, queries = [], []
+            for _ in range(iterations):
+                with CaptureQueriesContext(connection) as captured:
+                    started = time.perf_counter()
+                    response = benchmark(context)
+                    latencies.append((time.perf_counter() - started) * 1000)
+                queries.append(len(captured))
+                if response is not None and response.status_code >= 400:
+                    raise BenchmarkError(f"Benchmark [{name}] failed with the status [{response.status_code}]")
+
+            result = {
+                "name": name,
+                **{f"p{percent}": round(percentile(latencies, percent), 2) for percent in PERCENTILES},
+                "max": round(max(latencies), 2),
+                "queries": max(queries),
+            }
+            logger.info("Benchmark results: %s", result)
+            results.append(result)
+
+    return results
@@ -0,0 +1,239 @@
+"""
+Read replica routing of the read-only views, event handlers and management command scans.
+
+When READ_REPLICA_DATABASE names a database alias (routing is disabled when it isn't set), the reads of the blocks of
+code which declare it are sent to that replica by `ReadReplicaRouter`, the writes always go to the primary (default)
+database:
+    - view classes (for the given HTTP methods) and functions (views, event handlers, management command handlers)
+      declare it with the `read_replica` decorator;
+    - any block of code with the `use_read_replica` context manager, and the steps of long scans (e.g. batches of
+      users) with `iter_from_read_replica`.
+The blocks whose reads must be fresh (e.g. building data cached until it changes) opt out with `use_primary_database`.
+
+Read-your-writes protection:
+    - once a block writes, its later reads go to the primary database;
+    - once a request writes, the client is pinned (by the READ_REPLICA_PIN_COOKIE_NAME cookie) to the primary database
+      for READ_REPLICA_PIN_SECONDS, so its next requests read what it wrote even while the replica lags behind;
+    - the clients authenticated by an `Authorization` header (e.g. JWT service clients) may not send the cookie back,
+      the views they read from right after writing (e.g. the credentials API) keep them on the primary database.
+"""
+
+import functools
+import re
+import threading
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+from credentials.apps.core.query_budget import get_view_class
+
+READ_METHODS = ("GET", "HEAD", "OPTIONS")
+READ_REPLICA_PIN_COOKIE_NAME = "credentials_read_primary"
+WRITE_REGEX = re.compile(r"\s*(INSERT|UPDATE|DELETE|REPLACE)\b", re.IGNORECASE)
+
+_local = threading.local()
+
+
+class ReadReplicaState:
+    """
+    Routing state of a request or of a block of code (see `use_read_replica`).
+    """
+
+    def __init__(self, active=False, pinned=False):
+        # reads are sent to the replica while the state is active and not pinned
+        self.active = active
+        self.pinned = pinned
+        self.wrote = False
+
+    def __call__(self, execute, sql, params, many, context):  # pylint: disable=too-many-positional-arguments
+        # execute wrapper of the primary database connection
+        if not self.wrote and WRITE_REGEX.match(sql):
+            self.wrote = self.pinned = True
+        return execute(sql, params, many, context)
+
+    @property
+    def uses_replica(self):
+        return self.active and not self.pinned
+
+
+def get_read_replica_database():
+    """
+    The alias of the replica database, None if the routing is disabled.
+    """
+    return settings.READ_REPLICA_DATABASE or None
+
+
+def _get_state():
+    return getattr(_local, "state", None)
+
+
+@contextmanager
+def _enter_state(state):
+    previous = _get_state()
+    _local.state = state
+    try:
+        with connections[DEFAULT_DB_ALIAS].execute_wrapper(state):
+            yield state
+    finally:
+        _local.state = previous
+        if previous is not None and state.wrote:
+            previous.wrote = previous.pinned = True
+
+
+@contextmanager
+def use_read_replica():
+    """
+    Sends the reads of the block to the replica, until the block writes.
+
+    Yields:
+        ReadReplicaState: the routing state, None if the routing is disabled.
+    """
+    if not get_read_replica_database():
+        yield None
+        return
+
+    current = _get_state()
+    if current is not None and current.active:
+        # nested block, the state (and its pin) is shared
+        yield current
+        return
+
+    with _enter_state(ReadReplicaState(active=True, pinned=bool(current and current.pinned))) as state:
+        yield state
+
+
+@contextmanager
+def use_primary_database():
+    """
+    Sends the reads of the block to the primary database, even within a block using the replica.
+    """
+    if not get_read_replica_database():
+        yield
+        return
+
+    with _enter_state(ReadReplicaState(pinned=True)):
+        yield
+
+
+def iter_from_read_replica(iterable):
+    """
+    Iterates with each step (but not the code consuming the items) reading from the replica, e.g. the batches of a
+    scan which writes between the batches.
+    """
+    iterator = iter(iterable)
+    while True:
+        with use_read_replica():
+            try:
+                item = next(iterator)
+            except StopIteration:
+                return
+        yield item
+
+
+def read_replica(methods=READ_METHODS, token_clients=True):
+    """
+    Declares that a view class (routed by `ReadReplicaMiddleware`) or a function (a view, an event handler or a
+    management command handler, routed on every call with `use_read_replica`) can read from the replica.
+
+    Arguments:
+        methods (tuple): the HTTP methods of the requests to the view class which read from the replica.
+        token_clients (bool): whether the requests to the view class authenticated by an `Authorization` header read
+            from the replica (these clients may not send the pin cookie back, so they can't be pinned).
+    """
+
+    def decorator(view_or_function):
+        if isinstance(view_or_function, type):
+            view_or_function.read_replica_methods = methods
+            view_or_function.read_replica_token_clients = token_clients
+            return view_or_function
+
+        @functools.wraps(view_or_function)
+        def wrapper(*args, **kwargs):
+            with use_read_replica():
+                return view_or_function(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def get_view_read_replica_methods(view_func):
+    """
+    The HTTP methods for which the class of the view function (DRF and Django class-based views) declared to read
+    from the replica.
+    """
+    return getattr(get_view_class(view_func), "read_replica_methods", ())
+
+
+def _reads_from_replica(request, view_func):
+    if request.method not in get_view_read_replica_methods(view_func):
+        return False
+    return "HTTP_AUTHORIZATION" not in request.META or get_view_class(view_func).read_replica_token_clients
+
+
+class ReadReplicaRouter:
+    """
+    Sends the reads of the blocks using the replica to the replica. The other reads and the writes of the instances
+    loaded from the replica are sent to the primary database, everything else is left to the default routing.
+    """
+
+    def db_for_read(self, model, **hints):  # pylint: disable=unused-argument
+        database = get_read_replica_database()
+        state = _get_state()
+        if database and state is not None and state.uses_replica:
+            return database
+        return self._get_primary_database(database, **hints)
+
+    def db_for_write(self, model, **hints):  # pylint: disable=unused-argument
+        return self._get_primary_database(get_read_replica_database(), **hints)
+
+    def allow_relation(self, obj1, obj2, **hints):  # pylint: disable=unused-argument
+        # the replica holds the same data as the primary database
+        database = get_read_replica_database()
+        if database and database in (obj1._state.db, obj2._state.db):  # pylint: disable=protected-access
+            return True
+        return None
+
+    def _get_primary_database(self, database, instance=None, **hints):  # pylint: disable=unused-argument
+        # otherwise the instances loaded from the replica would keep using it
+        if database and instance is not None and instance._state.db == database:  # pylint: disable=protected-access
+            return DEFAULT_DB_ALIAS
+        return None
+
+
+class ReadReplicaMiddleware:
+    """
+    Sends the reads of the views declaring it (see `read_replica`) to the replica, pins the clients which wrote to the
+    primary database.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        if not get_read_replica_database():
+            return self.get_response(request)
+
+        state = ReadReplicaState(pinned=bool(request.COOKIES.get(READ_REPLICA_PIN_COOKIE_NAME)))
+        with _enter_state(state):
+            response = self.get_response(request)
+            if response.streaming and state.uses_replica:
+                # the content is produced after the middleware returns
+                response.streaming_content = iter_from_read_replica(response.streaming_content)
+
+        if state.wrote:
+            response.set_cookie(
+                READ_REPLICA_PIN_COOKIE_NAME,
+                "1",
+                max_age=settings.READ_REPLICA_PIN_SECONDS,
+                httponly=True,
+                secure=request.is_secure(),
+                samesite="Lax",
+            )
+        return response
+
+    def process_view(self, request, view_func, view_args, view_kwargs):  # pylint: disable=unused-argument
+        state = _get_state()
+        if state is not None and _reads_from_replica(request, view_func):
+            state.active = True
@@ -0,0 +1,69 @@
+"""Management command to generate the synthetic scale data"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from credentials.apps.core.scale_data import (
+    DEFAULT_BATCH_SIZE,
+    DEFAULT_COMPLETION_RATE,
+    DEFAULT_ISSUANCE_RATE,
+    DEFAULT_SIZES,
+    ScaleDataError,
+    ScaleDataGenerator,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Bulk loads reproducible synthetic sites, catalog, learners, grades and credentials for capacity planning and load
+    benchmarks (see the `run_benchmarks` command).
+
+    Example usage:
+
+    $ ./manage.py generate_scale_data --seed 1
+    $ ./manage.py generate_scale_data --seed 2 --sites 2 --programs 50 --learners 100000
+    """
+
+    help = "Generate synthetic scale data."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--seed", type=int, required=True, help="Random seed, the same seed generates the same data."
+        )
+        for size, default in DEFAULT_SIZES.items():
+            parser.add_argument(
+                f"--{size}", type=int, default=default, help=f"Number of {size.replace('_', ' ')} (per site)."
+            )
+        parser.add_argument(
+            "--completion_rate",
+            type=float,
+            default=DEFAULT_COMPLETION_RATE,
+            help="Share of the learner programs which are completed.",
+        )
+        parser.add_argument(
+            "--issuance_rate",
+            type=float,
+            default=DEFAULT_ISSUANCE_RATE,
+            help="Share of the program certificates with a verifiable credential issuance line.",
+        )
+        parser.add_argument(
+            "--batch_size", type=int, default=DEFAULT_BATCH_SIZE, help="Number of records inserted at once."
+        )
+
+    def handle(self, *args, **options):
+        generator = ScaleDataGenerator(
+            options["seed"],
+            sizes={size: options[size] for size in DEFAULT_SIZES},
+            completion_rate=options["completion_rate"],
+            issuance_rate=options["issuance_rate"],
+            batch_size=options["batch_size"],
+        )
+        try:
+            stats = generator.generate()
+        except ScaleDataError as exc:
+            raise CommandError(str(exc)) from exc
+
+        logger.info(f"...completed! Generated scale data for the seed [{options['seed']}]: {stats}")
@@ -9,14 +9,14 @@ that one direction.
 """
 
 import logging
-import time
-from typing import TYPE_CHECKING, Dict, List
-from urllib.parse import urljoin
+from functools import partial
+from typing import TYPE_CHECKING, Optional
 
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
 
 from credentials.apps.core.models import SiteConfiguration
+from credentials.apps.core.user_sync import DEFAULT_BATCH_SIZE, DEFAULT_MAX_WORKERS, sync_users
 
 if TYPE_CHECKING:
     from django.contrib.auth.models import AbstractUser
@@ -28,29 +28,43 @@ User = get_user_model()
 class Command(BaseCommand):
     def add_arguments(self, parser):
         parser.add_argument(
-            "--batch_size", type=int, default=10, help="Number of IDs to process at a time. Default %(default)"
+            "--batch_size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help="Number of IDs to process at a time. Default %(default)s",
         )
         parser.add_argument(
-            "--pause_secs", type=int, default=1, help="Number of seconds to pause between calls. Default %(default)"
+            "--max_workers",
+            type=int,
+            default=DEFAULT_MAX_WORKERS,
+            help="Number of concurrent calls. Default %(default)s",
+        )
+        parser.add_argument(
+            "--pause_secs",
+            type=float,
+            default=1,
+            help="Number of seconds to pause between rounds of concurrent calls. Default %(default)s",
+        )
+        parser.add_argument(
+            "--checkpoint_file",
+            default=None,
+            help="File to save the progress to, and to resume from. The users are processed from scratch if not given",
         )
         parser.add_argument("--verbose", action="store_true", help="Log each update")
         parser.add_argument(
-            "--site_id", type=int, default=0, help="ORM id of the site to query for lms_user_ids. Default %(default)"
+            "--site_id", type=int, default=0, help="ORM id of the site to query for lms_user_ids. Default %(default)s"
         )
         parser.add_argument("--dry_run", action="store_true", help="Don't actually change the data")
 
     def handle(self, *args, **options):
         """
-        Get batches of user info from accounts and update the lms_user_id
-        for users who are missing it.
+        Get batches of user info from accounts and activate the inactive users
+        who are active on the LMS.
         """
         logger.info("Beginning is_active matching.")
-        inactive_credentials_users = User.objects.filter(is_active=False)
-        count_users = inactive_credentials_users.count()
-        offset = options.get("batch_size")
-        pause = options.get("pause_secs")
-        verbosity = options.get("verbose")
+        inactive_credentials_users = User.objects.filter(is_active=False).only("id", "username", "lms_user_id")
         site_id = options.get("site_id")
+        verbose = options.get("verbose")
         dry_run = options.get("dry_run")
 
         site_configs = SiteConfiguration.objects.first()
@@ -60,63 +74,42 @@ class Command(BaseCommand):
             site_configs = SiteConfiguration.objects.get(site__id=site_id)
         logger.info(f"using {site_configs.site.domain} for user queries")
 
-        # loop over users in batches
-        logger.warning(f"Start processing {count_users} inactive Credentials user accounts")
-        for x in range(0, count_users, offset):
-            slice_size = min(count_users, x + offset)
-            curr_users = inactive_credentials_users[x:slice_size]
-            is_active_statuses = self.get_is_active(curr_users, site_configs)
-            for user in curr_users:
-                if user.username not in is_active_statuses:
-                    logger.error(f"Could not get is_active for user with lms_user_id {user.lms_user_id}")
-                elif user.is_active != is_active_statuses[user.username]:
-                    self.enable_user(user, verbosity, dry_run)
-            if x + slice_size < count_users:
-                time.sleep(pause)
-
-        logger.info("Finished is_active matching.")
-
-    def get_is_active(
-        self,
-        users: List["AbstractUser"],
-        site_config: SiteConfiguration,
-    ) -> Dict[str, bool]:
-        """Get is_active status from the LMS for a list of users.
-
-        Args:
-            users: List of user objects
-            site_config: SiteConfiguration object of Site to query
+        logger.warning("Start processing inactive Credentials user accounts")
+        report = sync_users(
+            inactive_credentials_users,
+            site_configs,
+            partial(self.enable_user, verbose=verbose, dry_run=dry_run),
+            ["is_active"],
+            batch_size=options.get("batch_size"),
+            max_workers=options.get("max_workers"),
+            pause_secs=options.get("pause_secs"),
+            checkpoint_file=options.get("checkpoint_file"),
+            dry_run=dry_run,
+        )
 
-        Returns:
-            a dict of form { username[str]: is_active[bool] }
-        """
-        query_param_names = ",".join(user.username for user in users)
-        user_url = urljoin(site_config.user_api_url, f"accounts?username={query_param_names}")
-        user_response = site_config.api_client.get(user_url)
-
-        user_dict = {}
-        if user_response.status_code == 200:
-            user_data = user_response.json()
-            for user_profile in user_data:
-                user_dict[user_profile["username"]] = user_profile["is_active"]
-        else:
-            logger.error(
-                f"{urljoin(site_config.user_api_url, 'accounts?username=')}[usernames redacted]"
-                f"returned status {user_response.status_code}"
-            )
-
-        return user_dict
-
-    def enable_user(self, user: "AbstractUser", verbosity: bool, dry_run: bool) -> None:
-        """Update the is_active status for the user.
+        logger.info(
+            f"Finished is_active matching: processed {report['processed']}, activated {report['updated']}, "
+            f"failed {report['failed']}."
+        )
+
+    def enable_user(
+        self, user: "AbstractUser", account: Optional[dict], verbose: bool = False, dry_run: bool = False
+    ) -> bool:
+        """Set the is_active status for the user if the LMS user is active.
 
         Although this management command is written to only update from False to True,
 
+        Returns:
+            True if the user has been changed.
         """
+        if account is None:
+            logger.error(f"Could not get is_active for user with lms_user_id {user.lms_user_id}")
+            return False
+        if not account["is_active"]:
+            return False
+
         user.is_active = True
-        dry_run_msg = "(dry run) " if dry_run else ""
-        if verbosity:
+        if verbose:
+            dry_run_msg = "(dry run) " if dry_run else ""
             logger.info(f"{dry_run_msg}Setting user with lms_user_id {user.lms_user_id} to active status")
-        # use update_fields to just update this one piece of data
-        if not dry_run:
-            user.save(update_fields=["is_active"])
+        return True
@@ -0,0 +1,36 @@
+"""Management command to process the background username replacement jobs"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from credentials.apps.core.username_replacement import (
+    process_username_replacement_jobs,
+    purge_username_replacement_jobs,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Processes pending username replacement jobs (large requests to the username replacement API), then purges the jobs
+    processed before the retention period (USERNAME_REPLACEMENT setting).
+
+    Example usage:
+
+    $ ./manage.py process_username_replacement_jobs
+    $ ./manage.py process_username_replacement_jobs --limit 1
+    """
+
+    help = "Process pending username replacement jobs."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--limit", type=int, default=None, help="Maximum number of processed jobs. All pending jobs by default."
+        )
+
+    def handle(self, *args, **options):
+        total = process_username_replacement_jobs(limit=options.get("limit"))
+        purged = purge_username_replacement_jobs()
+        logger.info(f"...completed! Processed {total} username replacement jobs, purged {purged} processed jobs.")
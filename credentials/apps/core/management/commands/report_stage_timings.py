@@ -0,0 +1,74 @@
+"""Management command to aggregate the stage timings of captured logs"""
+
+import logging
+import sys
+from collections import defaultdict
+
+from django.core.management.base import BaseCommand, CommandError
+
+from credentials.apps.core.timing import parse_stage_timings
+from credentials.apps.core.utils import percentile
+
+logger = logging.getLogger(__name__)
+
+PERCENTILES = (50, 90, 99)
+
+
+class Command(BaseCommand):
+    """
+    Aggregates the stage timings (see `credentials.apps.core.timing`) of captured logs: prints, per operation and
+    stage, the number of the timed runs, the duration percentiles and maximum (in milliseconds) and the share of the
+    total operation time.
+
+    Example usage:
+
+    $ ./manage.py report_stage_timings /var/log/credentials/*.log
+    $ kubectl logs credentials-worker | ./manage.py report_stage_timings - --operation badges_event
+    """
+
+    help = "Aggregate the stage timings of captured logs."
+
+    def add_arguments(self, parser):
+        parser.add_argument("paths", nargs="+", help="Log files to read, '-' reads the standard input.")
+        parser.add_argument(
+            "--operation", action="append", dest="operations", help="Operation to report (repeatable), all by default."
+        )
+
+    def handle(self, *args, **options):
+        durations = defaultdict(lambda: defaultdict(list))
+        for path in options["paths"]:
+            try:
+                self._read(path, durations, options["operations"])
+            except OSError as exc:
+                raise CommandError(f"Can't read the log file [{path}]: {exc}") from exc
+
+        if not durations:
+            logger.info("No stage timings found.")
+            return
+
+        header = f"{'operation':<35}{'stage':<30}{'count':>8}" + "".join(f"{f'p{p}':>10}" for p in PERCENTILES)
+        self.stdout.write(f"{header}{'max':>10}{'share':>8}")
+        for operation, stages in sorted(durations.items()):
+            total = sum(stages["total"])
+            for stage, values in sorted(stages.items(), key=lambda item: (item[0] != "total", -sum(item[1]))):
+                self.stdout.write(
+                    f"{operation:<35}{stage:<30}{len(values):>8}"
+                    + "".join(f"{percentile(values, percent):>10.2f}" for percent in PERCENTILES)
+                    + f"{max(values):>10.2f}{sum(values) / total if total else 0:>8.1%}"
+                )
+
+    def _read(self, path, durations, operations):
+        if path == "-":
+            self._read_lines(sys.stdin, durations, operations)
+            return
+        with open(path, encoding="utf-8", errors="replace") as log_file:
+            self._read_lines(log_file, durations, operations)
+
+    def _read_lines(self, lines, durations, operations):
+        for line in lines:
+            parsed = parse_stage_timings(line)
+            if parsed is None or (operations and parsed[0] not in operations):
+                continue
+            operation, timings = parsed
+            for stage, duration in timings.items():
+                durations[operation][stage].append(duration)
@@ -0,0 +1,53 @@
+"""Management command to run the load benchmarks against the scale data"""
+
+import logging
+
+from django.core.management.base import BaseCommand, CommandError
+
+from credentials.apps.core.benchmarks import BENCHMARKS, DEFAULT_ITERATIONS, BenchmarkError, run_benchmarks
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Runs the hot endpoints and event handlers against the scale data generated with the `generate_scale_data` command,
+    prints their latency percentiles (in milliseconds) and query counts.
+
+    Example usage:
+
+    $ ./manage.py run_benchmarks --seed 1
+    $ ./manage.py run_benchmarks --seed 1 --iterations 100 --benchmark program_records_list --benchmark credentials_list
+    """
+
+    help = "Run the load benchmarks against the scale data."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--seed", type=int, required=True, help="Seed the scale data was generated with.")
+        parser.add_argument("--site_index", type=int, default=0, help="Scale data site to run the benchmarks on.")
+        parser.add_argument(
+            "--benchmark",
+            action="append",
+            choices=list(BENCHMARKS),
+            dest="benchmarks",
+            help="Benchmark to run (repeatable), all the available ones by default.",
+        )
+        parser.add_argument(
+            "--iterations", type=int, default=DEFAULT_ITERATIONS, help="Number of measured runs of every benchmark."
+        )
+
+    def handle(self, *args, **options):
+        try:
+            results = run_benchmarks(
+                options["seed"],
+                site_index=options["site_index"],
+                names=options["benchmarks"],
+                iterations=options["iterations"],
+            )
+        except BenchmarkError as exc:
+            raise CommandError(str(exc)) from exc
+
+        columns = [column for column in results[0] if column != "name"] if results else []
+        self.stdout.write(f"{'benchmark':<30}" + "".join(f"{column:>10}" for column in columns))
+        for result in results:
+            self.stdout.write(f"{result['name']:<30}" + "".join(f"{result[column]:>10}" for column in columns))
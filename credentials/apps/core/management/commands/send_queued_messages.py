@@ -0,0 +1,56 @@
+"""Management command to deliver the queued ACE messages"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from credentials.apps.core.messaging import purge_queued_messages, send_queued_messages
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Delivers queued ACE messages in batches until the queue is drained, then purges the messages sent or failed before
+    the retention period (ACE_MESSAGE_QUEUE setting).
+
+    Example usage:
+
+    $ ./manage.py send_queued_messages
+    $ ./manage.py send_queued_messages --max_workers 8 --rate_limit 20
+    """
+
+    help = "Deliver queued ACE messages."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--batch_size", type=int, default=100, help="Number of messages delivered at once.")
+        parser.add_argument(
+            "--max_attempts", type=int, default=5, help="Number of delivery attempts before a message is failed."
+        )
+        parser.add_argument(
+            "--max_workers", type=int, default=None, help="Number of concurrent deliveries (ACE_MESSAGE_QUEUE setting)."
+        )
+        parser.add_argument(
+            "--rate_limit",
+            type=float,
+            default=None,
+            help="Maximum number of deliveries per second, 0 disables throttling (ACE_MESSAGE_QUEUE setting).",
+        )
+
+    def handle(self, *args, **options):
+        batch_size = options.get("batch_size")
+
+        total = 0
+        while True:
+            processed_items = send_queued_messages(
+                batch_size=batch_size,
+                max_attempts=options.get("max_attempts"),
+                max_workers=options.get("max_workers"),
+                rate_limit=options.get("rate_limit"),
+            )
+            total += processed_items
+            if processed_items < batch_size:
+                break
+
+        purged = purge_queued_messages()
+        logger.info(f"...completed! Delivered {total} queued messages, purged {purged} processed messages.")
@@ -0,0 +1,121 @@
+"""
+Tests for the generate_scale_data and run_benchmarks management commands
+"""
+
+from io import StringIO
+from unittest import mock
+
+from django.contrib.sites.models import Site
+from django.core.management import CommandError, call_command
+from django.db import transaction
+from django.test import TestCase
+
+from credentials.apps.badges.models import BadgeRequirement, BadgeTemplate, DataRule
+from credentials.apps.catalog.models import CourseRun, Program
+from credentials.apps.core.benchmarks import BenchmarkContext
+from credentials.apps.core.utils import percentile
+from credentials.apps.credentials.models import CourseCertificate, ProgramCertificate, UserCredential
+from credentials.apps.records.models import UserGrade
+
+SIZES = [
+    "--programs=2",
+    "--courses_per_program=2",
+    "--learners=5",
+    "--programs_per_learner=1",
+    "--badge_templates=2",
+    "--requirements_per_template=2",
+    "--batch_size=3",
+]
+
+
+class GenerateScaleDataTests(TestCase):
+    def generate(self, seed, *args):
+        call_command("generate_scale_data", f"--seed={seed}", *SIZES, *args)
+
+    def snapshot(self, seed):
+        site = Site.objects.get(domain=f"scale-{seed}-0.example.com")
+        return {
+            "programs": list(Program.objects.filter(site=site).order_by("id").values_list("title", "uuid")),
+            "course_runs": list(CourseRun.objects.filter(course__site=site).order_by("id").values_list("key", "uuid")),
+            "grades": list(
+                UserGrade.objects.filter(course_run__course__site=site)
+                .order_by("id")
+                .values_list("username", "course_run__key", "percent_grade")
+            ),
+            "credentials": list(
+                UserCredential.objects.filter(username__startswith=f"scale_{seed}_")
+                .order_by("id")
+                .values_list("username", "uuid")
+            ),
+        }
+
+    def test_generate(self):
+        self.generate(1, "--completion_rate=1")
+
+        site = Site.objects.get(domain="scale-1-0.example.com")
+        self.assertTrue(site.siteconfiguration.records_enabled)
+        self.assertEqual(Program.objects.filter(site=site).count(), 2)
+        self.assertEqual(
+            [program.course_runs.count() for program in Program.objects.filter(site=site)],
+            [2, 2],
+        )
+        self.assertEqual(UserGrade.objects.filter(course_run__course__site=site).count(), 5 * 2)
+        # all the programs are completed:
+        self.assertEqual(CourseCertificate.objects.filter(site=site).count(), 4)
+        self.assertEqual(
+            UserCredential.objects.filter(course_credentials__site=site).count()
+            + UserCredential.objects.filter(program_credentials__site=site).count(),
+            5 * 3,
+        )
+        self.assertEqual(BadgeTemplate.objects.filter(site=site, state="active").count(), 2)
+        self.assertEqual(BadgeRequirement.objects.filter(template__site=site).count(), 4)
+        self.assertEqual(DataRule.objects.filter(requirement__template__site=site).count(), 8)
+
+    def test_reproducible(self):
+        with transaction.atomic():
+            self.generate(1)
+            first = self.snapshot(1)
+            transaction.set_rollback(True)
+
+        self.generate(1)
+
+        self.assertEqual(self.snapshot(1), first)
+
+    def test_generated_seed(self):
+        self.generate(1)
+
+        with self.assertRaisesRegex(CommandError, r"seed \[1\] is already generated"):
+            self.generate(1)
+
+    def test_benchmark_context(self):
+        self.generate(2, "--completion_rate=1")
+
+        context = BenchmarkContext(2)
+
+        self.assertEqual(context.site.domain, "scale-2-0.example.com")
+        self.assertTrue(context.learner.username.startswith("scale_2_0_"))
+        self.assertEqual(
+            ProgramCertificate.objects.get(pk=context.user_credential.credential_id).program_id, context.program.id
+        )
+        self.assertEqual(len(context.course_runs), 2)
+
+    def test_run_benchmarks(self):
+        results = [{"name": "credentials_list", "p50": 1.5, "p90": 2.0, "p99": 2.5, "max": 2.5, "queries": 4}]
+        out = StringIO()
+
+        with mock.patch(
+            "credentials.apps.core.management.commands.run_benchmarks.run_benchmarks", return_value=results
+        ) as mock_run:
+            call_command("run_benchmarks", "--seed=1", "--benchmark=credentials_list", "--iterations=5", stdout=out)
+
+        mock_run.assert_called_once_with(1, site_index=0, names=["credentials_list"], iterations=5)
+        self.assertEqual(out.getvalue().splitlines()[1].split(), ["credentials_list", "1.5", "2.0", "2.5", "2.5", "4"])
+
+    def test_run_benchmarks_without_data(self):
+        with self.assertRaisesRegex(CommandError, r"No scale data is generated for the seed \[3\]"):
+            call_command("run_benchmarks", "--seed=3")
+
+    def test_percentile(self):
+        values = list(range(1, 101))
+        self.assertEqual([percentile(values, percent) for percent in (50, 90, 99, 100)], [50, 90, 99, 100])
+        self.assertEqual(percentile([7], 99), 7)
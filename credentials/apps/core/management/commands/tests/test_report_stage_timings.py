@@ -0,0 +1,53 @@
+"""
+Tests for the report_stage_timings management command
+"""
+
+import tempfile
+from io import StringIO
+
+from django.core.management import CommandError, call_command
+from django.test import SimpleTestCase
+
+LOG = """\
+2026-10-19 10:00:00,000 INFO 1 [credentials.apps.core.timing] Stage timings: operation=badges_event total_ms=10.0 \
+requirements_ms=6.0 penalties_ms=2.0
+2026-10-19 10:00:01,000 INFO 1 [credentials.apps.badges] Badge awarded
+2026-10-19 10:00:02,000 INFO 1 [credentials.apps.core.timing] Stage timings: operation=badges_event total_ms=30.0 \
+requirements_ms=20.0 penalties_ms=4.0
+2026-10-19 10:00:03,000 INFO 1 [credentials.apps.core.timing] Stage timings: operation=catalog_sync total_ms=100.0 \
+programs_api_ms=80.0
+"""
+
+
+class ReportStageTimingsTests(SimpleTestCase):
+    def report(self, *args):
+        out = StringIO()
+        with tempfile.NamedTemporaryFile("w", suffix=".log") as log_file:
+            log_file.write(LOG)
+            log_file.flush()
+            call_command("report_stage_timings", log_file.name, *args, stdout=out)
+        return [line.split() for line in out.getvalue().splitlines()]
+
+    def test_report(self):
+        lines = self.report()
+
+        self.assertEqual(lines[0], ["operation", "stage", "count", "p50", "p90", "p99", "max", "share"])
+        self.assertEqual(
+            lines[1:],
+            [
+                ["badges_event", "total", "2", "10.00", "30.00", "30.00", "30.00", "100.0%"],
+                ["badges_event", "requirements", "2", "6.00", "20.00", "20.00", "20.00", "65.0%"],
+                ["badges_event", "penalties", "2", "2.00", "4.00", "4.00", "4.00", "15.0%"],
+                ["catalog_sync", "total", "1", "100.00", "100.00", "100.00", "100.00", "100.0%"],
+                ["catalog_sync", "programs_api", "1", "80.00", "80.00", "80.00", "80.00", "80.0%"],
+            ],
+        )
+
+    def test_operation_filter(self):
+        lines = self.report("--operation=catalog_sync")
+
+        self.assertEqual([line[0] for line in lines[1:]], ["catalog_sync", "catalog_sync"])
+
+    def test_missing_file(self):
+        with self.assertRaisesRegex(CommandError, r"Can't read the log file \[/nonexistent.log\]"):
+            call_command("report_stage_timings", "/nonexistent.log")
@@ -0,0 +1,153 @@
+"""
+Batched delivery of ACE messages.
+
+When the `ACE_MESSAGE_QUEUE` setting is enabled, messages are serialized into a queue table instead of being
+rendered and delivered during the request (or the issuance side effect). Queued messages are delivered in batches
+by the `send_queued_messages` management command: with a bounded number of concurrent deliveries and throttled to
+the configured rate, so a cohort completing a program together doesn't flood the email backend.
+
+Messages of a batch are rendered in the same process, so their (shared) templates are compiled once. The messages of
+a batch are claimed (marked as being sent) in a short transaction, they are delivered and throttled without holding
+any database lock. The messages claimed by an interrupted delivery are delivered again after CLAIM_TIMEOUT seconds.
+
+The sent and failed messages (they include the recipients' email addresses) are purged after RETENTION_DAYS days.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Q
+from django.utils import timezone
+from edx_ace import ace
+from edx_ace.message import Message
+from edx_django_utils.monitoring import increment
+
+from credentials.apps.core.models import QueuedMessage
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_ACE_MESSAGE_QUEUE = {
+    "ENABLED": False,
+    "MAX_WORKERS": 4,
+    # messages per second, unlimited if 0
+    "RATE_LIMIT": 10,
+    # seconds before the messages claimed by an interrupted delivery are delivered again
+    "CLAIM_TIMEOUT": 60 * 60,
+    # days the sent and failed messages are kept for
+    "RETENTION_DAYS": 7,
+}
+
+
+def get_message_queue_config():
+    """
+    Returns ACE messages queue configuration, see the `ACE_MESSAGE_QUEUE` setting.
+    """
+
+    return {**DEFAULT_ACE_MESSAGE_QUEUE, **getattr(settings, "ACE_MESSAGE_QUEUE", {})}
+
+
+def send_message(msg):
+    """
+    Sends the personalized ACE message, or queues it for the batched delivery if the queue is enabled.
+
+    Arguments:
+        msg (Message): personalized ACE message.
+    """
+
+    if get_message_queue_config()["ENABLED"]:
+        QueuedMessage.objects.create(name=msg.name, message=str(msg))
+    else:
+        ace.send(msg)
+
+
+def send_queued_messages(batch_size=100, max_attempts=5, max_workers=None, rate_limit=None):
+    """
+    Delivers a batch of queued messages, in the order they were queued.
+
+    Messages which failed to be delivered are retried (by the following runs) up to `max_attempts` times.
+
+    Arguments:
+        batch_size (int): The maximum number of messages delivered.
+        max_attempts (int): The number of delivery attempts before a message is failed.
+        max_workers (int): Optional. The number of concurrent deliveries.
+        rate_limit (float): Optional. The maximum number of deliveries started per second, unlimited if 0.
+
+    Returns:
+        int: delivered messages count.
+    """
+
+    config = get_message_queue_config()
+    max_workers = max_workers or config["MAX_WORKERS"]
+    rate_limit = config["RATE_LIMIT"] if rate_limit is None else rate_limit
+
+    now = timezone.now()
+    with transaction.atomic():
+        queued_messages = list(
+            QueuedMessage.objects.filter(
+                Q(state=QueuedMessage.PENDING)
+                | Q(state=QueuedMessage.SENDING, modified__lt=now - timedelta(seconds=config["CLAIM_TIMEOUT"]))
+            )
+            .select_for_update(skip_locked=True)
+            .order_by("id")[:batch_size]
+        )
+        if not queued_messages:
+            return 0
+
+        # the claimed messages aren't picked by the concurrent deliveries, until CLAIM_TIMEOUT
+        QueuedMessage.objects.filter(id__in=[queued_message.id for queued_message in queued_messages]).update(
+            state=QueuedMessage.SENDING, modified=now
+        )
+
+    # NOTE: deliveries don't use the database, the results are saved from this thread.
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = []
+        for queued_message in queued_messages:
+            futures.append(executor.submit(ace.send, Message.from_string(queued_message.message)))
+            if rate_limit:
+                time.sleep(1 / rate_limit)
+
+    for queued_message, future in zip(queued_messages, futures):
+        queued_message.modified = timezone.now()
+        try:
+            future.result()
+        except Exception as exc:  # pylint: disable=broad-except
+            queued_message.attempts += 1
+            queued_message.error = str(exc)
+            queued_message.state = (
+                QueuedMessage.FAILED if queued_message.attempts >= max_attempts else QueuedMessage.PENDING
+            )
+            increment("ace_queued_messages_failures")
+            logger.error(f"Queued message {queued_message} delivery failed (attempt {queued_message.attempts}): {exc}")
+            continue
+
+        queued_message.state = QueuedMessage.SENT
+        increment("ace_queued_messages_sent")
+
+    QueuedMessage.objects.bulk_update(queued_messages, ["state", "attempts", "error", "modified"])
+
+    return len(queued_messages)
+
+
+def purge_queued_messages(retention_days=None):
+    """
+    Deletes the messages sent or failed more than `retention_days` days ago.
+
+    Arguments:
+        retention_days (int): Optional. The number of days the messages are kept for.
+
+    Returns:
+        int: deleted messages count.
+    """
+
+    if retention_days is None:
+        retention_days = get_message_queue_config()["RETENTION_DAYS"]
+
+    deleted, __ = QueuedMessage.objects.filter(
+        state__in=(QueuedMessage.SENT, QueuedMessage.FAILED),
+        modified__lt=timezone.now() - timedelta(days=retention_days),
+    ).delete()
+    return deleted
@@ -0,0 +1,43 @@
+# Generated by Django 5.2.11 on 2026-10-19 10:38
+
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0023_add_core_user_indices"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="QueuedMessage",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+                ("name", models.CharField(help_text="ACE message type name.", max_length=255)),
+                ("message", models.TextField(help_text="Serialized ACE message.")),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[("pending", "pending"), ("sent", "sent"), ("failed", "failed")],
+                        default="pending",
+                        max_length=32,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("error", models.TextField(blank=True, default="", help_text="The latest delivery error.")),
+            ],
+            options={
+                "indexes": [models.Index(fields=["state", "id"], name="core_queued_state_b59e84_idx")],
+            },
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.11 on 2026-10-19 15:22
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("core", "0025_usernamereplacementjob"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="queuedmessage",
+            name="state",
+            field=models.CharField(
+                choices=[("pending", "pending"), ("sending", "sending"), ("sent", "sent"), ("failed", "failed")],
+                default="pending",
+                max_length=32,
+            ),
+        ),
+    ]
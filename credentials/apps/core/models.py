@@ -1,6 +1,7 @@
 """Core models."""
 
 import hashlib
+import uuid
 from urllib.parse import urljoin
 
 from django.conf import settings
@@ -9,8 +10,11 @@ from django.contrib.sites.models import Site
 from django.core.cache import cache
 from django.db import models
 from django.utils.translation import gettext_lazy as _
+from django_extensions.db.models import TimeStampedModel
 from edx_rest_api_client.client import OAuthAPIClient
 
+from credentials.apps.core.utils import _choices
+
 
 class SiteConfiguration(models.Model):
     """
@@ -213,3 +217,58 @@ class User(AbstractUser):
 
     def get_full_name(self):
         return self.full_name or super().get_full_name()
+
+
+class QueuedMessage(TimeStampedModel):
+    """
+    An ACE message waiting to be delivered in background (see `send_queued_messages` management command).
+
+    .. pii: Stores the serialized message, which includes the recipient's email address and the message context. Sent
+        and failed messages are deleted after a retention period (see `purge_queued_messages`).
+        pii values: email
+    .. pii_types: email_address
+    .. pii_retirement: local_api
+    """
+
+    PENDING, SENDING, SENT, FAILED = ("pending", "sending", "sent", "failed")
+
+    name = models.CharField(max_length=255, help_text=_("ACE message type name."))
+    message = models.TextField(help_text=_("Serialized ACE message."))
+    state = models.CharField(max_length=32, choices=_choices(PENDING, SENDING, SENT, FAILED), default=PENDING)
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True, default="", help_text=_("The latest delivery error."))
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["state", "id"]),
+        ]
+
+    def __str__(self):
+        return f"{self.name} ({self.id})"
+
+
+class UsernameReplacementJob(TimeStampedModel):
+    """
+    A large username replacement request processed in background (see `process_username_replacement_jobs`
+    management command).
+
+    .. pii: Stores the current and the new usernames of the replacement request. The requested mappings are cleared
+        once the job is processed, and processed jobs (with the replacements outcome) are deleted after a retention
+        period (see `purge_username_replacement_jobs`).
+        pii values: username
+    .. pii_types: username
+    .. pii_retirement: local_api
+    """
+
+    PENDING, RUNNING, COMPLETED, FAILED = ("pending", "running", "completed", "failed")
+
+    uuid = models.UUIDField(default=uuid.uuid4, editable=False, unique=True)
+    username_mappings = models.JSONField(help_text=_("The requested list of {current_username: new_username}."))
+    state = models.CharField(
+        max_length=32, choices=_choices(PENDING, RUNNING, COMPLETED, FAILED), default=PENDING, db_index=True
+    )
+    result = models.JSONField(default=dict, blank=True, help_text=_("Replacements outcome and per-model counts."))
+    error = models.TextField(blank=True, default="")
+
+    def __str__(self):
+        return f"UsernameReplacementJob {self.uuid} ({self.state})"
@@ -0,0 +1,187 @@
+"""
+Query budgets of the views and event handlers.
+
+The database queries of every request (`QueryBudgetMiddleware`) and of every decorated function (`query_budget`) are
+counted and timed, and the repeated queries (the same SQL with any parameters, the N+1 pattern) are found by their
+fingerprints. The stats are exported as custom attributes:
+    - `<name>_query_count`: number of queries;
+    - `<name>_query_duplicates`: number of queries repeating an earlier query fingerprint;
+    - `<name>_query_time_ms`: time spent in the database;
+where the name is "request" for the requests and the `query_budget` name for the decorated functions.
+
+Views and functions declare their budgets (the maximum number of queries) with the `query_budget` decorator. A budget
+overrun is logged, counted with the `query_budget_exceeded` custom metric and, when the budgets are enforced (see the
+`credentials.apps.core.tests.query_budget_plugin` pytest plugin), recorded as a violation.
+"""
+
+import functools
+import logging
+import re
+import time
+from collections import Counter
+from contextlib import ExitStack, contextmanager
+
+from django.db import connections
+from edx_django_utils.monitoring import increment, set_custom_attribute
+
+logger = logging.getLogger(__name__)
+
+REQUEST_NAME = "request"
+IN_CLAUSE_REGEX = re.compile(r"\((?:%s, )*%s\)")
+
+# budget overruns are only recorded when the budgets are enforced (in tests):
+_enforcement = {"enabled": False, "violations": []}
+
+
+class QueryStats:
+    """
+    Database queries of a block of code (see `track_queries`).
+    """
+
+    def __init__(self, name, budget=None):
+        self.name = name
+        self.budget = budget
+        self.label = name
+        self.count = 0
+        self.time = 0.0
+        self.fingerprints = Counter()
+
+    def __call__(self, execute, sql, params, many, context):  # pylint: disable=too-many-positional-arguments
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.time += time.perf_counter() - started
+            self.count += 1
+            self.fingerprints[get_fingerprint(sql)] += 1
+
+    @property
+    def duplicates(self):
+        return self.count - len(self.fingerprints)
+
+    @property
+    def exceeded(self):
+        return self.budget is not None and self.count > self.budget
+
+    def report(self):
+        set_custom_attribute(f"{self.name}_query_count", self.count)
+        set_custom_attribute(f"{self.name}_query_duplicates", self.duplicates)
+        set_custom_attribute(f"{self.name}_query_time_ms", round(self.time * 1000, 2))
+        if not self.exceeded:
+            return
+
+        set_custom_attribute("query_budget_exceeded", self.label)
+        increment("query_budget_exceeded")
+        fingerprint, repeats = self.fingerprints.most_common(1)[0]
+        message = (
+            f"[{self.label}] made {self.count} queries over its budget of {self.budget}, "
+            f"the most repeated one ({repeats} times): {fingerprint}"
+        )
+        logger.warning(message)
+        if _enforcement["enabled"]:
+            _enforcement["violations"].append(message)
+
+
+def get_fingerprint(sql):
+    """
+    The query SQL with the `IN` clauses of any length collapsed (the parameters aren't a part of the SQL).
+    """
+    return IN_CLAUSE_REGEX.sub("(...)", sql)
+
+
+@contextmanager
+def track_queries(name, budget=None):
+    """
+    Tracks the queries of the block on all the database connections, reports the stats on exit.
+
+    Yields:
+        QueryStats: the stats of the block.
+    """
+    stats = QueryStats(name, budget)
+    try:
+        with ExitStack() as stack:
+            for connection in connections.all():
+                stack.enter_context(connection.execute_wrapper(stats))
+            yield stats
+    finally:
+        stats.report()
+
+
+def query_budget(max_queries, name=None):
+    """
+    Declares the query budget of a view (a function or a class, checked by `QueryBudgetMiddleware`) or of an event
+    handler (any other function, which is tracked on every call with `track_queries`).
+
+    Arguments:
+        max_queries (int): the budget.
+        name (str): the custom attributes prefix of a handler, the function name by default.
+    """
+
+    def decorator(view_or_function):
+        if isinstance(view_or_function, type):
+            view_or_function.query_budget = max_queries
+            return view_or_function
+
+        @functools.wraps(view_or_function)
+        def wrapper(*args, **kwargs):
+            with track_queries(name or view_or_function.__name__, max_queries):
+                return view_or_function(*args, **kwargs)
+
+        wrapper.query_budget = max_queries
+        return wrapper
+
+    return decorator
+
+
+def get_view_query_budget(view_func):
+    """
+    The budget declared for the view function or its class (DRF and Django class-based views).
+    """
+    budget = getattr(view_func, "query_budget", None)
+    if budget is None:
+        budget = getattr(get_view_class(view_func), "query_budget", None)
+    return budget
+
+
+def get_view_class(view_func):
+    """
+    The class of a DRF or Django class-based view function, None for other views.
+    """
+    return getattr(view_func, "cls", None) or getattr(view_func, "view_class", None)
+
+
+class QueryBudgetMiddleware:
+    """
+    Tracks the queries of every request, checks the budgets of the views which declare them.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        with track_queries(REQUEST_NAME) as stats:
+            request.query_stats = stats
+            return self.get_response(request)
+
+    def process_view(self, request, view_func, view_args, view_kwargs):  # pylint: disable=unused-argument
+        stats = getattr(request, "query_stats", None)
+        if stats is not None:
+            stats.budget = get_view_query_budget(view_func)
+            view = get_view_class(view_func) or view_func
+            stats.label = f"{view.__module__}.{view.__qualname__}"
+
+
+@contextmanager
+def enforce_query_budgets():
+    """
+    Records the budget overruns during the block.
+
+    Yields:
+        list: the overrun messages.
+    """
+    previous = dict(_enforcement)
+    _enforcement.update(enabled=True, violations=[])
+    try:
+        yield _enforcement["violations"]
+    finally:
+        _enforcement.update(previous)
@@ -0,0 +1,403 @@
+"""
+Synthetic data generation for capacity planning and load benchmarks (see `run_benchmarks`).
+
+The data is generated from a seed: the same seed and sizes produce the same sites, catalog, learners, grades and
+credentials, so benchmark results of different code versions can be compared. Every site is generated as follows:
+    - organizations, and programs made of courses (with course runs) owned by the organizations;
+    - course and program certificate configurations;
+    - learners enrolled in programs, with grades for the program course runs and course certificates for the passed
+      ones, and program certificates for the completed programs;
+    - badge templates with requirements (course passing of the program course runs);
+    - verifiable credentials issuance lines for a share of the program certificates (if verifiable credentials are
+      enabled).
+
+All the records are created with `bulk_create`, learners are generated in chunks to keep the memory use flat.
+"""
+
+import logging
+import random
+import uuid
+from datetime import timedelta
+from decimal import Decimal
+
+from django.contrib.auth.hashers import UNUSABLE_PASSWORD_PREFIX
+from django.contrib.contenttypes.models import ContentType
+from django.contrib.sites.models import Site
+from django.db import transaction
+from django.utils import timezone
+
+from credentials.apps.badges.models import BadgeRequirement, BadgeTemplate, DataRule
+from credentials.apps.catalog.models import Course, CourseRun, Organization, Program
+from credentials.apps.core.models import SiteConfiguration, User
+from credentials.apps.credentials.constants import CertificateType, UserCredentialStatus
+from credentials.apps.credentials.models import CourseCertificate, ProgramCertificate, UserCredential
+from credentials.apps.records.models import UserGrade
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SIZES = {
+    "sites": 1,
+    "organizations": 2,
+    "programs": 10,
+    "courses_per_program": 4,
+    "runs_per_course": 1,
+    "learners": 1000,
+    "programs_per_learner": 2,
+    "badge_templates": 5,
+    "requirements_per_template": 3,
+}
+DEFAULT_COMPLETION_RATE = 0.5
+DEFAULT_ISSUANCE_RATE = 0.2
+DEFAULT_BATCH_SIZE = 1000
+
+COURSE_PASSING_EVENT = "org.openedx.learning.course.passing.status.updated.v1"
+LETTER_GRADES = ((Decimal("0.9"), "A"), (Decimal("0.8"), "B"), (Decimal("0.7"), "C"), (Decimal("0.6"), "D"))
+PASSING_GRADE = Decimal("0.6")
+
+
+class ScaleDataError(Exception):
+    """Raised when the scale data can't be generated."""
+
+
+def get_site_domain(seed, site_index):
+    return f"scale-{seed}-{site_index}.example.com"
+
+
+def get_learner_username(seed, site_index, learner_index):
+    return f"scale_{seed}_{site_index}_{learner_index}"
+
+
+class ScaleDataGenerator:
+    """
+    Generates the scale data for a seed (see the module docstring).
+
+    Arguments:
+        seed (int): random generator seed, also a part of the generated names.
+        sizes (dict): numbers of the generated records (see `DEFAULT_SIZES`), per site where applicable.
+        completion_rate (float): share of the learner programs which are completed (all the course runs are passed).
+        issuance_rate (float): share of the program certificates with a verifiable credential issuance line.
+        batch_size (int): number of records inserted at once (and of learners generated at once).
+    """
+
+    def __init__(
+        self,
+        seed,
+        sizes=None,
+        completion_rate=DEFAULT_COMPLETION_RATE,
+        issuance_rate=DEFAULT_ISSUANCE_RATE,
+        batch_size=DEFAULT_BATCH_SIZE,
+    ):  # pylint: disable=too-many-positional-arguments
+        self.seed = seed
+        self.sizes = {**DEFAULT_SIZES, **(sizes or {})}
+        self.completion_rate = completion_rate
+        self.issuance_rate = issuance_rate
+        self.batch_size = batch_size
+        self.random = random.Random(seed)
+        self.now = timezone.now()
+        self.stats = {}
+
+    def generate(self):
+        """
+        Generates the data for all the sites.
+
+        Returns:
+            dict: counts of the generated records by model.
+        """
+        domains = [get_site_domain(self.seed, site_index) for site_index in range(self.sizes["sites"])]
+        if Site.objects.filter(domain__in=domains).exists():
+            raise ScaleDataError(f"Scale data for the seed [{self.seed}] is already generated")
+
+        for site_index, domain in enumerate(domains):
+            with transaction.atomic():
+                self.generate_site(site_index, domain)
+            logger.info("Generated scale data for the site [%s]: %s", domain, self.stats)
+
+        return self.stats
+
+    def generate_site(self, site_index, domain):
+        site = Site.objects.create(domain=domain, name=domain)
+        SiteConfiguration.objects.create(
+            site=site,
+            platform_name=f"Scale {self.seed}",
+            lms_url_root=f"https://lms.{domain}",
+            catalog_api_url=f"https://discovery.{domain}/api/v1/",
+            records_enabled=True,
+        )
+        self._count(Site, 1)
+
+        key_prefix = f"S{self.seed}x{site_index}"
+        organizations = self.create(
+            Organization,
+            [
+                Organization(site=site, uuid=self.uuid(), key=f"{key_prefix}Org{index}", name=f"Organization {index}")
+                for index in range(self.sizes["organizations"])
+            ],
+        )
+        programs = self.generate_catalog(site, key_prefix, organizations)
+        course_certificates, program_certificates = self.generate_certificates(site, programs)
+        self.generate_badge_templates(site, programs)
+
+        learner_programs = min(self.sizes["programs_per_learner"], len(programs))
+        for start in range(0, self.sizes["learners"], self.batch_size):
+            end = min(start + self.batch_size, self.sizes["learners"])
+            self.generate_learners(
+                site_index, range(start, end), programs, learner_programs, course_certificates, program_certificates
+            )
+
+    def generate_catalog(self, site, key_prefix, organizations):
+        """
+        Returns:
+            list: the programs with their course runs (as `program.generated_course_runs`).
+        """
+        courses = self.create(
+            Course,
+            [
+                Course(site=site, uuid=self.uuid(), key=f"{key_prefix}+C{index}", title=f"Course {index}")
+                for index in range(self.sizes["programs"] * self.sizes["courses_per_program"])
+            ],
+        )
+        Course.owners.through.objects.bulk_create(
+            [
+                Course.owners.through(
+                    course_id=course.id, organization_id=organizations[index % len(organizations)].id, sort_value=0
+                )
+                for index, course in enumerate(courses)
+            ],
+            batch_size=self.batch_size,
+        )
+
+        start_date = self.now - timedelta(days=365)
+        course_runs = self.create(
+            CourseRun,
+            [
+                CourseRun(
+                    course=course,
+                    uuid=self.uuid(),
+                    key=f"course-v1:{course.key.replace('+', f'Org{index % len(organizations)}+', 1)}+R{run_index}",
+                    start_date=start_date,
+                    end_date=start_date + timedelta(days=90),
+                )
+                for index, course in enumerate(courses)
+                for run_index in range(self.sizes["runs_per_course"])
+            ],
+        )
+
+        programs = self.create(
+            Program,
+            [
+                Program(site=site, uuid=self.uuid(), title=f"Program {index}", type="Professional Certificate")
+                for index in range(self.sizes["programs"])
+            ],
+        )
+        runs_per_program = self.sizes["courses_per_program"] * self.sizes["runs_per_course"]
+        program_course_runs, program_organizations = [], []
+        for index, program in enumerate(programs):
+            program.generated_course_runs = course_runs[index * runs_per_program : (index + 1) * runs_per_program]
+            program_course_runs += [
+                Program.course_runs.through(program_id=program.id, courserun_id=course_run.id, sort_value=sort_value)
+                for sort_value, course_run in enumerate(program.generated_course_runs)
+            ]
+            program_organizations.append(
+                Program.authoring_organizations.through(
+                    program_id=program.id, organization_id=organizations[index % len(organizations)].id, sort_value=0
+                )
+            )
+        Program.course_runs.through.objects.bulk_create(program_course_runs, batch_size=self.batch_size)
+        Program.authoring_organizations.through.objects.bulk_create(program_organizations, batch_size=self.batch_size)
+
+        return programs
+
+    def generate_certificates(self, site, programs):
+        """
+        Returns:
+            tuple: course certificates by course run id, program certificates by program id.
+        """
+        course_certificates = self.create(
+            CourseCertificate,
+            [
+                CourseCertificate(
+                    site=site,
+                    course_id=course_run.key,
+                    course_run=course_run,
+                    certificate_type=CertificateType.VERIFIED,
+                    is_active=True,
+                )
+                for program in programs
+                for course_run in program.generated_course_runs
+            ],
+            unique_field="course_id",
+        )
+        program_certificates = self.create(
+            ProgramCertificate,
+            [
+                ProgramCertificate(site=site, program_uuid=program.uuid, program=program, is_active=True)
+                for program in programs
+            ],
+            unique_field="program_uuid",
+        )
+        return (
+            {course_certificate.course_run_id: course_certificate for course_certificate in course_certificates},
+            {program_certificate.program_id: program_certificate for program_certificate in program_certificates},
+        )
+
+    def generate_badge_templates(self, site, programs):
+        templates = self.create(
+            BadgeTemplate,
+            [
+                BadgeTemplate(
+                    site=site,
+                    uuid=self.uuid(),
+                    name=f"Badge {index}",
+                    origin=BadgeTemplate.ORIGIN,
+                    state=BadgeTemplate.STATES.active,
+                    is_active=True,
+                )
+                for index in range(self.sizes["badge_templates"])
+            ],
+        )
+        requirements, course_run_keys = [], []
+        for index, template in enumerate(templates):
+            program = programs[index % len(programs)]
+            for requirement_index in range(self.sizes["requirements_per_template"]):
+                course_run = program.generated_course_runs[requirement_index % len(program.generated_course_runs)]
+                requirements.append(
+                    BadgeRequirement(
+                        template=template,
+                        event_type=COURSE_PASSING_EVENT,
+                        description=f"Pass {course_run.key}",
+                        blend=f"group-{requirement_index}",
+                    )
+                )
+                course_run_keys.append(course_run.key)
+
+        self.create(BadgeRequirement, requirements, unique_field=None)
+        # the requirements have no unique field, they are fetched in the order of creation:
+        requirements = BadgeRequirement.objects.filter(template__in=templates).order_by("id")
+        self.create(
+            DataRule,
+            [
+                DataRule(requirement=requirement, data_path=data_path, operator="eq", value=value)
+                for requirement, course_run_key in zip(requirements, course_run_keys)
+                for data_path, value in (("course.course_key", course_run_key), ("is_passing", "true"))
+            ],
+            unique_field=None,
+        )
+
+    def generate_learners(
+        self, site_index, learner_indices, programs, learner_programs, course_certificates, program_certificates
+    ):  # pylint: disable=too-many-positional-arguments
+        users, grades, user_credentials = [], [], []
+        course_certificate_type = ContentType.objects.get_for_model(CourseCertificate)
+        program_certificate_type = ContentType.objects.get_for_model(ProgramCertificate)
+
+        for learner_index in learner_indices:
+            username = get_learner_username(self.seed, site_index, learner_index)
+            users.append(
+                User(
+                    username=username,
+                    email=f"{username}@example.com",
+                    full_name=f"Learner {learner_index}",
+                    password=UNUSABLE_PASSWORD_PREFIX,
+                )
+            )
+            for program in self.random.sample(programs, learner_programs):
+                completed = self.random.random() < self.completion_rate
+                for course_run in program.generated_course_runs:
+                    percent_grade = self.percent_grade(passing=True if completed else None)
+                    grades.append(
+                        UserGrade(
+                            username=username,
+                            course_run=course_run,
+                            percent_grade=percent_grade,
+                            letter_grade=self.letter_grade(percent_grade),
+                            verified=True,
+                            lms_last_updated_at=self.now,
+                        )
+                    )
+                    if percent_grade >= PASSING_GRADE:
+                        user_credentials.append(
+                            self.user_credential(username, course_certificate_type, course_certificates[course_run.id])
+                        )
+                if completed:
+                    user_credentials.append(
+                        self.user_credential(username, program_certificate_type, program_certificates[program.id])
+                    )
+
+        self.create(User, users, unique_field=None)
+        self.create(UserGrade, grades, unique_field=None)
+        user_credentials = self.create(UserCredential, user_credentials)
+        self.generate_issuance_lines(
+            [
+                user_credential
+                for user_credential in user_credentials
+                if user_credential.credential_content_type_id == program_certificate_type.id
+                and self.random.random() < self.issuance_rate
+            ]
+        )
+
+    def generate_issuance_lines(self, user_credentials):
+        # pylint: disable=import-outside-toplevel
+        from credentials.apps.verifiable_credentials.issuance.models import IssuanceLine
+        from credentials.apps.verifiable_credentials.issuance.preissuance import init_issuance_lines
+        from credentials.apps.verifiable_credentials.settings import vc_settings
+        from credentials.apps.verifiable_credentials.storages.utils import get_available_storages
+        from credentials.apps.verifiable_credentials.toggles import is_verifiable_credentials_enabled
+
+        storages = get_available_storages() if is_verifiable_credentials_enabled() else []
+        if not user_credentials or not storages:
+            return
+
+        storage, issuer_id = storages[0], IssuanceLine.resolve_issuer().issuer_id
+        # the status list of the issuer is limited:
+        available = max(vc_settings.STATUS_LIST_LENGTH - IssuanceLine.get_next_status_index(issuer_id), 0)
+        initiated = init_issuance_lines(user_credentials[:available], storage, storage.get_data_model(), issuer_id)
+        self._count(IssuanceLine, initiated)
+
+    def create(self, model, objects, unique_field="uuid"):
+        """
+        Bulk creates the objects.
+
+        The created objects are fetched again by the unique field, unless there is none: the primary keys aren't set by
+        `bulk_create` on all the databases.
+        """
+        model.objects.bulk_create(objects, batch_size=self.batch_size)
+        self._count(model, len(objects))
+        if unique_field is None or all(obj.pk is not None for obj in objects):
+            return objects
+
+        values = [getattr(obj, unique_field) for obj in objects]
+        created = {}
+        for start in range(0, len(values), self.batch_size):
+            batch = values[start : start + self.batch_size]
+            created.update(
+                (getattr(obj, unique_field), obj) for obj in model.objects.filter(**{f"{unique_field}__in": batch})
+            )
+        return [created[value] for value in values]
+
+    def uuid(self):
+        return uuid.UUID(int=self.random.getrandbits(128), version=4)
+
+    def percent_grade(self, passing=None):
+        """
+        Random percent grade, a passing one if requested.
+        """
+        low = PASSING_GRADE if passing else Decimal("0.3")
+        return (low + (Decimal(1) - low) * Decimal(self.random.random())).quantize(Decimal("0.0001"))
+
+    def letter_grade(self, percent_grade):
+        for threshold, letter_grade in LETTER_GRADES:
+            if percent_grade >= threshold:
+                return letter_grade
+        return "F"
+
+    def user_credential(self, username, content_type, credential):
+        return UserCredential(
+            username=username,
+            credential_content_type=content_type,
+            credential_id=credential.id,
+            status=UserCredentialStatus.AWARDED,
+            uuid=self.uuid(),
+        )
+
+    def _count(self, model, count):
+        self.stats[model._meta.label] = self.stats.get(model._meta.label, 0) + count
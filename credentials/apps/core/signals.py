@@ -1,7 +1,8 @@
 from django.contrib.sites.models import Site
-from django.db.models.signals import pre_delete, pre_save
+from django.db.models.signals import post_delete, post_save, pre_delete, pre_save
 
-from credentials.apps.core.models import SiteConfiguration
+from credentials.apps.core.api import clear_user_identity_cache
+from credentials.apps.core.models import SiteConfiguration, User
 
 
 def clear_site_cache(sender, **kwargs):  # pylint: disable=unused-argument
@@ -11,3 +12,12 @@ def clear_site_cache(sender, **kwargs):  # pylint: disable=unused-argument
 # Clear the Site cache to force a refresh of related SiteConfiguration objects
 pre_delete.connect(clear_site_cache, sender=SiteConfiguration, dispatch_uid="pre_delete_siteconfiguration_clear_cache")
 pre_save.connect(clear_site_cache, sender=SiteConfiguration, dispatch_uid="pre_save_siteconfiguration_clear_cache")
+
+
+def clear_user_identity(sender, instance, **kwargs):  # pylint: disable=unused-argument
+    clear_user_identity_cache(instance.username)
+
+
+# Drop the cached event bus identity of a changed User
+post_save.connect(clear_user_identity, sender=User, dispatch_uid="post_save_user_clear_identity_cache")
+post_delete.connect(clear_user_identity, sender=User, dispatch_uid="post_delete_user_clear_identity_cache")
@@ -0,0 +1,32 @@
+"""
+Pytest plugin failing the tests in which a view or an event handler goes over its query budget (see
+`credentials.apps.core.query_budget`).
+
+The budgets are checked for all the tests unless the `--ignore-query-budgets` option is given.
+"""
+
+import pytest
+
+from credentials.apps.core.query_budget import enforce_query_budgets
+
+
+def pytest_addoption(parser):
+    parser.addoption(
+        "--ignore-query-budgets",
+        action="store_true",
+        default=False,
+        help="Don't fail the tests in which views or event handlers go over their query budgets.",
+    )
+
+
+@pytest.hookimpl(wrapper=True)
+def pytest_runtest_call(item):
+    if item.config.getoption("--ignore-query-budgets"):
+        return (yield)
+
+    with enforce_query_budgets() as violations:
+        result = yield
+
+    if violations:
+        pytest.fail("Query budget exceeded:\n" + "\n".join(violations), pytrace=False)
+    return result
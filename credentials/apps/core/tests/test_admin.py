@@ -2,12 +2,14 @@
 Core Admin Module Test Cases
 """
 
+from unittest import mock
+
 from django.contrib.admin.sites import AdminSite
 from django.contrib.messages.storage.fallback import FallbackStorage
 from django.http import HttpRequest
 from django.test import TestCase
 
-from credentials.apps.core.admin import CustomUserAdmin
+from credentials.apps.core.admin import CustomUserAdmin, EstimatedCountPaginator
 from credentials.apps.core.models import User
 from credentials.apps.core.tests.factories import USER_PASSWORD, UserFactory
 
@@ -117,3 +119,35 @@ class UsersAdminTestCase(TestCase):
         assert not User.objects.get(lms_user_id=1).is_superuser
         assert not User.objects.get(lms_user_id=2).is_superuser
         assert User.objects.get(lms_user_id=3).is_superuser
+
+
+class EstimatedCountPaginatorTestCase(TestCase):
+    """
+    Test Case module for EstimatedCountPaginator
+    """
+
+    def setUp(self):
+        super().setUp()
+        UserFactory.create_batch(3)
+
+    @mock.patch("credentials.apps.core.admin.get_estimated_count", return_value=200000)
+    def test_estimated_count(self, mock_get_estimated_count):
+        with self.assertNumQueries(0):
+            self.assertEqual(EstimatedCountPaginator(User.objects.all(), 10).count, 200000)
+        mock_get_estimated_count.assert_called_once_with(User)
+
+    @mock.patch("credentials.apps.core.admin.get_estimated_count", return_value=200000)
+    def test_filtered_count(self, mock_get_estimated_count):
+        self.assertEqual(
+            EstimatedCountPaginator(User.objects.filter(is_active=True), 10).count,
+            User.objects.filter(is_active=True).count(),
+        )
+        mock_get_estimated_count.assert_not_called()
+
+    @mock.patch("credentials.apps.core.admin.get_estimated_count", return_value=10)
+    def test_small_table_count(self, _mock_get_estimated_count):
+        self.assertEqual(EstimatedCountPaginator(User.objects.all(), 10).count, User.objects.count())
+
+    def test_estimation_unavailable(self):
+        # the test database has no statistics:
+        self.assertEqual(EstimatedCountPaginator(User.objects.all(), 10).count, User.objects.count())
@@ -0,0 +1,53 @@
+"""Test core.analytics."""
+
+from unittest import mock
+
+from django.test import TestCase, override_settings
+
+from credentials.apps.core import analytics
+
+
+@mock.patch("segment.analytics.client.Consumer")
+class SegmentClientsTests(TestCase):
+    """Tests for the shared Segment clients."""
+
+    def tearDown(self):
+        analytics._clients.clear()  # pylint: disable=protected-access
+        super().tearDown()
+
+    def test_get_segment_client_without_key(self, _consumer):
+        self.assertIsNone(analytics.get_segment_client(None))
+        self.assertIsNone(analytics.get_segment_client(""))
+
+    @override_settings(SEGMENT_CLIENT_CONFIG={"MAX_QUEUE_SIZE": 5})
+    def test_get_segment_client_is_shared(self, consumer):
+        client = analytics.get_segment_client("key")
+
+        self.assertIs(client, analytics.get_segment_client("key"))
+        self.assertIsNot(client, analytics.get_segment_client("another key"))
+        self.assertEqual(client.queue.maxsize, 5)
+        self.assertEqual(consumer.call_count, 2)
+
+    @override_settings(SEGMENT_CLIENT_CONFIG={"MAX_QUEUE_SIZE": 1, "SEND": True})
+    @mock.patch("credentials.apps.core.analytics.set_custom_attribute")
+    @mock.patch("credentials.apps.core.analytics.increment")
+    def test_dropped_events_are_reported(self, mock_increment, mock_set_custom_attribute, _consumer):
+        client = analytics.get_segment_client("key")
+
+        queued, __ = client.track("user", "first")
+        self.assertTrue(queued)
+        mock_set_custom_attribute.assert_called_with("segment_queue_depth", 1)
+        mock_increment.assert_not_called()
+
+        queued, __ = client.track("user", "second")
+        self.assertFalse(queued)
+        mock_increment.assert_called_once_with("segment_events_dropped")
+
+    def test_shutdown_segment_clients(self, _consumer):
+        client = analytics.get_segment_client("key")
+
+        with mock.patch.object(client, "shutdown") as mock_shutdown:
+            analytics.shutdown_segment_clients()
+
+        mock_shutdown.assert_called_once_with()
+        self.assertIsNot(client, analytics.get_segment_client("key"))
@@ -3,11 +3,15 @@ Tests for the Python functions in the Core app's `api.py` file
 """
 
 import ddt
-from django.test import TestCase
+from django.test import TestCase, override_settings
 from openedx_events.learning.data import UserData, UserPersonalData
 from testfixtures import LogCapture
 
-from credentials.apps.core.api import get_or_create_user_from_event_data, get_user_by_username
+from credentials.apps.core.api import (
+    clear_user_identity_cache,
+    get_or_create_user_from_event_data,
+    get_user_by_username,
+)
 from credentials.apps.core.tests.factories import UserFactory
 
 
@@ -82,3 +86,76 @@ class CoreApiTests(TestCase):
             get_or_create_user_from_event_data(bad_data)
 
         assert log.records[0].msg == expected_message
+
+
+@override_settings(USER_IDENTITY_CACHE_TTL=60)
+class UserIdentityCacheTests(TestCase):
+    """
+    Unit tests for the identity caching of `get_or_create_user_from_event_data`
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+        self.user_event_data = UserData(
+            pii=UserPersonalData(username=self.user.username, email=self.user.email, name=self.user.full_name),
+            id=self.user.lms_user_id,
+            is_active=self.user.is_active,
+        )
+
+    def cache_user_identity(self):
+        with self.captureOnCommitCallbacks(execute=True):
+            get_or_create_user_from_event_data(self.user_event_data)
+
+    def test_cached_user_identity(self):
+        self.cache_user_identity()
+
+        with self.assertNumQueries(0):
+            returned_user, created = get_or_create_user_from_event_data(self.user_event_data)
+
+        assert not created
+        assert returned_user.id == self.user.id
+
+    def test_changed_user_identity(self):
+        self.cache_user_identity()
+        changed_event_data = UserData(
+            pii=UserPersonalData(username=self.user.username, email="changed@example.com", name=self.user.full_name),
+            id=self.user.lms_user_id,
+            is_active=self.user.is_active,
+        )
+
+        with self.assertNumQueries(1):
+            returned_user, __ = get_or_create_user_from_event_data(changed_event_data)
+
+        assert returned_user.id == self.user.id
+
+    def test_user_change_drops_cached_identity(self):
+        self.cache_user_identity()
+        self.user.is_staff = True
+        self.user.save()
+
+        with self.assertNumQueries(1):
+            returned_user, __ = get_or_create_user_from_event_data(self.user_event_data)
+
+        assert returned_user.is_staff
+
+    def test_user_identity_cached_on_commit(self):
+        # the transaction isn't committed (e.g. it is rolled back), the user isn't cached
+        get_or_create_user_from_event_data(self.user_event_data)
+
+        with self.assertNumQueries(1):
+            get_or_create_user_from_event_data(self.user_event_data)
+
+    def test_clear_user_identity_cache(self):
+        self.cache_user_identity()
+        clear_user_identity_cache(self.user.username)
+
+        with self.assertNumQueries(1):
+            get_or_create_user_from_event_data(self.user_event_data)
+
+    @override_settings(USER_IDENTITY_CACHE_TTL=0)
+    def test_user_identity_cache_disabled(self):
+        self.cache_user_identity()
+
+        with self.assertNumQueries(1):
+            get_or_create_user_from_event_data(self.user_event_data)
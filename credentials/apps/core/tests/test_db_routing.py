@@ -0,0 +1,193 @@
+"""Tests for the read replica routing"""
+
+from django.contrib.sites.models import Site
+from django.http import HttpResponse, StreamingHttpResponse
+from django.test import RequestFactory, TestCase, override_settings
+from rest_framework.views import APIView
+
+from credentials.apps.core.db_routing import (
+    READ_REPLICA_PIN_COOKIE_NAME,
+    ReadReplicaMiddleware,
+    get_view_read_replica_methods,
+    iter_from_read_replica,
+    read_replica,
+    use_primary_database,
+    use_read_replica,
+)
+
+PRIMARY_DOMAIN = "primary.example.org"
+REPLICA_DOMAIN = "replica.example.org"
+
+
+def read_domains():
+    return list(
+        Site.objects.filter(domain__in=[PRIMARY_DOMAIN, REPLICA_DOMAIN]).order_by("id").values_list("domain", flat=True)
+    )
+
+
+def stream_domains():
+    yield from read_domains()
+
+
+@read_replica()
+def replica_handler():
+    return read_domains()
+
+
+@read_replica()
+class ReplicaView(APIView):
+    pass
+
+
+@read_replica(methods=("POST",))
+class ReplicaPostView(APIView):
+    pass
+
+
+@read_replica(token_clients=False)
+class ReplicaCookieClientsView(APIView):
+    pass
+
+
+@override_settings(READ_REPLICA_DATABASE="replica")
+class ReadReplicaRoutingTests(TestCase):
+    databases = {"default", "replica"}
+
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        # the databases hold different data, so that the reads tell which one they are sent to
+        Site.objects.create(domain=PRIMARY_DOMAIN, name="primary")
+        Site.objects.using("replica").create(domain=REPLICA_DOMAIN, name="replica")
+
+    def test_use_read_replica(self):
+        with use_read_replica() as state:
+            self.assertEqual(read_domains(), [REPLICA_DOMAIN])
+            self.assertTrue(state.uses_replica)
+
+        self.assertEqual(read_domains(), [PRIMARY_DOMAIN])
+
+    def test_writes_pin_to_primary(self):
+        with use_read_replica() as state:
+            with use_read_replica():
+                Site.objects.filter(domain=PRIMARY_DOMAIN).update(name="updated")
+            self.assertTrue(state.wrote)
+            self.assertEqual(read_domains(), [PRIMARY_DOMAIN])
+
+    def test_writes_go_to_primary(self):
+        with use_read_replica():
+            site = Site.objects.get(domain=REPLICA_DOMAIN)
+            Site.objects.create(domain="new.example.org", name="new")
+
+        self.assertEqual(site._state.db, "replica")  # pylint: disable=protected-access
+        self.assertTrue(Site.objects.using("default").filter(domain="new.example.org").exists())
+        self.assertFalse(Site.objects.using("replica").filter(domain="new.example.org").exists())
+
+    def test_use_primary_database(self):
+        with use_read_replica():
+            with use_primary_database():
+                self.assertEqual(read_domains(), [PRIMARY_DOMAIN])
+            self.assertEqual(read_domains(), [REPLICA_DOMAIN])
+
+    @override_settings(READ_REPLICA_DATABASE=None)
+    def test_disabled(self):
+        with use_read_replica() as state:
+            self.assertEqual(read_domains(), [PRIMARY_DOMAIN])
+
+        self.assertIsNone(state)
+        self.assertEqual(replica_handler(), [PRIMARY_DOMAIN])
+
+    def test_handler(self):
+        self.assertEqual(replica_handler(), [REPLICA_DOMAIN])
+
+    def test_iter_from_read_replica(self):
+        def scan():
+            for _ in range(2):
+                yield read_domains()
+
+        results = []
+        for domains in iter_from_read_replica(scan()):
+            # the writes between the steps don't pin the next steps
+            Site.objects.filter(domain=PRIMARY_DOMAIN).update(name="updated")
+            results.append((domains, read_domains()))
+
+        self.assertEqual(results, [([REPLICA_DOMAIN], [PRIMARY_DOMAIN])] * 2)
+
+    def test_view_read_replica_methods(self):
+        self.assertEqual(get_view_read_replica_methods(ReplicaView.as_view()), ("GET", "HEAD", "OPTIONS"))
+        self.assertEqual(get_view_read_replica_methods(ReplicaPostView.as_view()), ("POST",))
+        self.assertEqual(get_view_read_replica_methods(APIView.as_view()), ())
+
+    def call_middleware(self, request, view=ReplicaView, write=False, streaming=False):
+        middleware = None
+        domains = []
+
+        def get_response(request):
+            middleware.process_view(request, view.as_view(), (), {})
+            if write:
+                Site.objects.create(domain="new.example.org", name="new")
+            if streaming:
+                # the domains are read once the content is iterated
+                return StreamingHttpResponse(stream_domains())
+            domains.extend(read_domains())
+            return HttpResponse()
+
+        middleware = ReadReplicaMiddleware(get_response)
+        response = middleware(request)
+        if streaming:
+            domains.append(b"".join(response.streaming_content).decode())
+        return response, domains
+
+    def test_middleware(self):
+        response, domains = self.call_middleware(RequestFactory().get("/"))
+
+        self.assertEqual(domains, [REPLICA_DOMAIN])
+        self.assertNotIn(READ_REPLICA_PIN_COOKIE_NAME, response.cookies)
+
+    def test_middleware_other_methods(self):
+        __, domains = self.call_middleware(RequestFactory().post("/"))
+        self.assertEqual(domains, [PRIMARY_DOMAIN])
+
+        __, domains = self.call_middleware(RequestFactory().post("/"), view=ReplicaPostView)
+        self.assertEqual(domains, [REPLICA_DOMAIN])
+
+    def test_middleware_token_clients(self):
+        __, domains = self.call_middleware(RequestFactory().get("/", HTTP_AUTHORIZATION="JWT token"))
+        self.assertEqual(domains, [REPLICA_DOMAIN])
+
+        # these clients can't be pinned
+        __, domains = self.call_middleware(
+            RequestFactory().get("/", HTTP_AUTHORIZATION="JWT token"), view=ReplicaCookieClientsView
+        )
+        self.assertEqual(domains, [PRIMARY_DOMAIN])
+
+        __, domains = self.call_middleware(RequestFactory().get("/"), view=ReplicaCookieClientsView)
+        self.assertEqual(domains, [REPLICA_DOMAIN])
+
+    def test_middleware_views_without_replica(self):
+        __, domains = self.call_middleware(RequestFactory().get("/"), view=APIView)
+        self.assertEqual(domains, [PRIMARY_DOMAIN])
+
+    def test_middleware_streaming(self):
+        __, domains = self.call_middleware(RequestFactory().get("/"), streaming=True)
+        self.assertEqual(domains, [REPLICA_DOMAIN])
+
+    @override_settings(READ_REPLICA_PIN_SECONDS=15)
+    def test_middleware_pins_writing_clients(self):
+        response, domains = self.call_middleware(RequestFactory().get("/"), write=True)
+
+        self.assertEqual(domains, [PRIMARY_DOMAIN])
+        cookie = response.cookies[READ_REPLICA_PIN_COOKIE_NAME]
+        self.assertEqual(cookie["max-age"], 15)
+
+        request = RequestFactory().get("/")
+        request.COOKIES[READ_REPLICA_PIN_COOKIE_NAME] = cookie.value
+        __, domains = self.call_middleware(request)
+        self.assertEqual(domains, [PRIMARY_DOMAIN])
+
+    @override_settings(READ_REPLICA_DATABASE=None)
+    def test_middleware_disabled(self):
+        response, domains = self.call_middleware(RequestFactory().get("/"), write=True)
+
+        self.assertEqual(domains, [PRIMARY_DOMAIN])
+        self.assertNotIn(READ_REPLICA_PIN_COOKIE_NAME, response.cookies)
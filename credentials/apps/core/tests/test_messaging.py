@@ -0,0 +1,123 @@
+"""Test core.messaging."""
+
+from datetime import timedelta
+from unittest import mock
+
+from django.core import mail
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+from django.utils import timezone
+from edx_ace import Recipient
+from edx_ace.message import Message
+
+from credentials.apps.core.messaging import purge_queued_messages, send_message, send_queued_messages
+from credentials.apps.core.models import QueuedMessage
+from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.records.messages import ProgramCreditRequest
+
+QUEUE_ENABLED = {"ENABLED": True, "MAX_WORKERS": 2, "RATE_LIMIT": 0}
+
+
+class MessagingTests(SiteMixin, TestCase):
+    """Tests for the batched ACE messages delivery."""
+
+    def _get_message(self, email_address="pathway@example.com"):
+        return ProgramCreditRequest(self.site, "learner@example.com").personalize(
+            recipient=Recipient(lms_user_id=None, email_address=email_address),
+            language="en",
+            user_context={
+                "pathway_name": "Pathway",
+                "program_name": "Program",
+                "record_link": "https://example.com/records/",
+                "user_full_name": "Learner",
+                "program_completed": True,
+                "previously_sent": False,
+                "csv_link": "https://example.com/records/csv",
+            },
+        )
+
+    def test_send_message(self):
+        send_message(self._get_message())
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertFalse(QueuedMessage.objects.exists())
+
+    @override_settings(ACE_MESSAGE_QUEUE=QUEUE_ENABLED)
+    def test_send_queued_messages(self):
+        for index in range(3):
+            send_message(self._get_message(f"pathway{index}@example.com"))
+
+        self.assertEqual(len(mail.outbox), 0)
+        self.assertEqual(QueuedMessage.objects.filter(state=QueuedMessage.PENDING).count(), 3)
+
+        self.assertEqual(send_queued_messages(batch_size=2), 2)
+        self.assertEqual(send_queued_messages(batch_size=2), 1)
+        self.assertEqual(send_queued_messages(batch_size=2), 0)
+
+        self.assertEqual(
+            sorted(email.to[0] for email in mail.outbox),
+            ["pathway0@example.com", "pathway1@example.com", "pathway2@example.com"],
+        )
+        self.assertEqual(mail.outbox[0].reply_to, ["learner@example.com"])
+        self.assertEqual(QueuedMessage.objects.filter(state=QueuedMessage.SENT).count(), 3)
+
+    @override_settings(ACE_MESSAGE_QUEUE=QUEUE_ENABLED)
+    @mock.patch("edx_ace.ace.send", side_effect=Exception("unavailable"))
+    def test_send_queued_messages_retries(self, mock_send):
+        send_message(self._get_message())
+
+        call_command("send_queued_messages", max_attempts=2)
+        queued_message = QueuedMessage.objects.get()
+        self.assertEqual(queued_message.state, QueuedMessage.PENDING)
+        self.assertEqual(queued_message.attempts, 1)
+        self.assertEqual(queued_message.error, "unavailable")
+
+        call_command("send_queued_messages", max_attempts=2)
+        queued_message.refresh_from_db()
+        self.assertEqual(queued_message.state, QueuedMessage.FAILED)
+        self.assertEqual(mock_send.call_count, 2)
+
+    @override_settings(ACE_MESSAGE_QUEUE=QUEUE_ENABLED)
+    def test_send_queued_messages_claimed(self):
+        send_message(self._get_message())
+        states = []
+        original_from_string = Message.from_string
+
+        def from_string(message):
+            # the deliveries use their own threads (and database connections), the state is read before
+            states.extend(QueuedMessage.objects.values_list("state"))
+            return original_from_string(message)
+
+        with mock.patch("credentials.apps.core.messaging.Message.from_string", side_effect=from_string):
+            send_queued_messages()
+
+        # the message is delivered once it is claimed
+        self.assertEqual(states, [(QueuedMessage.SENDING,)])
+        self.assertEqual(QueuedMessage.objects.get().state, QueuedMessage.SENT)
+
+    @override_settings(ACE_MESSAGE_QUEUE={**QUEUE_ENABLED, "CLAIM_TIMEOUT": 60})
+    def test_send_interrupted_messages(self):
+        for index in range(2):
+            send_message(self._get_message(f"pathway{index}@example.com"))
+        QueuedMessage.objects.update(state=QueuedMessage.SENDING)
+        QueuedMessage.objects.filter(id=QueuedMessage.objects.earliest("id").id).update(
+            modified=timezone.now() - timedelta(seconds=61)
+        )
+
+        # only the message claimed by the interrupted delivery is delivered again
+        self.assertEqual(send_queued_messages(), 1)
+        self.assertEqual([email.to[0] for email in mail.outbox], ["pathway0@example.com"])
+
+    @override_settings(ACE_MESSAGE_QUEUE=QUEUE_ENABLED)
+    def test_purge_queued_messages(self):
+        for __ in range(4):
+            send_message(self._get_message())
+        messages = list(QueuedMessage.objects.order_by("id"))
+        for queued_message, state in zip(messages, (QueuedMessage.SENT, QueuedMessage.FAILED, QueuedMessage.PENDING)):
+            QueuedMessage.objects.filter(id=queued_message.id).update(
+                state=state, modified=timezone.now() - timedelta(days=8)
+            )
+        QueuedMessage.objects.filter(id=messages[3].id).update(state=QueuedMessage.SENT)
+
+        self.assertEqual(purge_queued_messages(retention_days=7), 2)
+        self.assertEqual(list(QueuedMessage.objects.order_by("id")), messages[2:])
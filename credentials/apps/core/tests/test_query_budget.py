@@ -0,0 +1,109 @@
+"""Tests for the query budgets"""
+
+from unittest import mock
+
+from django.contrib.sites.models import Site
+from django.http import HttpResponse
+from django.test import RequestFactory, TestCase
+from rest_framework.views import APIView
+
+from credentials.apps.core.query_budget import (
+    QueryBudgetMiddleware,
+    enforce_query_budgets,
+    get_fingerprint,
+    get_view_query_budget,
+    query_budget,
+    track_queries,
+)
+
+LOGGER_NAME = "credentials.apps.core.query_budget"
+
+
+def read_sites(count):
+    for _ in range(count):
+        list(Site.objects.all())
+    list(Site.objects.filter(id__in=[1, 2]))
+    list(Site.objects.filter(id__in=[1, 2, 3]))
+
+
+@query_budget(3)
+def budgeted_handler(count):
+    read_sites(count)
+
+
+@query_budget(1)
+class BudgetedView(APIView):
+    pass
+
+
+class QueryBudgetTests(TestCase):
+    @mock.patch("credentials.apps.core.query_budget.set_custom_attribute")
+    def test_track_queries(self, mock_set_custom_attribute):
+        with track_queries("test") as stats:
+            read_sites(3)
+
+        self.assertEqual(stats.count, 5)
+        # the repeated query and the IN queries of different lengths:
+        self.assertEqual(stats.duplicates, 3)
+        self.assertFalse(stats.exceeded)
+        mock_set_custom_attribute.assert_any_call("test_query_count", 5)
+        mock_set_custom_attribute.assert_any_call("test_query_duplicates", 3)
+        self.assertEqual(mock_set_custom_attribute.call_args_list[2][0][0], "test_query_time_ms")
+
+    def test_fingerprint(self):
+        self.assertEqual(
+            get_fingerprint('SELECT "id" FROM "site" WHERE "id" IN (%s, %s, %s) AND "name" = %s'),
+            'SELECT "id" FROM "site" WHERE "id" IN (...) AND "name" = %s',
+        )
+
+    @mock.patch("credentials.apps.core.query_budget.increment")
+    def test_handler_within_budget(self, mock_increment):
+        with enforce_query_budgets() as violations:
+            budgeted_handler(1)
+
+        self.assertEqual(violations, [])
+        mock_increment.assert_not_called()
+
+    @mock.patch("credentials.apps.core.query_budget.increment")
+    def test_handler_over_budget(self, mock_increment):
+        with self.assertLogs(LOGGER_NAME, level="WARNING") as logs:
+            with enforce_query_budgets() as violations:
+                budgeted_handler(3)
+
+        self.assertEqual(len(violations), 1)
+        self.assertIn("[budgeted_handler] made 5 queries over its budget of 3", violations[0])
+        self.assertIn("the most repeated one (3 times)", logs.output[0])
+        mock_increment.assert_called_once_with("query_budget_exceeded")
+
+    def test_nested_enforcement(self):
+        with enforce_query_budgets() as outer_violations:
+            with enforce_query_budgets() as violations:
+                with self.assertLogs(LOGGER_NAME, level="WARNING"):
+                    budgeted_handler(3)
+
+        self.assertEqual(len(violations), 1)
+        self.assertEqual(outer_violations, [])
+
+    def test_view_query_budget(self):
+        self.assertEqual(get_view_query_budget(BudgetedView.as_view()), 1)
+        self.assertEqual(get_view_query_budget(budgeted_handler), 3)
+        self.assertIsNone(get_view_query_budget(APIView.as_view()))
+
+    def test_middleware(self):
+        view = BudgetedView.as_view()
+        middleware = None
+
+        def get_response(request):
+            middleware.process_view(request, view, (), {})
+            read_sites(0)
+            return HttpResponse()
+
+        middleware = QueryBudgetMiddleware(get_response)
+        request = RequestFactory().get("/")
+
+        with enforce_query_budgets() as violations:
+            middleware(request)
+
+        self.assertEqual(request.query_stats.count, 2)
+        self.assertEqual(len(violations), 1)
+        self.assertIn(f"[{__name__}.BudgetedView] made 2 queries over its budget of 1", violations[0])
@@ -0,0 +1,86 @@
+"""Tests for the stage timing"""
+
+from unittest import mock
+
+from django.test import SimpleTestCase, override_settings
+
+from credentials.apps.core.timing import parse_stage_timings, timed_operation, timed_stage
+
+LOGGER_NAME = "credentials.apps.core.timing"
+
+
+@override_settings(STAGE_TIMING_ENABLED=True)
+class TimingTests(SimpleTestCase):
+    @mock.patch("credentials.apps.core.timing.set_custom_attribute")
+    def test_operation(self, mock_set_custom_attribute):
+        with self.assertLogs(LOGGER_NAME) as logs:
+            with timed_operation("issuance"):
+                with timed_stage("upsert"):
+                    pass
+                with timed_stage("email"):
+                    pass
+                with timed_stage("upsert"):
+                    pass
+
+        self.assertEqual(len(logs.records), 1)
+        record = logs.records[0]
+        self.assertEqual(list(record.stage_timings), ["operation", "total_ms", "upsert_ms", "email_ms"])
+        self.assertEqual(
+            parse_stage_timings(record.getMessage()),
+            (
+                "issuance",
+                {
+                    "total": record.stage_timings["total_ms"],
+                    "upsert": record.stage_timings["upsert_ms"],
+                    "email": record.stage_timings["email_ms"],
+                },
+            ),
+        )
+        self.assertEqual(
+            [call[0][0] for call in mock_set_custom_attribute.call_args_list],
+            ["issuance_total_ms", "issuance_upsert_ms", "issuance_email_ms"],
+        )
+
+    def test_nested_operation(self):
+        with self.assertLogs(LOGGER_NAME) as logs:
+            with timed_operation("event"):
+                with timed_stage("user"):
+                    pass
+                with timed_operation("issuance"):
+                    with timed_stage("upsert"):
+                        pass
+
+        inner, outer = (record.stage_timings for record in logs.records)
+        self.assertEqual(list(inner), ["operation", "total_ms", "upsert_ms"])
+        self.assertEqual(list(outer), ["operation", "total_ms", "user_ms", "issuance_ms"])
+
+    def test_operation_failure(self):
+        with self.assertLogs(LOGGER_NAME) as logs:
+            with self.assertRaises(ValueError):
+                with timed_operation("issuance"):
+                    with timed_stage("upsert"):
+                        raise ValueError
+
+        self.assertIn("upsert_ms", logs.records[0].stage_timings)
+
+    def test_stage_outside_of_operation(self):
+        with self.assertNoLogs(LOGGER_NAME):
+            with timed_stage("upsert"):
+                pass
+
+    @override_settings(STAGE_TIMING_ENABLED=False)
+    def test_disabled(self):
+        with self.assertNoLogs(LOGGER_NAME):
+            with timed_operation("issuance") as operation:
+                with timed_stage("upsert"):
+                    pass
+
+        self.assertIsNone(operation)
+
+    def test_parse_other_lines(self):
+        self.assertIsNone(parse_stage_timings("INFO Issued a credential"))
+        self.assertIsNone(parse_stage_timings("Stage timings: upsert_ms=1.0"))
+        self.assertEqual(
+            parse_stage_timings("2026-10-19 INFO [timing] Stage timings: operation=sync total_ms=5.5 api_ms=x"),
+            ("sync", {"total": 5.5}),
+        )
@@ -0,0 +1,156 @@
+import json
+import os
+import tempfile
+from unittest import mock
+from urllib.parse import parse_qs, urlparse
+
+import responses
+from django.contrib.auth import get_user_model
+from django.test import TestCase
+
+from credentials.apps.core.tests.factories import UserFactory
+from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.core.user_sync import iterate_user_batches, sync_users
+
+User = get_user_model()
+
+JSON = "application/json"
+
+
+class SyncUsersTests(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = [UserFactory(username=f"user{i}", lms_user_id=None) for i in range(7)]
+        # stub LMS accounts, user6 is missing on the LMS
+        self.lms_accounts = {
+            user.username: {"username": user.username, "id": 100 + i} for i, user in enumerate(self.users[:6])
+        }
+        self.requested_usernames = []
+        self.failing_usernames = set()
+
+        self.mock_access_token_response()
+        responses.add_callback(
+            responses.GET,
+            self.site.siteconfiguration.user_api_url + "accounts",
+            callback=self.accounts_callback,
+            content_type=JSON,
+            match_querystring=False,
+        )
+
+    def accounts_callback(self, request):
+        usernames = parse_qs(urlparse(request.url).query)["username"][0].split(",")
+        self.requested_usernames.append(usernames)
+        if self.failing_usernames.intersection(usernames):
+            return 503, {}, "{}"
+        accounts = [self.lms_accounts[username] for username in usernames if username in self.lms_accounts]
+        return 200, {}, json.dumps(accounts)
+
+    def update_user(self, user, account):
+        if account is None:
+            return False
+        user.lms_user_id = account["id"]
+        return True
+
+    def sync(self, **kwargs):
+        return sync_users(
+            User.objects.filter(lms_user_id=None, username__startswith="user"),
+            self.site_configuration,
+            self.update_user,
+            ["lms_user_id"],
+            **kwargs,
+        )
+
+    def test_iterate_user_batches(self):
+        batches = list(
+            iterate_user_batches(
+                User.objects.filter(username__startswith="user"), 3, start_after=self.users[0].id, limit=5
+            )
+        )
+        self.assertEqual(
+            [[user.id for user in batch] for batch in batches],
+            [[u.id for u in self.users[1:4]], [u.id for u in self.users[4:6]]],
+        )
+
+    @responses.activate
+    def test_sync_users(self):
+        report = self.sync(batch_size=2, max_workers=2)
+
+        self.assertEqual(report, {"processed": 7, "updated": 6, "failed": 0})
+        self.assertEqual(len(self.requested_usernames), 4)
+        self.assertTrue(all(len(usernames) <= 2 for usernames in self.requested_usernames))
+        self.assertEqual(
+            dict(User.objects.filter(username__startswith="user").values_list("username", "lms_user_id")),
+            {**{username: account["id"] for username, account in self.lms_accounts.items()}, "user6": None},
+        )
+
+    @responses.activate
+    def test_sync_users_failed_batch(self):
+        self.failing_usernames.add("user3")
+        report = self.sync(batch_size=2, max_workers=3)
+
+        self.assertEqual(report, {"processed": 7, "updated": 4, "failed": 2})
+        self.assertFalse(User.objects.filter(username__in=["user2", "user3"]).exclude(lms_user_id=None).exists())
+
+    @responses.activate
+    def test_sync_users_dry_run(self):
+        report = self.sync(batch_size=10, dry_run=True)
+
+        self.assertEqual(report["updated"], 6)
+        self.assertFalse(User.objects.filter(username__startswith="user").exclude(lms_user_id=None).exists())
+
+    @responses.activate
+    def test_sync_users_resume(self):
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file = os.path.join(directory, "checkpoint")
+
+            report = self.sync(batch_size=2, max_workers=1, limit=3, checkpoint_file=checkpoint_file)
+            self.assertEqual(report["processed"], 3)
+            with open(checkpoint_file, encoding="utf-8") as checkpoint:
+                self.assertEqual(int(checkpoint.read()), self.users[2].id)
+
+            self.requested_usernames = []
+            report = self.sync(batch_size=10, checkpoint_file=checkpoint_file)
+
+        self.assertEqual(report["processed"], 4)
+        self.assertEqual(self.requested_usernames, [["user3", "user4", "user5", "user6"]])
+
+    @responses.activate
+    def test_sync_users_resume_failed_batch(self):
+        self.failing_usernames.add("user3")
+        with tempfile.TemporaryDirectory() as directory:
+            checkpoint_file = os.path.join(directory, "checkpoint")
+
+            with self.assertLogs("credentials.apps.core.user_sync", level="WARNING") as logs:
+                self.sync(batch_size=2, max_workers=1, checkpoint_file=checkpoint_file)
+            # the checkpoint isn't advanced past the failed batch
+            with open(checkpoint_file, encoding="utf-8") as checkpoint:
+                self.assertEqual(int(checkpoint.read()), self.users[1].id)
+            self.assertIn(f"the checkpoint is frozen at user id {self.users[1].id}", logs.output[-1])
+
+            self.failing_usernames.clear()
+            self.requested_usernames = []
+            report = self.sync(batch_size=10, checkpoint_file=checkpoint_file)
+
+        self.assertEqual(report["updated"], 2)
+        self.assertEqual(self.requested_usernames, [["user2", "user3", "user6"]])
+
+    @responses.activate
+    @mock.patch("credentials.apps.core.user_sync.clear_user_identity_cache")
+    def test_sync_users_clears_identity_cache(self, mock_clear_user_identity_cache):
+        with self.captureOnCommitCallbacks(execute=True):
+            self.sync(batch_size=4, max_workers=1)
+
+        self.assertEqual(
+            [call.args for call in mock_clear_user_identity_cache.call_args_list],
+            [("user0", "user1", "user2", "user3"), ("user4", "user5")],
+        )
+
+    @responses.activate
+    @mock.patch("credentials.apps.core.user_sync.invalidate_public_program_records")
+    def test_sync_users_invalidates_public_records(self, mock_invalidate_public_program_records):
+        self.sync(batch_size=4, max_workers=1)
+
+        self.assertEqual(
+            [call.args for call in mock_invalidate_public_program_records.call_args_list],
+            [("user0", "user1", "user2", "user3"), ("user4", "user5")],
+        )
@@ -0,0 +1,99 @@
+from datetime import timedelta
+
+from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.utils import timezone
+
+from credentials.apps.badges.models import BadgeProgress
+from credentials.apps.core.models import UsernameReplacementJob
+from credentials.apps.core.tests.factories import UserFactory
+from credentials.apps.core.username_replacement import (
+    chunk_username_mappings,
+    purge_username_replacement_jobs,
+    replace_usernames,
+)
+from credentials.apps.credentials.models import UserCredential
+from credentials.apps.credentials.tests.factories import UserCredentialFactory
+from credentials.apps.records.models import UserGrade
+from credentials.apps.records.tests.factories import UserGradeFactory
+
+User = get_user_model()
+
+
+class ReplaceUsernamesTests(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.users = UserFactory.create_batch(4, full_name="Jane Example")
+        for user in self.users:
+            UserCredentialFactory(username=user.username)
+            UserGradeFactory(username=user.username)
+            BadgeProgress.objects.create(username=user.username)
+        self.mappings = [{user.username: f"{user.username}_new"} for user in self.users]
+
+    def assert_replaced(self, users):
+        for user in users:
+            new_username = f"{user.username}_new"
+            self.assertEqual(User.objects.get(username=new_username).full_name, "")
+            self.assertTrue(UserCredential.objects.filter(username=new_username).exists())
+            self.assertTrue(UserGrade.objects.filter(username=new_username).exists())
+            self.assertTrue(BadgeProgress.objects.filter(username=new_username).exists())
+
+    def test_replace_usernames(self):
+        # one update per model and chunk
+        with CaptureQueriesContext(connection) as queries:
+            result = replace_usernames(self.mappings + [{"missing": "missing_new"}], chunk_size=3)
+        updates = [query for query in queries.captured_queries if query["sql"].startswith("UPDATE")]
+
+        self.assertEqual(len(updates), 8)
+        self.assertEqual(result["successful_replacements"], self.mappings + [{"missing": "missing_new"}])
+        self.assertEqual(result["failed_replacements"], [])
+        self.assertEqual(
+            result["replacement_counts"],
+            {"core.user": 4, "credentials.usercredential": 4, "records.usergrade": 4, "badges.badgeprogress": 4},
+        )
+        self.assert_replaced(self.users)
+
+    def test_chained_replacements(self):
+        """Verify chained mappings are applied one after another."""
+        username = self.users[0].username
+        result = replace_usernames([{username: "intermediate"}, {"intermediate": f"{username}_new"}], chunk_size=10)
+
+        self.assertEqual(len(result["successful_replacements"]), 2)
+        self.assert_replaced(self.users[:1])
+
+    def test_chunk_username_mappings(self):
+        pairs = [("a", "b"), ("c", "d"), ("b", "e"), ("f", "g"), ("h", "i")]
+        self.assertEqual(
+            list(chunk_username_mappings(pairs, 2)),
+            [[("a", "b"), ("c", "d")], [("b", "e"), ("f", "g")], [("h", "i")]],
+        )
+
+    def test_failed_chunk_is_replaced_one_by_one(self):
+        """Verify only the failing mappings of a chunk are reported as failed."""
+        taken_username = UserFactory().username
+        failing_username = self.users[1].username
+        self.mappings[1] = {failing_username: taken_username}
+
+        result = replace_usernames(self.mappings, chunk_size=10)
+
+        self.assertEqual(result["failed_replacements"], [self.mappings[1]])
+        self.assertEqual(len(result["successful_replacements"]), 3)
+        self.assertTrue(User.objects.filter(username=failing_username).exists())
+        self.assertTrue(UserGrade.objects.filter(username=failing_username).exists())
+        self.assert_replaced([user for user in self.users if user.username != failing_username])
+
+
+class UsernameReplacementJobsTests(TestCase):
+    def test_purge_username_replacement_jobs(self):
+        jobs = [UsernameReplacementJob.objects.create(username_mappings=[]) for __ in range(4)]
+        states = (UsernameReplacementJob.COMPLETED, UsernameReplacementJob.FAILED, UsernameReplacementJob.PENDING)
+        for job, state in zip(jobs, states):
+            UsernameReplacementJob.objects.filter(id=job.id).update(
+                state=state, modified=timezone.now() - timedelta(days=8)
+            )
+        UsernameReplacementJob.objects.filter(id=jobs[3].id).update(state=UsernameReplacementJob.COMPLETED)
+
+        self.assertEqual(purge_username_replacement_jobs(retention_days=7), 2)
+        self.assertEqual(list(UsernameReplacementJob.objects.order_by("id")), jobs[2:])
@@ -1,11 +1,15 @@
 """Test core.utils."""
 
+from decimal import Decimal
 from unittest import mock
 
 from django.test import TestCase
 
+from credentials.apps.catalog.tests.factories import CourseRunFactory
 from credentials.apps.core.tests.factories import UserFactory
-from credentials.apps.core.utils import update_full_name
+from credentials.apps.core.utils import update_full_name, update_or_create_if_changed
+from credentials.apps.records.models import UserGrade
+from credentials.apps.records.tests.factories import UserGradeFactory
 
 
 class UtilsTests(TestCase):
@@ -28,3 +32,56 @@ class UtilsTests(TestCase):
         update_full_name(strategy, {"full_name": "Bort"}, self.user)
         self.assertEqual(self.user.full_name, "Bort")
         self.assertTrue(strategy.storage.user.changed.called)
+
+
+class UpdateOrCreateIfChangedTests(TestCase):
+    """Tests for the conditional upsert."""
+
+    def setUp(self):
+        super().setUp()
+        self.course_run = CourseRunFactory()
+        self.lookup = {"username": "learner", "course_run": self.course_run}
+        self.defaults = {"letter_grade": "A", "percent_grade": Decimal("0.9000"), "verified": True}
+
+    def test_create(self):
+        grade, created = update_or_create_if_changed(UserGrade, self.defaults, **self.lookup)
+
+        self.assertTrue(created)
+        self.assertEqual(grade, UserGrade.objects.get(**self.lookup))
+
+    def test_update(self):
+        stored = UserGradeFactory(**self.lookup, letter_grade="B")
+
+        with mock.patch("credentials.apps.core.utils.increment") as mock_increment:
+            grade, created = update_or_create_if_changed(UserGrade, self.defaults, **self.lookup)
+
+        self.assertFalse(created)
+        mock_increment.assert_not_called()
+        stored.refresh_from_db()
+        self.assertEqual(stored.letter_grade, "A")
+        self.assertEqual(stored.modified, grade.modified)
+        self.assertGreater(stored.modified, stored.created)
+
+    def test_noop(self):
+        stored = UserGradeFactory(**self.lookup, **self.defaults)
+
+        # the stored grade is only read:
+        with mock.patch("credentials.apps.core.utils.increment") as mock_increment, self.assertNumQueries(1):
+            grade, created = update_or_create_if_changed(
+                UserGrade, {**self.defaults, "course_run": self.course_run}, **self.lookup
+            )
+
+        self.assertFalse(created)
+        self.assertEqual(grade, stored)
+        mock_increment.assert_called_once_with("usergrade_noop_writes")
+        self.assertEqual(UserGrade.objects.get().modified, stored.modified)
+
+    def test_stale(self):
+        stored = UserGradeFactory(**self.lookup, letter_grade="B")
+
+        with mock.patch("credentials.apps.core.utils.increment") as mock_increment:
+            update_or_create_if_changed(UserGrade, self.defaults, is_stale=lambda grade: True, **self.lookup)
+
+        mock_increment.assert_called_once_with("usergrade_stale_writes")
+        stored.refresh_from_db()
+        self.assertEqual(stored.letter_grade, "B")
@@ -0,0 +1,137 @@
+"""
+Per-stage timing of the credential issuance and event handling operations.
+
+An operation (`timed_operation`) times the stages (`timed_stage`) run within it, in the same thread, at any depth of
+the call stack. When the operation completes, its total and per-stage durations (in milliseconds) are:
+    - logged as a single structured line (`Stage timings: operation=<name> total_ms=<ms> <stage>_ms=<ms> ...`, the
+      durations are also passed to the log record as the `stage_timings` extra field), see the `report_stage_timings`
+      management command for the aggregation of the captured logs;
+    - exported as `<operation>_total_ms` and `<operation>_<stage>_ms` custom attributes.
+
+A stage run more than once within an operation is summed. An operation started within another operation is reported
+on its own and is timed as a stage of the outer one.
+
+The timing is enabled with the STAGE_TIMING_ENABLED setting; when it's disabled, the operations and the stages are
+shared no-op context managers.
+"""
+
+import logging
+import threading
+import time
+from contextlib import contextmanager, nullcontext
+
+from django.conf import settings
+from edx_django_utils.monitoring import set_custom_attribute
+
+logger = logging.getLogger(__name__)
+
+LOG_MESSAGE_PREFIX = "Stage timings: "
+
+_NOOP = nullcontext()
+_local = threading.local()
+
+
+class TimedOperation:
+    """
+    Stage durations of an operation.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.stages = {}
+        self.started = time.perf_counter()
+
+    def add(self, stage, duration):
+        self.stages[stage] = self.stages.get(stage, 0.0) + duration
+
+    def report(self):
+        timings = {"total_ms": _to_ms(time.perf_counter() - self.started)}
+        timings.update((f"{stage}_ms", _to_ms(duration)) for stage, duration in self.stages.items())
+
+        for field, value in timings.items():
+            set_custom_attribute(f"{self.name}_{field}", value)
+        fields = " ".join(f"{field}={value}" for field, value in timings.items())
+        logger.info(
+            f"{LOG_MESSAGE_PREFIX}operation={self.name} {fields}",
+            extra={"stage_timings": {"operation": self.name, **timings}},
+        )
+
+
+def _to_ms(duration):
+    return round(duration * 1000, 2)
+
+
+def _get_operations():
+    operations = getattr(_local, "operations", None)
+    if operations is None:
+        operations = _local.operations = []
+    return operations
+
+
+def timed_operation(name):
+    """
+    Times the operation and the stages run within it (a context manager).
+    """
+    if not getattr(settings, "STAGE_TIMING_ENABLED", False):
+        return _NOOP
+    return _timed_operation(name)
+
+
+@contextmanager
+def _timed_operation(name):
+    operations = _get_operations()
+    operation = TimedOperation(name)
+    operations.append(operation)
+    try:
+        yield operation
+    finally:
+        operations.pop()
+        if operations:
+            operations[-1].add(name, time.perf_counter() - operation.started)
+        operation.report()
+
+
+def timed_stage(name):
+    """
+    Times the stage of the current operation (a context manager), a no-op outside of an operation.
+    """
+    operations = getattr(_local, "operations", None)
+    if not operations:
+        return _NOOP
+    return _timed_stage(operations[-1], name)
+
+
+@contextmanager
+def _timed_stage(operation, name):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        operation.add(name, time.perf_counter() - started)
+
+
+def parse_stage_timings(line):
+    """
+    Parses the stage timings log line.
+
+    Returns:
+        tuple: the operation name and the durations by the stage (including the "total"), or None if the line isn't a
+            stage timings log line.
+    """
+    _, prefix, fields = line.partition(LOG_MESSAGE_PREFIX)
+    if not prefix:
+        return None
+
+    operation, timings = None, {}
+    for field in fields.split():
+        key, _, value = field.partition("=")
+        if key == "operation":
+            operation = value
+        elif key.endswith("_ms"):
+            try:
+                timings[key[: -len("_ms")]] = float(value)
+            except ValueError:
+                continue
+    if operation is None or "total" not in timings:
+        return None
+    return operation, timings
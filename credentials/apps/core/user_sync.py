@@ -0,0 +1,214 @@
+"""
+Synchronization of Credentials users with their LMS accounts.
+
+Users are iterated by primary key (keyset pagination) in batches. A round of batches is fetched concurrently from the
+LMS accounts API, through a single pooled OAuth session, and the changed users are written with a single `bulk_update`
+per batch (the batches are read from the read replica, if any). After every round, the last user id processed without
+failures (no batch failed up to it) is saved to the (optional) checkpoint file, so an interrupted synchronization is
+resumed from there. The failed batches are not retried by the run itself: the checkpoint is no longer advanced after a
+failure, so they are reprocessed by running the synchronization again with the same checkpoint file.
+"""
+
+import logging
+import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from pathlib import Path
+from urllib.parse import urljoin
+
+from django.db import transaction
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from credentials.apps.core.api import clear_user_identity_cache
+from credentials.apps.core.db_routing import iter_from_read_replica
+from credentials.apps.records.public_records import invalidate_public_program_records
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+DEFAULT_MAX_WORKERS = 4
+
+
+class LMSAccountsError(Exception):
+    """The LMS accounts API didn't return the accounts of a batch of users."""
+
+
+def get_pooled_api_client(site_config, max_workers):
+    """
+    Returns the OAuth API client of the site, with a connection pool sized for the concurrent requests.
+
+    Idempotent requests are retried on connection errors and on the LMS throttling/server errors.
+    """
+
+    api_client = site_config.api_client
+    adapter = HTTPAdapter(
+        pool_connections=max_workers,
+        pool_maxsize=max_workers,
+        max_retries=Retry(
+            total=3, backoff_factor=0.5, status_forcelist=(429, 500, 502, 503, 504), raise_on_status=False
+        ),
+    )
+    api_client.mount("https://", adapter)
+    api_client.mount("http://", adapter)
+    return api_client
+
+
+def fetch_accounts(api_client, site_config, usernames):
+    """
+    Fetches the LMS accounts of the users.
+
+    Arguments:
+        api_client (requests.Session): LMS API client.
+        site_config (SiteConfiguration): configuration of the site to query.
+        usernames (list): usernames of the batch.
+
+    Returns:
+        dict: LMS accounts keyed by username.
+
+    Raises:
+        LMSAccountsError: the accounts API responded with an error.
+    """
+
+    user_url = urljoin(site_config.user_api_url, f"accounts?username={','.join(usernames)}")
+    user_response = api_client.get(user_url)
+    if user_response.status_code != 200:
+        raise LMSAccountsError(
+            f"{urljoin(site_config.user_api_url, 'accounts?username=')}[usernames redacted] "
+            f"returned status {user_response.status_code}"
+        )
+    return {account["username"]: account for account in user_response.json()}
+
+
+def read_checkpoint(checkpoint_file):
+    """
+    Returns the last processed user id saved to the checkpoint file, 0 if there is none.
+    """
+
+    if not checkpoint_file:
+        return 0
+    try:
+        return int(Path(checkpoint_file).read_text(encoding="utf-8").strip() or 0)
+    except FileNotFoundError:
+        return 0
+
+
+def write_checkpoint(checkpoint_file, last_id):
+    """
+    Saves the last processed user id to the checkpoint file.
+    """
+
+    if checkpoint_file:
+        Path(checkpoint_file).write_text(str(last_id), encoding="utf-8")
+
+
+def iterate_user_batches(queryset, batch_size, start_after=0, limit=0):
+    """
+    Yields batches of users ordered by id, without offset slicing.
+
+    Arguments:
+        queryset (QuerySet): users to iterate.
+        batch_size (int): users per batch.
+        start_after (int): iterate users with a greater id only.
+        limit (int): the maximum number of users, unlimited if 0.
+    """
+
+    last_id = start_after
+    remaining = limit or None
+    while remaining is None or remaining > 0:
+        size = batch_size if remaining is None else min(batch_size, remaining)
+        batch = list(queryset.filter(id__gt=last_id).order_by("id")[:size])
+        if not batch:
+            return
+        yield batch
+        last_id = batch[-1].id
+        if remaining is not None:
+            remaining -= len(batch)
+
+
+def sync_users(
+    queryset,
+    site_config,
+    update_user,
+    fields,
+    batch_size=DEFAULT_BATCH_SIZE,
+    max_workers=DEFAULT_MAX_WORKERS,
+    pause_secs=0,
+    limit=0,
+    checkpoint_file=None,
+    dry_run=False,
+):  # pylint: disable=too-many-positional-arguments
+    """
+    Synchronizes users with their LMS accounts.
+
+    Arguments:
+        queryset (QuerySet): users to synchronize.
+        site_config (SiteConfiguration): configuration of the site to query.
+        update_user (callable): called as `update_user(user, account)` for every user with an LMS account (None if
+            the user is missing on the LMS). Updates the user and returns True if it has been changed.
+        fields (list): user fields changed by `update_user`.
+        batch_size (int): users per LMS request.
+        max_workers (int): concurrent LMS requests.
+        pause_secs (float): pause between rounds of concurrent requests.
+        limit (int): the maximum number of users, unlimited if 0.
+        checkpoint_file (str): optional path of the checkpoint file, used to resume the synchronization.
+        dry_run (bool): don't save the changed users.
+
+    Returns:
+        dict: counts of the `processed`, `updated` and `failed` (their accounts couldn't be fetched) users.
+    """
+
+    api_client = get_pooled_api_client(site_config, max_workers)
+    report = {"processed": 0, "updated": 0, "failed": 0}
+    batches = iter_from_read_replica(
+        iterate_user_batches(queryset, batch_size, read_checkpoint(checkpoint_file), limit)
+    )
+    # the checkpoint is not advanced past a failed batch, so that a resumed synchronization retries it
+    checkpoint_frozen = False
+    checkpoint_id = None
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while True:
+            # NOTE: users are loaded from this thread, the LMS requests don't use the database.
+            round_batches = [batch for __, batch in zip(range(max_workers), batches)]
+            if not round_batches:
+                break
+
+            futures = [
+                executor.submit(fetch_accounts, api_client, site_config, [user.username for user in batch])
+                for batch in round_batches
+            ]
+            for batch, future in zip(round_batches, futures):
+                report["processed"] += len(batch)
+                try:
+                    accounts = future.result()
+                except Exception as exc:  # pylint: disable=broad-except
+                    report["failed"] += len(batch)
+                    checkpoint_frozen = True
+                    logger.error(f"Could not get LMS accounts for a batch of {len(batch)} users: {exc}")
+                    continue
+
+                changed = [user for user in batch if update_user(user, accounts.get(user.username))]
+                report["updated"] += len(changed)
+                if changed and not dry_run:
+                    queryset.model.objects.bulk_update(changed, fields)
+                    # `bulk_update` doesn't send the model signals (the public records include the full name)
+                    usernames = [user.username for user in changed]
+                    transaction.on_commit(partial(clear_user_identity_cache, *usernames))
+                    invalidate_public_program_records(*usernames)
+                if not checkpoint_frozen:
+                    checkpoint_id = batch[-1].id
+
+            last_id = round_batches[-1][-1].id
+            if not dry_run and checkpoint_id is not None:
+                write_checkpoint(checkpoint_file, checkpoint_id)
+            logger.info(f"Synchronized {report['processed']} users (up to user id {last_id})")
+            if pause_secs and len(round_batches) == max_workers:
+                time.sleep(pause_secs)
+
+    if checkpoint_frozen:
+        logger.warning(
+            f"{report['failed']} users could not be synchronized, the checkpoint is frozen at user id "
+            f"{checkpoint_id or 0}: run the synchronization again with the same checkpoint file to retry them"
+        )
+    return report
@@ -0,0 +1,226 @@
+"""
+Set-based username replacement.
+
+Username mappings are applied in chunks: every model holding usernames is updated once per chunk, with a single
+`UPDATE ... SET username = CASE username WHEN <current> THEN <new> ... END WHERE username IN (...)` statement.
+A chunk never contains chained replacements (a new username which is the current username of another mapping), so
+mappings are applied as if they were replaced one after another.
+
+Large requests are processed in background (see `UsernameReplacementJob` and `process_username_replacement_jobs`
+management command). The requested mappings of a job are cleared once it is processed, and its outcome is deleted after
+a retention period (see `purge_username_replacement_jobs`).
+"""
+
+import logging
+from datetime import timedelta
+
+from django.apps import apps
+from django.conf import settings
+from django.db import transaction
+from django.db.models import Case, CharField, F, Value, When
+from django.utils import timezone
+
+from credentials.apps.core.api import clear_user_identity_cache
+from credentials.apps.core.models import UsernameReplacementJob
+from credentials.apps.records.public_records import invalidate_public_program_records
+
+logger = logging.getLogger(__name__)
+
+# (model_name, column_name)
+MODELS_WITH_USERNAME = (
+    ("core.user", "username"),
+    ("credentials.usercredential", "username"),
+    ("records.usergrade", "username"),
+    ("badges.badgeprogress", "username"),
+)
+
+DEFAULT_USERNAME_REPLACEMENT = {
+    "CHUNK_SIZE": 500,
+    # requests with more mappings are processed in background
+    "ASYNC_THRESHOLD": 1000,
+    # days the outcome of the processed background requests is kept for
+    "RETENTION_DAYS": 7,
+}
+
+
+def get_username_replacement_config():
+    """
+    Returns username replacement configuration, see the `USERNAME_REPLACEMENT` setting.
+    """
+
+    return {**DEFAULT_USERNAME_REPLACEMENT, **getattr(settings, "USERNAME_REPLACEMENT", {})}
+
+
+def load_replacement_locations(models_with_fields=MODELS_WITH_USERNAME):
+    """Takes tuples that contain a model path and returns the list with a loaded version of the model"""
+    try:
+        return [(apps.get_model(model), column) for (model, column) in models_with_fields]
+    except LookupError:
+        logger.exception("Unable to load models for username replacement")
+        raise
+
+
+def chunk_username_mappings(username_pairs, chunk_size):
+    """
+    Splits (current_username, new_username) pairs into chunks without chained replacements.
+    """
+
+    chunk, current_usernames, new_usernames = [], set(), set()
+    for current_username, new_username in username_pairs:
+        if len(chunk) >= chunk_size or current_username in new_usernames or new_username in current_usernames:
+            yield chunk
+            chunk, current_usernames, new_usernames = [], set(), set()
+        chunk.append((current_username, new_username))
+        current_usernames.add(current_username)
+        new_usernames.add(new_username)
+    if chunk:
+        yield chunk
+
+
+def _replace_chunk(chunk, replacement_locations, counts):
+    """
+    Replaces the usernames of the chunk for all (model, column) pairs, in a single transaction.
+    """
+
+    chunk_counts = {}
+    with transaction.atomic():
+        # the first mapping of a current username wins, as if they were replaced one after another
+        mapping = {}
+        for current_username, new_username in chunk:
+            mapping.setdefault(current_username, new_username)
+
+        for model, column in replacement_locations:
+            new_value = Case(
+                *[When(**{column: current}, then=Value(new)) for current, new in mapping.items()],
+                default=F(column),
+                output_field=CharField(),
+            )
+            update_kwargs = {column: new_value}
+            # Clear PII fields for user retirement to match LMS retirement pattern
+            if model._meta.label_lower == "core.user" and column == "username":
+                update_kwargs["full_name"] = ""
+                update_kwargs["first_name"] = ""
+                update_kwargs["last_name"] = ""
+            chunk_counts[model._meta.label_lower] = model.objects.filter(**{f"{column}__in": list(mapping)}).update(
+                **update_kwargs
+            )
+
+    for label, changed in chunk_counts.items():
+        counts[label] = counts.get(label, 0) + changed
+
+
+def replace_usernames(username_mappings, chunk_size=None, replacement_locations=None):
+    """
+    Replaces usernames for all the models holding them.
+
+    A chunk which fails to be replaced is retried one mapping at a time, so only the failing mappings are reported.
+    Usernames that don't exist in this service are treated as a success because no work needs to be done changing
+    their username.
+
+    Arguments:
+        username_mappings (list): {current_username: new_username} objects.
+        chunk_size (int): Optional. The number of mappings replaced at once.
+        replacement_locations (list): Optional. (model, column) pairs to replace usernames in.
+
+    Returns:
+        dict: `successful_replacements` and `failed_replacements` mappings, and `replacement_counts` of the changed
+            rows per model.
+    """
+
+    chunk_size = chunk_size or get_username_replacement_config()["CHUNK_SIZE"]
+    replacement_locations = replacement_locations or load_replacement_locations()
+    username_pairs = [next(iter(username_pair.items())) for username_pair in username_mappings]
+
+    successful_pairs, failed_pairs, counts = [], [], {}
+    for chunk in chunk_username_mappings(username_pairs, chunk_size):
+        try:
+            _replace_chunk(chunk, replacement_locations, counts)
+            successful_pairs.extend(chunk)
+        except Exception:  # pylint: disable=broad-except
+            logger.exception(f"Unable to replace a chunk of {len(chunk)} usernames, replacing them one by one")
+            for current_username, new_username in chunk:
+                try:
+                    _replace_chunk([(current_username, new_username)], replacement_locations, counts)
+                    successful_pairs.append((current_username, new_username))
+                except Exception as exc:  # pylint: disable=broad-except
+                    logger.exception(
+                        "Unable to change username from %s to %s because %s", current_username, new_username, exc
+                    )
+                    failed_pairs.append((current_username, new_username))
+
+        usernames = [username for username_pair in chunk for username in username_pair]
+        clear_user_identity_cache(*usernames)
+        invalidate_public_program_records(*usernames)
+
+    logger.info(
+        f"Replaced {len(successful_pairs)} usernames ({len(failed_pairs)} failed), changed rows per model: {counts}"
+    )
+    return {
+        "successful_replacements": [{current: new} for current, new in successful_pairs],
+        "failed_replacements": [{current: new} for current, new in failed_pairs],
+        "replacement_counts": counts,
+    }
+
+
+def process_username_replacement_jobs(limit=None):
+    """
+    Processes pending username replacement jobs, in the order they were requested.
+
+    A job is claimed before it is processed, so concurrent workers never pick the same job. Replacements are
+    idempotent: a job left running by an interrupted worker may safely be set back to pending. The requested mappings
+    are cleared once the job is completed or failed, only its outcome is kept (see `purge_username_replacement_jobs`).
+
+    Arguments:
+        limit (int): Optional. The maximum number of processed jobs.
+
+    Returns:
+        int: processed jobs count.
+    """
+
+    processed = 0
+    while limit is None or processed < limit:
+        with transaction.atomic():
+            job = (
+                UsernameReplacementJob.objects.filter(state=UsernameReplacementJob.PENDING)
+                .select_for_update(skip_locked=True)
+                .order_by("id")
+                .first()
+            )
+            if job is None:
+                break
+            job.state = UsernameReplacementJob.RUNNING
+            job.save(update_fields=["state", "modified"])
+
+        try:
+            job.result = replace_usernames(job.username_mappings)
+            job.state = UsernameReplacementJob.COMPLETED
+        except Exception as exc:  # pylint: disable=broad-except
+            logger.exception(f"{job} failed")
+            job.state = UsernameReplacementJob.FAILED
+            job.error = str(exc)
+        job.username_mappings = []
+        job.save(update_fields=["username_mappings", "state", "result", "error", "modified"])
+        processed += 1
+
+    return processed
+
+
+def purge_username_replacement_jobs(retention_days=None):
+    """
+    Deletes the username replacement jobs completed or failed more than `retention_days` days ago.
+
+    Arguments:
+        retention_days (int): Optional. The number of days the processed jobs are kept for.
+
+    Returns:
+        int: deleted jobs count.
+    """
+
+    if retention_days is None:
+        retention_days = get_username_replacement_config()["RETENTION_DAYS"]
+
+    deleted, __ = UsernameReplacementJob.objects.filter(
+        state__in=(UsernameReplacementJob.COMPLETED, UsernameReplacementJob.FAILED),
+        modified__lt=timezone.now() - timedelta(days=retention_days),
+    ).delete()
+    return deleted
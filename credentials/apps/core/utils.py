@@ -1,5 +1,11 @@
 """Core utils."""
 
+import math
+
+from django.db import transaction
+from django_extensions.db.models import TimeStampedModel
+from edx_django_utils.monitoring import increment
+
 
 # This function is used by our oauth2 authorization pipeline. See settings/base.py
 def update_full_name(strategy, details, user=None, *_args, **_kwargs):  # pylint: disable=keyword-arg-before-vararg
@@ -26,3 +32,65 @@ def _choices(*values):
     Helper for use with model field 'choices'.
     """
     return [(value,) * 2 for value in values]
+
+
+def update_or_create_if_changed(model, defaults, is_stale=None, **lookup):
+    """
+    Look up an object with the given lookup, creating it with the defaults if it doesn't exist or updating it otherwise.
+
+    Unlike `update_or_create`, the stored object is only locked and saved when the defaults differ from the stored
+    values, so no-op writes are turned into reads. Updates for which `is_stale(stored_object)` is true are skipped too,
+    so stale updates don't overwrite newer data. Skipped writes are counted with the `<model>_noop_writes` and
+    `<model>_stale_writes` custom metrics.
+
+    Returns:
+        tuple: the object and a boolean telling whether it was created.
+    """
+    obj = model.objects.filter(**lookup).first()
+    if obj is None or _get_changed_fields(obj, defaults, is_stale):
+        with transaction.atomic():
+            obj = model.objects.select_for_update().filter(**lookup).first()
+            if obj is None:
+                return model.objects.update_or_create(defaults=defaults, **lookup)
+
+            changed_fields = _get_changed_fields(obj, defaults, is_stale)
+            if changed_fields:
+                for name in changed_fields:
+                    setattr(obj, name, defaults[name])
+                if isinstance(obj, TimeStampedModel):
+                    changed_fields.append("modified")
+                obj.save(update_fields=changed_fields)
+
+    return obj, False
+
+
+def _get_changed_fields(obj, defaults, is_stale):
+    """
+    Names of the fields the defaults would change, none if the write is stale (the skipped write is counted).
+    """
+    model_name = obj._meta.model_name
+    if is_stale is not None and is_stale(obj):
+        increment(f"{model_name}_stale_writes")
+        return []
+
+    changed_fields = []
+    for name, value in defaults.items():
+        field = obj._meta.get_field(name)
+        if field.is_relation:
+            changed = getattr(obj, field.attname) != getattr(value, "pk", value)
+        else:
+            changed = getattr(obj, name) != value
+        if changed:
+            changed_fields.append(name)
+
+    if not changed_fields:
+        increment(f"{model_name}_noop_writes")
+    return changed_fields
+
+
+def percentile(values, percent):
+    """
+    Nearest-rank percentile of the values.
+    """
+    ordered = sorted(values)
+    return ordered[max(math.ceil(percent / 100 * len(ordered)) - 1, 0)]
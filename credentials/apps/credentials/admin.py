@@ -1,7 +1,9 @@
 from config_models.admin import ConfigurationModelAdmin
 from django.contrib import admin
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from django.db.models import Q
 
+from credentials.apps.core.admin import ScalableChangeListAdminMixin
 from credentials.apps.credentials.forms import ProgramCertificateAdminForm, SignatoryModelForm
 from credentials.apps.credentials.models import (
     CourseCertificate,
@@ -34,15 +36,29 @@ class UserCredentialDateOverrideInline(admin.TabularInline):
 
 
 @admin.register(UserCredential)
-class UserCredentialAdmin(TimeStampedModelAdminMixin, admin.ModelAdmin):
+class UserCredentialAdmin(ScalableChangeListAdminMixin, TimeStampedModelAdminMixin, admin.ModelAdmin):
     list_display = ("username", "certificate_uuid", "status", "credential_content_type", "title")
     list_filter = ("status", "credential_content_type")
     readonly_fields = TimeStampedModelAdminMixin.readonly_fields + ("uuid",)
-    search_fields = ("username",)
+    search_fields = ("^username",)
     inlines = (UserCredentialAttributeInline, UserCredentialDateOverrideInline)
 
     def get_queryset(self, request):
-        return super().get_queryset(request).prefetch_related("credential")
+        # the credentials (and their titles) are fetched at once for all listed user credentials:
+        return (
+            super()
+            .get_queryset(request)
+            .select_related("credential_content_type")
+            .prefetch_related(
+                GenericPrefetch(
+                    "credential",
+                    [
+                        ProgramCertificate.objects.select_related("program"),
+                        CourseCertificate.objects.select_related("course_run__course"),
+                    ],
+                )
+            )
+        )
 
     def certificate_uuid(self, obj):
         """Certificate UUID value displayed on admin panel."""
@@ -62,6 +78,8 @@ class UserCredentialAdmin(TimeStampedModelAdminMixin, admin.ModelAdmin):
 
     def get_search_results(self, request, queryset, search_term):
         queryset, use_distinct = super().get_search_results(request, queryset, search_term)
+        if not search_term:
+            return queryset, use_distinct
 
         matching_program_certs = ProgramCertificate.objects.filter(program__title__icontains=search_term).values_list(
             "id", flat=True
@@ -8,6 +8,9 @@ from typing import TYPE_CHECKING, Optional
 from django.contrib.contenttypes.models import ContentType
 
 from credentials.apps.catalog.api import get_course_runs_by_course_run_keys
+from credentials.apps.core.query_budget import query_budget
+from credentials.apps.core.timing import timed_operation, timed_stage
+from credentials.apps.core.utils import update_or_create_if_changed
 from credentials.apps.credentials.models import (
     CourseCertificate as _CourseCertificate,
     ProgramCertificate as _ProgramCertificate,
@@ -64,11 +67,12 @@ def _update_or_create_credential(username, credential_type, credential_id, statu
     """
     try:
         content_type = ContentType.objects.get_for_model(credential_type)
-        credential, created = _UserCredential.objects.update_or_create(
+        credential, created = update_or_create_if_changed(
+            _UserCredential,
+            {"status": status},
             username=username,
             credential_content_type=content_type,
             credential_id=credential_id,
-            defaults={"status": status},
         )
     except Exception:
         logger.exception(
@@ -231,6 +235,7 @@ def get_credential_dates(user_credentials, many):
         return get_credential_visible_date(user_credentials, use_date_override=True)
 
 
+@query_budget(20)
 def process_course_credential_update(user, course_run_key: str, mode: str, credential_status: str) -> None:
     """
     A utility function responsible for creating or updating a course credential associated with a learner. Primarily
@@ -243,14 +248,24 @@ def process_course_credential_update(user, course_run_key: str, mode: str, crede
          (e.g. "verified", etc.)
         credential_status (String): The desired status of the credential ("awarded" or "revoked")
     """
-    course_run = _get_course_run(course_run_key)
+    with timed_operation("course_credential_update"):
+        _process_course_credential_update(user, course_run_key, mode, credential_status)
+
+
+def _process_course_credential_update(user, course_run_key, mode, credential_status):
+    with timed_stage("course_run_lookup"):
+        course_run = _get_course_run(course_run_key)
     if course_run:
         # Check if a course certificate configuration exists before we attempt to award or revoke the credential. We
         # cannot process a credential update if this configuration doesn't exist. If one doesn't exist, try to create
         # one on the fly (this tracks with legacy behavior when awarding credentials through the REST API pathway).
-        course_cert_config = get_course_cert_config(course_run, mode, create=True)
+        with timed_stage("certificate_configuration"):
+            course_cert_config = get_course_cert_config(course_run, mode, create=True)
         if course_cert_config:
-            _update_or_create_credential(user.username, _CourseCertificate, course_cert_config.id, credential_status)
+            with timed_stage("credential_upsert"):
+                _update_or_create_credential(
+                    user.username, _CourseCertificate, course_cert_config.id, credential_status
+                )
         else:
             logger.error(
                 f"Error updating credential for user [{user.id}] in course run [{course_run_key}] with status "
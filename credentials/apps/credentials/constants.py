@@ -22,3 +22,20 @@ class CertificateType:
     PROFESSIONAL = "professional"
     NO_ID_PROFESSIONAL = "no-id-professional"
     MASTERS = "masters"
+
+
+class SideEffectChannel:
+    """Allowed values for CredentialSideEffect.channel"""
+
+    PATHWAY_EMAILS = "pathway_emails"
+    COMPLETION_EMAIL = "completion_email"
+    EVENT_BUS = "event_bus"
+    SEGMENT = "segment"
+
+
+class SideEffectState:
+    """Allowed values for CredentialSideEffect.state"""
+
+    PENDING = "pending"
+    PROCESSED = "processed"
+    FAILED = "failed"
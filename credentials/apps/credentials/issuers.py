@@ -11,13 +11,16 @@ from django.contrib.contenttypes.models import ContentType
 from django.db import transaction
 from openedx_events.learning.data import ProgramCertificateData, ProgramData, UserData, UserPersonalData
 from openedx_events.learning.signals import PROGRAM_CERTIFICATE_AWARDED, PROGRAM_CERTIFICATE_REVOKED
-from segment.analytics.client import Client as SegmentClient
 
 from credentials.apps.api.exceptions import DuplicateAttributeError
+from credentials.apps.core.analytics import get_segment_client
 from credentials.apps.core.api import get_user_by_username
-from credentials.apps.credentials.constants import UserCredentialStatus
+from credentials.apps.core.timing import timed_operation, timed_stage
+from credentials.apps.core.utils import update_or_create_if_changed
+from credentials.apps.credentials.constants import SideEffectChannel, UserCredentialStatus
 from credentials.apps.credentials.models import (
     CourseCertificate,
+    CredentialSideEffect,
     ProgramCertificate,
     UserCredential,
     UserCredentialAttribute,
@@ -75,13 +78,12 @@ class AbstractCredentialIssuer(metaclass=abc.ABCMeta):
         Returns:
             UserCredential
         """
-        user_credential, __ = UserCredential.objects.update_or_create(
+        user_credential, __ = update_or_create_if_changed(
+            UserCredential,
+            {"status": status},
             username=username,
             credential_content_type=ContentType.objects.get_for_model(credential),
             credential_id=credential.id,
-            defaults={
-                "status": status,
-            },
         )
 
         self.set_credential_attributes(user_credential, attributes)
@@ -171,30 +173,119 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
         Returns:
             UserCredential
         """
-        user_credential, created = UserCredential.objects.update_or_create(
-            username=username,
-            credential_content_type=ContentType.objects.get_for_model(credential),
-            credential_id=credential.id,
-            defaults={
-                "status": status,
-            },
+        with timed_operation("program_certificate_issuance"):
+            with timed_stage("credential_upsert"):
+                user_credential, created = update_or_create_if_changed(
+                    UserCredential,
+                    {"status": status},
+                    username=username,
+                    credential_content_type=ContentType.objects.get_for_model(credential),
+                    credential_id=credential.id,
+                )
+
+            site_config = getattr(credential.site, "siteconfiguration", None)
+            with timed_stage("user_lookup"):
+                user = get_user_by_username(username)
+
+            # set any additional attributes specific to this program certificate
+            with timed_stage("attributes"):
+                self.set_credential_attributes(user_credential, attributes)
+
+            if getattr(settings, "DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS", False):
+                # record the side effects to be dispatched in background, once the credential is committed
+                with timed_stage("side_effects_recording"):
+                    self._record_side_effects(request, site_config, user, user_credential, created, lms_user_id)
+                return user_credential
+
+            # send an updated program progress message if the learner shared their progress before earning their
+            # credential
+            with timed_stage("pathway_emails"):
+                self._send_updated_emails_for_program(request, site_config, username, credential, created)
+            # send a congratulatory email message to the learner for earning a credential (if program has opted in)
+            with timed_stage("completion_email"):
+                self._send_program_completion_email(username, credential, created, lms_user_id)
+            # emit any program credential events to the event bus
+            with timed_stage("event_bus"):
+                self._emit_program_certificate_signal(user, user_credential, status, credential)
+            # emit a segment event for analytics tracking
+            with timed_stage("segment"):
+                self._emit_program_certificate_segment_event(
+                    request, site_config, user, user_credential, credential, created
+                )
+
+            return user_credential
+
+    def _record_side_effects(
+        self,
+        request,
+        site_config,
+        user,
+        user_credential,
+        created,
+        lms_user_id,
+    ):  # pylint: disable=too-many-positional-arguments
+        """
+        Records the side effects of the issuance (the ones which would be performed) for background dispatching.
+
+        Args:
+            request (HttpRequest): The original request object, used to capture the base URL of program record links
+            site_config (SiteConfiguration): The site configuration associated with the (program) credential
+            user (User): The user (learner) associated with the recently generated credential
+            user_credential (UserCredential): The recently generated user credential associated with the learner
+            created (bool): Boolean describing if this user credential record was created or updated
+            lms_user_id (int): The learner's LMS User Id, used to send emails to the learner via ACE
+        """
+        channels = []
+        if site_config and site_config.records_enabled and created:
+            channels.append(SideEffectChannel.PATHWAY_EMAILS)
+        if created and getattr(settings, "SEND_EMAIL_ON_PROGRAM_COMPLETION", False):
+            channels.append(SideEffectChannel.COMPLETION_EMAIL)
+        if user:
+            channels.append(SideEffectChannel.EVENT_BUS)
+        if user and site_config and site_config.segment_key:
+            channels.append(SideEffectChannel.SEGMENT)
+
+        params = {
+            "created": created,
+            "status": user_credential.status,
+            "lms_user_id": lms_user_id,
+            "base_url": request.build_absolute_uri("/") if request else None,
+        }
+        CredentialSideEffect.objects.bulk_create(
+            [
+                CredentialSideEffect(user_credential=user_credential, channel=channel, params=params)
+                for channel in channels
+            ]
         )
 
-        site_config = getattr(credential.site, "siteconfiguration", None)
-        user = get_user_by_username(username)
+    def dispatch_side_effect(self, side_effect):
+        """
+        Performs a side effect recorded during a deferred issuance.
 
-        # set any additional attributes specific to this program certificate
-        self.set_credential_attributes(user_credential, attributes)
-        # send an updated program progress message if the learner shared their progress before earning their credential
-        self._send_updated_emails_for_program(request, site_config, username, credential, created)
-        # send a congratulatory email message to the learner for earning a credential (if program has opted in)
-        self._send_program_completion_email(username, credential, created, lms_user_id)
-        # emit any program credential events to the event bus
-        self._emit_program_certificate_signal(user, user_credential, status, credential)
-        # emit a segment event for analytics tracking
-        self._emit_program_certificate_segment_event(request, site_config, user, user_credential, credential, created)
+        Args:
+            side_effect (CredentialSideEffect): The side effect to perform
+        """
+        user_credential = side_effect.user_credential
+        credential = user_credential.credential
+        site_config = getattr(credential.site, "siteconfiguration", None)
+        params = side_effect.params
 
-        return user_credential
+        if side_effect.channel == SideEffectChannel.PATHWAY_EMAILS:
+            self._send_updated_emails_for_program(
+                None, site_config, user_credential.username, credential, params["created"], params["base_url"]
+            )
+        elif side_effect.channel == SideEffectChannel.COMPLETION_EMAIL:
+            self._send_program_completion_email(
+                user_credential.username, credential, params["created"], params["lms_user_id"]
+            )
+        elif side_effect.channel == SideEffectChannel.EVENT_BUS:
+            user = get_user_by_username(user_credential.username)
+            self._emit_program_certificate_signal(user, user_credential, params["status"], credential)
+        elif side_effect.channel == SideEffectChannel.SEGMENT:
+            user = get_user_by_username(user_credential.username)
+            self._emit_program_certificate_segment_event(
+                None, site_config, user, user_credential, credential, params["created"], status=params["status"]
+            )
 
     def _send_updated_emails_for_program(
         self,
@@ -203,14 +294,14 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
         username,
         credential,
         created,
+        base_url=None,
     ):  # pylint: disable=too-many-positional-arguments
         """
         This function is responsible for sending an updated email to a pathway org only if the user has previously
         shared their program progress through a pathway. Checks if the site configuration has record keeping enabled
         and, if not, we do not send an email.
 
-        We may want to move this function call to some type of task queue in the future once Credentials supports this
-        functionality.
+        The email is sent in background if the `DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS` setting is enabled.
 
         Args:
             request (HttpRequest): The original HttpRequest object
@@ -218,9 +309,10 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
             credential (AbstractCredential[ProgramCertificate]): The type of credential used to issue the above user
              credential
             created (bool): A boolean describing whether the credential was created (True) or just updated (False)
+            base_url (str): Optional. The absolute base URL of program record links, used instead of the request
         """
         if site_config and site_config.records_enabled and created:
-            send_updated_emails_for_program(request, username, credential)
+            send_updated_emails_for_program(request, username, credential, base_url=base_url)
 
     def _send_program_completion_email(self, username, credential, created, lms_user_id):
         """
@@ -297,6 +389,8 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
         user_credential,
         credential,
         created,
+        *,
+        status=None,
     ):  # pylint: disable=too-many-positional-arguments
         """
         A utility function used to dispatch a Segment event when a program certificate record has been created or
@@ -310,6 +404,7 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
             credential (AbstractCredential[ProgramCredential]): The credential issued to the learner, associated with a
              specific program.
             created (bool): Boolean describing if this user credential record was created or updated
+            status (str): Optional. The status the credential was issued with (the current status by default)
         """
         if not user:
             logger.warning(
@@ -320,7 +415,7 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
 
         segment_client = None
         if site_config and site_config.segment_key:
-            segment_client = SegmentClient(write_key=site_config.segment_key)
+            segment_client = get_segment_client(site_config.segment_key)
 
         if segment_client:
             event_name = "edx.bi.credentials.credential_issuers.program_certificate_updated"
@@ -340,7 +435,7 @@ class ProgramCertificateIssuer(AbstractCredentialIssuer):
                     "program_type": program.type_slug,
                 },
                 "uuid": str(user_credential.uuid),
-                "status": user_credential.status,
+                "status": status or user_credential.status,
                 "url": f"https://{credential.site.domain}/credentials/{str(user_credential.uuid).replace('-', '')}/",
                 "timestamp": user_credential.modified,
             }
@@ -0,0 +1,54 @@
+"""Management command to dispatch recorded program certificate issuance side effects"""
+
+import logging
+
+from django.core.management.base import BaseCommand
+
+from credentials.apps.credentials.constants import SideEffectChannel
+from credentials.apps.credentials.side_effects import process_side_effects
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Dispatches pending program certificate issuance side effects in batches until the queue is drained.
+
+    Example usage:
+
+    $ ./manage.py process_credential_side_effects
+    $ ./manage.py process_credential_side_effects --channel segment --batch_size 500
+    """
+
+    help = "Dispatch pending program certificate issuance side effects."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--channel",
+            default=None,
+            choices=[
+                SideEffectChannel.PATHWAY_EMAILS,
+                SideEffectChannel.COMPLETION_EMAIL,
+                SideEffectChannel.EVENT_BUS,
+                SideEffectChannel.SEGMENT,
+            ],
+            help="Dispatch side effects of this channel only.",
+        )
+        parser.add_argument("--batch_size", type=int, default=100, help="Number of side effects dispatched at once.")
+        parser.add_argument(
+            "--max_attempts", type=int, default=5, help="Number of dispatching attempts before a side effect is failed."
+        )
+
+    def handle(self, *args, **options):
+        channel = options.get("channel")
+        batch_size = options.get("batch_size")
+        max_attempts = options.get("max_attempts")
+
+        total = 0
+        while True:
+            processed_items = process_side_effects(channel=channel, batch_size=batch_size, max_attempts=max_attempts)
+            total += processed_items
+            if processed_items < batch_size:
+                break
+
+        logger.info(f"...completed! Dispatched {total} credential side effects.")
@@ -8,6 +8,7 @@ from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand, CommandError
 
 from credentials.apps.credentials.models import RevokeCertificatesConfig, UserCredential
+from credentials.apps.credentials.revocation import DEFAULT_CHUNK_SIZE, revoke_user_credentials
 
 if TYPE_CHECKING:
     from argparse import ArgumentParser
@@ -29,6 +30,13 @@ class Command(BaseCommand):
     Example usage:
 
     $ ./manage.py revoke_certificates --lms_user_ids 867 5309 925 --credential_id 90210
+
+    Large lists of users can be read from a file (whitespace separated LMS user IDs):
+
+    $ ./manage.py revoke_certificates --lms_user_ids_file user_ids.txt --credential_id 90210
+
+    Certificates are revoked in chunks (see `revoke_user_credentials`), so an interrupted revocation is resumed by
+    running the command again.
     """
 
     help = "Revoke certificates for a list of LMS user IDs.  Defaults to program certificates."
@@ -54,7 +62,18 @@ class Command(BaseCommand):
             "--lms_user_ids",
             default=None,
             nargs="+",
-            help="Users for whom this certificate should be revoked. Required.",
+            help="Users for whom this certificate should be revoked. Required, unless --lms_user_ids_file is given.",
+        )
+        parser.add_argument(
+            "--lms_user_ids_file",
+            default=None,
+            help="Path of a file listing (whitespace separated) users for whom this certificate should be revoked.",
+        )
+        parser.add_argument(
+            "--chunk_size",
+            type=int,
+            default=DEFAULT_CHUNK_SIZE,
+            help=f"Number of certificates revoked at once. Defaults to {DEFAULT_CHUNK_SIZE}.",
         )
         parser.add_argument(
             "--credential_id",
@@ -86,11 +105,19 @@ class Command(BaseCommand):
             a QuerySet of User objects.
         """
         users = User.objects.filter(lms_user_id__in=lms_user_ids)
-        missing_users = set(lms_user_ids).difference({str(i.lms_user_id) for i in users})
+        missing_users = set(lms_user_ids).difference({str(i) for i in users.values_list("lms_user_id", flat=True)})
         if missing_users:
             logger.warning(f"The following user IDs don't match existing users: {missing_users}")
         return users
 
+    def read_lms_user_ids_file(self, path: str) -> list[str]:
+        """Returns the (whitespace separated) LMS user IDs listed by the file."""
+        try:
+            with open(path, encoding="utf-8") as lms_user_ids_file:
+                return lms_user_ids_file.read().split()
+        except OSError as exc:
+            raise CommandError(f"Unable to read lms_user_ids_file: {exc}") from exc
+
     def get_args_from_database(self) -> dict[str, Any]:
         """Returns an options dictionary from the current NotifyCredentialsConfig model."""
         config = RevokeCertificatesConfig.current()
@@ -108,45 +135,62 @@ class Command(BaseCommand):
         verbosity = options.get("verbose")
         credential_type = options.get("credential_type")
         dry_run = options.get("dry_run")
-        lms_user_ids = options.get("lms_user_ids")
+        lms_user_ids = options.get("lms_user_ids") or []
+        lms_user_ids_file = options.get("lms_user_ids_file")
+        chunk_size = options.get("chunk_size") or DEFAULT_CHUNK_SIZE
 
         logger.info(
             f"revoke_certificates starting, dry-run={dry_run}, credential_id={credential_id}, "
-            f"credential_type={credential_type}, lms_user_ids={lms_user_ids}, verbosity={verbosity}"
+            f"credential_type={credential_type}, lms_user_ids={lms_user_ids}, lms_user_ids_file={lms_user_ids_file}, "
+            f"chunk_size={chunk_size}, verbosity={verbosity}"
         )
 
         # Because we allow args_from_database, we cannot rely on marking arguments as required,
         # so we validate our arguments here.
         if not credential_id:
             raise CommandError("You must specify a credential_id")
+        if lms_user_ids_file:
+            lms_user_ids = lms_user_ids + self.read_lms_user_ids_file(lms_user_ids_file)
         if not lms_user_ids:
             raise CommandError("You must specify list of lms_user_ids")
-        users = self.get_usernames_from_lms_user_ids(lms_user_ids)
-        if not users:
-            raise CommandError("None of the given lms_user_ids maps to a real user")
-
-        # We use usernames here, not foreign keys, so just make a list.
-        # This is not going to be a huge set of users, run from a management command.
-        usernames = [i.username for i in users]  # type: list[str]
 
-        user_creds_to_revoke = UserCredential.objects.filter(
-            username__in=usernames,
-            status=UserCredential.AWARDED,
-            credential_content_type__model=credential_type,
-            credential_id=credential_id,
-        )
-        if not user_creds_to_revoke:
+        # the given users are resolved and their certificates revoked a chunk at a time
+        lms_user_ids = list(dict.fromkeys(str(lms_user_id) for lms_user_id in lms_user_ids))
+        found_users = found_credentials = revoked = 0
+        for start in range(0, len(lms_user_ids), chunk_size):
+            # We use usernames here, not foreign keys, so just make a list.
+            usernames = list(
+                self.get_usernames_from_lms_user_ids(lms_user_ids[start : start + chunk_size]).values_list(
+                    "username", flat=True
+                )
+            )
+            if not usernames:
+                continue
+            found_users += len(usernames)
+
+            # only the awarded ones are revoked, the revoked ones may have revocation events left to emit
+            user_creds_to_revoke = UserCredential.objects.filter(
+                username__in=usernames,
+                credential_content_type__model=credential_type,
+                credential_id=credential_id,
+            )
+            found_credentials += user_creds_to_revoke.count()
+            revoked += revoke_user_credentials(
+                user_creds_to_revoke, chunk_size=chunk_size, dry_run=dry_run, verbose=verbosity
+            )
+            logger.info(f"Processed {min(start + chunk_size, len(lms_user_ids))} of {len(lms_user_ids)} lms_user_ids")
+
+        # nothing has been revoked if any of these fails
+        if not found_users:
+            raise CommandError("None of the given lms_user_ids maps to a real user")
+        if not found_credentials:
             raise CommandError("No active certificates match the given criteria")
-
-        # as a manually input list, this should be small enough to do in a single bulk_update
-        for user_cred in user_creds_to_revoke:
-            if verbosity:
-                # It's not worth doing an extra query to annotate the verbose logging message with
-                # user ID, and username isn't PII safe. If the person reading the logs wants more
-                # info about the affected users, this log message includes enough to look them up.
-                logger.info(f"Revoking UserCredential {user_cred.id} ({credential_type} {credential_id})")
-            user_cred.status = UserCredential.REVOKED
-        if not dry_run:
-            user_creds_to_revoke.bulk_update(user_creds_to_revoke, ["status"])
-
-        logger.info("Done revoking certificates")
+        if not revoked:
+            # e.g. a resumed revocation, once the pending revocation events are emitted
+            logger.info("All the matching certificates are already revoked")
+            return
+
+        if dry_run:
+            logger.info(f"Dry run: {revoked} certificates would be revoked")
+        else:
+            logger.info(f"Done revoking certificates: {revoked} certificates revoked")
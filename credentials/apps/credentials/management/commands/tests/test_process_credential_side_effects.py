@@ -0,0 +1,73 @@
+"""
+Tests for the process_credential_side_effects management command
+"""
+
+from unittest import mock
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from credentials.apps.core.tests.factories import UserFactory
+from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.credentials.constants import SideEffectChannel, SideEffectState
+from credentials.apps.credentials.models import CredentialSideEffect
+from credentials.apps.credentials.tests.factories import ProgramCertificateFactory, UserCredentialFactory
+
+DISPATCH = "credentials.apps.credentials.issuers.ProgramCertificateIssuer.dispatch_side_effect"
+
+
+class ProcessCredentialSideEffectsTests(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user_credential = UserCredentialFactory(
+            credential=ProgramCertificateFactory(site=self.site), username=UserFactory().username
+        )
+        self.side_effects = [
+            CredentialSideEffect.objects.create(user_credential=self.user_credential, channel=channel)
+            for channel in (SideEffectChannel.EVENT_BUS, SideEffectChannel.SEGMENT)
+        ]
+
+    @mock.patch(DISPATCH)
+    def test_dispatch_pending(self, mock_dispatch):
+        call_command("process_credential_side_effects", batch_size=1)
+
+        assert [call.args[0] for call in mock_dispatch.mock_calls] == self.side_effects
+        assert set(CredentialSideEffect.objects.values_list("state", flat=True)) == {SideEffectState.PROCESSED}
+
+        call_command("process_credential_side_effects")
+        assert mock_dispatch.call_count == 2
+
+    @mock.patch(DISPATCH)
+    def test_dispatch_channel(self, mock_dispatch):
+        call_command("process_credential_side_effects", channel=SideEffectChannel.SEGMENT)
+
+        mock_dispatch.assert_called_once_with(self.side_effects[1])
+        assert CredentialSideEffect.objects.get(channel=SideEffectChannel.EVENT_BUS).state == SideEffectState.PENDING
+
+    @mock.patch(DISPATCH, side_effect=ValueError("unavailable"))
+    def test_dispatch_retries(self, mock_dispatch):
+        call_command("process_credential_side_effects", channel=SideEffectChannel.SEGMENT, max_attempts=2)
+
+        side_effect = CredentialSideEffect.objects.get(channel=SideEffectChannel.SEGMENT)
+        assert side_effect.attempts == 1
+        assert side_effect.state == SideEffectState.PENDING
+        assert side_effect.error == "unavailable"
+
+        call_command("process_credential_side_effects", channel=SideEffectChannel.SEGMENT, max_attempts=2)
+
+        side_effect.refresh_from_db()
+        assert side_effect.attempts == 2
+        assert side_effect.state == SideEffectState.FAILED
+        assert mock_dispatch.call_count == 2
+
+    @mock.patch(DISPATCH, side_effect=[None, KeyboardInterrupt()])
+    def test_dispatch_interrupted(self, mock_dispatch):
+        with self.assertRaises(KeyboardInterrupt):
+            call_command("process_credential_side_effects")
+
+        # the state of the side effects is recorded as they are dispatched
+        assert [side_effect.state for side_effect in CredentialSideEffect.objects.order_by("id")] == [
+            SideEffectState.PROCESSED,
+            SideEffectState.PENDING,
+        ]
+        assert mock_dispatch.call_count == 2
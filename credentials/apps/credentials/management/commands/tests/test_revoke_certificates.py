@@ -2,12 +2,13 @@
 Tests for the revoke_certificates management command
 """
 
+import tempfile
 from unittest import mock
 
 from django.contrib.contenttypes.models import ContentType
 from django.core.management import call_command
 from django.core.management.base import CommandError
-from django.test import TestCase
+from django.test import TestCase, override_settings
 
 from credentials.apps.catalog.tests.factories import (
     CourseFactory,
@@ -17,8 +18,11 @@ from credentials.apps.catalog.tests.factories import (
 )
 from credentials.apps.core.tests.factories import UserFactory
 from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.credentials.constants import SideEffectChannel, SideEffectState
 from credentials.apps.credentials.management.commands.revoke_certificates import Command
-from credentials.apps.credentials.models import RevokeCertificatesConfig, UserCredential
+from credentials.apps.credentials.models import CredentialSideEffect, RevokeCertificatesConfig, UserCredential
+from credentials.apps.credentials.revocation import USER_CREDENTIALS_REVOKED
+from credentials.apps.credentials.side_effects import process_side_effects
 from credentials.apps.credentials.tests.factories import (
     CourseCertificateFactory,
     ProgramCertificateFactory,
@@ -240,3 +244,149 @@ class RevokeCertificatesTests(SiteMixin, TestCase):
         # Explicitly disabled
         with self.assertRaisesRegex(CommandError, "RevokeCertificatesConfig is disabled.*"):
             call_command(Command(), "--lms_user_ids", "8675309", "--credential_id", "123", "--args-from-database")
+
+    def test_lms_user_ids_file(self):
+        """verify users can be read from a file, and certificates are revoked in chunks"""
+        users_to_revoke = self.users[:2]
+        with tempfile.NamedTemporaryFile("w", suffix=".txt") as lms_user_ids_file:
+            lms_user_ids_file.write(f"{users_to_revoke[0].lms_user_id}\n{users_to_revoke[1].lms_user_id} 8675309\n")
+            lms_user_ids_file.flush()
+
+            call_command(
+                Command(),
+                f"--lms_user_ids_file={lms_user_ids_file.name}",
+                f"--credential_id={self.program_cert.id}",
+                "--chunk_size=1",
+            )
+
+        revoked_usernames = set(
+            UserCredential.objects.filter(status=UserCredential.REVOKED).values_list("username", flat=True)
+        )
+        self.assertSetEqual(revoked_usernames, {user.username for user in users_to_revoke})
+
+    def test_lms_user_ids_file_missing(self):
+        with self.assertRaisesRegex(CommandError, "Unable to read lms_user_ids_file"):
+            call_command(Command(), "--lms_user_ids_file=/nonexistent", f"--credential_id={self.program_cert.id}")
+
+    def test_revocation_is_resumable(self):
+        """verify already revoked certificates are skipped"""
+        UserCredential.objects.filter(username=self.users[0].username).update(status=UserCredential.REVOKED)
+
+        with mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_REVOKED") as revoked_event:
+            call_command(
+                Command(),
+                "--lms_user_ids",
+                self.users[0].lms_user_id,
+                self.users[1].lms_user_id,
+                f"--credential_id={self.program_cert.id}",
+            )
+
+        self.assertEqual(revoked_event.send_event.call_count, 1)
+        self.assertEqual(
+            revoked_event.send_event.call_args.kwargs["program_certificate"].user.id, self.users[1].lms_user_id
+        )
+
+    @mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_REVOKED")
+    def test_revocation_events(self, revoked_event):
+        """verify revocation events and signals are sent for every chunk"""
+        handler = mock.Mock()
+        USER_CREDENTIALS_REVOKED.connect(handler)
+        self.addCleanup(USER_CREDENTIALS_REVOKED.disconnect, handler)
+
+        call_command(
+            Command(),
+            "--lms_user_ids",
+            *[user.lms_user_id for user in self.users],
+            f"--credential_id={self.program_cert.id}",
+            "--chunk_size=2",
+        )
+
+        revoked_ids = UserCredential.objects.filter(status=UserCredential.REVOKED).values_list("id", flat=True)
+        self.assertEqual(revoked_event.send_event.call_count, 3)
+        self.assertEqual(handler.call_count, 2)
+        self.assertCountEqual(
+            [
+                user_credential_id
+                for call in handler.call_args_list
+                for user_credential_id in call.kwargs["user_credential_ids"]
+            ],
+            revoked_ids,
+        )
+
+    @mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_REVOKED")
+    def test_interrupted_revocation_events_emitted_on_resume(self, revoked_event):
+        """verify the events of the credentials revoked by an interrupted revocation are emitted on resume"""
+        with mock.patch(
+            "credentials.apps.credentials.revocation._emit_revocation_events", side_effect=RuntimeError
+        ), self.assertRaises(RuntimeError):
+            call_command(
+                Command(), "--lms_user_ids", self.users[0].lms_user_id, f"--credential_id={self.program_cert.id}"
+            )
+
+        side_effect = CredentialSideEffect.objects.get()
+        self.assertEqual(side_effect.state, SideEffectState.PENDING)
+        revoked_event.send_event.assert_not_called()
+
+        call_command(
+            Command(),
+            "--lms_user_ids",
+            self.users[0].lms_user_id,
+            self.users[1].lms_user_id,
+            f"--credential_id={self.program_cert.id}",
+        )
+
+        self.assertCountEqual(
+            [call.kwargs["program_certificate"].user.id for call in revoked_event.send_event.call_args_list],
+            [self.users[0].lms_user_id, self.users[1].lms_user_id],
+        )
+        self.assertFalse(CredentialSideEffect.objects.filter(state=SideEffectState.PENDING).exists())
+
+    @mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_REVOKED")
+    def test_resumed_revocation_with_nothing_left_to_revoke(self, revoked_event):
+        """verify a resumed revocation that finds everything revoked emits the pending events and succeeds"""
+        with mock.patch(
+            "credentials.apps.credentials.revocation._emit_revocation_events", side_effect=RuntimeError
+        ), self.assertRaises(RuntimeError):
+            call_command(
+                Command(), "--lms_user_ids", self.users[0].lms_user_id, f"--credential_id={self.program_cert.id}"
+            )
+
+        with self.assertLogs(level="INFO") as logs:
+            call_command(
+                Command(), "--lms_user_ids", self.users[0].lms_user_id, f"--credential_id={self.program_cert.id}"
+            )
+
+        revoked_event.send_event.assert_called_once()
+        self.assertFalse(CredentialSideEffect.objects.filter(state=SideEffectState.PENDING).exists())
+        self.assertIn("All the matching certificates are already revoked", "\n".join(logs.output))
+
+    @override_settings(DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS=True)
+    @mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_REVOKED")
+    def test_deferred_revocation_events(self, revoked_event):
+        """verify revocation events are recorded for background dispatching"""
+        call_command(
+            Command(),
+            "--lms_user_ids",
+            self.users[0].lms_user_id,
+            f"--credential_id={self.program_cert.id}",
+        )
+
+        revoked_event.send_event.assert_not_called()
+        side_effect = CredentialSideEffect.objects.get()
+        self.assertEqual(side_effect.channel, SideEffectChannel.EVENT_BUS)
+        self.assertEqual(side_effect.params["status"], UserCredential.REVOKED)
+
+        process_side_effects()
+        revoked_event.send_event.assert_called_once()
+
+    def test_dry_run_report(self):
+        """verify dry run reports the certificates which would be revoked"""
+        with self.assertLogs(level="INFO") as cm:
+            call_command(
+                Command(),
+                "--lms_user_ids",
+                *[user.lms_user_id for user in self.users],
+                f"--credential_id={self.program_cert.id}",
+                "--dry-run",
+            )
+        self.assertTrue(any("Dry run: 3 certificates would be revoked" in s for s in cm.output))
@@ -0,0 +1,66 @@
+# Generated by Django 5.2.11 on 2026-10-19 10:08
+
+import django.db.models.deletion
+import django_extensions.db.fields
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("credentials", "0033_remove_download_url"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="CredentialSideEffect",
+            fields=[
+                ("id", models.AutoField(auto_created=True, primary_key=True, serialize=False, verbose_name="ID")),
+                (
+                    "created",
+                    django_extensions.db.fields.CreationDateTimeField(auto_now_add=True, verbose_name="created"),
+                ),
+                (
+                    "modified",
+                    django_extensions.db.fields.ModificationDateTimeField(auto_now=True, verbose_name="modified"),
+                ),
+                (
+                    "channel",
+                    models.CharField(
+                        choices=[
+                            ("pathway_emails", "pathway_emails"),
+                            ("completion_email", "completion_email"),
+                            ("event_bus", "event_bus"),
+                            ("segment", "segment"),
+                        ],
+                        max_length=32,
+                    ),
+                ),
+                (
+                    "params",
+                    models.JSONField(default=dict, help_text="Issuance details the side effect is dispatched with."),
+                ),
+                (
+                    "state",
+                    models.CharField(
+                        choices=[("pending", "pending"), ("processed", "processed"), ("failed", "failed")],
+                        default="pending",
+                        max_length=32,
+                    ),
+                ),
+                ("attempts", models.PositiveSmallIntegerField(default=0)),
+                ("error", models.TextField(blank=True, default="", help_text="The latest dispatching error.")),
+                (
+                    "user_credential",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="side_effects",
+                        to="credentials.usercredential",
+                    ),
+                ),
+            ],
+            options={
+                "indexes": [models.Index(fields=["channel", "state"], name="credentials_channel_2d3f1a_idx")],
+            },
+        ),
+    ]
@@ -447,3 +447,45 @@ class RevokeCertificatesConfig(ConfigurationModel):
 
     def __str__(self):
         return str(self.arguments)
+
+
+class CredentialSideEffect(TimeStampedModel):
+    """
+    A side effect of a program certificate issuance (emails, events) waiting to be dispatched.
+
+    Side effects are recorded in the same transaction as the issued credential and dispatched in background
+    (see `process_credential_side_effects` management command).
+
+    .. no_pii:
+    """
+
+    user_credential = models.ForeignKey(UserCredential, on_delete=models.CASCADE, related_name="side_effects")
+    channel = models.CharField(
+        max_length=32,
+        choices=_choices(
+            constants.SideEffectChannel.PATHWAY_EMAILS,
+            constants.SideEffectChannel.COMPLETION_EMAIL,
+            constants.SideEffectChannel.EVENT_BUS,
+            constants.SideEffectChannel.SEGMENT,
+        ),
+    )
+    params = models.JSONField(default=dict, help_text="Issuance details the side effect is dispatched with.")
+    state = models.CharField(
+        max_length=32,
+        choices=_choices(
+            constants.SideEffectState.PENDING,
+            constants.SideEffectState.PROCESSED,
+            constants.SideEffectState.FAILED,
+        ),
+        default=constants.SideEffectState.PENDING,
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    error = models.TextField(blank=True, default="", help_text="The latest dispatching error.")
+
+    class Meta:
+        indexes = [
+            models.Index(fields=["channel", "state"]),
+        ]
+
+    def __str__(self):
+        return f"{self.channel} ({self.user_credential_id})"
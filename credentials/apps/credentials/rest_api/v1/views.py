@@ -10,6 +10,8 @@ from rest_framework.authentication import SessionAuthentication
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from credentials.apps.core.db_routing import read_replica
+from credentials.apps.core.query_budget import query_budget
 from credentials.apps.credentials.rest_api.v1.permissions import CanGetLearnerStatus
 from credentials.apps.records.api import single_learner_cert_status
 
@@ -87,6 +89,8 @@ bulk_learner_cert_status_return_schema = openapi.Schema(
 )
 
 
+@read_replica(methods=("POST",))
+@query_budget(25)
 class LearnerCertificateStatusView(APIView):
     authentication_classes = (
         JwtAuthentication,
@@ -134,6 +138,8 @@ class LearnerCertificateStatusView(APIView):
             )
 
 
+@read_replica(methods=("POST",))
+@query_budget(30)
 class BulkLearnerCertificateStatusView(APIView):
     authentication_classes = (
         JwtAuthentication,
@@ -0,0 +1,192 @@
+"""
+Bulk revocation of user credentials.
+
+Credentials are revoked in chunks (keyset ordered by id), each chunk with a single set-based update:
+    - `USER_CREDENTIALS_REVOKED` signal is sent for every chunk (e.g. verifiable credentials status lists are updated);
+    - program certificate revocation events are recorded (as event bus side effects) in the same transaction as the
+      revoked credentials, and emitted once the chunk is committed (or dispatched in background if the
+      `DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS` setting is enabled).
+
+Only awarded credentials are revoked, so an interrupted revocation is resumed by running it again: the revocation
+events which were recorded but not emitted yet are emitted first (an event may be emitted twice if the revocation is
+interrupted right after it was emitted). The events are locked while they are emitted, so the ones being emitted by
+the side effects workers are skipped, and the other way around.
+"""
+
+import logging
+
+from django.conf import settings
+from django.contrib.auth import get_user_model
+from django.db import transaction
+from django.dispatch import Signal
+from django.utils import timezone
+
+from credentials.apps.credentials.constants import SideEffectChannel, SideEffectState, UserCredentialStatus
+from credentials.apps.credentials.issuers import ProgramCertificateIssuer
+from credentials.apps.credentials.models import CredentialSideEffect, ProgramCertificate, UserCredential
+
+logger = logging.getLogger(__name__)
+User = get_user_model()
+
+DEFAULT_CHUNK_SIZE = 1000
+
+# Sent (within the revocation transaction) for every chunk of revoked user credentials.
+# providing_args=["user_credential_ids"]
+USER_CREDENTIALS_REVOKED = Signal()
+
+
+def revoke_user_credentials(queryset, chunk_size=DEFAULT_CHUNK_SIZE, dry_run=False, verbose=False):
+    """
+    Revokes the awarded user credentials of the queryset.
+
+    Arguments:
+        queryset (QuerySet): user credentials to revoke.
+        chunk_size (int): number of user credentials revoked at once.
+        dry_run (bool): only report the user credentials which would be revoked.
+        verbose (bool): log every revoked user credential.
+
+    Returns:
+        int: revoked (or to be revoked, for a dry run) user credentials count.
+    """
+
+    if not dry_run and not getattr(settings, "DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS", False):
+        # the events of the credentials revoked by an interrupted revocation
+        pending_events = _get_pending_revocation_events().filter(user_credential__in=queryset.values("id"))
+        while _emit_pending_revocation_events(pending_events, chunk_size):
+            pass
+
+    queryset = queryset.filter(status=UserCredentialStatus.AWARDED).order_by("id")
+    total = 0
+    last_id = 0
+
+    while True:
+        chunk = list(
+            queryset.filter(id__gt=last_id).values_list("id", "credential_content_type__model", "credential_id")[
+                :chunk_size
+            ]
+        )
+        if not chunk:
+            break
+
+        last_id = chunk[-1][0]
+        if verbose:
+            for user_credential_id, credential_type, credential_id in chunk:
+                # It's not worth doing an extra query to annotate the verbose logging message with
+                # user ID, and username isn't PII safe. If the person reading the logs wants more
+                # info about the affected users, this log message includes enough to look them up.
+                logger.info(f"Revoking UserCredential {user_credential_id} ({credential_type} {credential_id})")
+
+        if dry_run:
+            total += len(chunk)
+            continue
+
+        total += _revoke_chunk([user_credential_id for user_credential_id, __, __ in chunk])
+        logger.info(f"Revoked {total} user credentials so far (up to UserCredential {last_id})")
+
+    return total
+
+
+def _revoke_chunk(user_credential_ids):
+    """
+    Revokes a chunk of user credentials and propagates the revocation.
+    """
+
+    deferred = getattr(settings, "DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS", False)
+
+    with transaction.atomic():
+        # the chunk may have been changed since it was selected, only the still awarded credentials are revoked
+        user_credentials = list(
+            UserCredential.objects.select_for_update()
+            .filter(id__in=user_credential_ids, status=UserCredentialStatus.AWARDED)
+            .select_related("credential_content_type")
+        )
+        if not user_credentials:
+            return 0
+
+        revoked_ids = [user_credential.id for user_credential in user_credentials]
+        now = timezone.now()
+        UserCredential.objects.filter(id__in=revoked_ids).update(status=UserCredentialStatus.REVOKED, modified=now)
+        for user_credential in user_credentials:
+            user_credential.status = UserCredentialStatus.REVOKED
+            user_credential.modified = now
+
+        USER_CREDENTIALS_REVOKED.send(sender=UserCredential, user_credential_ids=revoked_ids)
+
+        program_credentials = [
+            user_credential
+            for user_credential in user_credentials
+            if user_credential.credential_content_type.model_class() is ProgramCertificate
+        ]
+        CredentialSideEffect.objects.bulk_create(
+            [
+                CredentialSideEffect(
+                    user_credential=user_credential,
+                    channel=SideEffectChannel.EVENT_BUS,
+                    params={"created": False, "status": UserCredentialStatus.REVOKED},
+                )
+                for user_credential in program_credentials
+            ]
+        )
+
+    if program_credentials and not deferred:
+        _emit_pending_revocation_events(
+            _get_pending_revocation_events().filter(
+                user_credential__in=[user_credential.id for user_credential in program_credentials]
+            ),
+            len(program_credentials),
+        )
+
+    return len(user_credentials)
+
+
+def _get_pending_revocation_events():
+    return CredentialSideEffect.objects.filter(
+        channel=SideEffectChannel.EVENT_BUS, state=SideEffectState.PENDING, params__status=UserCredentialStatus.REVOKED
+    )
+
+
+def _emit_pending_revocation_events(queryset, limit):
+    """
+    Emits (up to the limit) the recorded revocation events of the queryset and marks them processed.
+
+    The events are locked while they are emitted, the ones locked by the side effects workers (see
+    `process_side_effects`) are left to them, so an event is not emitted by both.
+
+    Returns:
+        int: emitted events count.
+    """
+
+    with transaction.atomic():
+        side_effects = list(
+            queryset.select_for_update(skip_locked=True, of=("self",))
+            .select_related("user_credential")
+            .order_by("id")[:limit]
+        )
+        if side_effects:
+            _emit_revocation_events([side_effect.user_credential for side_effect in side_effects])
+            CredentialSideEffect.objects.filter(id__in=[side_effect.id for side_effect in side_effects]).update(
+                state=SideEffectState.PROCESSED, modified=timezone.now()
+            )
+    return len(side_effects)
+
+
+def _emit_revocation_events(user_credentials):
+    """
+    Emits program certificate revocation events for the chunk of revoked user credentials.
+    """
+
+    issuer = ProgramCertificateIssuer()
+    users = User.objects.in_bulk(
+        {user_credential.username for user_credential in user_credentials}, field_name="username"
+    )
+    program_certificates = ProgramCertificate.objects.select_related("program", "site").in_bulk(
+        {user_credential.credential_id for user_credential in user_credentials}
+    )
+
+    for user_credential in user_credentials:
+        issuer._emit_program_certificate_signal(  # pylint: disable=protected-access
+            users.get(user_credential.username),
+            user_credential,
+            UserCredentialStatus.REVOKED,
+            program_certificates[user_credential.credential_id],
+        )
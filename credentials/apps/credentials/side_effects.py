@@ -0,0 +1,82 @@
+"""
+Background dispatching of program certificate issuance side effects.
+
+When the `DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS` setting is enabled, the program certificate issuer records its side
+effects (pathway emails, program completion email, event bus and Segment events) in the same transaction as the issued
+credential, and returns as soon as it is committed. The recorded side effects are dispatched here.
+
+Every channel can be processed by its own workers (see `process_credential_side_effects` management command), so the
+number of workers run per channel limits its concurrency. Concurrent workers never pick the same side effects.
+
+Each side effect is dispatched in its own transaction, which records its state: an interrupted batch only dispatches
+again the side effect it was interrupted in, and only the row of that side effect is locked while it is dispatched.
+"""
+
+import logging
+
+from django.db import transaction
+from edx_django_utils.cache import RequestCache
+from edx_django_utils.monitoring import increment
+
+from credentials.apps.credentials.constants import SideEffectState
+from credentials.apps.credentials.issuers import ProgramCertificateIssuer
+from credentials.apps.credentials.models import CredentialSideEffect
+
+logger = logging.getLogger(__name__)
+
+
+def process_side_effects(channel=None, batch_size=100, max_attempts=5):
+    """
+    Dispatches a batch of pending side effects, in the order they were recorded.
+
+    Side effects which failed to be dispatched are retried (by the following runs) up to `max_attempts` times.
+
+    Arguments:
+        channel (str): Optional. Dispatch side effects of this channel only.
+        batch_size (int): The maximum number of side effects dispatched.
+        max_attempts (int): The number of dispatching attempts before a side effect is failed.
+
+    Returns:
+        int: dispatched side effects count.
+    """
+    issuer = ProgramCertificateIssuer()
+    # data shared by the side effects (e.g. program emails context) is cached per batch
+    RequestCache.clear_all_namespaces()
+
+    queryset = CredentialSideEffect.objects.filter(state=SideEffectState.PENDING)
+    if channel:
+        queryset = queryset.filter(channel=channel)
+    queryset = (
+        queryset.select_for_update(skip_locked=True, of=("self",)).select_related("user_credential").order_by("id")
+    )
+
+    dispatched = 0
+    last_id = 0
+    while dispatched < batch_size:
+        with transaction.atomic():
+            # the side effects which failed in this batch are left to the following ones
+            side_effect = queryset.filter(id__gt=last_id).first()
+            if side_effect is None:
+                break
+            last_id = side_effect.id
+
+            try:
+                with transaction.atomic():
+                    issuer.dispatch_side_effect(side_effect)
+            except Exception as exc:  # pylint: disable=broad-except
+                side_effect.attempts += 1
+                side_effect.error = str(exc)
+                if side_effect.attempts >= max_attempts:
+                    side_effect.state = SideEffectState.FAILED
+                increment(f"credentials_side_effects_{side_effect.channel}_failures")
+                logger.exception(
+                    f"Credential side effect {side_effect} dispatching failed (attempt {side_effect.attempts})"
+                )
+            else:
+                side_effect.state = SideEffectState.PROCESSED
+                increment(f"credentials_side_effects_{side_effect.channel}_dispatched")
+
+            side_effect.save(update_fields=["state", "attempts", "error", "modified"])
+        dispatched += 1
+
+    return dispatched
@@ -6,19 +6,25 @@ from unittest import mock
 
 import factory
 import faker
+from django.contrib.admin.sites import AdminSite
 from django.contrib.messages.storage.fallback import FallbackStorage
+from django.db import connection
 from django.http import HttpRequest
-from django.test import TestCase
+from django.test import RequestFactory, TestCase
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 
 from credentials.apps.catalog.data import OrganizationDetails, ProgramDetails
 from credentials.apps.catalog.tests.factories import CourseRunFactory
 from credentials.apps.core.tests.factories import USER_PASSWORD, SiteConfigurationFactory, UserFactory
+from credentials.apps.credentials.admin import UserCredentialAdmin
 from credentials.apps.credentials.forms import ProgramCertificateAdminForm
+from credentials.apps.credentials.models import UserCredential
 from credentials.apps.credentials.tests.factories import (
     CourseCertificateFactory,
     ProgramCertificateFactory,
     SignatoryFactory,
+    UserCredentialFactory,
 )
 
 
@@ -120,3 +126,50 @@ class CourseCertificateAdminTestCase(TestCase):
         data["signatories"] = self.signatory.id
         response = self.client.post(reverse("admin:credentials_coursecertificate_add"), data=self.data)
         self.assertEqual(response.status_code, expected)
+
+
+class UserCredentialAdminTestCase(TestCase):
+    """
+    Test Case module for UserCredentialAdmin
+    """
+
+    def setUp(self):
+        super().setUp()
+        self.superuser = UserFactory(is_superuser=True, is_staff=True)
+        self.model_admin = UserCredentialAdmin(UserCredential, AdminSite())
+
+    def create_user_credentials(self, count):
+        for __ in range(count):
+            UserCredentialFactory(credential=ProgramCertificateFactory())
+            UserCredentialFactory(credential=CourseCertificateFactory(course_run=CourseRunFactory()))
+
+    def get_changelist_rows(self, **params):
+        request = RequestFactory().get("/", params)
+        request.user = self.superuser
+        changelist = self.model_admin.get_changelist_instance(request)
+        return [
+            (user_credential.credential_content_type.model, self.model_admin.title(user_credential))
+            for user_credential in changelist.result_list
+        ]
+
+    def test_changelist_queries(self):
+        self.create_user_credentials(1)
+        with CaptureQueriesContext(connection) as queries:
+            self.get_changelist_rows()
+
+        # the number of queries doesn't depend on the number of listed user credentials:
+        self.create_user_credentials(3)
+        with self.assertNumQueries(len(queries)):
+            rows = self.get_changelist_rows()
+        self.assertEqual(len(rows), 8)
+        self.assertTrue(all(title for __, title in rows))
+
+    def test_search(self):
+        UserCredentialFactory(username="learner", credential=ProgramCertificateFactory())
+        UserCredentialFactory(username="another-learner", credential=ProgramCertificateFactory())
+
+        request = RequestFactory().get("/", {"q": "learn"})
+        request.user = self.superuser
+        changelist = self.model_admin.get_changelist_instance(request)
+
+        self.assertEqual([user_credential.username for user_credential in changelist.result_list], ["learner"])
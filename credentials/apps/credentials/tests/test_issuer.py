@@ -13,10 +13,11 @@ from testfixtures import LogCapture
 from credentials.apps.api.exceptions import DuplicateAttributeError
 from credentials.apps.catalog.tests.factories import ProgramFactory
 from credentials.apps.core.tests.factories import SiteConfigurationFactory, SiteFactory, UserFactory
-from credentials.apps.credentials.constants import UserCredentialStatus
+from credentials.apps.credentials.constants import SideEffectChannel, UserCredentialStatus
 from credentials.apps.credentials.issuers import CourseCertificateIssuer, ProgramCertificateIssuer
 from credentials.apps.credentials.models import (
     CourseCertificate,
+    CredentialSideEffect,
     ProgramCertificate,
     UserCredential,
     UserCredentialAttribute,
@@ -78,6 +79,18 @@ class CertificateIssuerBase:
         self._assert_usercredential_fields(user_credential, self.certificate, self.user.username, "revoked", [])
         self.assertEqual(updated_credential, user_credential)
 
+    def test_reissue_unchanged_credential(self):
+        """
+        Verify re-issuing a credential with the same status doesn't write it.
+        """
+        issued_credential = self.issuer.issue_credential(self.certificate, self.user.username, "awarded")
+
+        with mock.patch.object(UserCredential, "save") as mock_save:
+            reissued_credential = self.issuer.issue_credential(self.certificate, self.user.username, "awarded")
+
+        mock_save.assert_not_called()
+        self.assertEqual(reissued_credential, issued_credential)
+
     def test_issue_credential_without_attributes(self):
         """
         Verify credentials can be issued without attributes.
@@ -200,6 +213,29 @@ class ProgramCertificateIssuerTests(CertificateIssuerBase, TestCase):
             self.issuer.issue_credential(self.certificate, self.user.username, attributes=self.attributes)
             self.assertEqual(mock_method.call_count, 1)
 
+    @override_settings(STAGE_TIMING_ENABLED=True)
+    def test_stage_timings(self):
+        """
+        Verify that the durations of the issuance stages are logged when the stage timing is enabled.
+        """
+        with self.assertLogs("credentials.apps.core.timing") as logs:
+            self.issuer.issue_credential(self.certificate, self.user.username, attributes=self.attributes)
+
+        self.assertEqual(
+            list(logs.records[0].stage_timings),
+            [
+                "operation",
+                "total_ms",
+                "credential_upsert_ms",
+                "user_lookup_ms",
+                "attributes_ms",
+                "pathway_emails_ms",
+                "completion_email_ms",
+                "event_bus_ms",
+                "segment_ms",
+            ],
+        )
+
     @override_settings(SEND_EMAIL_ON_PROGRAM_COMPLETION=True)
     @mock.patch("credentials.apps.credentials.issuers.send_program_certificate_created_message")
     def test_send_learner_email_when_awarding_program_cert(self, mock_send_learner_email):
@@ -357,7 +393,7 @@ class ProgramCertificateIssuerTests(CertificateIssuerBase, TestCase):
         assert expected_error_message in log.records[0].msg
         assert mock_send.call_count == 0
 
-    @mock.patch("credentials.apps.credentials.issuers.SegmentClient", autospec=True)
+    @mock.patch("credentials.apps.credentials.issuers.get_segment_client")
     def test_emit_segment_event_credential_created(self, mock_segment_client):
         """
         A test that verifies the contents and event type of a Segment event that is emit when learner's program
@@ -386,14 +422,14 @@ class ProgramCertificateIssuerTests(CertificateIssuerBase, TestCase):
             "timestamp": user_credential.modified,
         }
 
-        mock_segment_client_method_calls = mock_segment_client.method_calls
+        mock_segment_client_method_calls = mock_segment_client.return_value.method_calls
         assert len(mock_segment_client_method_calls) == 1
         call_args = mock_segment_client_method_calls[0].kwargs
         assert call_args["user_id"] == self.user.lms_user_id
         assert call_args["event"] == expected_event_name
         assert call_args["properties"] == expected_event_properties
 
-    @mock.patch("credentials.apps.credentials.issuers.SegmentClient", autospec=True)
+    @mock.patch("credentials.apps.credentials.issuers.get_segment_client")
     def test_emit_segment_event_credential_updated(self, mock_segment_client):
         """
         A test that verifies the contents and event type of a Segment event that is emit when learner's program
@@ -428,14 +464,14 @@ class ProgramCertificateIssuerTests(CertificateIssuerBase, TestCase):
             "timestamp": user_credential.modified,
         }
 
-        mock_segment_client_method_calls = mock_segment_client.method_calls
+        mock_segment_client_method_calls = mock_segment_client.return_value.method_calls
         assert len(mock_segment_client_method_calls) == 1
         call_args = mock_segment_client_method_calls[0].kwargs
         assert call_args["user_id"] == self.user.lms_user_id
         assert call_args["event"] == expected_event_name
         assert call_args["properties"] == expected_event_properties
 
-    @mock.patch("credentials.apps.credentials.issuers.SegmentClient", autospec=True)
+    @mock.patch("credentials.apps.credentials.issuers.get_segment_client")
     def test_emit_segment_event_segment_not_configured(self, mock_segment_client):
         """
         A test that verifies if Segment is not setup, we don't try to send an event.
@@ -465,6 +501,129 @@ class ProgramCertificateIssuerTests(CertificateIssuerBase, TestCase):
         assert expected_log_message in log_messages
 
 
+@override_settings(DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS=True, SEND_EMAIL_ON_PROGRAM_COMPLETION=True)
+class ProgramCertificateIssuerDeferredSideEffectsTests(TestCase):
+    """
+    Tests for the deferred side effects of program certificates issuance.
+    """
+
+    issuer = ProgramCertificateIssuer()
+
+    def setUp(self):
+        super().setUp()
+        self.site = SiteFactory()
+        self.site_config = SiteConfigurationFactory(site=self.site, segment_key="key")
+        self.program = ProgramFactory(site=self.site, uuid=uuid4())
+        self.certificate = ProgramCertificateFactory(
+            program_uuid=self.program.uuid, program=self.program, site=self.site
+        )
+        self.user = UserFactory()
+
+    @mock.patch("credentials.apps.credentials.issuers.get_segment_client")
+    @mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_AWARDED.send_event")
+    @mock.patch("credentials.apps.credentials.issuers.send_program_certificate_created_message")
+    @mock.patch("credentials.apps.credentials.issuers.send_updated_emails_for_program")
+    def test_side_effects_are_recorded(self, mock_pathway_emails, mock_completion_email, mock_send, mock_segment):
+        """
+        Verify that the side effects are recorded instead of being performed during the issuance.
+        """
+        request = mock.Mock(build_absolute_uri=mock.Mock(return_value="https://example.com/"))
+        user_credential = self.issuer.issue_credential(
+            self.certificate, self.user.username, request=request, lms_user_id=self.user.lms_user_id
+        )
+
+        for mocked in (mock_pathway_emails, mock_completion_email, mock_send, mock_segment):
+            assert mocked.call_count == 0
+
+        side_effects = CredentialSideEffect.objects.filter(user_credential=user_credential)
+        assert sorted(side_effects.values_list("channel", flat=True)) == sorted(
+            [
+                SideEffectChannel.PATHWAY_EMAILS,
+                SideEffectChannel.COMPLETION_EMAIL,
+                SideEffectChannel.EVENT_BUS,
+                SideEffectChannel.SEGMENT,
+            ]
+        )
+        assert side_effects.first().params == {
+            "created": True,
+            "status": "awarded",
+            "lms_user_id": self.user.lms_user_id,
+            "base_url": "https://example.com/",
+        }
+
+    def test_update_records_event_side_effects_only(self):
+        """
+        Verify that only the applicable side effects are recorded when an existing credential is updated.
+        """
+        self.site_config.segment_key = None
+        self.site_config.save()
+
+        self.issuer.issue_credential(self.certificate, self.user.username)
+        CredentialSideEffect.objects.all().delete()
+        user_credential = self.issuer.issue_credential(self.certificate, self.user.username, "revoked")
+
+        side_effects = CredentialSideEffect.objects.filter(user_credential=user_credential)
+        assert list(side_effects.values_list("channel", flat=True)) == [SideEffectChannel.EVENT_BUS]
+        assert side_effects.get().params["status"] == "revoked"
+
+    @mock.patch("credentials.apps.credentials.issuers.send_updated_emails_for_program")
+    def test_dispatch_pathway_emails(self, mock_pathway_emails):
+        """
+        Verify that pathway emails are dispatched with the base URL captured during the issuance.
+        """
+        user_credential = UserCredentialFactory(credential=self.certificate, username=self.user.username)
+        side_effect = CredentialSideEffect.objects.create(
+            user_credential=user_credential,
+            channel=SideEffectChannel.PATHWAY_EMAILS,
+            params={"created": True, "status": "awarded", "lms_user_id": None, "base_url": "https://example.com/"},
+        )
+
+        self.issuer.dispatch_side_effect(side_effect)
+
+        mock_pathway_emails.assert_called_once_with(
+            None, self.user.username, self.certificate, base_url="https://example.com/"
+        )
+
+    @mock.patch("credentials.apps.credentials.issuers.PROGRAM_CERTIFICATE_REVOKED.send_event")
+    def test_dispatch_event_bus(self, mock_send):
+        """
+        Verify that program certificate events are dispatched with the status of the issuance.
+        """
+        user_credential = UserCredentialFactory(
+            credential=self.certificate, username=self.user.username, status="revoked"
+        )
+        side_effect = CredentialSideEffect.objects.create(
+            user_credential=user_credential,
+            channel=SideEffectChannel.EVENT_BUS,
+            params={"created": False, "status": "revoked", "lms_user_id": None, "base_url": None},
+        )
+
+        self.issuer.dispatch_side_effect(side_effect)
+
+        assert mock_send.call_count == 1
+        assert mock_send.mock_calls[0].kwargs["program_certificate"].uuid == str(user_credential.uuid)
+
+    @mock.patch("credentials.apps.credentials.issuers.get_segment_client")
+    def test_dispatch_segment(self, mock_segment):
+        """
+        Verify that Segment events are dispatched with the status of the issuance, even if it changed since.
+        """
+        user_credential = UserCredentialFactory(
+            credential=self.certificate, username=self.user.username, status="revoked"
+        )
+        side_effect = CredentialSideEffect.objects.create(
+            user_credential=user_credential,
+            channel=SideEffectChannel.SEGMENT,
+            params={"created": True, "status": "awarded", "lms_user_id": None, "base_url": None},
+        )
+
+        self.issuer.dispatch_side_effect(side_effect)
+
+        mock_track = mock_segment.return_value.track
+        assert mock_track.call_count == 1
+        assert mock_track.call_args.kwargs["properties"]["status"] == "awarded"
+
+
 class CourseCertificateIssuerTests(CertificateIssuerBase, TestCase):
     """
     Tests for course Issuer class and its methods.
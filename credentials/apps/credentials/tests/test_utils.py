@@ -5,6 +5,7 @@ import ddt
 from django.contrib.auth import get_user_model
 from django.core import mail
 from django.test import TestCase, override_settings
+from edx_django_utils.cache import RequestCache
 from slugify import slugify
 from testfixtures import LogCapture
 
@@ -62,6 +63,7 @@ class ProgramCertificateIssuedEmailTests(SiteMixin, TestCase):
         self.program_cert = None
 
         mail.outbox = []
+        RequestCache.clear_all_namespaces()
 
         # Setup program and default email config
         self._setup_program_and_program_cert("Example Program")
@@ -136,6 +138,20 @@ class ProgramCertificateIssuedEmailTests(SiteMixin, TestCase):
         send_program_certificate_created_message(self.user.username, self.program_cert, lms_user_id=123)
         self._assert_email_contents()
 
+    def test_shared_context_is_built_once(self):
+        """The context shared by the learners of a program is built once per (program, language)"""
+        other_user = UserFactory()
+        with mock.patch.object(
+            ProgramCompletionEmailConfiguration,
+            "get_email_config_for_program",
+            wraps=ProgramCompletionEmailConfiguration.get_email_config_for_program,
+        ) as mock_get_config:
+            send_program_certificate_created_message(self.user.username, self.program_cert, lms_user_id=123)
+            send_program_certificate_created_message(other_user.username, self.program_cert, lms_user_id=456)
+
+        self.assertEqual(mock_get_config.call_count, 1)
+        self.assertEqual([email.to[0] for email in mail.outbox], [self.user.email, other_user.email])
+
     def test_no_config(self):
         """With the config deleted, it shouldn't send an email"""
         self.default_config.delete()
@@ -5,24 +5,30 @@ from itertools import groupby
 from typing import TYPE_CHECKING, Dict, Optional
 
 from django.conf import settings
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 from django.core.exceptions import ObjectDoesNotExist
 from django.db.models import Q
-from edx_ace import Recipient, ace
+from edx_ace import Recipient
+from edx_django_utils.cache import RequestCache
 
 from credentials.apps.catalog.data import ProgramStatus
 from credentials.apps.core.api import get_user_by_username
+from credentials.apps.core.messaging import send_message
 from credentials.apps.credentials.messages import ProgramCertificateIssuedMessage
-from credentials.apps.credentials.models import ProgramCompletionEmailConfiguration, UserCredential
+from credentials.apps.credentials.models import (
+    ProgramCertificate,
+    ProgramCompletionEmailConfiguration,
+    UserCredential,
+)
 
 if TYPE_CHECKING:
     from django.db.models import DateTimeField
     from django.db.models.query import QuerySet
 
-    from credentials.apps.credentials.models import ProgramCertificate
-
 log = logging.getLogger(__name__)
 
 VISIBLE_DATE_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+PROGRAM_COMPLETION_EMAIL_CACHE_NAMESPACE = "credentials.program_completion_email"
 
 
 def to_language(locale):
@@ -98,14 +104,67 @@ def _filter_visible_program_certificates(query_set: "QuerySet") -> "QuerySet":
         (QuerySet): A queryset of program UserCredentials that should be visible.
     """
     now = datetime.datetime.now(datetime.timezone.utc)
-    visible_program_cert_ids = []  # type: list[Optional[int]]
-    for user_credential in query_set:
-        program_visible_date = _get_program_certificate_visible_date(user_credential)
-        if program_visible_date and program_visible_date <= now:
-            visible_program_cert_ids.append(user_credential.id)
+    visible_program_cert_ids = [
+        user_credential_id
+        for user_credential_id, program_visible_date in _get_program_certificate_visible_dates(query_set).items()
+        if program_visible_date and program_visible_date <= now
+    ]
     return UserCredential.objects.filter(pk__in=visible_program_cert_ids)
 
 
+def _get_program_certificate_visible_dates(query_set: "QuerySet") -> Dict[int, Optional[datetime.datetime]]:
+    """
+    Batch version of `_get_program_certificate_visible_date`: the number of queries doesn't depend on the number of
+    program credentials.
+
+    Arguments:
+        query_set (UserCredential QuerySet): A queryset of UserCredential
+        objects of the ProgramCertificate ContentType.
+
+    Returns:
+        (Dict): The program credentials visible dates (or None) keyed by UserCredential id.
+    """
+    user_credentials = list(
+        query_set.prefetch_related(
+            GenericPrefetch(
+                "credential",
+                [ProgramCertificate.objects.select_related("program").prefetch_related("program__course_runs")],
+            )
+        )
+    )
+
+    course_run_ids = {
+        course_run.id
+        for user_credential in user_credentials
+        for course_run in user_credential.credential.program.course_runs.all()
+    }
+    # The first (by id) course certificate of every user for every course run:
+    course_run_dates = {}  # type: Dict[tuple, datetime.datetime]
+    course_run_certs = (
+        UserCredential.objects.filter(
+            username__in={user_credential.username for user_credential in user_credentials},
+            course_credentials__course_run__in=course_run_ids,
+        )
+        .order_by("id")
+        .values_list(
+            "username", "course_credentials__course_run", "course_credentials__certificate_available_date", "created"
+        )
+    )
+    for username, course_run_id, certificate_available_date, created in course_run_certs:
+        course_run_dates.setdefault((username, course_run_id), certificate_available_date or created)
+
+    visible_dates = {}
+    for user_credential in user_credentials:
+        last_date = None  # type: Optional[datetime.datetime]
+        for course_run in user_credential.credential.program.course_runs.all():
+            date = course_run_dates.get((user_credential.username, course_run.id))
+            if date:
+                last_date = max(last_date, date) if last_date else date
+        visible_dates[user_credential.id] = last_date
+
+    return visible_dates
+
+
 def _get_program_certificate_visible_date(user_program_credential: UserCredential) -> Optional[datetime.datetime]:
     """
     Finds the program credential visible date by finding the latest associated
@@ -206,6 +265,44 @@ def get_credential_visible_date(
     return get_credential_visible_dates([user_credential], use_date_override)[user_credential]
 
 
+def get_program_completion_email_context(program_certificate: "ProgramCertificate") -> Optional[Dict]:
+    """
+    Returns the part of the program completion email context shared by all the learners of the program (in the
+    language of the program certificate), or None if the email shouldn't be sent for the program.
+
+    The shared context is built once per (program, language) and reused by all the messages sent within the same
+    request (or batch of background side effects).
+
+    Args:
+        program_certificate (AbstractCredential[ProgramCertificate]): A ProgramCertificate configuration for a program
+    """
+    request_cache = RequestCache(PROGRAM_COMPLETION_EMAIL_CACHE_NAMESPACE)
+    cache_key = f"{program_certificate.program_uuid}.{program_certificate.language}"
+    cached_response = request_cache.get_cached_response(cache_key)
+    if cached_response.is_found:
+        return cached_response.value
+
+    program_details = program_certificate.program_details
+    email_configuration = ProgramCompletionEmailConfiguration.get_email_config_for_program(
+        program_certificate.program_uuid, program_details.type_slug
+    )
+
+    shared_context = None
+    # If a config doesn't exist or isn't enabled, or the program is retired, we don't want to send emails
+    if getattr(email_configuration, "enabled", None) and program_details.status != ProgramStatus.RETIRED.value:
+        shared_context = {
+            "program_title": program_details.title,
+            "program_type": program_details.type,
+            "custom_email_html_template_extra": email_configuration.html_template,
+            # remove any leading spaces of the plaintext content so that the email doesn't look horrendous
+            "custom_email_plaintext_template_extra": textwrap.dedent(email_configuration.plaintext_template),
+            "logo_url": getattr(settings, "LOGO_URL_PNG", ""),
+        }
+
+    request_cache.set(cache_key, shared_context)
+    return shared_context
+
+
 def send_program_certificate_created_message(
     username: str, program_certificate: "ProgramCertificate", lms_user_id: int
 ) -> None:
@@ -221,40 +318,25 @@ def send_program_certificate_created_message(
     """
     user = get_user_by_username(username)
     program_uuid = program_certificate.program_uuid
-    program_details = program_certificate.program_details
 
-    email_configuration = ProgramCompletionEmailConfiguration.get_email_config_for_program(
-        program_uuid, program_details.type_slug
-    )
-    # If a config doesn't exist or isn't enabled, we don't want to send emails for this program.
-    if not getattr(email_configuration, "enabled", None):
+    shared_context = get_program_completion_email_context(program_certificate)
+    if not shared_context:
         log.info(
             f"Not sending program completion email to learner [{user.id}] "
             f"in program [{program_uuid}] because it's not enabled"
         )
         return
 
-    # Don't send out emails for retired programs
-    if program_details.status == ProgramStatus.RETIRED.value:
-        return
-
     try:
         if not lms_user_id:
             log.warning("Program certificate created email sent without lms_user_id")
         msg = ProgramCertificateIssuedMessage(program_certificate.site, user.email).personalize(
             recipient=Recipient(lms_user_id=lms_user_id, email_address=user.email),
             language=program_certificate.language,
-            user_context={
-                "program_title": program_details.title,
-                "program_type": program_details.type,
-                "custom_email_html_template_extra": email_configuration.html_template,
-                # remove any leading spaces of the plaintext content so that the email doesn't look horrendous
-                "custom_email_plaintext_template_extra": textwrap.dedent(email_configuration.plaintext_template),
-                "logo_url": getattr(settings, "LOGO_URL_PNG", ""),
-            },
+            user_context=shared_context,
         )
         log.info(f"Sending Program completion email to learner with id [{user.id}] in Program [{program_uuid}]")
-        ace.send(msg)
+        send_message(msg)
     # We wouldn't want any issues that arise from formatting or sending this email message to interrupt the process
     # of issuing a learner their Program Certificate. We cast a wide net for exceptions here for this reason.
     except Exception as ex:
@@ -15,6 +15,8 @@ from django.utils.translation import gettext as _, override
 from django.views.generic import TemplateView
 
 from credentials.apps.catalog.data import OrganizationDetails, ProgramDetails
+from credentials.apps.core.db_routing import read_replica
+from credentials.apps.core.query_budget import query_budget
 from credentials.apps.core.views import ThemeViewMixin
 from credentials.apps.credentials.exceptions import MissingCertificateLogoError
 from credentials.apps.credentials.models import ProgramCertificate, UserCredential
@@ -69,6 +71,8 @@ def _get_org_name(organization_names, render_language):
     return org_name_string
 
 
+@read_replica()
+@query_budget(25)
 class RenderCredential(SocialMediaMixin, ThemeViewMixin, TemplateView):
     """Certificate rendering view."""
 
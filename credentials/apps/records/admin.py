@@ -2,6 +2,7 @@
 
 from django.contrib import admin
 
+from credentials.apps.core.admin import ScalableChangeListAdminMixin
 from credentials.apps.records.models import ProgramCertRecord, UserCreditPathway, UserGrade
 
 
@@ -27,7 +28,7 @@ class ProgramCertRecordAdmin(admin.ModelAdmin):
 
 
 @admin.register(UserGrade)
-class UserGradeAdmin(admin.ModelAdmin):
+class UserGradeAdmin(ScalableChangeListAdminMixin, admin.ModelAdmin):
     """Admin for the UserGrade model."""
 
     list_display = (
@@ -36,9 +37,10 @@ class UserGradeAdmin(admin.ModelAdmin):
         "letter_grade",
         "percent_grade",
     )
+    list_select_related = ("course_run__course",)
     search_fields = (
-        "username",
-        "course_run__key",
+        "^username",
+        "=course_run__key",
     )
     raw_id_fields = ("course_run",)
     readonly_fields = ["lms_last_updated_at"]
@@ -17,6 +17,7 @@ from credentials.apps.credentials.api import (
 )
 from credentials.apps.credentials.data import UserCredentialStatus
 from credentials.apps.records.models import ProgramCertRecord, UserCreditPathway, UserGrade
+from credentials.apps.records.public_records import get_public_program_record
 from credentials.apps.records.utils import get_credentials
 
 if TYPE_CHECKING:
@@ -124,7 +125,107 @@ def _get_transformed_pathway_data(program, user):
     return pathway_data
 
 
-def _get_transformed_grade_data(program, user):  # pylint: disable=too-many-statements
+def get_program_grade_rows(course_runs, course_credentials, grades, get_school, get_issue_date):
+    """
+    Builds the grade rows of a learner's program record, a row per course of the program. Used by the Program Record
+    page and by the exports of the program records.
+
+    Args:
+        course_runs (List[CourseRun]): the course-runs of the program, in the order maintained by the Program's sorted
+            field
+        course_credentials (List[Tuple]): the learner's course certificates (of any status), as
+            `(course-run id, status, credential)` tuples
+        grades (List[Tuple]): the learner's verified grades, as `(course-run id, percent grade, letter grade, grade)`
+            tuples
+        get_school (Callable): returns the school of a course
+        get_issue_date (Callable): returns the issue date of an awarded course certificate (a `credential`)
+
+    Returns:
+        grade_rows (List[Dict]): A list containing a subset of a learner's grade information for each course
+        highest_attempt_dict (Dict): A dictionary mapping a learner's highest achieved grade (a `grade`) to each course
+    """
+    course_runs_by_id = {course_run.id: course_run for course_run in course_runs}
+    course_credentials = [
+        (course_run_id, status, credential)
+        for course_run_id, status, credential in course_credentials
+        if course_run_id in course_runs_by_id
+    ]
+    # maps a course-run id to the status of the learner's credential in the course-run
+    credential_statuses = {course_run_id: status for course_run_id, status, __ in course_credentials}
+
+    # `num_attempts_dict` is used to track how many times a learner has attempted a particular course
+    num_attempts_dict = defaultdict(int)
+    # `highest_attempts` maps the learner's highest grade earned in a course-run to a course
+    highest_attempts = {}
+    for course_run_id, percent_grade, letter_grade, grade in grades:
+        status = credential_statuses.get(course_run_id)
+        if status is None:
+            continue
+        course = course_runs_by_id[course_run_id].course
+        num_attempts_dict[course] += 1
+        # find the highest course grade out of all attempts at a course
+        if status == UserCredentialStatus.AWARDED.value:
+            current = highest_attempts.setdefault(course, (percent_grade, letter_grade, grade))
+            if percent_grade > current[0]:
+                highest_attempts[course] = (percent_grade, letter_grade, grade)
+
+    # create a collection of awarded credentials mapped to a *course*, this will help us build the rows below and we
+    # need an easy way to know if a learner has earned a course credential in any eligible course runs of a specific
+    # course
+    awarded_course_credentials = {
+        course_runs_by_id[course_run_id].course: (course_run_id, credential)
+        for course_run_id, status, credential in course_credentials
+        if status == UserCredentialStatus.AWARDED.value
+    }
+
+    grade_rows = []
+    added_courses = set()
+    for course_run in course_runs:
+        course = course_run.course
+        if course in added_courses:
+            continue
+        highest_attempt = highest_attempts.get(course)
+        awarded_credential = awarded_course_credentials.get(course)
+
+        course_run_key = course_attempts = issue_date_formatted = percent_grade = letter_grade = ""
+        # Case 1: Learner has earned a credential in a course-run of a course that is associated with this program,
+        # with a grade (or Case 2: we have no record of a grade)
+        if awarded_credential and awarded_credential[0] == course_run.id:
+            course_run_key = course_run.key
+            issue_date = get_issue_date(awarded_credential[1])
+            issue_date_formatted = issue_date.isoformat() if issue_date else ""
+            if highest_attempt:
+                course_attempts = num_attempts_dict[course]
+                percent_grade = float(highest_attempt[0])
+                letter_grade = highest_attempt[1] or _("N/A")
+        # Case 3: Learner has a record of a grade in, but has not earned a Credential for, a course run of a course that
+        # is associated with this program. We actually don't have any logic for this case, as we only add grades to the
+        # "highest attempt" dictionary if-and-only-if the learner has earned a course credential in the course. The
+        # UI's behavior at this point is the same for Case #3 and Case #4 below, the grade is not shown and the
+        # Credential appears as "not earned".
+        # Case 4: learner has no grades associated with, nor earned a course credential in, a course run of a course
+        # associated with this program
+        elif highest_attempt or awarded_credential:
+            continue
+
+        grade_rows.append(
+            {
+                "name": course.title,
+                "school": get_school(course),
+                "attempts": course_attempts,
+                "course_id": course_run_key,
+                "issue_date": issue_date_formatted,
+                "percent_grade": percent_grade,
+                "letter_grade": letter_grade,
+            }
+        )
+        added_courses.add(course)
+
+    highest_attempt_dict = {course: highest_attempt[2] for course, highest_attempt in highest_attempts.items()}
+    return grade_rows, highest_attempt_dict
+
+
+def _get_transformed_grade_data(program, user):
     """
     A utility function that gathers and transforms a learner's grade data for course-runs that are part of a Program.
     This data is used to render a learner's Program Record page.
@@ -152,122 +253,38 @@ def _get_transformed_grade_data(program, user):  # pylint: disable=too-many-stat
     )
     # create a new dictionary, mapping a course-run id (key) to an associated credential
     user_credential_dict = {
-        user_credential.credential.course_run.key: user_credential for user_credential in course_user_credentials
+        user_credential.credential.course_run_id: user_credential for user_credential in course_user_credentials
     }
     # maps a credential to its visible_date (a date when the certificate becomes viewable)
     visible_dates = get_credential_dates(course_user_credentials, True)
     # retrieves the learner's grades (from verified course-runs) relevant to this program
-    course_grades = UserGrade.objects.select_related("course_run__course").filter(
+    course_grades = UserGrade.objects.filter(
         username=user.username, course_run__in=program_course_runs_set, verified=True
     )
 
-    # `num_attempts_dict` is used to track how many times a learner has attempted a particular course
-    num_attempts_dict = defaultdict(int)
-    # `highest_attempt_dict` maps the learner's highest grade earned in a course-run to a course
-    highest_attempt_dict = {}
-    # `last_updated` tracks the most recent time any certificate or grade was last updated
+    # `last_updated` tracks the most recent time any certificate or grade (of a course-run with a certificate) was last
+    # updated
     last_updated = None
-
-    # find the learner's highest grade for each course, how many times they have taken each course, and keep track of
-    # the last time these records were updated
     for course_grade in course_grades:
-        course_run = course_grade.course_run
-        course = course_run.course
-
-        user_credential = user_credential_dict.get(course_run.key)
+        user_credential = user_credential_dict.get(course_grade.course_run_id)
         if user_credential:
-            num_attempts_dict[course] += 1
             visible_date = visible_dates[user_credential]
             last_updated = max(filter(None, [visible_date, course_grade.modified, last_updated]))
-
-            # find the highest course grade out of all attempts at a course
-            if user_credential.status == UserCredentialStatus.AWARDED.value:
-                current = highest_attempt_dict.setdefault(course, course_grade)
-                if course_grade.percent_grade > current.percent_grade:
-                    highest_attempt_dict[course] = course_grade
-
     last_updated = last_updated or datetime.datetime.today()
 
-    # now, transform this grade data into the format we prefer for our response
-    transformed_grade_data = []
-    added_courses = set()
-
-    # create a collection of awarded credentials mapped to a *course*, this will help us build responses below and we
-    # need an easy way to know if a learner has earned a course credential in any eligible course runs of a specific
-    # course
-    awarded_course_credential_dict = {}
-    for user_credential in course_user_credentials:
-        if (
-            user_credential.status == UserCredentialStatus.AWARDED.value
-            and user_credential.credential.course_run in program_course_runs_set
-        ):
-            awarded_course_credential_dict[user_credential.credential.course_run.course] = user_credential
-
-    # Add the credential and grade data to the response in the order that is maintained by the Program's sorted field
-    for course_run in program_course_runs:
-        course = course_run.course
-        grade = highest_attempt_dict.get(course, None)
-        awarded_credential = awarded_course_credential_dict.get(course, None)
-        issue_date = None
-        if awarded_credential:
-            issue_date = get_credential_dates(awarded_credential, False)
-
-        match = False
-        course_run_key = ""
-        course_attempts = ""
-        issue_date_formatted = ""
-        percent_grade = ""
-        letter_grade = ""
-        # Case 1: Learner has earned a credential and grade in a course-run of a course that is associated with this
-        # program
-        if (
-            awarded_credential
-            and awarded_credential.credential.course_run == course_run
-            and grade
-            and course not in added_courses
-        ):
-            match = True
-            course_run_key = course_run.key
-            course_attempts = num_attempts_dict[course]
-            issue_date_formatted = issue_date.isoformat() if issue_date else ""
-            percent_grade = float(grade.percent_grade)
-            letter_grade = grade.letter_grade or _("N/A")
-        # Case 2: Learner has earned a credential in, but we have no record of a grade for, a course-run of a course
-        # that is associated with this program
-        elif (
-            awarded_credential
-            and awarded_credential.credential.course_run == course_run
-            and not grade
-            and course not in added_courses
-        ):
-            match = True
-            course_run_key = course_run.key
-            issue_date_formatted = issue_date.isoformat() if issue_date else ""
-        # Case 3: Learner has a record of a grade in, but has not earned a Credential for, a course run of a course that
-        # is associated with this program. We actually don't have any logic for this case, as we only add grades to the
-        # "highest attempt" dictionary if-and-only-if the learner has earned a course credential in the course. See
-        # lines 177 -> 180 above. This comment is here for informational purposes when another maintainer looks at this
-        # code and thinks "hey, we forgot a case here!". The UI's behavior at this point is the same for Case #3 and
-        # Case #4 below, the grade is not shown and the Credential appears as "not earned".
-        ################################################################################################################
-        # Case 4: learner has no grades associated with, nor earned a course credential in, a course run of a course
-        # associated with this program
-        elif not grade and not awarded_credential and course not in added_courses:
-            match = True
-
-        if match:
-            transformed_grade_data.append(
-                {
-                    "name": course.title,
-                    "school": ", ".join(course.owners.values_list("name", flat=True)),
-                    "attempts": course_attempts,
-                    "course_id": course_run_key,
-                    "issue_date": issue_date_formatted,
-                    "percent_grade": percent_grade,
-                    "letter_grade": letter_grade,
-                }
-            )
-            added_courses.add(course)
+    transformed_grade_data, highest_attempt_dict = get_program_grade_rows(
+        program_course_runs,
+        [
+            (user_credential.credential.course_run_id, user_credential.status, user_credential)
+            for user_credential in course_user_credentials
+        ],
+        [
+            (course_grade.course_run_id, course_grade.percent_grade, course_grade.letter_grade, course_grade)
+            for course_grade in course_grades
+        ],
+        get_school=lambda course: ", ".join(course.owners.values_list("name", flat=True)),
+        get_issue_date=lambda user_credential: get_credential_dates(user_credential, False),
+    )
 
     # In the current implementation of the Program Record page, the Program info is coupled to some of the grade data
     # generated in this function. Previously, all this logic was in a single function and it was hard to follow. While
@@ -354,6 +371,32 @@ def get_program_details(request_user, request_site, uuid, is_public):
         user = request_user
         program_uuid = uuid
 
+    return _get_program_details(user, program_uuid, request_site, uuid, is_public)
+
+
+def get_public_program_details(request_site, uuid):
+    """
+    Retrieves the (cached, see `credentials.apps.records.public_records`) details of a shared ProgramCertRecord
+    instance.
+
+    Arguments:
+        request_site: Site from the request
+        uuid(str): ID of the shared ProgramCertRecord instance
+    Returns:
+        PublicProgramRecord: The details (see `get_program_details`) as `data`, with their ETag and Last-Modified.
+    Raises:
+        ProgramCertRecord.DoesNotExist: If there is no shared ProgramCertRecord with the given ID.
+    """
+    return get_public_program_record(
+        request_site,
+        uuid,
+        lambda program_cert_record: _get_program_details(
+            program_cert_record.user, program_cert_record.program.uuid, request_site, uuid, is_public=True
+        ),
+    )
+
+
+def _get_program_details(user, program_uuid, request_site, uuid, is_public):
     data = get_program_record_data(
         user, program_uuid, request_site, platform_name=request_site.siteconfiguration.platform_name
     )
@@ -0,0 +1,18 @@
+"""
+Basic configuration for the records app.
+"""
+
+from django.apps import AppConfig
+
+
+class RecordsConfig(AppConfig):
+    """
+    Records app configuration.
+    """
+
+    name = "credentials.apps.records"
+    verbose_name = "Records"
+
+    def ready(self):
+        # connect signal handlers for the public program records cache
+        from credentials.apps.records import signals  # pylint: disable=unused-import,import-outside-toplevel
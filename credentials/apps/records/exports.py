@@ -0,0 +1,331 @@
+"""
+Streamed CSV exports of program records.
+
+The CSV rows are written as they are produced, so the exports can be served with a `StreamingHttpResponse` without
+being built in memory first:
+    - `iter_program_record_csv` exports the record of a learner: the learner and program metadata rows followed by the
+      grade rows;
+    - `iter_program_records_csv` exports the records of many learners (e.g. of all the learners who shared their record
+      of a program, see `iter_program_records`) as a single table, a row per learner and course.
+
+The records of many learners (of a program, see `iter_program_records`, or of a credit pathway cohort, see
+`iter_pathway_records`) are assembled with set-based queries: the number of queries depends on the number of chunks of
+learners (and on the number of programs), not on the number of learners. The pathway records are exported as NDJSON
+(`iter_ndjson`), a record per line, or as CSV (`iter_pathway_records_csv`), a row per learner and course.
+"""
+
+import csv
+import json
+from collections import defaultdict
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Exists, OuterRef, Q
+from django.utils import timezone
+
+from credentials.apps.credentials.data import UserCredentialStatus
+from credentials.apps.credentials.models import UserCredential
+from credentials.apps.credentials.utils import filter_visible
+from credentials.apps.records.api import get_program_grade_rows
+from credentials.apps.records.constants import UserCreditPathwayStatus
+from credentials.apps.records.models import ProgramCertRecord, UserCreditPathway, UserGrade
+
+GRADE_FIELDS = ["name", "school", "attempts", "course_id", "issue_date", "percent_grade", "letter_grade"]
+BULK_FIELDS = [
+    "username",
+    "full_name",
+    "email",
+    "program_uuid",
+    "program_name",
+    "program_type",
+    "program_completed",
+    *GRADE_FIELDS,
+]
+PATHWAY_EXPORT_FIELDS = [*BULK_FIELDS[:7], "sent", "modified", *GRADE_FIELDS]
+PATHWAY_EXPORT_CHUNK_SIZE = 500
+PROGRAM_EXPORT_CHUNK_SIZE = 500
+
+
+class Echo:
+    """
+    File-like object which returns the written value instead of buffering it (see `csv.writer`).
+    """
+
+    def write(self, value):
+        return value
+
+
+def get_csv_writer():
+    return csv.writer(Echo(), quoting=csv.QUOTE_ALL)
+
+
+def get_program_record_metadata(record):
+    """
+    Metadata rows of a learner's program record (see `get_program_record_data`).
+    """
+    program, learner = record["program"], record["learner"]
+    return [
+        ["Program Name", program.get("name", None)],
+        ["Program Type", program.get("type_name", None)],
+        ["Platform Provider", record["platform_name"]],
+        ["Authoring Organization(s)", program.get("school", None)],
+        ["Learner Name", learner.get("full_name", None)],
+        ["Username", learner.get("username", None)],
+        ["Email", learner.get("email", None)],
+        [""],
+    ]
+
+
+def iter_program_record_csv(record):
+    """
+    Yields the CSV lines of a learner's program record (see `get_program_record_data`).
+    """
+    writer = get_csv_writer()
+    for row in get_program_record_metadata(record):
+        yield writer.writerow(row)
+    yield writer.writerow(GRADE_FIELDS)
+    for grade in record["grades"]:
+        yield writer.writerow([grade.get(field, "") for field in GRADE_FIELDS])
+
+
+def iter_program_records_csv(records):
+    """
+    Yields the CSV lines of the program records of many learners (see `iter_program_records`), a row per learner and
+    course.
+    """
+    writer = get_csv_writer()
+    yield writer.writerow(BULK_FIELDS)
+    for record in records:
+        program = record["program"]
+        learner_row = [
+            record["username"],
+            record["full_name"],
+            record["email"],
+            program["uuid"],
+            program["name"],
+            program["type"],
+            program["completed"],
+        ]
+        # a learner without grade rows is still listed
+        for grade in record["grades"] or [{}]:
+            yield writer.writerow(learner_row + [grade.get(field, "") for field in GRADE_FIELDS])
+
+
+def iter_program_records(program, chunk_size=PROGRAM_EXPORT_CHUNK_SIZE):
+    """
+    Yields the program records of every learner who shared their record of the program, in chunks of learners (ordered
+    by the time they first shared their record).
+
+    A record has the same grade rows as the Program Record page (see `get_program_record_data`), its "modified" value
+    is the time of the latest change of the record (it was shared, or a grade or a credential of the program changed).
+
+    Arguments:
+        program (Program): the program
+        chunk_size (int): number of learners whose records are assembled at once
+    """
+    program_cert_records = ProgramCertRecord.objects.filter(program=program)
+    program_data = _ProgramExportData(program)
+    last_id = 0
+    while True:
+        chunk = list(program_cert_records.filter(id__gt=last_id).select_related("user").order_by("id")[:chunk_size])
+        if not chunk:
+            return
+        last_id = chunk[-1].id
+        yield from program_data.get_records(chunk)
+
+
+def iter_pathway_records(pathway, since=None, chunk_size=PATHWAY_EXPORT_CHUNK_SIZE):
+    """
+    Yields the program records of every learner who sent their record to the credit pathway, in chunks of learners
+    (ordered by the time they first sent their record, and by program within a chunk).
+
+    A record has the same grade rows as the Program Record page (see `get_program_record_data`), its "modified" value
+    is the time of the latest change of the record (it was sent, or a grade or a credential of the program changed).
+
+    Arguments:
+        pathway (Pathway): the credit pathway
+        since (datetime): if set, only the records modified since then are exported
+        chunk_size (int): number of learners whose records are assembled at once
+    """
+    user_credit_pathways = UserCreditPathway.objects.filter(
+        pathway=pathway, status=UserCreditPathwayStatus.SENT, program__isnull=False
+    )
+    if since:
+        user_credit_pathways = user_credit_pathways.filter(
+            Q(modified__gte=since)
+            | Exists(
+                UserGrade.objects.filter(
+                    username=OuterRef("user__username"), course_run__programs=OuterRef("program"), modified__gte=since
+                )
+            )
+            | Exists(
+                UserCredential.objects.filter(
+                    Q(course_credentials__course_run__programs=OuterRef("program"))
+                    | Q(program_credentials__program_uuid=OuterRef("program__uuid")),
+                    username=OuterRef("user__username"),
+                    modified__gte=since,
+                )
+            )
+        )
+
+    programs = {}
+    last_id = 0
+    while True:
+        chunk = list(
+            user_credit_pathways.filter(id__gt=last_id).select_related("user", "program").order_by("id")[:chunk_size]
+        )
+        if not chunk:
+            return
+        last_id = chunk[-1].id
+
+        by_program = defaultdict(list)
+        for user_credit_pathway in chunk:
+            by_program[user_credit_pathway.program].append(user_credit_pathway)
+        for program, program_user_credit_pathways in by_program.items():
+            if program.id not in programs:
+                programs[program.id] = _ProgramExportData(program)
+            records = programs[program.id].get_records(program_user_credit_pathways)
+            for user_credit_pathway, record in zip(program_user_credit_pathways, records):
+                yield {**record, "sent": user_credit_pathway.modified}
+
+
+class _ProgramExportData:
+    """
+    The catalog data of a program, shared by the records of all the learners.
+    """
+
+    def __init__(self, program):
+        self.program = program
+        self.course_runs = list(program.course_runs.select_related("course"))
+        self.course_schools = {
+            course.id: ", ".join(course.owners.values_list("name", flat=True))
+            for course in {course_run.course for course_run in self.course_runs}
+        }
+        self.school = ", ".join(program.authoring_organizations.values_list("name", flat=True))
+
+    def get_records(self, learner_records):
+        """
+        Yields the records of the learners, in order.
+
+        Arguments:
+            learner_records (list): the UserCreditPathway or the ProgramCertRecord of every learner
+        """
+        usernames = {learner_record.user.username for learner_record in learner_records}
+        course_run_ids = [course_run.id for course_run in self.course_runs]
+
+        # the visible course certificates (see `filter_visible`) of the program course runs, of any status
+        course_credentials = defaultdict(list)
+        for course_credential in (
+            UserCredential.objects.filter(
+                Q(course_credentials__certificate_available_date__lte=timezone.now())
+                | Q(course_credentials__certificate_available_date__isnull=True),
+                username__in=usernames,
+                course_credentials__course_run__in=course_run_ids,
+            )
+            .order_by("id")
+            .values(
+                "username",
+                "status",
+                "created",
+                "modified",
+                "course_credentials__course_run",
+                "course_credentials__certificate_available_date",
+                "date_override__date",
+            )
+        ):
+            course_credentials[course_credential["username"]].append(course_credential)
+
+        grades = defaultdict(list)
+        for grade in (
+            UserGrade.objects.filter(username__in=usernames, course_run__in=course_run_ids, verified=True)
+            .order_by("id")
+            .values("username", "course_run", "percent_grade", "letter_grade", "modified")
+        ):
+            grades[grade["username"]].append(grade)
+
+        program_credentials = dict(
+            filter_visible(
+                UserCredential.objects.filter(
+                    username__in=usernames,
+                    status=UserCredentialStatus.AWARDED.value,
+                    program_credentials__program_uuid=self.program.uuid,
+                )
+            ).values_list("username", "modified")
+        )
+
+        for learner_record in learner_records:
+            user = learner_record.user
+            grade_rows = self._get_grade_rows(course_credentials[user.username], grades[user.username])
+            modified = max(
+                [
+                    learner_record.modified,
+                    *(course_credential["modified"] for course_credential in course_credentials[user.username]),
+                    *(grade["modified"] for grade in grades[user.username]),
+                    *filter(None, [program_credentials.get(user.username)]),
+                ]
+            )
+            yield {
+                "username": user.username,
+                "full_name": user.get_full_name(),
+                "email": user.email,
+                "program": {
+                    "uuid": self.program.uuid.hex,
+                    "name": self.program.title,
+                    "type": self.program.type,
+                    "completed": user.username in program_credentials,
+                    "school": self.school,
+                },
+                "modified": modified,
+                "grades": grade_rows,
+            }
+
+    def _get_grade_rows(self, course_credentials, grades):
+        """
+        The grade rows of a learner, see `get_program_grade_rows`.
+        """
+        grade_rows, __ = get_program_grade_rows(
+            self.course_runs,
+            [
+                (course_credential["course_credentials__course_run"], course_credential["status"], course_credential)
+                for course_credential in course_credentials
+            ],
+            [(grade["course_run"], grade["percent_grade"], grade["letter_grade"], grade) for grade in grades],
+            get_school=lambda course: self.course_schools[course.id],
+            get_issue_date=lambda course_credential: (
+                course_credential["date_override__date"]
+                or course_credential["course_credentials__certificate_available_date"]
+                or course_credential["created"]
+            ),
+        )
+        return grade_rows
+
+
+def iter_ndjson(records):
+    """
+    Yields the records as NDJSON lines.
+    """
+    for record in records:
+        yield json.dumps(record, cls=DjangoJSONEncoder) + "\n"
+
+
+def iter_pathway_records_csv(records):
+    """
+    Yields the CSV lines of the pathway records (see `iter_pathway_records`), a row per learner and course.
+    """
+    writer = get_csv_writer()
+    yield writer.writerow(PATHWAY_EXPORT_FIELDS)
+    for record in records:
+        program = record["program"]
+        learner_row = [
+            record["username"],
+            record["full_name"],
+            record["email"],
+            program["uuid"],
+            program["name"],
+            program["type"],
+            program["completed"],
+            record["sent"].isoformat(),
+            record["modified"].isoformat(),
+        ]
+        # a learner without grade rows is still listed
+        for grade in record["grades"] or [{}]:
+            yield writer.writerow(learner_row + [grade.get(field, "") for field in GRADE_FIELDS])
@@ -0,0 +1,152 @@
+"""
+Bulk ingestion of user grades.
+
+A batch of grades is written with a constant number of queries:
+    - the course runs of the batch are resolved at once (by key, within the site);
+    - the stored grades of the batch are read at once, grades which aren't newer than the stored ones (by
+      `lms_last_updated_at`) or which don't change them are skipped;
+    - if there is anything left to write, the stored grades are locked (and compared again) and the remaining grades
+      are upserted with a single `bulk_create(update_conflicts=True)`.
+"""
+
+import logging
+from collections import Counter
+
+from django.db import connection, transaction
+from edx_django_utils.monitoring import accumulate
+
+from credentials.apps.catalog.models import CourseRun
+from credentials.apps.records.models import UserGrade
+from credentials.apps.records.public_records import invalidate_public_program_records
+
+logger = logging.getLogger(__name__)
+
+UNIQUE_FIELDS = ["username", "course_run"]
+COMPARED_FIELDS = ["letter_grade", "percent_grade", "verified", "lms_last_updated_at"]
+UPDATE_FIELDS = [*COMPARED_FIELDS, "modified"]
+
+
+class GradeUpsertStatus:
+    """Per-grade results of the bulk grade upsert."""
+
+    CREATED = "created"
+    UPDATED = "updated"
+    SKIPPED = "skipped"
+    FAILED = "failed"
+
+
+def upsert_user_grades(site, grades):
+    """
+    Creates or updates the given grades, unless the stored grades are as new or newer or the same.
+
+    Grades without `lms_last_updated_at` are always written. When the same learner and course run appear in the batch
+    more than once, the newest grade (the last one, for equal timestamps) is written and the others are skipped.
+
+    Arguments:
+        site (Site): site the course runs belong to.
+        grades (list): dicts with "username", "course_run" (course run key), "letter_grade", "percent_grade",
+            "verified" and (optionally) "lms_last_updated_at".
+
+    The skipped grades are counted with the `usergrade_skipped_writes` custom metric.
+
+    Returns:
+        list: a (status, error) tuple per grade, in the order of the grades.
+    """
+    results = [None] * len(grades)
+    course_runs = {
+        course_run.key: course_run
+        for course_run in CourseRun.objects.filter(key__in={grade["course_run"] for grade in grades}, course__site=site)
+    }
+
+    # the newest grade for every learner and course run:
+    latest = {}
+    for index, grade in enumerate(grades):
+        course_run = course_runs.get(grade["course_run"])
+        if course_run is None:
+            results[index] = (GradeUpsertStatus.FAILED, f"No CourseRun exists for key [{grade['course_run']}]")
+            continue
+        grade_key = (grade["username"], course_run.id)
+        if grade_key in latest:
+            previous = latest[grade_key]
+            if _is_older(grade, grades[previous]):
+                results[index] = (GradeUpsertStatus.SKIPPED, None)
+                continue
+            results[previous] = (GradeUpsertStatus.SKIPPED, None)
+        latest[grade_key] = index
+
+    # the stored grades are only locked when there is something to write:
+    if _get_user_grades(grades, latest, course_runs, _get_stored_grades(latest), results):
+        with transaction.atomic():
+            user_grades = _get_user_grades(grades, latest, course_runs, _get_stored_grades(latest, lock=True), results)
+            if user_grades:
+                UserGrade.objects.bulk_create(
+                    user_grades,
+                    update_conflicts=True,
+                    # MySQL upserts on any unique constraint and doesn't accept the conflict target:
+                    unique_fields=UNIQUE_FIELDS if connection.features.supports_update_conflicts_with_target else None,
+                    update_fields=UPDATE_FIELDS,
+                )
+                invalidate_public_program_records(*(user_grade.username for user_grade in user_grades))
+
+    counts = Counter(grade_status for grade_status, _ in results)
+    if counts[GradeUpsertStatus.SKIPPED]:
+        accumulate("usergrade_skipped_writes", counts[GradeUpsertStatus.SKIPPED])
+    logger.info("Upserted a batch of %d grades: %s", len(grades), dict(counts))
+    return results
+
+
+def _get_stored_grades(grade_keys, lock=False):
+    """
+    The stored values of the grades with the given (username, course run id) keys.
+    """
+    queryset = UserGrade.objects.filter(
+        username__in={username for username, _ in grade_keys},
+        course_run_id__in={course_run_id for _, course_run_id in grade_keys},
+    )
+    if lock:
+        queryset = queryset.select_for_update()
+
+    return {
+        (stored["username"], stored["course_run_id"]): stored
+        for stored in queryset.values("username", "course_run_id", *COMPARED_FIELDS)
+    }
+
+
+def _get_user_grades(grades, latest, course_runs, stored_grades, results):
+    """
+    Builds the grades to write, sets the results of the latest grades.
+    """
+    user_grades = []
+    for grade_key, index in latest.items():
+        grade, stored = grades[index], stored_grades.get(grade_key)
+        if stored is None:
+            results[index] = (GradeUpsertStatus.CREATED, None)
+        elif _is_older(grade, stored, or_equal=True) or all(
+            grade.get(field) == stored[field] for field in COMPARED_FIELDS
+        ):
+            results[index] = (GradeUpsertStatus.SKIPPED, None)
+            continue
+        else:
+            results[index] = (GradeUpsertStatus.UPDATED, None)
+        user_grades.append(
+            UserGrade(
+                username=grade["username"],
+                course_run=course_runs[grade["course_run"]],
+                letter_grade=grade["letter_grade"],
+                percent_grade=grade["percent_grade"],
+                verified=grade["verified"],
+                lms_last_updated_at=grade.get("lms_last_updated_at"),
+            )
+        )
+
+    return user_grades
+
+
+def _is_older(grade, other, or_equal=False):
+    """
+    Whether the grade was updated in the LMS before the other one. Grades without `lms_last_updated_at` aren't ordered.
+    """
+    updated_at, other_updated_at = grade.get("lms_last_updated_at"), other.get("lms_last_updated_at")
+    if updated_at is None or other_updated_at is None:
+        return False
+    return updated_at <= other_updated_at if or_equal else updated_at < other_updated_at
@@ -0,0 +1,131 @@
+"""
+Cache of the public (shared) program records.
+
+Shared program records are anonymous, read-mostly content which pathway partners open many times. Their
+representation is kept in the shared cache (for PUBLIC_PROGRAM_RECORD_CACHE_TTL seconds, `0` disables the cache),
+keyed by the site and the ProgramCertRecord UUID, and it is served with ETag and Last-Modified headers, so repeat
+fetches are answered with 304 responses.
+
+The cached representation is tagged with the versions of the data it is built from. The versions are the timestamps
+of the latest changes, kept in the shared cache:
+    - the learner version is bumped (see `invalidate_public_program_records`) whenever a credential, a grade, a credit
+      pathway or a shared record of the learner (or the learner themselves) changes;
+    - the catalog version is bumped whenever a program, a course, a course run, an organization, a pathway, a
+      certificate configuration or a site configuration changes.
+A cached representation with versions other than the current ones is rebuilt. The ETag is derived from the versions
+and Last-Modified is the newest of them.
+
+NOTE: the versions are bumped by model signals, writes which don't send them (e.g. `QuerySet.update()`) must call
+`invalidate_public_program_records` (or `invalidate_public_program_records_catalog`) explicitly. These are:
+    - the bulk credentials revocation (`revoke_user_credentials`, through the `USER_CREDENTIALS_REVOKED` signal);
+    - the grades upsert (`upsert_user_grades`);
+    - the username replacement (`replace_usernames`);
+    - the users synchronization with the LMS (`sync_users`).
+"""
+
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.utils.http import quote_etag
+
+from credentials.apps.core.db_routing import use_primary_database
+from credentials.apps.records.models import ProgramCertRecord
+
+CATALOG_VERSION_CACHE_KEY = "records.public_program_records.catalog_version"
+
+
+class PublicProgramRecord:
+    """
+    Cached representation of a public program record.
+    """
+
+    def __init__(self, site, uuid, username, *, versions, data):
+        self.username = username
+        self.versions = versions
+        self.data = data
+        self.etag = quote_etag(
+            hashlib.md5("|".join(str(value) for value in (site.id, uuid, *versions)).encode("utf8")).hexdigest()
+        )
+        self.last_modified = int(max(versions))
+
+
+def _get_record_cache_key(site, uuid):
+    return f"records.public_program_records.record.{site.id}.{uuid}"
+
+
+def _get_learner_version_cache_key(username):
+    return "records.public_program_records.learner_version.{}".format(hashlib.md5(username.encode("utf8")).hexdigest())
+
+
+def _get_versions(username):
+    keys = [_get_learner_version_cache_key(username), CATALOG_VERSION_CACHE_KEY]
+    versions = cache.get_many(keys)
+    for key in keys:
+        if key not in versions:
+            # unknown (e.g. evicted) versions are considered changed now
+            now = time.time()
+            versions[key] = now if cache.add(key, now, None) else cache.get(key, now)
+    return tuple(versions[key] for key in keys)
+
+
+def get_public_program_record(site, uuid, build):
+    """
+    Returns the (cached) representation of the shared program record.
+
+    Arguments:
+        site (Site): site the record is requested from
+        uuid (str): UUID of the shared ProgramCertRecord
+        build (callable): builds the representation of the given ProgramCertRecord, called on a cache miss
+
+    Returns:
+        PublicProgramRecord: the representation, with its versions
+
+    Raises:
+        ProgramCertRecord.DoesNotExist: if there is no record with the given UUID
+    """
+    ttl = settings.PUBLIC_PROGRAM_RECORD_CACHE_TTL
+    cache_key = _get_record_cache_key(site, uuid)
+    if ttl:
+        cached = cache.get(cache_key)
+        if cached is not None and cached.versions == _get_versions(cached.username):
+            return cached
+
+    # read from the primary database: a representation built from a lagging replica would be cached as current
+    with use_primary_database():
+        program_cert_record = ProgramCertRecord.objects.select_related("user", "program").get(uuid=uuid)
+        # the versions are read before the record is built, a change made meanwhile invalidates the representation
+        versions = _get_versions(program_cert_record.user.username)
+        public_record = PublicProgramRecord(
+            site, uuid, program_cert_record.user.username, versions=versions, data=build(program_cert_record)
+        )
+    if ttl:
+        cache.set(cache_key, public_record, ttl)
+    return public_record
+
+
+def _bump_versions(keys):
+    # bumped once the change is committed, so that the data read under the new version includes it
+    transaction.on_commit(lambda: cache.set_many(dict.fromkeys(keys, time.time()), None))
+
+
+def invalidate_public_program_records(*usernames):
+    """
+    Drops the cached public program records of the given learners. Must be called whenever a credential, a grade or a
+    credit pathway of a learner is changed without model signals being sent (e.g. with `QuerySet.update()`).
+
+    Arguments:
+        usernames (String): The usernames of the learners whose records changed
+    """
+    if usernames:
+        _bump_versions([_get_learner_version_cache_key(username) for username in set(usernames)])
+
+
+def invalidate_public_program_records_catalog():
+    """
+    Drops all the cached public program records. Must be called whenever the catalog (or a certificate or site
+    configuration) is changed without model signals being sent.
+    """
+    _bump_versions([CATALOG_VERSION_CACHE_KEY])
@@ -35,3 +35,19 @@ class CanAccessProgramRecord(permissions.BasePermission):
         if get_username_param(request):
             return request.user and (request.user.is_superuser or request.user.is_staff)
         return True
+
+
+class CanExportPathwayRecords(permissions.BasePermission):
+    """
+    Allows access to the records sent to a credit pathway for staff members, and for the pathway's partner: users with
+    the `records.view_usercreditpathway` permission whose email is the pathway's email.
+    """
+
+    def has_object_permission(self, request, view, obj):
+        if request.user.is_staff:
+            return True
+        return (
+            request.user.has_perm("records.view_usercreditpathway")
+            and bool(obj.email)
+            and request.user.email.lower() == obj.email.lower()
+        )
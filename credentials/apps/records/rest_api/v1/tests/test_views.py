@@ -1,23 +1,38 @@
+import csv
+import io
+import json
+from uuid import uuid4
+
+from django.contrib.auth.models import Permission
 from django.contrib.contenttypes.models import ContentType
-from django.test import TestCase
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase, override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework.test import APIRequestFactory
 
 from credentials.apps.catalog.tests.factories import (
     CourseFactory,
     CourseRunFactory,
     OrganizationFactory,
+    PathwayFactory,
     ProgramFactory,
 )
 from credentials.apps.core.tests.factories import USER_PASSWORD, UserFactory
 from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.credentials.models import UserCredential
 from credentials.apps.credentials.tests.factories import (
     CourseCertificateFactory,
     ProgramCertificateFactory,
     UserCredentialFactory,
 )
-from credentials.apps.records.api import get_program_details
+from credentials.apps.records.api import get_program_details, get_program_record_data
 from credentials.apps.records.rest_api.v1.serializers import ProgramRecordSerializer, ProgramSerializer
-from credentials.apps.records.tests.factories import ProgramCertRecordFactory
+from credentials.apps.records.tests.factories import (
+    ProgramCertRecordFactory,
+    UserCreditPathwayFactory,
+    UserGradeFactory,
+)
 from credentials.apps.records.utils import get_user_program_data
 
 
@@ -205,3 +220,180 @@ class ProgramRecordsViewTests(SiteMixin, TestCase):
         self.assertEqual(response.status_code, 404)
         response = self.client.get("/records/api/v1/program_records/?username=invalid_user")
         self.assertEqual(response.status_code, 404)
+
+
+class PublicProgramRecordTests(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.user = UserFactory()
+        self.course_run = CourseRunFactory(course=CourseFactory(site=self.site))
+        self.program = ProgramFactory(course_runs=[self.course_run], site=self.site)
+        self.course_cert = CourseCertificateFactory(course_id=self.course_run.key, site=self.site)
+        UserCredentialFactory(username=self.user.username, credential=self.course_cert)
+        self.program_cert_record = ProgramCertRecordFactory(program=self.program, user=self.user)
+        self.url = f"/records/api/v1/program_records/{self.program_cert_record.uuid}/?is_public=true"
+
+    def test_conditional_get(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertIn("no-cache", response["Cache-Control"])
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(response.status_code, 304)
+
+        response = self.client.get(self.url, HTTP_IF_MODIFIED_SINCE=response["Last-Modified"])
+        self.assertEqual(response.status_code, 304)
+
+    def test_cached(self):
+        response = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            cached_response = self.client.get(self.url)
+        self.assertEqual(cached_response.data, response.data)
+        self.assertEqual(cached_response["ETag"], response["ETag"])
+
+    @override_settings(PUBLIC_PROGRAM_RECORD_CACHE_TTL=0)
+    def test_cache_disabled(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+        self.assertIsNone(
+            cache.get(f"records.public_program_records.record.{self.site.id}.{self.program_cert_record.uuid}")
+        )
+
+    def test_invalidated_by_grade(self):
+        response = self.client.get(self.url)
+        self.assertEqual(response.data["record"]["grades"][0]["percent_grade"], "")
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserGradeFactory(username=self.user.username, course_run=self.course_run, percent_grade=0.75)
+
+        updated_response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(updated_response.status_code, 200)
+        self.assertNotEqual(updated_response["ETag"], response["ETag"])
+        self.assertEqual(updated_response.data["record"]["grades"][0]["percent_grade"], 0.75)
+
+    def test_invalidated_by_catalog(self):
+        response = self.client.get(self.url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.program.title = "Updated program"
+            self.program.save()
+
+        updated_response = self.client.get(self.url, HTTP_IF_NONE_MATCH=response["ETag"])
+        self.assertEqual(updated_response.status_code, 200)
+        self.assertEqual(updated_response.data["record"]["program"]["name"], "Updated program")
+
+    def test_not_invalidated_by_other_learner(self):
+        etag = self.client.get(self.url)["ETag"]
+
+        with self.captureOnCommitCallbacks(execute=True):
+            UserGradeFactory(course_run=self.course_run)
+
+        response = self.client.get(self.url, HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(response.status_code, 304)
+
+    def test_unknown_record(self):
+        response = self.client.get(f"/records/api/v1/program_records/{uuid4()}/?is_public=true")
+        self.assertEqual(response.status_code, 404)
+
+
+class PathwayRecordsExportViewTests(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.course_runs = [CourseRunFactory(course=course) for course in CourseFactory.create_batch(2, site=self.site)]
+        self.course_runs.append(CourseRunFactory(course=self.course_runs[0].course))
+        self.program = ProgramFactory(course_runs=self.course_runs, site=self.site)
+        self.pathway = PathwayFactory(site=self.site, programs=[self.program])
+        self.course_certs = [
+            CourseCertificateFactory(course_run=course_run, course_id=course_run.key, site=self.site)
+            for course_run in self.course_runs
+        ]
+        self.learners = []
+        for _ in range(3):
+            self.add_learner()
+        # a second attempt and a revoked credential
+        UserGradeFactory(username=self.learners[0].username, course_run=self.course_runs[2], percent_grade=0.95)
+        UserCredentialFactory(username=self.learners[0].username, credential=self.course_certs[2])
+        UserCredentialFactory(
+            username=self.learners[1].username, credential=self.course_certs[1], status=UserCredential.REVOKED
+        )
+        self.staff = UserFactory(is_staff=True)
+        self.client.login(username=self.staff.username, password=USER_PASSWORD)
+        self.url = f"/records/api/v1/pathway_records/{self.pathway.uuid.hex}/"
+
+    def add_learner(self):
+        learner = UserFactory()
+        UserGradeFactory(username=learner.username, course_run=self.course_runs[0], percent_grade=0.8)
+        UserCredentialFactory(username=learner.username, credential=self.course_certs[0])
+        UserCreditPathwayFactory(user=learner, pathway=self.pathway, program=self.program)
+        self.learners.append(learner)
+        return learner
+
+    def get_records(self, url=None):
+        response = self.client.get(url or self.url)
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "application/x-ndjson")
+        return [json.loads(line) for line in b"".join(response.streaming_content).decode("utf-8").splitlines()]
+
+    def test_ndjson(self):
+        records = self.get_records()
+
+        self.assertEqual([record["username"] for record in records], [learner.username for learner in self.learners])
+        for learner, record in zip(self.learners, records):
+            self.assertEqual(record["grades"], get_program_record_data(learner, self.program.uuid, self.site)["grades"])
+            self.assertEqual(record["program"]["uuid"], self.program.uuid.hex)
+
+    def test_csv(self):
+        response = self.client.get(self.url, {"output_format": "csv"})
+
+        self.assertEqual(response.status_code, 200)
+        rows = list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode("utf-8"))))
+        self.assertEqual(len(rows), len(self.learners) * 2)
+        self.assertEqual(
+            [(row["name"], row["course_id"]) for row in rows if row["username"] == self.learners[0].username],
+            [(self.course_runs[1].course.title, ""), (self.course_runs[2].course.title, self.course_runs[2].key)],
+        )
+
+    def test_since(self):
+        records = self.get_records()
+        since = max(record["modified"] for record in records)
+        learner = self.add_learner()
+
+        updated_records = self.get_records(f"{self.url}?since={since.replace('+', '%2B')}")
+
+        self.assertEqual(
+            [record["username"] for record in updated_records],
+            [record["username"] for record in records if record["modified"] == since] + [learner.username],
+        )
+
+    def test_set_based_queries(self):
+        self.client.get(self.url)  # the session and the site are loaded
+        with CaptureQueriesContext(connection) as queries:
+            b"".join(self.client.get(self.url).streaming_content)
+
+        for _ in range(3):
+            self.add_learner()
+        with self.assertNumQueries(len(queries.captured_queries)):
+            b"".join(self.client.get(self.url).streaming_content)
+
+    def test_invalid_parameters(self):
+        self.assertEqual(self.client.get(self.url, {"output_format": "xml"}).status_code, 400)
+        self.assertEqual(self.client.get(self.url, {"since": "yesterday"}).status_code, 400)
+
+    def test_partner_access(self):
+        partner = UserFactory(email=self.pathway.email.upper())
+        self.client.login(username=partner.username, password=USER_PASSWORD)
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+        partner.user_permissions.add(Permission.objects.get(codename="view_usercreditpathway"))
+        self.assertEqual(self.client.get(self.url).status_code, 200)
+
+        partner.email = "other@example.com"
+        partner.save()
+        self.assertEqual(self.client.get(self.url).status_code, 403)
+
+    def test_unauthenticated(self):
+        self.client.logout()
+        self.assertEqual(self.client.get(self.url).status_code, 401)
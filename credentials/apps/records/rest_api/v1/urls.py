@@ -1,10 +1,18 @@
+from django.urls import re_path
 from rest_framework import routers
 
+from credentials.apps.credentials.constants import UUID_PATTERN
 from credentials.apps.records.rest_api.v1 import views
 
 router = routers.DefaultRouter()
 router.register(r"program_records", views.ProgramRecordsViewSet, basename="records")
 
-urlpatterns = []
+urlpatterns = [
+    re_path(
+        rf"^pathway_records/{UUID_PATTERN}/$",
+        views.PathwayRecordsExportView.as_view(),
+        name="pathway_records_export",
+    ),
+]
 
 urlpatterns += router.urls
@@ -1,22 +1,38 @@
+import datetime
 import logging
 
 from django.contrib.auth import get_user_model
+from django.http import StreamingHttpResponse
+from django.shortcuts import get_object_or_404
+from django.utils import timezone
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_datetime
+from django.utils.http import http_date
 from edx_rest_framework_extensions.auth.jwt.authentication import JwtAuthentication
-from rest_framework import mixins, status, viewsets
+from rest_framework import mixins, permissions, status, viewsets
 from rest_framework.authentication import SessionAuthentication
+from rest_framework.exceptions import ValidationError
 from rest_framework.response import Response
+from rest_framework.views import APIView
 
+from credentials.apps.catalog.models import Pathway
 from credentials.apps.core.api import get_user_by_username
-from credentials.apps.records.api import get_program_details
+from credentials.apps.core.db_routing import read_replica
+from credentials.apps.core.query_budget import query_budget
+from credentials.apps.records.api import get_program_details, get_public_program_details
+from credentials.apps.records.exports import iter_ndjson, iter_pathway_records, iter_pathway_records_csv
 from credentials.apps.records.models import ProgramCertRecord
-from credentials.apps.records.rest_api.v1.permissions import CanAccessProgramRecord, IsPublic
+from credentials.apps.records.rest_api.v1.permissions import CanAccessProgramRecord, CanExportPathwayRecords, IsPublic
 from credentials.apps.records.rest_api.v1.serializers import ProgramRecordSerializer, ProgramSerializer
 from credentials.apps.records.utils import get_user_program_data
+from credentials.shared.constants import PathwayType
 
 User = get_user_model()
 log = logging.getLogger(__name__)
 
 
+@read_replica()
+@query_budget(40)
 class ProgramRecordsViewSet(mixins.RetrieveModelMixin, mixins.ListModelMixin, viewsets.GenericViewSet):
     authentication_classes = (
         JwtAuthentication,
@@ -85,6 +101,9 @@ class ProgramRecordsViewSet(mixins.RetrieveModelMixin, mixins.ListModelMixin, vi
             else:
                 return Response(status=status.HTTP_404_NOT_FOUND)
 
+        if is_public:
+            return self._retrieve_public(request, kwargs["pk"])
+
         try:
             program = get_program_details(
                 request_user=user,
@@ -97,3 +116,70 @@ class ProgramRecordsViewSet(mixins.RetrieveModelMixin, mixins.ListModelMixin, vi
         else:
             serializer = ProgramRecordSerializer(program)
             return Response(serializer.data)
+
+    def _retrieve_public(self, request, uuid):
+        """
+        Responds with the cached shared record, or with a 304 if the client has the current one.
+        """
+        try:
+            public_record = get_public_program_details(request.site, uuid)
+        except ProgramCertRecord.DoesNotExist:
+            return Response(status=status.HTTP_404_NOT_FOUND)
+
+        response = get_conditional_response(
+            request, etag=public_record.etag, last_modified=public_record.last_modified
+        ) or Response(ProgramRecordSerializer(public_record.data).data)
+        response.headers["ETag"] = public_record.etag
+        response.headers["Last-Modified"] = http_date(public_record.last_modified)
+        # the record may change at any time, clients have to revalidate it
+        patch_cache_control(response, no_cache=True)
+        return response
+
+
+@read_replica()
+class PathwayRecordsExportView(APIView):
+    """
+    Streams the program records of every learner who sent their record to a credit pathway, for the pathway's partner.
+
+    GET: /records/api/v1/pathway_records/:pathway_uuid/?output_format=ndjson|csv&since=<ISO 8601 datetime>
+
+    Query parameters:
+        output_format: "ndjson" (the default, a record per line) or "csv" (a row per learner and course)
+        since: if set, only the records modified since then are exported (the records have their "modified" time, the
+            latest one can be used as `since` of the next export)
+    """
+
+    authentication_classes = (
+        JwtAuthentication,
+        SessionAuthentication,
+    )
+    permission_classes = (
+        permissions.IsAuthenticated,
+        CanExportPathwayRecords,
+    )
+    output_formats = {
+        "ndjson": ("application/x-ndjson", iter_ndjson),
+        "csv": ("text/csv", iter_pathway_records_csv),
+    }
+
+    def get(self, request, uuid):
+        pathway = get_object_or_404(Pathway, uuid=uuid, site=request.site, pathway_type=PathwayType.CREDIT.value)
+        self.check_object_permissions(request, pathway)
+
+        output_format = request.query_params.get("output_format", "ndjson")
+        if output_format not in self.output_formats:
+            raise ValidationError({"output_format": [f"Expected one of: {', '.join(self.output_formats)}."]})
+        since = request.query_params.get("since")
+        if since:
+            try:
+                since = parse_datetime(since)
+            except ValueError:
+                since = None
+            if since is None:
+                raise ValidationError({"since": ["Expected an ISO 8601 datetime."]})
+            if timezone.is_naive(since):
+                since = timezone.make_aware(since, datetime.timezone.utc)
+
+        content_type, iter_output = self.output_formats[output_format]
+        log.info(f"Exporting the records of pathway [{pathway.uuid}] (since [{since}]) for user [{request.user.id}]")
+        return StreamingHttpResponse(iter_output(iter_pathway_records(pathway, since=since)), content_type=content_type)
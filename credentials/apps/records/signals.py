@@ -0,0 +1,87 @@
+"""
+Records signal handlers.
+"""
+
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from credentials.apps.catalog.models import Course, CourseRun, Organization, Pathway, Program
+from credentials.apps.core.models import SiteConfiguration, User
+from credentials.apps.credentials.models import (
+    CourseCertificate,
+    ProgramCertificate,
+    UserCredential,
+    UserCredentialAttribute,
+    UserCredentialDateOverride,
+)
+from credentials.apps.credentials.revocation import USER_CREDENTIALS_REVOKED
+
+from .models import ProgramCertRecord, UserCreditPathway, UserGrade
+from .public_records import invalidate_public_program_records, invalidate_public_program_records_catalog
+
+
+@receiver(post_save, sender=User)
+@receiver(post_save, sender=UserCredential)
+@receiver(post_delete, sender=UserCredential)
+@receiver(post_save, sender=UserGrade)
+@receiver(post_delete, sender=UserGrade)
+def invalidate_learner_public_records(instance, **kwargs):
+    """
+    Drop the cached public records of a learner whose credential or grade changed.
+    """
+    invalidate_public_program_records(instance.username)
+
+
+@receiver(post_save, sender=UserCredentialAttribute)
+@receiver(post_delete, sender=UserCredentialAttribute)
+@receiver(post_save, sender=UserCredentialDateOverride)
+@receiver(post_delete, sender=UserCredentialDateOverride)
+def invalidate_credential_public_records(instance, **kwargs):
+    """
+    Drop the cached public records of a learner whose credential dates changed.
+    """
+    invalidate_public_program_records(instance.user_credential.username)
+
+
+@receiver(post_save, sender=ProgramCertRecord)
+@receiver(post_delete, sender=ProgramCertRecord)
+@receiver(post_save, sender=UserCreditPathway)
+@receiver(post_delete, sender=UserCreditPathway)
+def invalidate_user_public_records(instance, **kwargs):
+    """
+    Drop the cached public records of a learner whose shared record or credit pathway changed.
+    """
+    invalidate_public_program_records(instance.user.username)
+
+
+@receiver(USER_CREDENTIALS_REVOKED)
+def invalidate_revoked_public_records(user_credential_ids, **kwargs):
+    """
+    Drop the cached public records of learners whose credentials were bulk revoked (they are updated without being
+    saved).
+    """
+    invalidate_public_program_records(
+        *UserCredential.objects.filter(id__in=user_credential_ids).values_list("username", flat=True).distinct()
+    )
+
+
+@receiver(post_save, sender=Organization)
+@receiver(post_delete, sender=Organization)
+@receiver(post_save, sender=Course)
+@receiver(post_delete, sender=Course)
+@receiver(post_save, sender=CourseRun)
+@receiver(post_delete, sender=CourseRun)
+@receiver(post_save, sender=Program)
+@receiver(post_delete, sender=Program)
+@receiver(post_save, sender=Pathway)
+@receiver(post_delete, sender=Pathway)
+@receiver(post_save, sender=CourseCertificate)
+@receiver(post_delete, sender=CourseCertificate)
+@receiver(post_save, sender=ProgramCertificate)
+@receiver(post_delete, sender=ProgramCertificate)
+@receiver(post_save, sender=SiteConfiguration)
+def invalidate_catalog_public_records(**kwargs):
+    """
+    Drop all the cached public records when the catalog or a certificate or site configuration changed.
+    """
+    invalidate_public_program_records_catalog()
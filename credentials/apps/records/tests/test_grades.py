@@ -0,0 +1,119 @@
+"""Tests for the bulk grade ingestion"""
+
+import datetime
+from decimal import Decimal
+from unittest import mock
+
+from django.test import TestCase
+from django.utils import timezone
+
+from credentials.apps.catalog.tests.factories import CourseFactory, CourseRunFactory
+from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.records.grades import GradeUpsertStatus, upsert_user_grades
+from credentials.apps.records.models import UserGrade
+from credentials.apps.records.tests.factories import UserGradeFactory
+
+
+class UpsertUserGradesTests(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.course_runs = CourseRunFactory.create_batch(2, course=CourseFactory(site=self.site))
+        self.now = timezone.now()
+
+    def build_grade(self, username="learner", course_run=None, percent_grade="0.9", lms_last_updated_at=None):
+        return {
+            "username": username,
+            "course_run": (course_run or self.course_runs[0]).key,
+            "letter_grade": "A",
+            "percent_grade": Decimal(percent_grade),
+            "verified": True,
+            "lms_last_updated_at": lms_last_updated_at,
+        }
+
+    def test_upsert(self):
+        stored = UserGradeFactory(username="learner", course_run=self.course_runs[0], percent_grade=Decimal("0.5"))
+        grades = [
+            self.build_grade(),
+            self.build_grade(course_run=self.course_runs[1]),
+            self.build_grade(username="another-learner"),
+        ]
+
+        results = upsert_user_grades(self.site, grades)
+
+        self.assertEqual(
+            results,
+            [(GradeUpsertStatus.UPDATED, None), (GradeUpsertStatus.CREATED, None), (GradeUpsertStatus.CREATED, None)],
+        )
+        stored.refresh_from_db()
+        self.assertEqual(stored.percent_grade, Decimal("0.9"))
+        self.assertEqual(UserGrade.objects.count(), 3)
+
+    def test_skips_stale_grades(self):
+        stored = UserGradeFactory(
+            username="learner",
+            course_run=self.course_runs[0],
+            percent_grade=Decimal("0.5"),
+            lms_last_updated_at=self.now,
+        )
+
+        for lms_last_updated_at in (self.now, self.now - datetime.timedelta(minutes=1)):
+            results = upsert_user_grades(self.site, [self.build_grade(lms_last_updated_at=lms_last_updated_at)])
+            self.assertEqual(results, [(GradeUpsertStatus.SKIPPED, None)])
+
+        results = upsert_user_grades(
+            self.site, [self.build_grade(lms_last_updated_at=self.now + datetime.timedelta(minutes=1))]
+        )
+        self.assertEqual(results, [(GradeUpsertStatus.UPDATED, None)])
+        stored.refresh_from_db()
+        self.assertEqual(stored.percent_grade, Decimal("0.9"))
+
+    def test_keeps_newest_duplicate(self):
+        grades = [
+            self.build_grade(percent_grade="0.7", lms_last_updated_at=self.now),
+            self.build_grade(percent_grade="0.6", lms_last_updated_at=self.now - datetime.timedelta(minutes=1)),
+            self.build_grade(percent_grade="0.8", lms_last_updated_at=self.now),
+        ]
+
+        results = upsert_user_grades(self.site, grades)
+
+        self.assertEqual([grade_status for grade_status, _ in results], ["skipped", "skipped", "created"])
+        self.assertEqual(UserGrade.objects.get().percent_grade, Decimal("0.8"))
+
+    def test_unknown_course_run(self):
+        other_site_course_run = CourseRunFactory()
+
+        results = upsert_user_grades(self.site, [self.build_grade(course_run=other_site_course_run)])
+
+        self.assertEqual(
+            results, [(GradeUpsertStatus.FAILED, f"No CourseRun exists for key [{other_site_course_run.key}]")]
+        )
+        self.assertFalse(UserGrade.objects.exists())
+
+    def test_skips_unchanged_grades(self):
+        stored = UserGradeFactory(
+            username="learner",
+            course_run=self.course_runs[0],
+            letter_grade="A",
+            percent_grade=Decimal("0.9"),
+            verified=True,
+            lms_last_updated_at=None,
+        )
+        grades = [self.build_grade(), self.build_grade(course_run=self.course_runs[1])]
+
+        with mock.patch("credentials.apps.records.grades.accumulate") as mock_accumulate:
+            results = upsert_user_grades(self.site, grades)
+
+        self.assertEqual(results, [(GradeUpsertStatus.SKIPPED, None), (GradeUpsertStatus.CREATED, None)])
+        mock_accumulate.assert_called_once_with("usergrade_skipped_writes", 1)
+        self.assertEqual(UserGrade.objects.get(pk=stored.pk).modified, stored.modified)
+
+    def test_queries(self):
+        grades = [self.build_grade(username=f"learner-{i}", course_run=self.course_runs[i % 2]) for i in range(10)]
+
+        # course runs, stored grades, locked stored grades, upsert (and the transaction savepoint):
+        with self.assertNumQueries(6):
+            upsert_user_grades(self.site, grades)
+
+        # unchanged grades are only read:
+        with self.assertNumQueries(2):
+            upsert_user_grades(self.site, grades)
@@ -81,6 +81,18 @@ class UpdatedProgramEmailTests(SiteMixin, TestCase):
         self.assertIn(expected_record_link, email.body)
         self.assertIn(expected_csv_link, email.body)
 
+    def test_send_updated_email_with_base_url(self):
+        """
+        Test that record links are built from the base URL when there is no request
+        """
+        UserCreditPathwayFactory(user=self.user, pathway=self.pathway, status=UserCreditPathwayStatus.SENT)
+
+        send_updated_emails_for_program(None, self.USERNAME, self.pc, base_url="https://example.com/")
+
+        self.assertEqual(1, len(mail.outbox))
+        record_path = reverse("records:public_programs", kwargs={"uuid": self.pcr.uuid.hex})
+        self.assertIn(urllib.parse.urljoin("https://example.com/", record_path), mail.outbox[0].body)
+
     def test_skip_if_user_has_no_program_certificate(self):
         """Verify that if the user has no program certificate, we do nothing."""
         # Mock sending an email to the partner
@@ -13,8 +13,9 @@ import ddt
 from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.core import mail
+from django.db import connection
 from django.test import TestCase
-from django.test.utils import override_settings
+from django.test.utils import CaptureQueriesContext, override_settings
 from django.urls import reverse
 
 from credentials.apps.catalog.data import PathwayStatus
@@ -154,17 +155,17 @@ class ProgramSendTests(SiteMixin, TestCase):
         response = self.post()
         self.assertEqual(response.status_code, 403)
 
-    @patch("credentials.apps.records.views.ace")
-    def test_from_address_set(self, mock_ace):
+    @patch("credentials.apps.records.views.send_message")
+    def test_from_address_set(self, mock_send_message):
         """Verify that the email uses the proper from address"""
         response = self.post()
         self.assertEqual(response.status_code, 200)
         self.assertEqual(
-            mock_ace.send.call_args[0][0].options["from_address"], self.site_configuration.partner_from_address
+            mock_send_message.call_args[0][0].options["from_address"], self.site_configuration.partner_from_address
         )
 
-    @patch("credentials.apps.records.views.ace")
-    def test_no_full_name(self, mock_ace):
+    @patch("credentials.apps.records.views.send_message")
+    def test_no_full_name(self, mock_send_message):
         """Verify that the email uses the username as a backup for the full name."""
         self.user.full_name = ""
         self.user.first_name = ""
@@ -173,17 +174,17 @@ class ProgramSendTests(SiteMixin, TestCase):
 
         response = self.post()
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(mock_ace.send.call_args[0][0].context["user_full_name"], self.user.username)
+        self.assertEqual(mock_send_message.call_args[0][0].context["user_full_name"], self.user.username)
 
-    @patch("credentials.apps.records.views.ace")
-    def test_from_address_unset(self, mock_ace):
+    @patch("credentials.apps.records.views.send_message")
+    def test_from_address_unset(self, mock_send_message):
         """Verify that the email uses the proper default from address"""
         self.site_configuration.partner_from_address = None
         self.site_configuration.save()
 
         response = self.post()
         self.assertEqual(response.status_code, 200)
-        self.assertEqual(mock_ace.send.call_args[0][0].options["from_address"], "no-reply@" + self.site.domain)
+        self.assertEqual(mock_send_message.call_args[0][0].options["from_address"], "no-reply@" + self.site.domain)
 
     def test_email_content_complete(self):
         """Verify an email is actually sent"""
@@ -347,7 +348,7 @@ class ProgramRecordCsvViewTests(SiteMixin, TestCase):
         self.program = ProgramFactory(course_runs=self.course_runs, authoring_organizations=self.orgs, site=self.site)
         self.program_cert_record = ProgramCertRecordFactory.create(user=self.user, program=self.program)
 
-    @patch("credentials.apps.records.views.SegmentClient", autospec=True)
+    @patch("credentials.apps.records.views.get_segment_client")
     def test_404s_with_no_program_cert_record(self, segment_client):  # pylint: disable=unused-argument
         """Verify that the view 404s if a program cert record isn't found"""
         self.program_cert_record.delete()
@@ -357,9 +358,8 @@ class ProgramRecordCsvViewTests(SiteMixin, TestCase):
         self.assertEqual(404, response.status_code)
 
     @ddt.data(True, False)
-    @patch("credentials.apps.records.views.SegmentClient", autospec=True)
-    @patch("credentials.apps.records.views.SegmentClient.track", autospec=True)
-    def tests_creates_csv(self, segment_should_be_used, segment_client, track):  # pylint: disable=unused-argument
+    @patch("credentials.apps.records.views.get_segment_client")
+    def tests_creates_csv(self, segment_should_be_used, get_segment_client):
         """
         Verify that the csv parses and contains all of the necessary titles/headers.
         """
@@ -371,8 +371,8 @@ class ProgramRecordCsvViewTests(SiteMixin, TestCase):
         )
         self.assertEqual(bool(self.site_configuration.segment_key), segment_should_be_used)
         self.assertEqual(200, response.status_code)
-        self.assertEqual(track.called, segment_should_be_used)
-        content = response.content.decode("utf-8")
+        self.assertEqual(get_segment_client.return_value.track.called, segment_should_be_used)
+        content = b"".join(response.streaming_content).decode("utf-8")
         csv_reader = csv.reader(io.StringIO(content))
         body = list(csv_reader)
         metadata_titles = [
@@ -394,7 +394,7 @@ class ProgramRecordCsvViewTests(SiteMixin, TestCase):
         for header in headers:
             self.assertIn(header, csv_headers)
 
-    @patch("credentials.apps.records.views.SegmentClient", autospec=True)
+    @patch("credentials.apps.records.views.get_segment_client")
     def test_filename(self, segment_client):  # pylint: disable=unused-argument
         """
         Verify that the filename in response Content-Disposition is utf-8 encoded
@@ -421,6 +421,88 @@ class ProgramRecordCsvViewTests(SiteMixin, TestCase):
 
         self.assertEqual(200, response.status_code)
 
+    @patch("credentials.apps.records.views.get_segment_client")
+    def test_program_without_grade_rows(self, segment_client):  # pylint: disable=unused-argument
+        """
+        Verify that the csv of a program without courses only has the metadata and the grades header
+        """
+        self.program.course_runs.clear()
+
+        response = self.client.get(
+            reverse("records:program_record_csv", kwargs={"uuid": self.program_cert_record.uuid.hex})
+        )
+
+        self.assertEqual(200, response.status_code)
+        body = list(csv.reader(io.StringIO(b"".join(response.streaming_content).decode("utf-8"))))
+        self.assertEqual(len(body), 9)
+        self.assertEqual(
+            body[-1], ["name", "school", "attempts", "course_id", "issue_date", "percent_grade", "letter_grade"]
+        )
+
+    @patch("credentials.apps.records.views.get_segment_client")
+    def test_download_finished_on_close(self, get_segment_client):
+        """
+        Verify that the download finished event is tracked once the stream is closed
+        """
+        self.site_configuration.segment_key = "xyzzy"
+        self.site_configuration.save()
+        track = get_segment_client.return_value.track
+
+        response = self.client.get(
+            reverse("records:program_record_csv", kwargs={"uuid": self.program_cert_record.uuid.hex})
+        )
+        self.assertEqual(track.call_args[1]["event"], "edx.bi.credentials.program_record.download_started")
+
+        b"".join(response.streaming_content)
+        response.close()
+        self.assertEqual(track.call_args[1]["event"], "edx.bi.credentials.program_record.download_finished")
+
+
+class ProgramRecordsBulkCsvViewTests(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.staff = UserFactory(is_staff=True)
+        self.client.login(username=self.staff.username, password=USER_PASSWORD)
+        self.course_run = CourseRunFactory(course=CourseFactory(site=self.site))
+        self.program = ProgramFactory(course_runs=[self.course_run], site=self.site)
+        self.learners = UserFactory.create_batch(2)
+        for learner in self.learners:
+            ProgramCertRecordFactory(user=learner, program=self.program)
+        UserGradeFactory(username=self.learners[0].username, course_run=self.course_run, percent_grade=0.9)
+
+    def get_rows(self, url_name, uuid):
+        response = self.client.get(reverse(f"records:{url_name}", kwargs={"uuid": uuid.hex}))
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response["Content-Type"], "text/csv")
+        return list(csv.DictReader(io.StringIO(b"".join(response.streaming_content).decode("utf-8"))))
+
+    def test_program_records(self):
+        rows = self.get_rows("program_records_csv", self.program.uuid)
+
+        self.assertEqual([row["username"] for row in rows], [learner.username for learner in self.learners])
+        self.assertEqual({row["program_uuid"] for row in rows}, {self.program.uuid.hex})
+        self.assertEqual([row["name"] for row in rows], [self.course_run.course.title] * 2)
+
+    def test_program_records_set_based_queries(self):
+        url = reverse("records:program_records_csv", kwargs={"uuid": self.program.uuid.hex})
+        self.client.get(url)  # the session and the site are loaded
+        with CaptureQueriesContext(connection) as queries:
+            b"".join(self.client.get(url).streaming_content)
+
+        for learner in UserFactory.create_batch(3):
+            ProgramCertRecordFactory(user=learner, program=self.program)
+            UserGradeFactory(username=learner.username, course_run=self.course_run)
+        with self.assertNumQueries(len(queries.captured_queries)):
+            b"".join(self.client.get(url).streaming_content)
+
+    def test_staff_only(self):
+        self.client.logout()
+        self.client.login(username=self.learners[0].username, password=USER_PASSWORD)
+
+        response = self.client.get(reverse("records:program_records_csv", kwargs={"uuid": self.program.uuid.hex}))
+
+        self.assertEqual(response.status_code, 403)
+
 
 class LearnerRecordRedirectionTests(SiteMixin, TestCase):
     """
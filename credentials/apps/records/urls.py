@@ -19,6 +19,11 @@ urlpatterns = [
         name="public_programs",
     ),
     re_path(rf"^programs/shared/{UUID_PATTERN}/csv$", views.ProgramRecordCsvView.as_view(), name="program_record_csv"),
+    re_path(
+        rf"^programs/{UUID_PATTERN}/records/csv$",
+        views.ProgramRecordsBulkCsvView.as_view(),
+        name="program_records_csv",
+    ),
     re_path(rf"^programs/{UUID_PATTERN}/send$", views.ProgramSendView.as_view(), name="send_program"),
     re_path(rf"^programs/{UUID_PATTERN}/share$", views.ProgramRecordCreationView.as_view(), name="share_program"),
 ]
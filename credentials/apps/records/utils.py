@@ -5,12 +5,13 @@ from typing import TYPE_CHECKING, Any, Dict, List, Tuple
 from django.contrib.contenttypes.models import ContentType
 from django.template.defaultfilters import slugify
 from django.urls import reverse
-from edx_ace import Recipient, ace
+from edx_ace import Recipient
 
 from credentials.apps.catalog.api import get_filtered_programs
 from credentials.apps.catalog.data import ProgramStatus
 from credentials.apps.catalog.models import Program
 from credentials.apps.core.api import get_user_by_username
+from credentials.apps.core.messaging import send_message
 from credentials.apps.credentials.api import (
     get_course_certificates_with_ids,
     get_program_certificates_with_ids,
@@ -29,7 +30,7 @@ if TYPE_CHECKING:
 logger = logging.getLogger(__name__)
 
 
-def send_updated_emails_for_program(request, username, program_certificate):
+def send_updated_emails_for_program(request, username, program_certificate, base_url=None):
     """
     If the user has previously sent an email to a pathway org, we want to send an updated one when they finish the
     program.  This function is called from the credentials Program Certificate awarding API
@@ -40,6 +41,8 @@ def send_updated_emails_for_program(request, username, program_certificate):
         username (string): The username of the user we will send on behalf of
         program_certificate (AbstractCredential[ProgramCertificate]): A ProgramCertificate configuration for a program,
          used to pull program details used in the updated Pathway program email
+        base_url (string): Optional. The absolute base URL used to build program record links when there is no request
+         object (e.g. when the email is sent in background)
     """
     site = program_certificate.site
     user = get_user_by_username(username)
@@ -63,7 +66,10 @@ def send_updated_emails_for_program(request, username, program_certificate):
     for user_pathway in user_pathways:
         pathway = user_pathway.pathway
         record_path = reverse("records:public_programs", kwargs={"uuid": pcr.uuid.hex})
-        record_link = request.build_absolute_uri(record_path)
+        if base_url:
+            record_link = urllib.parse.urljoin(base_url, record_path)
+        else:
+            record_link = request.build_absolute_uri(record_path)
         csv_link = urllib.parse.urljoin(record_link, "csv")
 
         msg = ProgramCreditRequest(site, user.email).personalize(
@@ -79,7 +85,7 @@ def send_updated_emails_for_program(request, username, program_certificate):
                 "csv_link": csv_link,
             },
         )
-        ace.send(msg)
+        send_message(msg)
 
 
 def get_credentials(request_username: str) -> Tuple[List["UserCredential"], List["UserCredential"]]:
@@ -1,5 +1,3 @@
-import csv
-import io
 import json
 import logging
 import urllib.parse
@@ -9,24 +7,28 @@ from uuid import uuid4
 from django import http
 from django.conf import settings
 from django.contrib.auth import get_user_model
-from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin
-from django.http import Http404, HttpRequest, HttpResponse, HttpResponseRedirect, JsonResponse
+from django.contrib.auth.mixins import AccessMixin, LoginRequiredMixin, UserPassesTestMixin
+from django.http import Http404, HttpRequest, HttpResponseRedirect, JsonResponse, StreamingHttpResponse
 from django.shortcuts import get_object_or_404
 from django.urls import reverse
 from django.utils.decorators import method_decorator
 from django.utils.translation import gettext as _
 from django.views.generic import TemplateView, View
 from django_ratelimit.decorators import ratelimit
-from edx_ace import Recipient, ace
-from segment.analytics.client import Client as SegmentClient
+from edx_ace import Recipient
 
 from credentials.apps.catalog.data import PathwayStatus
 from credentials.apps.catalog.models import Pathway, Program
+from credentials.apps.core.analytics import get_segment_client
 from credentials.apps.core.api import get_user_by_username
+from credentials.apps.core.db_routing import read_replica
+from credentials.apps.core.messaging import send_message
+from credentials.apps.core.query_budget import query_budget
 from credentials.apps.core.views import ThemeViewMixin
 from credentials.apps.credentials.models import ProgramCertificate, UserCredential
 from credentials.apps.records.api import get_program_record_data
 from credentials.apps.records.constants import UserCreditPathwayStatus
+from credentials.apps.records.exports import iter_program_record_csv, iter_program_records, iter_program_records_csv
 from credentials.apps.records.messages import ProgramCreditRequest
 from credentials.apps.records.models import ProgramCertRecord, UserCreditPathway
 from credentials.shared.constants import PathwayType
@@ -91,6 +93,7 @@ class RecordsListBaseView(LoginRequiredMixin, RecordsEnabledMixin, TemplateView,
         return context
 
 
+@read_replica()
 class RecordsView(RecordsListBaseView):
     """
     The RecordsView view continues to be required after converting our legacy frontend to the Learner Record MFE. This
@@ -103,6 +106,8 @@ class RecordsView(RecordsListBaseView):
         return HttpResponseRedirect(settings.LEARNER_RECORD_MFE_RECORDS_PAGE_URL)
 
 
+@read_replica()
+@query_budget(45)
 class ProgramRecordView(ConditionallyRequireLoginMixin, RecordsEnabledMixin, TemplateView, ThemeViewMixin):
     """
     The ProgramRecordView view continues to be required after converting our legacy frontend to the Learner Record MFE.
@@ -180,7 +185,7 @@ class ProgramSendView(LoginRequiredMixin, RecordsEnabledMixin, View):
             f"[Share Program Record] Internal Credentials User [{user.id}] is sharing their progress in program "
             f"[{program_uuid}] with pathway [{pathway_id}]"
         )
-        ace.send(msg)
+        send_message(msg)
 
         # Create a record of this email
         if UserCreditPathway.objects.filter(user=user, pathway=pathway, program=program).exists():
@@ -250,6 +255,8 @@ class ProgramRecordCreationView(LoginRequiredMixin, RecordsEnabledMixin, View):
         return JsonResponse({"url": url}, status=status_code)
 
 
+@read_replica()
+@query_budget(45)
 class ProgramRecordCsvView(RecordsEnabledMixin, View):
     """
     Returns a csv view of the Program Record for a Learner from a username and program_uuid.
@@ -260,7 +267,7 @@ class ProgramRecordCsvView(RecordsEnabledMixin, View):
     that force users to solve a captcha.
     """
 
-    class SegmentHttpResponse(HttpResponse):
+    class SegmentStreamingHttpResponse(StreamingHttpResponse):
         def __init__(self, *args, **kwargs):
             # Pop off the unneeded args that are sent to segment
             self.event = kwargs.pop("event")
@@ -268,14 +275,15 @@ class ProgramRecordCsvView(RecordsEnabledMixin, View):
             self.context = kwargs.pop("context")
             self.anonymous_id = kwargs.pop("anonymous_id")
             self.segment_client = kwargs.pop("segment_client")
-            super(ProgramRecordCsvView.SegmentHttpResponse, self).__init__(*args, **kwargs)
+            super().__init__(*args, **kwargs)
 
         def close(self):
+            # called by the server once the whole stream has been sent
             if self.segment_client:
                 self.segment_client.track(
                     self.anonymous_id, event=self.event, properties=self.properties, context=self.context
                 )
-            super(ProgramRecordCsvView.SegmentHttpResponse, self).close()
+            super().close()
 
     def get(self, request: HttpRequest, *args, **kwargs):
         site_configuration = request.site.siteconfiguration  # type: SiteConfiguration
@@ -310,17 +318,6 @@ class ProgramRecordCsvView(RecordsEnabledMixin, View):
             log.info("get_program_record failed to find all program record data: %s", record)
             raise Http404
 
-        user_metadata = [
-            ["Program Name", program.get("name", None)],
-            ["Program Type", program.get("type_name", None)],
-            ["Platform Provider", platform_name],
-            ["Authoring Organization(s)", program.get("school", None)],
-            ["Learner Name", learner.get("full_name", None)],
-            ["Username", learner.get("username", None)],
-            ["Email", learner.get("email", None)],
-            [""],
-        ]
-
         properties = {
             "category": "records",
             "program_uuid": program_cert_record.program.uuid.hex,
@@ -341,7 +338,7 @@ class ProgramRecordCsvView(RecordsEnabledMixin, View):
         # 2. If you fail on the segment client call, log the error but continue.
         anonymous_id = request.COOKIES.get("ajs_anonymous_id", str(uuid4()))
         if segment_key := site_configuration.segment_key:
-            segment_client = SegmentClient(write_key=segment_key)
+            segment_client = get_segment_client(segment_key)
             try:
                 segment_client.track(
                     None,  # anonymous_id,
@@ -352,18 +349,11 @@ class ProgramRecordCsvView(RecordsEnabledMixin, View):
             except AssertionError:
                 log.exception("get_program_record failed calling segment")
 
-        string_io = io.StringIO()
-        writer = csv.writer(string_io, quoting=csv.QUOTE_ALL)
-        writer.writerows(user_metadata)
-        writer = csv.DictWriter(string_io, record["grades"][0].keys(), quoting=csv.QUOTE_ALL)
-        writer.writeheader()
-        writer.writerows(record["grades"])
-        string_io.seek(0)
         filename = "{username}_{program_name}_grades".format(
             username=record["learner"]["username"], program_name=record["program"]["name"]
         )
-        response = ProgramRecordCsvView.SegmentHttpResponse(
-            string_io,
+        response = ProgramRecordCsvView.SegmentStreamingHttpResponse(
+            iter_program_record_csv(record),
             anonymous_id=anonymous_id,
             content_type="text/csv",
             context=context,
@@ -374,3 +364,28 @@ class ProgramRecordCsvView(RecordsEnabledMixin, View):
         filename = filename.replace(" ", "_").lower()
         response["Content-Disposition"] = 'attachment; filename="{filename}.csv"'.format(filename=filename)
         return response
+
+
+@read_replica()
+class ProgramRecordsBulkCsvView(LoginRequiredMixin, UserPassesTestMixin, RecordsEnabledMixin, View):
+    """
+    Returns a single csv of the Program Records of every learner in a Program (the learners who shared their record),
+    to be handed over to a partner institution. Only available to staff. The records of a credit Pathway are exported
+    by `PathwayRecordsExportView`.
+
+    The records are assembled a chunk of learners at a time (see `iter_program_records`) and written as the csv is
+    streamed.
+    """
+
+    def test_func(self):
+        return self.request.user.is_staff
+
+    def get(self, request: HttpRequest, *args, **kwargs):
+        program = get_object_or_404(Program, uuid=kwargs["uuid"], site=request.site)
+
+        response = StreamingHttpResponse(
+            iter_program_records_csv(iter_program_records(program)), content_type="text/csv"
+        )
+        filename = f"{program.title}_records".replace(" ", "_").lower()
+        response["Content-Disposition"] = f'attachment; filename="{filename}.csv"'
+        return response
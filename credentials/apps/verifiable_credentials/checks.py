@@ -4,6 +4,7 @@ Verifiable Credentials self-checks.
 
 from django.core.checks import Error, Tags, register
 
+from .composition.contexts import get_remote_contexts
 from .settings import vc_settings
 from .toggles import ENABLE_VERIFIABLE_CREDENTIALS
 
@@ -18,6 +19,7 @@ def vc_settings_checks(*args, **kwargs):
         - No default storages defined
         - DEFAULT_ISSUER[ID] is not set
         - DEFAULT_ISSUER[KEY] is not set
+        - a data model refers to JSON-LD contexts which can't be resolved locally
 
     Returns:
         List of any Errors.
@@ -60,4 +62,15 @@ def vc_settings_checks(*args, **kwargs):
             )
         )
 
+    for data_model in [*vc_settings.DEFAULT_DATA_MODELS, vc_settings.STATUS_LIST_DATA_MODEL]:
+        if remote_contexts := get_remote_contexts(data_model):
+            errors.append(
+                Error(
+                    f"{data_model.__name__} refers to JSON-LD contexts which can't be resolved locally: "
+                    f"{', '.join(remote_contexts)}.",
+                    hint="Use data models with the contexts bundled with didkit (see composition.contexts).",
+                    id="verifiable_credentials.E006",
+                )
+            )
+
     return errors
@@ -0,0 +1,38 @@
+"""
+JSON-LD contexts of the composed verifiable credentials.
+
+didkit resolves `@context` documents with its own (static) document loader while signing and verifying: it serves the
+documents bundled with the library and never fetches remote ones. A data model which refers to any other context
+can't be signed at all, so contexts are checked against the bundled ones in advance (see checks).
+"""
+
+LOCAL_CONTEXTS = frozenset(
+    {
+        "https://www.w3.org/2018/credentials/v1",
+        "https://www.w3.org/ns/credentials/v2",
+        "https://www.w3.org/ns/did/v1",
+        "https://w3id.org/security/v1",
+        "https://w3id.org/security/v2",
+        "https://w3id.org/security/data-integrity/v1",
+        "https://w3id.org/security/suites/ed25519-2020/v1",
+        "https://w3id.org/security/suites/jws-2020/v1",
+        "https://w3id.org/vc/status-list/2021/v1",
+        "https://w3id.org/vc-revocation-list-2020/v1",
+        "https://purl.imsglobal.org/spec/ob/v3p0/context.json",
+        "https://schema.org/",
+    }
+)
+
+
+def get_data_model_contexts(data_model):
+    """
+    Collect all contexts the given data model (class) emits.
+    """
+    return data_model().collect_context(None)
+
+
+def get_remote_contexts(data_model):
+    """
+    Collect the data model contexts which can't be resolved locally.
+    """
+    return [context for context in get_data_model_contexts(data_model) if context not in LOCAL_CONTEXTS]
@@ -2,14 +2,17 @@
 Issuance line processor.
 """
 
+import hashlib
 import json
 import logging
 
 import didkit
 from crum import get_current_request
 from django.utils.translation import gettext as _
+from edx_django_utils.monitoring import increment
 from rest_framework.exceptions import ValidationError
 
+from credentials.apps.core.timing import timed_operation, timed_stage
 from credentials.apps.credentials.constants import UserCredentialStatus
 
 from ..issuance import IssuanceException
@@ -17,6 +20,7 @@ from ..issuance.utils import didkit_issue_credential, didkit_verify_credential,
 from ..settings import vc_settings
 from ..storages.utils import get_storage
 from .models import IssuanceLine
+from .signing import should_verify_signed_credential
 
 logger = logging.getLogger(__name__)
 
@@ -33,13 +37,20 @@ class CredentialIssuer:
         - incoming data validation
         - resolving issuance configuration
         - resolving data model to use for verifiable credential composition
-        - composed verifiable credential signing
+        - composed verifiable credential signing (unless it was signed before)
     """
 
     INACTIVE_STATUSES = [
         UserCredentialStatus.REVOKED,
     ]
 
+    SIGNING_OPTIONS = {
+        "type": "Ed25519Signature2020",
+    }
+
+    # these claims change with every issuance line save, they aren't the signed credential inputs:
+    VOLATILE_CLAIMS = ("issued", "issuanceDate", "validFrom")
+
     def __init__(self, *, issuance_uuid, data=None):
         self._issuance_line = self._pickup_issuance_line(issuance_uuid)
         self._storage = self._issuance_line.storage
@@ -97,19 +108,16 @@ class CredentialIssuer:
         """
         err_message = _("Provided data didn't validate")
 
-        didkit_options = {
-            "type": "Ed25519Signature2020",
-        }
         issuer_key = get_issuer(self._issuance_line.issuer_id).issuer_key
 
         try:
             verifiable_credential_json = didkit_issue_credential(
-                composed_credential_json, json.dumps(didkit_options), issuer_key
+                composed_credential_json, json.dumps(self.SIGNING_OPTIONS), issuer_key
             )
         except didkit.DIDKitException as exc:  # pylint: disable=no-member, useless-suppression
             logger.exception(err_message)
             raise IssuanceException(detail=f"{err_message} [{exc}]")
-        except ValueError as exc:
+        except (ValueError, TimeoutError) as exc:
             logger.exception(err_message)
             raise IssuanceException(detail=f"{err_message} [{exc}]")
 
@@ -132,23 +140,50 @@ class CredentialIssuer:
             logger.exception(err_message)
             raise IssuanceException(detail=f"{err_message} [{exc}]")
 
+    @classmethod
+    def get_digest(cls, composed_credential_json):
+        """
+        Fingerprint the composed credential (signed credential inputs).
+        """
+        credential = json.loads(composed_credential_json)
+        for claim in cls.VOLATILE_CLAIMS:
+            credential.pop(claim, None)
+        return hashlib.sha256(json.dumps(credential, sort_keys=True).encode()).hexdigest()
+
     def issue(self):
         """
         Issue a signed digital credential document by validating, composing, and signing.
+
+        A previously signed (e.g. pre-issued) credential is served as is while its composition doesn't change.
         """
-        # construction (data collecting and shaping):
-        composed_credential = self.compose()
+        with timed_operation("verifiable_credential_issuance"):
+            # construction (data collecting and shaping):
+            with timed_stage("composition"):
+                composed_credential = self.compose()
+                digest = self.get_digest(composed_credential)
+
+            if self._issuance_line.signed_credential and self._issuance_line.signed_digest == digest:
+                increment("vc_signed_credential_reused")
+                with timed_stage("finalization"):
+                    self._issuance_line.finalize()
+                return self._issuance_line.signed_credential
 
-        # signing / structure validation:
-        verifiable_credential_json = self.sign(composed_credential)
+            # signing / structure validation:
+            with timed_stage("signing"):
+                verifiable_credential_json = self.sign(composed_credential)
 
-        # check it's verifiable:
-        self.verify(verifiable_credential_json)
+            # check it's verifiable (all or a sample of the signed credentials, see SIGNING_VERIFY_SAMPLE_RATE):
+            if should_verify_signed_credential():
+                with timed_stage("verification"):
+                    self.verify(verifiable_credential_json)
 
-        # issuance line finalization:
-        self._issuance_line.finalize()
+            # issuance line finalization:
+            with timed_stage("finalization"):
+                self._issuance_line.signed_credential = json.loads(verifiable_credential_json)
+                self._issuance_line.signed_digest = digest
+                self._issuance_line.finalize()
 
-        return json.loads(verifiable_credential_json)
+            return self._issuance_line.signed_credential
 
     @classmethod
     def init(cls, *, storage_id, user_credential=None, issuer_id=None):
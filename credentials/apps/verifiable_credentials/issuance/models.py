@@ -32,7 +32,10 @@ class IssuanceLine(TimeStampedModel):
     """
     Specific verifiable credential issuance details (issuance line).
 
-    .. no_pii:
+    .. pii: Stores the signed verifiable credential, which includes the learner's full name.
+        pii values: full_name
+    .. pii_types: name
+    .. pii_retirement: retained
     """
 
     # Initial data:
@@ -72,6 +75,18 @@ class IssuanceLine(TimeStampedModel):
         blank=True,
         help_text=_("Keeps track on a corresponding user credential's status"),
     )
+    # Signed verifiable credential (reused while its composition doesn't change):
+    signed_credential = models.JSONField(
+        null=True,
+        blank=True,
+        help_text=_("Signed verifiable credential document"),
+    )
+    signed_digest = models.CharField(
+        max_length=64,
+        blank=True,
+        default="",
+        help_text=_("Digest of the composed verifiable credential which was signed"),
+    )
 
     class Meta:
         ordering = ("created",)
@@ -221,10 +236,14 @@ class IssuanceLine(TimeStampedModel):
 
     def get_status_list_url(self, hash_str=None):
         request = get_current_request()
-        if not request:
+        if request:
+            base_url = request.build_absolute_uri().split(request.path)[0]
+        elif self.user_credential:
+            # out of request (pre-issuance), the credential's site is the one serving status lists:
+            base_url = f"https://{self.user_credential.credential.site.domain}"
+        else:
             return None
 
-        base_url = request.build_absolute_uri().split(request.path)[0]
         status_list_url = urljoin(
             base_url,
             reverse(
@@ -0,0 +1,181 @@
+"""
+Bulk pre-issuance of verifiable credentials.
+
+Awarded user credentials are walked in batches (keyset ordered by id), for every batch:
+    - issuance lines are initiated (with pre-allocated status indices) for the user credentials which have none yet;
+    - the not yet processed issuance lines are composed and signed (concurrently, see the signing service), the signed
+      credentials are stored on the issuance lines.
+
+The wallet flow then serves the stored signed credential as long as its composition stays the same (see
+`CredentialIssuer.issue`). The holder DID is only known once the wallet requests the credential, so the DID the
+learner has used with the storage before is assumed (issuance lines of learners without one are only initiated).
+
+Already pre-issued issuance lines are skipped, so an interrupted pre-issuance is resumed by running it again.
+"""
+
+import json
+import logging
+
+from django.db import IntegrityError, transaction
+
+from credentials.apps.credentials.constants import UserCredentialStatus
+
+from ..settings import vc_settings
+from .main import CredentialIssuer
+from .models import IssuanceLine
+from .signing import should_verify_signed_credential, sign_credentials, verify_credential
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_BATCH_SIZE = 100
+
+# status indices may be taken by concurrent (interactive) issuance initiations:
+STATUS_INDEX_ALLOCATION_ATTEMPTS = 3
+
+
+def preissue_credentials(queryset, storage, batch_size=DEFAULT_BATCH_SIZE, limit=None, dry_run=False):
+    """
+    Pre-issues verifiable credentials for the awarded user credentials of the queryset.
+
+    Arguments:
+        queryset (QuerySet): user credentials to pre-issue verifiable credentials for.
+        storage (BaseStorage): target storage (wallet).
+        batch_size (int): number of user credentials processed at once.
+        limit (int): stop after processing this many user credentials.
+        dry_run (bool): only count the user credentials which would be processed.
+
+    Returns:
+        dict: "processed", "initiated" (issuance lines), "signed" and "failed" counts.
+    """
+    queryset = queryset.filter(status=UserCredentialStatus.AWARDED).order_by("id")
+    issuer = IssuanceLine.resolve_issuer()
+    data_model = storage.get_data_model()
+    stats = {"processed": 0, "initiated": 0, "signed": 0, "failed": 0}
+    last_id = 0
+
+    while limit is None or stats["processed"] < limit:
+        size = batch_size if limit is None else min(batch_size, limit - stats["processed"])
+        batch = list(queryset.filter(id__gt=last_id).select_related("credential_content_type")[:size])
+        if not batch:
+            break
+        last_id = batch[-1].id
+        stats["processed"] += len(batch)
+        if dry_run:
+            continue
+
+        stats["initiated"] += init_issuance_lines(batch, storage, data_model, issuer.issuer_id)
+        signed, failed = sign_issuance_lines(
+            IssuanceLine.objects.filter(
+                user_credential__in=batch,
+                storage_id=storage.ID,
+                issuer_id=issuer.issuer_id,
+                processed=False,
+                signed_credential__isnull=True,
+            )
+            .exclude(subject_id="")
+            .select_related("user_credential"),
+            issuer,
+        )
+        stats["signed"] += signed
+        stats["failed"] += failed
+        logger.info("Pre-issued verifiable credentials up to user credential %d: %s", last_id, stats)
+
+    return stats
+
+
+def init_issuance_lines(user_credentials, storage, data_model, issuer_id):
+    """
+    Initiates issuance lines for the user credentials which have none for the storage yet.
+
+    Returns:
+        int: initiated issuance lines count.
+    """
+    initiated = set(
+        IssuanceLine.objects.filter(
+            user_credential__in=user_credentials, storage_id=storage.ID, issuer_id=issuer_id
+        ).values_list("user_credential_id", flat=True)
+    )
+    user_credentials = [user_credential for user_credential in user_credentials if user_credential.id not in initiated]
+    if not user_credentials:
+        return 0
+
+    # the latest holder DID for every learner (ordered by creation):
+    subject_ids = dict(
+        IssuanceLine.objects.filter(
+            storage_id=storage.ID,
+            user_credential__username__in={user_credential.username for user_credential in user_credentials},
+        )
+        .exclude(subject_id="")
+        .values_list("user_credential__username", "subject_id")
+    )
+
+    for attempt in range(1, STATUS_INDEX_ALLOCATION_ATTEMPTS + 1):
+        try:
+            with transaction.atomic():
+                next_status_index = IssuanceLine.get_next_status_index(issuer_id)
+                IssuanceLine.objects.bulk_create(
+                    IssuanceLine(
+                        user_credential=user_credential,
+                        storage_id=storage.ID,
+                        issuer_id=issuer_id,
+                        processed=False,
+                        data_model_id=data_model.ID,
+                        subject_id=subject_ids.get(user_credential.username, ""),
+                        status_index=next_status_index + i,
+                        status=user_credential.status,
+                    )
+                    for i, user_credential in enumerate(user_credentials)
+                )
+            return len(user_credentials)
+        except IntegrityError:
+            if attempt == STATUS_INDEX_ALLOCATION_ATTEMPTS:
+                raise
+            logger.warning("Status indices were taken concurrently, retrying allocation (attempt %d)", attempt)
+
+    return 0
+
+
+def sign_issuance_lines(issuance_lines, issuer):
+    """
+    Composes and signs the issuance lines, stores the signed credentials.
+
+    Returns:
+        tuple: signed and failed issuance lines counts.
+    """
+    lines, composed = [], []
+    failed = 0
+
+    for issuance_line in issuance_lines:
+        try:
+            credential_data = issuance_line.construct(context={"request": None})
+        except Exception:  # pylint: disable=broad-except
+            logger.exception("Verifiable credential composition failed: [%s]", issuance_line.uuid)
+            failed += 1
+            continue
+        lines.append(issuance_line)
+        composed.append(vc_settings.DEFAULT_RENDERER().render(credential_data))
+
+    results = sign_credentials(composed, json.dumps(CredentialIssuer.SIGNING_OPTIONS), issuer.issuer_key)
+
+    signed_lines = []
+    for issuance_line, composed_credential, (verifiable_credential_json, error) in zip(lines, composed, results):
+        if error is None and should_verify_signed_credential():
+            error = _verify(verifiable_credential_json)
+        if error is not None:
+            logger.error("Verifiable credential signing failed: [%s] %s", issuance_line.uuid, error)
+            failed += 1
+            continue
+        issuance_line.signed_credential = json.loads(verifiable_credential_json)
+        issuance_line.signed_digest = CredentialIssuer.get_digest(composed_credential)
+        signed_lines.append(issuance_line)
+
+    IssuanceLine.objects.bulk_update(signed_lines, ["signed_credential", "signed_digest"])
+    return len(signed_lines), failed
+
+
+def _verify(verifiable_credential_json):
+    try:
+        verification_result = json.loads(verify_credential(verifiable_credential_json, json.dumps({})))
+    except Exception as exc:  # pylint: disable=broad-except
+        return exc
+    return "; ".join(verification_result["errors"]) or None
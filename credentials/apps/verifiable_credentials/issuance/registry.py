@@ -0,0 +1,78 @@
+"""
+Issuers registry.
+
+Issuance configurations are looked up on every issuance and status list request, but they change rarely. The registry
+keeps them in process memory:
+    - the registry is reloaded when an issuance configuration is saved or deleted (a version key in the shared cache
+      lets other processes know about the change);
+    - the registry is reloaded after `ISSUERS_CACHE_TTL` seconds anyway (`0` disables the registry).
+
+NOTE: the registered issuance configurations are shared, they must not be modified.
+"""
+
+import threading
+import time
+import uuid
+
+from django.core.cache import cache
+
+from ..settings import vc_settings
+from .models import IssuanceConfiguration
+
+VERSION_CACHE_KEY = "verifiable_credentials.issuers.version"
+
+
+class IssuerRegistry:
+    """
+    In-process issuance configurations cache.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._state = None
+
+    @staticmethod
+    def _load(version):
+        # ordered by (enabled, created), so the last enabled issuer is the default one:
+        issuers = list(IssuanceConfiguration.objects.all())
+        return {
+            "issuers": {issuer.issuer_id: issuer for issuer in issuers},
+            "enabled": [issuer for issuer in issuers if issuer.enabled],
+            "version": version,
+            "loaded_at": time.monotonic(),
+        }
+
+    def _get_state(self):
+        ttl = vc_settings.ISSUERS_CACHE_TTL
+        if not ttl:
+            return self._load(version=None)
+
+        version = cache.get(VERSION_CACHE_KEY)
+        state = self._state
+        if state is None or state["version"] != version or time.monotonic() - state["loaded_at"] > ttl:
+            with self._lock:
+                state = self._state = self._load(version)
+        return state
+
+    def get_issuer(self, issuer_id):
+        return self._get_state()["issuers"].get(issuer_id)
+
+    def get_default_issuer(self):
+        enabled = self._get_state()["enabled"]
+        return enabled[-1] if enabled else None
+
+    def get_issuer_ids(self):
+        return list(self._get_state()["issuers"])
+
+    def get_active_issuer_ids(self):
+        return [issuer.issuer_id for issuer in self._get_state()["enabled"]]
+
+    def invalidate(self):
+        """
+        Drops the registry (in all processes).
+        """
+        cache.set(VERSION_CACHE_KEY, uuid.uuid4().hex, None)
+        self._state = None
+
+
+issuer_registry = IssuerRegistry()
@@ -0,0 +1,183 @@
+"""
+Verifiable credentials signing service.
+
+didkit calls are run on a persistent event loop (one per process, in a dedicated thread), instead of bridging a new
+event loop for every call. Requests are queued by the service: at most `SIGNING_MAX_CONCURRENCY` didkit calls are run
+at once, the following ones wait for their turn.
+
+Signing latency (including the time spent in the queue) is reported to monitoring.
+"""
+
+import asyncio
+import inspect
+import logging
+import os
+import random
+import threading
+import time
+
+import didkit
+from edx_django_utils.monitoring import accumulate, increment
+
+from ..settings import vc_settings
+
+logger = logging.getLogger(__name__)
+
+
+class SigningService:
+    """
+    Runs didkit calls on a persistent event loop.
+
+    The loop thread is started on the first call (and restarted in a forked process, e.g. a gunicorn worker).
+    """
+
+    def __init__(self, max_concurrency):
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._loop = None
+        self._thread = None
+        self._semaphore = None
+        self._pid = None
+
+    def _ensure_started(self):
+        with self._lock:
+            if self._loop is not None and self._pid == os.getpid():
+                return self._loop
+
+            self._loop = asyncio.new_event_loop()
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+            self._pid = os.getpid()
+            self._thread = threading.Thread(target=self._loop.run_forever, name="vc-signing-service", daemon=True)
+            self._thread.start()
+            return self._loop
+
+    async def _call(self, func, args):
+        async with self._semaphore:
+            result = func(*args)
+            if inspect.isawaitable(result):
+                result = await result
+            return result
+
+    def submit(self, func, *args):
+        """
+        Queues the didkit call.
+
+        Returns:
+            concurrent.futures.Future: the call result.
+        """
+        loop = self._ensure_started()
+        return asyncio.run_coroutine_threadsafe(self._call(func, args), loop)
+
+    def run(self, func, *args, timeout=None):
+        """
+        Runs the didkit call and waits for its result.
+
+        Raises:
+            TimeoutError: the call didn't complete in time.
+        """
+        timeout = vc_settings.SIGNING_TIMEOUT if timeout is None else timeout
+        future = self.submit(func, *args)
+        try:
+            return future.result(timeout=timeout)
+        except TimeoutError:
+            future.cancel()
+            raise
+
+    def shutdown(self):
+        """
+        Stops the event loop thread.
+        """
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is not None and self._pid == os.getpid():
+            asyncio.run_coroutine_threadsafe(self._stop(loop), loop)
+            thread.join(timeout=5)
+
+    @staticmethod
+    async def _stop(loop):
+        tasks = [task for task in asyncio.all_tasks(loop) if task is not asyncio.current_task()]
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        loop.stop()
+
+
+_service = None
+_service_lock = threading.Lock()
+
+
+def get_signing_service():
+    """
+    Returns the process-wide signing service.
+    """
+    global _service  # pylint: disable=global-statement
+
+    with _service_lock:
+        if _service is None:
+            _service = SigningService(max_concurrency=vc_settings.SIGNING_MAX_CONCURRENCY)
+        return _service
+
+
+def sign_credential(credential, options, issuer_key, timeout=None):
+    """
+    Signs the composed credential JSON-LD (adds a proof).
+    """
+    started = time.perf_counter()
+    try:
+        return get_signing_service().run(didkit.issue_credential, credential, options, issuer_key, timeout=timeout)
+    finally:
+        accumulate("vc_signing_time", time.perf_counter() - started)
+        increment("vc_signing_count")
+
+
+def sign_credentials(credentials, options, issuer_key, timeout=None):
+    """
+    Signs composed credentials concurrently (up to the service concurrency).
+
+    Returns:
+        list: (verifiable_credential_json, error) pairs, in the order of the given credentials.
+    """
+    service = get_signing_service()
+    timeout = vc_settings.SIGNING_TIMEOUT if timeout is None else timeout
+    started = time.perf_counter()
+    futures = [service.submit(didkit.issue_credential, credential, options, issuer_key) for credential in credentials]
+
+    results = []
+    for future in futures:
+        try:
+            results.append((future.result(timeout=timeout), None))
+        except Exception as exc:  # pylint: disable=broad-except
+            results.append((None, exc))
+
+    accumulate("vc_signing_time", time.perf_counter() - started)
+    accumulate("vc_signing_count", len(credentials))
+    return results
+
+
+def verify_credential(verifiable_credential, proof_options, timeout=None):
+    """
+    Verifies the verifiable credential JSON-LD.
+    """
+    started = time.perf_counter()
+    try:
+        return get_signing_service().run(
+            didkit.verify_credential, verifiable_credential, proof_options, timeout=timeout
+        )
+    finally:
+        accumulate("vc_verification_time", time.perf_counter() - started)
+
+
+def verify_presentation(presentation, proof_options, timeout=None):
+    """
+    Verifies the verifiable presentation JSON-LD.
+    """
+    return get_signing_service().run(didkit.verify_presentation, presentation, proof_options, timeout=timeout)
+
+
+def should_verify_signed_credential():
+    """
+    Decides whether a freshly signed credential is verified (see the `SIGNING_VERIFY_SAMPLE_RATE` setting).
+    """
+    sample_rate = vc_settings.SIGNING_VERIFY_SAMPLE_RATE
+    return sample_rate >= 1 or random.random() < sample_rate
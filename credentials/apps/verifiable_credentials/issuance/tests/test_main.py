@@ -3,6 +3,7 @@ import uuid
 from unittest import mock
 
 import didkit
+from django.conf import settings
 from django.contrib.contenttypes.models import ContentType
 from django.test import TestCase
 from rest_framework.exceptions import ValidationError
@@ -131,13 +132,45 @@ class MainIssuanceTestCase(SiteMixin, TestCase):
     @mock.patch("credentials.apps.verifiable_credentials.issuance.main.CredentialIssuer.verify")
     @mock.patch("credentials.apps.verifiable_credentials.issuance.main.IssuanceLine.finalize")
     def test_issue_sequence(self, mock_finalize, mock_verify, mock_sign, mock_compose):
-        mock_compose.return_value = {"credential": "composed"}
+        mock_compose.return_value = json.dumps({"credential": "composed"})
         mock_sign.return_value = json.dumps({"credential": "composed-and-signed"})
 
         result = CredentialIssuer(issuance_uuid=self.issuance_line.uuid).issue()
 
         mock_compose.assert_called_once()
-        mock_sign.assert_called_once_with({"credential": "composed"})
+        mock_sign.assert_called_once_with(json.dumps({"credential": "composed"}))
         mock_verify.assert_called_once_with(json.dumps({"credential": "composed-and-signed"}))
         mock_finalize.assert_called_once()
         self.assertEqual(result, json.loads(json.dumps({"credential": "composed-and-signed"})))
+
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.CredentialIssuer.compose")
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.CredentialIssuer.sign")
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.CredentialIssuer.verify")
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.IssuanceLine.finalize")
+    def test_issue_without_sampled_verification(self, mock_finalize, mock_verify, mock_sign, mock_compose):
+        mock_compose.return_value = json.dumps({"credential": "composed"})
+        mock_sign.return_value = json.dumps({"credential": "composed-and-signed"})
+
+        with self.settings(VERIFIABLE_CREDENTIALS={**settings.VERIFIABLE_CREDENTIALS, "SIGNING_VERIFY_SAMPLE_RATE": 0}):
+            CredentialIssuer(issuance_uuid=self.issuance_line.uuid).issue()
+
+        mock_sign.assert_called_once()
+        mock_verify.assert_not_called()
+        mock_finalize.assert_called_once()
+
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.CredentialIssuer.compose")
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.CredentialIssuer.sign")
+    @mock.patch("credentials.apps.verifiable_credentials.issuance.main.IssuanceLine.finalize")
+    def test_issue_reuses_signed_credential(self, mock_finalize, mock_sign, mock_compose):
+        mock_compose.return_value = json.dumps({"credential": "composed", "issued": "2024-01-02T00:00:00Z"})
+        self.issuance_line.signed_credential = {"credential": "composed-and-signed"}
+        self.issuance_line.signed_digest = CredentialIssuer.get_digest(
+            json.dumps({"issued": "2024-01-01T00:00:00Z", "credential": "composed"})
+        )
+        self.issuance_line.save()
+
+        result = CredentialIssuer(issuance_uuid=self.issuance_line.uuid).issue()
+
+        mock_sign.assert_not_called()
+        mock_finalize.assert_called_once()
+        self.assertEqual(result, {"credential": "composed-and-signed"})
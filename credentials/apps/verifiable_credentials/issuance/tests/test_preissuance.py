@@ -0,0 +1,113 @@
+from unittest import mock
+
+import didkit
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from credentials.apps.catalog.tests.factories import (
+    CourseFactory,
+    CourseRunFactory,
+    OrganizationFactory,
+    ProgramFactory,
+)
+from credentials.apps.core.tests.factories import UserFactory
+from credentials.apps.core.tests.mixins import SiteMixin
+from credentials.apps.credentials.constants import UserCredentialStatus
+from credentials.apps.credentials.models import UserCredential
+from credentials.apps.credentials.tests.factories import ProgramCertificateFactory, UserCredentialFactory
+from credentials.apps.verifiable_credentials.storages.learner_credential_wallet import LCWallet
+
+from ..main import CredentialIssuer
+from ..models import IssuanceLine
+from ..preissuance import preissue_credentials
+from ..signing import get_signing_service
+from .factories import IssuanceConfigurationFactory, IssuanceLineFactory
+
+HOLDER_DID = "did:example:holder"
+
+
+class PreissueCredentialsTestCase(SiteMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        issuer_key = didkit.generate_ed25519_key()  # pylint: disable=no-member, useless-suppression
+        issuer_id = get_signing_service().run(
+            didkit.key_to_did, "key", issuer_key  # pylint: disable=no-member, useless-suppression
+        )
+        self.issuer = IssuanceConfigurationFactory(issuer_id=issuer_id, issuer_key=issuer_key)
+
+        orgs = [OrganizationFactory(site=self.site)]
+        course_runs = CourseRunFactory.create_batch(2, course=CourseFactory(site=self.site))
+        program = ProgramFactory(course_runs=course_runs, authoring_organizations=orgs, site=self.site)
+        program_cert = ProgramCertificateFactory(program_uuid=program.uuid, site=self.site)
+        content_type = ContentType.objects.get(app_label="credentials", model="programcertificate")
+        self.users = UserFactory.create_batch(3)
+        self.user_credentials = [
+            UserCredentialFactory(username=user.username, credential_content_type=content_type, credential=program_cert)
+            for user in self.users
+        ]
+        revoked_user_credential = UserCredentialFactory(
+            username=UserFactory().username,
+            credential_content_type=content_type,
+            credential=program_cert,
+            status=UserCredentialStatus.REVOKED,
+        )
+        # the first learner has used the wallet before:
+        IssuanceLineFactory(
+            user_credential__username=self.users[0].username,
+            storage_id=LCWallet.ID,
+            issuer_id=issuer_id,
+            subject_id=HOLDER_DID,
+            status_index=0,
+            processed=True,
+        )
+        self.queryset = UserCredential.objects.filter(
+            id__in=[uc.id for uc in [*self.user_credentials, revoked_user_credential]]
+        )
+
+    def get_issuance_line(self, user_credential):
+        return IssuanceLine.objects.get(user_credential=user_credential, storage_id=LCWallet.ID)
+
+    def test_preissue_credentials(self):
+        stats = preissue_credentials(self.queryset, LCWallet, batch_size=2)
+
+        self.assertEqual(stats, {"processed": 3, "initiated": 3, "signed": 1, "failed": 0})
+        issuance_lines = [self.get_issuance_line(user_credential) for user_credential in self.user_credentials]
+        self.assertEqual([line.status_index for line in issuance_lines], [1, 2, 3])
+        self.assertEqual([line.subject_id for line in issuance_lines], [HOLDER_DID, "", ""])
+        self.assertEqual(issuance_lines[0].signed_credential["credentialSubject"]["id"], HOLDER_DID)
+        self.assertIn("proof", issuance_lines[0].signed_credential)
+        self.assertIsNone(issuance_lines[1].signed_credential)
+
+        # already pre-issued user credentials are skipped:
+        self.assertEqual(
+            preissue_credentials(self.queryset, LCWallet), {"processed": 3, "initiated": 0, "signed": 0, "failed": 0}
+        )
+
+    def test_dry_run(self):
+        stats = preissue_credentials(self.queryset, LCWallet, dry_run=True, limit=2)
+
+        self.assertEqual(stats, {"processed": 2, "initiated": 0, "signed": 0, "failed": 0})
+        self.assertFalse(IssuanceLine.objects.filter(user_credential__in=self.user_credentials).exists())
+
+    def test_wallet_flow_serves_preissued_credential(self):
+        preissue_credentials(self.queryset, LCWallet)
+        issuance_line = CredentialIssuer.init(storage_id=LCWallet.ID, user_credential=self.user_credentials[0])
+        preissued_credential = issuance_line.signed_credential
+
+        with mock.patch.object(CredentialIssuer, "sign") as mock_sign:
+            issued_credential = CredentialIssuer(issuance_uuid=issuance_line.uuid, data={"holder": HOLDER_DID}).issue()
+
+        mock_sign.assert_not_called()
+        self.assertEqual(issued_credential, preissued_credential)
+        self.assertTrue(self.get_issuance_line(self.user_credentials[0]).processed)
+
+    def test_wallet_flow_signs_changed_credential(self):
+        preissue_credentials(self.queryset, LCWallet)
+        issuance_line = CredentialIssuer.init(storage_id=LCWallet.ID, user_credential=self.user_credentials[0])
+
+        issued_credential = CredentialIssuer(
+            issuance_uuid=issuance_line.uuid, data={"holder": "did:example:another-holder"}
+        ).issue()
+
+        self.assertEqual(issued_credential["credentialSubject"]["id"], "did:example:another-holder")
+        self.assertEqual(self.get_issuance_line(self.user_credentials[0]).signed_credential, issued_credential)
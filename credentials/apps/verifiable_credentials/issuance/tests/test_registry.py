@@ -0,0 +1,54 @@
+from django.conf import settings
+from django.core.cache import cache
+from django.test import TestCase
+
+from ..models import IssuanceConfiguration
+from ..registry import VERSION_CACHE_KEY, issuer_registry
+from .factories import IssuanceConfigurationFactory
+
+
+class IssuerRegistryTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.issuer = IssuanceConfigurationFactory(issuer_id="did:key:test-1", enabled=True)
+        IssuanceConfigurationFactory(issuer_id="did:key:test-2", enabled=False)
+
+    def test_lookups_are_cached(self):
+        with self.assertNumQueries(1):
+            self.assertEqual(issuer_registry.get_issuer("did:key:test-1").issuer_key, self.issuer.issuer_key)
+            self.assertEqual(issuer_registry.get_default_issuer().issuer_id, "did:key:test-1")
+            self.assertIn("did:key:test-2", issuer_registry.get_issuer_ids())
+            self.assertNotIn("did:key:test-2", issuer_registry.get_active_issuer_ids())
+            self.assertIsNone(issuer_registry.get_issuer("did:key:unknown"))
+
+    def test_invalidated_on_save(self):
+        issuer_registry.get_default_issuer()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            IssuanceConfigurationFactory(issuer_id="did:key:test-3", enabled=True)
+            # the registry is reloaded once the change is committed
+            self.assertEqual(issuer_registry.get_default_issuer().issuer_id, "did:key:test-1")
+
+        self.assertEqual(issuer_registry.get_default_issuer().issuer_id, "did:key:test-3")
+
+    def test_invalidated_on_delete(self):
+        issuer_registry.get_issuer_ids()
+
+        with self.captureOnCommitCallbacks(execute=True):
+            IssuanceConfiguration.objects.filter(issuer_id="did:key:test-2").delete()
+
+        self.assertNotIn("did:key:test-2", issuer_registry.get_issuer_ids())
+
+    def test_invalidated_by_another_process(self):
+        issuer_registry.get_issuer_ids()
+
+        cache.set(VERSION_CACHE_KEY, "changed-elsewhere")
+
+        with self.assertNumQueries(1):
+            issuer_registry.get_issuer_ids()
+
+    def test_disabled(self):
+        with self.settings(VERIFIABLE_CREDENTIALS={**settings.VERIFIABLE_CREDENTIALS, "ISSUERS_CACHE_TTL": 0}):
+            with self.assertNumQueries(2):
+                issuer_registry.get_issuer_ids()
+                issuer_registry.get_issuer_ids()
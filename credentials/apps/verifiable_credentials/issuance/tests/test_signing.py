@@ -0,0 +1,79 @@
+import asyncio
+import json
+import threading
+
+import didkit
+from django.test import TestCase
+
+from credentials.apps.verifiable_credentials.issuance.signing import (
+    SigningService,
+    get_signing_service,
+    sign_credential,
+    sign_credentials,
+    verify_credential,
+)
+
+
+class SigningServiceTestCase(TestCase):
+    def setUp(self):
+        super().setUp()
+        self.issuer_key = didkit.generate_ed25519_key()  # pylint: disable=no-member, useless-suppression
+        self.issuer_id = get_signing_service().run(
+            didkit.key_to_did, "key", self.issuer_key  # pylint: disable=no-member, useless-suppression
+        )
+        self.options = json.dumps({"type": "Ed25519Signature2020"})
+
+    def compose(self, subject_id="did:example:learner"):
+        return json.dumps(
+            {
+                "@context": ["https://www.w3.org/2018/credentials/v1"],
+                "type": ["VerifiableCredential"],
+                "issuer": self.issuer_id,
+                "issuanceDate": "2024-01-01T00:00:00Z",
+                "credentialSubject": {"id": subject_id},
+            }
+        )
+
+    def test_sign_and_verify(self):
+        verifiable_credential = sign_credential(self.compose(), self.options, self.issuer_key)
+
+        self.assertIn("proof", json.loads(verifiable_credential))
+        self.assertEqual(json.loads(verify_credential(verifiable_credential, "{}"))["errors"], [])
+
+    def test_sign_credentials(self):
+        results = sign_credentials(
+            [self.compose(f"did:example:{i}") for i in range(3)] + ["not a credential"], self.options, self.issuer_key
+        )
+
+        self.assertEqual(len(results), 4)
+        for i, (verifiable_credential, error) in enumerate(results[:3]):
+            self.assertIsNone(error)
+            self.assertEqual(json.loads(verifiable_credential)["credentialSubject"]["id"], f"did:example:{i}")
+        self.assertIsNone(results[3][0])
+        self.assertIsNotNone(results[3][1])
+
+    def test_concurrency_is_bounded(self):
+        service = SigningService(max_concurrency=2)
+        self.addCleanup(service.shutdown)
+        running, max_running, lock = [0], [0], threading.Lock()
+
+        async def call():
+            with lock:
+                running[0] += 1
+                max_running[0] = max(max_running[0], running[0])
+            await asyncio.sleep(0.01)
+            with lock:
+                running[0] -= 1
+            return True
+
+        futures = [service.submit(call) for __ in range(6)]
+
+        self.assertTrue(all(future.result(timeout=5) for future in futures))
+        self.assertEqual(max_running[0], 2)
+
+    def test_timeout(self):
+        service = SigningService(max_concurrency=1)
+        self.addCleanup(service.shutdown)
+
+        with self.assertRaises(TimeoutError):
+            service.run(asyncio.sleep, 1, timeout=0.01)
@@ -12,6 +12,8 @@ from credentials.apps.credentials.models import UserCredential
 
 from ..settings import VerifiableCredentialsImproperlyConfigured
 from .models import IssuanceConfiguration, IssuanceLine
+from .registry import issuer_registry
+from .signing import sign_credential, verify_credential, verify_presentation
 
 
 def create_issuers():
@@ -26,7 +28,7 @@ def get_active_issuers():
     Collect all enabled issuers' ids.
     """
     # currently, the only (system level, default) is supported.
-    return list(IssuanceConfiguration.objects.filter(enabled=True).values_list("issuer_id", flat=True))
+    return issuer_registry.get_active_issuer_ids()
 
 
 def get_issuers():
@@ -42,14 +44,14 @@ def get_issuer_ids():
     Collect all issuers' ids.
     """
     # currently, the only (system level, default) is supported.
-    return list(IssuanceConfiguration.objects.values_list("issuer_id", flat=True))
+    return issuer_registry.get_issuer_ids()
 
 
 def get_default_issuer():
     """
     Fetch the default issuer.
     """
-    issuer = IssuanceConfiguration.objects.filter(enabled=True).last()
+    issuer = issuer_registry.get_default_issuer()
     if not issuer:
         msg = _("There are no enabled Issuance Configurations for some reason! At least one must be always active.")
         raise VerifiableCredentialsImproperlyConfigured(msg)
@@ -60,8 +62,7 @@ def get_issuer(issuer_id):
     """
     Fetch issuer by given ID.
     """
-    issuer = IssuanceConfiguration.objects.filter(issuer_id=issuer_id).first()
-    return issuer
+    return issuer_registry.get_issuer(issuer_id)
 
 
 def get_revoked_indices(issuer_id):
@@ -71,32 +72,25 @@ def get_revoked_indices(issuer_id):
     return IssuanceLine.get_indicies_for_status(issuer_id=issuer_id, status=UserCredential.REVOKED)
 
 
-@async_to_sync
-async def didkit_issue_credential(credential, options, issuer_key):
+def didkit_issue_credential(credential, options, issuer_key):
     """
     Given a credential JSON-LD add validate it and add a proof.
     """
-    return await didkit.issue_credential(
-        credential, options, issuer_key
-    )  # pylint: disable=no-member, useless-suppression
+    return sign_credential(credential, options, issuer_key)
 
 
-@async_to_sync
-async def didkit_verify_credential(credential, proof_options):
+def didkit_verify_credential(credential, proof_options):
     """
     Given a verifiable credential JSON-LD validate/verify it.
     """
-    return await didkit.verify_credential(credential, proof_options)  # pylint: disable=no-member, useless-suppression
+    return verify_credential(credential, proof_options)
 
 
-@async_to_sync
-async def didkit_verify_presentation(presentation, proof_options):
+def didkit_verify_presentation(presentation, proof_options):
     """
     Given a verifiable presentation JSON-LD validate/verify it.
     """
-    return await didkit.verify_presentation(
-        presentation, proof_options
-    )  # pylint: disable=no-member, useless-suppression
+    return verify_presentation(presentation, proof_options)
 
 
 @async_to_sync
@@ -0,0 +1,95 @@
+"""Pre-issue verifiable credentials."""
+
+import logging
+
+from django.core.management import BaseCommand, CommandError
+
+from credentials.apps.credentials.models import ProgramCertificate, UserCredential
+from credentials.apps.verifiable_credentials.constants import CredentialsType
+from credentials.apps.verifiable_credentials.issuance.preissuance import DEFAULT_BATCH_SIZE, preissue_credentials
+from credentials.apps.verifiable_credentials.storages.utils import get_available_storages, get_storage
+
+logger = logging.getLogger(__name__)
+
+
+class Command(BaseCommand):
+    """
+    Compose and sign verifiable credentials for awarded user credentials in advance (see `preissue_credentials`), so
+    the wallet requests are served without signing.
+
+    Example usage:
+
+    $ ./manage.py preissue_verifiable_credentials --storage_id lc_wallet --program_uuids <UUID> <UUID>
+    """
+
+    help = "Pre-issue verifiable credentials for awarded user credentials. Defaults to program certificates."
+
+    def add_arguments(self, parser):
+        """
+        Add arguments to the command parser.
+        """
+        parser.add_argument(
+            "--storage_id",
+            default=None,
+            help="Target storage (wallet) identifier. Defaults to the first available storage.",
+        )
+        parser.add_argument(
+            "--credential_type",
+            default=CredentialsType.PROGRAM,
+            choices=[CredentialsType.PROGRAM, CredentialsType.COURSE],
+            help="Type of the user credentials to pre-issue verifiable credentials for.",
+        )
+        parser.add_argument(
+            "--program_uuids",
+            default=None,
+            nargs="+",
+            help="Only pre-issue verifiable credentials for the certificates of these programs.",
+        )
+        parser.add_argument(
+            "--batch_size",
+            type=int,
+            default=DEFAULT_BATCH_SIZE,
+            help=f"Number of user credentials processed at once. Defaults to {DEFAULT_BATCH_SIZE}.",
+        )
+        parser.add_argument(
+            "--limit",
+            type=int,
+            default=None,
+            help="Stop after processing this many user credentials.",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Just count the user credentials which would be processed.",
+        )
+
+    def handle(self, *args, **options):
+        storage_id = options["storage_id"] or get_available_storages()[0].ID
+        storage = get_storage(storage_id)
+        if storage not in get_available_storages():
+            raise CommandError(f"Storage [{storage_id}] isn't available")
+
+        queryset = UserCredential.objects.filter(credential_content_type__model=options["credential_type"])
+        if options["program_uuids"]:
+            if options["credential_type"] != CredentialsType.PROGRAM:
+                raise CommandError("--program_uuids can only be used with program certificates")
+            queryset = queryset.filter(
+                credential_id__in=ProgramCertificate.objects.filter(
+                    program_uuid__in=options["program_uuids"]
+                ).values_list("id", flat=True)
+            )
+
+        stats = preissue_credentials(
+            queryset,
+            storage,
+            batch_size=options["batch_size"],
+            limit=options["limit"],
+            dry_run=options["dry_run"],
+        )
+
+        if options["dry_run"]:
+            logger.info(
+                "Dry run: verifiable credentials would be pre-issued for %d user credentials", stats["processed"]
+            )
+        else:
+            logger.info("Done pre-issuing verifiable credentials: %s", stats)
@@ -0,0 +1,32 @@
+from unittest.mock import ANY, patch
+
+from django.core.management import CommandError, call_command
+from django.test import TestCase
+
+from credentials.apps.verifiable_credentials.storages.learner_credential_wallet import LCWallet
+
+COMMAND_MODULE = "credentials.apps.verifiable_credentials.management.commands.preissue_verifiable_credentials"
+
+
+class PreissueVerifiableCredentialsTestCase(TestCase):
+    @patch(f"{COMMAND_MODULE}.preissue_credentials")
+    def test_preissue_verifiable_credentials(self, mock_preissue_credentials):
+        mock_preissue_credentials.return_value = {"processed": 0, "initiated": 0, "signed": 0, "failed": 0}
+
+        call_command("preissue_verifiable_credentials", "--batch_size", "10", "--limit", "20")
+
+        mock_preissue_credentials.assert_called_once_with(ANY, LCWallet, batch_size=10, limit=20, dry_run=False)
+
+    def test_unavailable_storage(self):
+        with self.assertRaisesMessage(CommandError, "Storage [unknown] isn't available"):
+            call_command("preissue_verifiable_credentials", "--storage_id", "unknown")
+
+    def test_program_uuids_of_course_certificates(self):
+        with self.assertRaises(CommandError):
+            call_command(
+                "preissue_verifiable_credentials",
+                "--credential_type",
+                "coursecertificate",
+                "--program_uuids",
+                "00000000-0000-0000-0000-000000000000",
+            )
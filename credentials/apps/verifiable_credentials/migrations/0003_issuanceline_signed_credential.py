@@ -0,0 +1,28 @@
+# Generated by Django 5.2.11 on 2026-10-19 11:20
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("verifiable_credentials", "0002_alter_issuanceline_subject_id"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="issuanceline",
+            name="signed_credential",
+            field=models.JSONField(blank=True, help_text="Signed verifiable credential document", null=True),
+        ),
+        migrations.AddField(
+            model_name="issuanceline",
+            name="signed_digest",
+            field=models.CharField(
+                blank=True,
+                default="",
+                help_text="Digest of the composed verifiable credential which was signed",
+                max_length=64,
+            ),
+        ),
+    ]
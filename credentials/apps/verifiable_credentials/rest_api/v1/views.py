@@ -15,6 +15,8 @@ from rest_framework.permissions import AllowAny, IsAuthenticated
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
+from credentials.apps.core.db_routing import read_replica
+from credentials.apps.core.query_budget import query_budget
 from credentials.apps.credentials.models import UserCredential
 from credentials.apps.verifiable_credentials.issuance import IssuanceException
 from credentials.apps.verifiable_credentials.issuance.main import CredentialIssuer
@@ -25,7 +27,7 @@ from credentials.apps.verifiable_credentials.permissions import VerifiablePresen
 from credentials.apps.verifiable_credentials.storages.utils import get_available_storages, get_storage
 from credentials.apps.verifiable_credentials.utils import (
     generate_base64_qr_code,
-    get_user_credentials_data,
+    get_user_credentials_data_by_type,
     is_valid_uuid,
 )
 
@@ -103,18 +105,20 @@ class CredentialsViewSet(mixins.ListModelMixin, viewsets.GenericViewSet):
             }
         """
         types = self.request.query_params.get("types")
-        response = {}
 
         if types:
-            types = types.split(",")
+            types = [
+                credential_type for credential_type in types.split(",") if credential_type in self.CREDENTIAL_TYPES_MAP
+            ]
         else:
-            types = self.CREDENTIAL_TYPES_MAP.keys()
+            types = list(self.CREDENTIAL_TYPES_MAP.keys())
 
-        for credential_type in types:
-            if credential_type in self.CREDENTIAL_TYPES_MAP:
-                response[self.CREDENTIAL_TYPES_MAP[credential_type]] = get_user_credentials_data(
-                    request.user.username, credential_type
-                )
+        # all the requested credential types are collected at once:
+        credentials_data = get_user_credentials_data_by_type(request.user.username, types)
+        response = {
+            self.CREDENTIAL_TYPES_MAP[credential_type]: credentials_data.get(credential_type, [])
+            for credential_type in types
+        }
 
         return Response(response)
 
@@ -254,6 +258,8 @@ class AvailableStoragesView(ListAPIView):
         return get_available_storages()
 
 
+@read_replica()
+@query_budget(10)
 class StatusList2021View(APIView):
     """
     Verifiable credentials status verification.
@@ -39,6 +39,14 @@ DEFAULTS = {
     "STATUS_LIST_STORAGE": "credentials.apps.verifiable_credentials.storages.status_list.StatusList2021",
     "STATUS_LIST_DATA_MODEL": "credentials.apps.verifiable_credentials.composition.status_list.StatusListDataModel",
     "STATUS_LIST_LENGTH": 10000,
+    # concurrent didkit calls per process, the following ones are queued
+    "SIGNING_MAX_CONCURRENCY": 4,
+    # seconds to wait for a didkit call (including the time spent in the queue)
+    "SIGNING_TIMEOUT": 10,
+    # share of freshly signed credentials which are verified (1 - all of them, 0 - none)
+    "SIGNING_VERIFY_SAMPLE_RATE": 1.0,
+    # seconds to keep issuance configurations in process memory (0 - don't keep)
+    "ISSUERS_CACHE_TTL": 300,
 }
 
 # List of settings that may be in string import notation:
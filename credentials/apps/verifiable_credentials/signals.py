@@ -2,12 +2,16 @@
 Verifiable Credentials signal handlers.
 """
 
-from django.db.models.signals import post_save
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
 from django.dispatch import receiver
 
+from credentials.apps.credentials.constants import UserCredentialStatus
 from credentials.apps.credentials.models import UserCredential
+from credentials.apps.credentials.revocation import USER_CREDENTIALS_REVOKED
 
-from .issuance.models import IssuanceLine
+from .issuance.models import IssuanceConfiguration, IssuanceLine
+from .issuance.registry import issuer_registry
 
 
 @receiver(post_save, sender=UserCredential)
@@ -28,3 +32,22 @@ def update_issuance_lines(instance, created, **kwargs):
     # find all related issuance lines and switch status:
     issuance_lines = IssuanceLine.objects.filter(user_credential=user_credential)
     issuance_lines.update(status=user_credential.status)
+
+
+@receiver(USER_CREDENTIALS_REVOKED)
+def revoke_issuance_lines(user_credential_ids, **kwargs):
+    """
+    Keep track on bulk revoked user credentials (they are updated without being saved) and revoke related issuance
+    lines, so revocations are published with status lists.
+    """
+    IssuanceLine.objects.filter(user_credential_id__in=user_credential_ids).update(status=UserCredentialStatus.REVOKED)
+
+
+@receiver(post_save, sender=IssuanceConfiguration)
+@receiver(post_delete, sender=IssuanceConfiguration)
+def invalidate_issuer_registry(**kwargs):
+    """
+    Make all processes reload issuance configurations, once the change is committed (otherwise they could reload the
+    previous ones under the new version).
+    """
+    transaction.on_commit(issuer_registry.invalidate)
@@ -1,7 +1,10 @@
+from unittest import mock
+
 from django.core.checks import Error
 from django.test import TestCase, override_settings
 
 from ..checks import vc_settings_checks
+from ..composition.open_badges import OpenBadgesDataModel
 from ..toggles import ENABLE_VERIFIABLE_CREDENTIALS
 
 
@@ -41,3 +44,13 @@ class VCSettingsChecksTestCase(TestCase):
                 self.assertIsInstance(error, Error)
                 self.assertEqual(error.id, expected_errors[i]["id"])
                 self.assertEqual(error.msg, expected_errors[i]["msg"])
+
+    def test_remote_contexts_check(self):
+        with mock.patch.object(OpenBadgesDataModel, "get_context", return_value=["https://example.com/context.json"]):
+            errors = vc_settings_checks()
+
+        self.assertIn("verifiable_credentials.E006", [error.id for error in errors])
+        self.assertTrue(all("https://example.com/context.json" in error.msg for error in errors))
+
+    def test_local_contexts_check(self):
+        self.assertEqual(vc_settings_checks(), [])
@@ -10,7 +10,10 @@ from credentials.apps.catalog.tests.factories import (
 from credentials.apps.core.tests.factories import UserFactory
 from credentials.apps.core.tests.mixins import SiteMixin
 from credentials.apps.credentials.constants import UserCredentialStatus
+from credentials.apps.credentials.models import UserCredential
+from credentials.apps.credentials.revocation import USER_CREDENTIALS_REVOKED
 from credentials.apps.credentials.tests.factories import ProgramCertificateFactory, UserCredentialFactory
+from credentials.apps.verifiable_credentials.issuance.models import IssuanceLine
 from credentials.apps.verifiable_credentials.issuance.tests.factories import IssuanceLineFactory
 from credentials.apps.verifiable_credentials.storages.learner_credential_wallet import LCWallet
 
@@ -57,3 +60,19 @@ class SignalsTestCase(SiteMixin, TestCase):
 
         self.assertEqual(self.issuance_line.status, UserCredentialStatus.AWARDED)
         self.assertEqual(self.issuance_line_2.status, UserCredentialStatus.AWARDED)
+
+    def test_revoke_issuance_lines(self):
+        IssuanceLineFactory.create(
+            user_credential=self.program_user_credential,
+            status=UserCredentialStatus.AWARDED,
+            status_index=7,
+            storage_id=LCWallet.ID,
+        )
+
+        USER_CREDENTIALS_REVOKED.send(sender=UserCredential, user_credential_ids=[self.program_user_credential.id])
+
+        self.assertFalse(
+            IssuanceLine.objects.filter(user_credential=self.program_user_credential)
+            .exclude(status=UserCredentialStatus.REVOKED)
+            .exists()
+        )
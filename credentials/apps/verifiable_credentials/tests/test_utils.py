@@ -2,7 +2,9 @@ import base64
 
 import pytest
 from django.contrib.contenttypes.models import ContentType
+from django.db import connection
 from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
 
 from credentials.apps.catalog.tests.factories import (
     CourseFactory,
@@ -21,6 +23,7 @@ from credentials.apps.verifiable_credentials.utils import (
     capitalize_first,
     generate_base64_qr_code,
     get_user_credentials_data,
+    get_user_credentials_data_by_type,
 )
 
 
@@ -164,6 +167,41 @@ class GetProgramCertificatesTests(SiteMixin, TestCase):
         result = get_user_credentials_data(self.user.username, "non_existing_content_type")
         assert result == []
 
+    def test_get_user_credentials_data_by_type(self):
+        result = get_user_credentials_data_by_type(
+            self.user.username, ["programcertificate", "coursecertificate", "non_existing_content_type"]
+        )
+        assert result == {
+            "programcertificate": get_user_credentials_data(self.user.username, "programcertificate"),
+            "coursecertificate": get_user_credentials_data(self.user.username, "coursecertificate"),
+        }
+        assert result["programcertificate"][0]["credential_org"] == "TestOrg1, TestOrg2"
+
+    def test_get_user_credentials_data_by_type_queries(self):
+        """Verify the number of queries doesn't depend on the number of credentials."""
+        models = ["programcertificate", "coursecertificate"]
+        with CaptureQueriesContext(connection) as queries:
+            get_user_credentials_data_by_type(self.user.username, models)
+
+        for __ in range(3):
+            program = ProgramFactory(course_runs=self.course_runs, authoring_organizations=self.orgs, site=self.site)
+            UserCredentialFactory(
+                username=self.user.username,
+                credential_content_type=self.program_credential_content_type,
+                credential=ProgramCertificateFactory(program=program, program_uuid=program.uuid, site=self.site),
+            )
+            course_run = CourseRunFactory(course=self.course)
+            UserCredentialFactory(
+                username=self.user.username,
+                credential_content_type=self.course_credential_content_type,
+                credential=CourseCertificateFactory(course_id=course_run.key, course_run=course_run, site=self.site),
+            )
+
+        with self.assertNumQueries(len(queries)):
+            result = get_user_credentials_data_by_type(self.user.username, models)
+        assert len(result["programcertificate"]) == 4
+        assert len(result["coursecertificate"]) == 5
+
 
 class TestGenerateBase64QRCode(TestCase):
     def test_correct_output_format(self):
@@ -4,10 +4,12 @@ from uuid import UUID
 
 import qrcode
 from django.contrib.contenttypes.models import ContentType
+from django.contrib.contenttypes.prefetch import GenericPrefetch
 
 from credentials.apps.catalog.models import CourseRun
 from credentials.apps.credentials.api import get_user_credentials_by_content_type
 from credentials.apps.credentials.data import UserCredentialStatus
+from credentials.apps.credentials.models import CourseCertificate, ProgramCertificate
 
 
 def get_user_credentials_data(username, model):
@@ -22,31 +24,69 @@ def get_user_credentials_data(username, model):
         list(dict): A list of dictionaries, each dictionary containing information for a credential that the
         user awarded
     """
-    try:
-        credential_cert_content_type = ContentType.objects.get(app_label="credentials", model=model)
-    except ContentType.DoesNotExist:
-        return []
+    return get_user_credentials_data_by_type(username, [model]).get(model, [])
+
+
+def get_user_credentials_data_by_type(username, models):
+    """
+    Batch version of `get_user_credentials_data`: collects context data for several credential types at once.
+
+    The number of queries doesn't depend on the number of user credentials: certificates (with programs and their
+    authoring organizations) are prefetched, course runs are looked up with a single query.
+
+    Arguments:
+        username(str): Username for whom we are getting UserCredential objects for
+        models(list): The models for content types (programcertificate | coursecertificate)
+
+    Returns:
+        dict: lists of credentials data (see `get_user_credentials_data`) keyed by the given (existing) models
+    """
+    content_types = ContentType.objects.filter(app_label="credentials", model__in=models)
+    data = {content_type.model: [] for content_type in content_types}
+    if not data:
+        return data
 
     credentials = get_user_credentials_by_content_type(
-        username, [credential_cert_content_type], UserCredentialStatus.AWARDED.value
+        username, list(content_types), UserCredentialStatus.AWARDED.value
     )
+    credentials = list(
+        credentials.select_related("credential_content_type").prefetch_related(
+            GenericPrefetch(
+                "credential",
+                [
+                    ProgramCertificate.objects.select_related("program").prefetch_related(
+                        "program__authoring_organizations"
+                    ),
+                    CourseCertificate.objects.select_related("course_run"),
+                ],
+            )
+        )
+    )
+
+    course_ids = {
+        credential.credential.course_id
+        for credential in credentials
+        if credential.credential_content_type.model == "coursecertificate"
+    }
+    course_runs = {}
+    for course_run in CourseRun.objects.filter(key__in=course_ids).select_related("course").order_by("pk"):
+        course_runs.setdefault(course_run.key, course_run)
 
-    data = []
     for credential in credentials:
+        model = credential.credential_content_type.model
         if model == "programcertificate":
             credential_uuid = credential.credential.program_uuid.hex
             credential_title = credential.credential.program.title
             credential_org = ", ".join(
-                credential.credential.program.authoring_organizations.values_list("name", flat=True)
+                organization.name for organization in credential.credential.program.authoring_organizations.all()
             )
         elif model == "coursecertificate":
-            course_run = CourseRun.objects.filter(key=credential.credential.course_id).first()
-            course = getattr(course_run, "course", None)
+            course = getattr(course_runs.get(credential.credential.course_id), "course", None)
             credential_uuid = credential.credential.course_id
             credential_title = credential.credential.title or getattr(course, "title", "")
             credential_org = credential.credential.course_key.org
 
-        data.append(
+        data[model].append(
             {
                 "uuid": credential.uuid.hex,
                 "status": credential.status,
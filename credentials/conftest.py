@@ -0,0 +1,18 @@
+"""
+Pytest: base testing config/fixtures shared by all the apps.
+"""
+
+import pytest
+from edx_django_utils.cache import TieredCache
+
+
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # the cached data (e.g. users, see `get_or_create_user_from_event_data`, or the issuers registry) would outlive the
+    # per-test database rollbacks
+    from credentials.apps.verifiable_credentials.issuance.registry import (  # pylint: disable=import-outside-toplevel
+        issuer_registry,
+    )
+
+    TieredCache.dangerous_clear_all_tiers()
+    issuer_registry.invalidate()
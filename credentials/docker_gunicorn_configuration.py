@@ -51,6 +51,15 @@ def post_fork(server, worker):  # pylint: disable=unused-argument
     close_all_caches()
 
 
+def worker_exit(server, worker):  # pylint: disable=unused-argument
+    """
+    Flush the queued Segment events before the worker exits.
+    """
+    from credentials.apps.core.analytics import shutdown_segment_clients  # pylint: disable=import-outside-toplevel
+
+    shutdown_segment_clients()
+
+
 def when_ready(server):  # pylint: disable=unused-argument
     """
     When in debug mode, run Django's `check` to better match what `manage.py runserver` does.
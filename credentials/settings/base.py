@@ -4,11 +4,11 @@ from os.path import abspath, dirname, join
 
 from corsheaders.defaults import default_headers as corsheaders_default_headers
 from django.conf.global_settings import LANGUAGES_BIDI
+from edx_django_utils.plugins import add_plugins, get_plugin_apps
 from edx_toggles.toggles import WaffleSwitch
-from edx_django_utils.plugins import get_plugin_apps, add_plugins
 
-from credentials.settings.utils import get_logger_config
 from credentials.apps.plugins.constants import PROJECT_TYPE, SettingsType
+from credentials.settings.utils import get_logger_config
 
 # PATH vars
 
@@ -90,6 +90,8 @@ MIDDLEWARE = (
     "edx_django_utils.monitoring.CachedCustomMonitoringMiddleware",
     "edx_django_utils.monitoring.MonitoringMemoryMiddleware",
     "edx_django_utils.monitoring.FrontendMonitoringMiddleware",
+    "credentials.apps.core.query_budget.QueryBudgetMiddleware",
+    "credentials.apps.core.db_routing.ReadReplicaMiddleware",
     "edx_rest_framework_extensions.auth.jwt.middleware.JwtAuthCookieMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.locale.LocaleMiddleware",
@@ -134,6 +136,14 @@ DATABASES = {
     }
 }
 
+# READ REPLICA CONFIGURATION
+# Alias (in DATABASES) of the replica the read-only views, event handlers and management command scans read from, see
+# `credentials.apps.core.db_routing`. The routing is disabled when it isn't set.
+READ_REPLICA_DATABASE = None
+# Specified in seconds: the requests of a client which wrote read from the primary database for this long.
+READ_REPLICA_PIN_SECONDS = 30
+DATABASE_ROUTERS = ["credentials.apps.core.db_routing.ReadReplicaRouter"]
+
 # Internationalization
 # https://docs.djangoproject.com/en/dev/topics/i18n/
 
@@ -373,6 +383,23 @@ PROGRAMS_CACHE_TTL = 60 * 60
 # Specified in seconds. Enable caching by setting this to a value greater than 0.
 USER_CACHE_TTL = 30 * 60
 
+# SEGMENT ANALYTICS CLIENTS CONFIGURATION
+# Clients are shared per site, events are uploaded in batches from a bounded queue.
+SEGMENT_CLIENT_CONFIG = {
+    "MAX_QUEUE_SIZE": 10000,
+    "UPLOAD_SIZE": 100,
+    "UPLOAD_INTERVAL": 0.5,
+    "SEND": True,
+}
+
+# EVENT BUS USER IDENTITY CONFIGURATION
+# Specified in seconds. Enable caching by setting this to a value greater than 0.
+USER_IDENTITY_CACHE_TTL = 30 * 60
+
+# PUBLIC PROGRAM RECORDS CACHE CONFIGURATION
+# Specified in seconds. Enable caching of the shared program records by setting this to a value greater than 0.
+PUBLIC_PROGRAM_RECORD_CACHE_TTL = 60 * 60
+
 # Credentials service user in Programs service and LMS
 CREDENTIALS_SERVICE_USER = "credentials_service_user"
 
@@ -398,6 +425,16 @@ ACE_ENABLED_CHANNELS = ["django_email"]
 ACE_CHANNEL_DEFAULT_EMAIL = "django_email"
 ACE_CHANNEL_TRANSACTIONAL_EMAIL = "django_email"
 ACE_CHANNEL_SAILTHRU_TEMPLATE_NAME = ""  # unused, but required to be set or we see an exception
+# Queued messages are delivered in batches by the `send_queued_messages` management command.
+# RATE_LIMIT is specified in messages per second, 0 disables throttling. The messages claimed by an interrupted delivery
+# are delivered again after CLAIM_TIMEOUT seconds, the sent and failed messages are purged after RETENTION_DAYS days.
+ACE_MESSAGE_QUEUE = {
+    "ENABLED": False,
+    "MAX_WORKERS": 4,
+    "RATE_LIMIT": 10,
+    "CLAIM_TIMEOUT": 60 * 60,
+    "RETENTION_DAYS": 7,
+}
 
 # Set up logging for development use (logging to stdout)
 LOGGING_FORMAT_STRING = os.environ.get("LOGGING_FORMAT_STRING", "")
@@ -449,6 +486,14 @@ if os.environ.get("ENABLE_DJANGO_TOOLBAR", False):
 # END DJANGO DEBUG TOOLBAR CONFIGURATION
 
 USERNAME_REPLACEMENT_WORKER = "replace with valid username"
+# Usernames are replaced CHUNK_SIZE mappings at a time. Requests with more than ASYNC_THRESHOLD mappings are processed
+# in background by the `process_username_replacement_jobs` management command, which deletes the jobs processed more
+# than RETENTION_DAYS ago.
+USERNAME_REPLACEMENT = {
+    "CHUNK_SIZE": 500,
+    "ASYNC_THRESHOLD": 1000,
+    "RETENTION_DAYS": 7,
+}
 LEARNER_STATUS_WORKER = "replace with valid username"
 
 CSRF_COOKIE_SECURE = False
@@ -497,6 +542,30 @@ SOCIAL_AUTH_REDIRECT_IS_HTTPS = False
 # .. toggle_warning: This is a toggle for the feature
 # .. toggle_tickets: MICROBA-521
 SEND_EMAIL_ON_PROGRAM_COMPLETION = False
+
+# .. toggle_name: DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: If enabled, the side effects of a program certificate issuance (pathway emails, program
+#    completion email, event bus and Segment events) are recorded with the issued credential and dispatched in
+#    background by the `process_credential_side_effects` management command, instead of during the request.
+# .. toggle_use_cases: opt_in
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: NA
+# .. toggle_warning: The `process_credential_side_effects` management command must be run periodically.
+DEFER_PROGRAM_CERTIFICATE_SIDE_EFFECTS = False
+
+# .. toggle_name: STAGE_TIMING_ENABLED
+# .. toggle_implementation: SettingToggle
+# .. toggle_default: False
+# .. toggle_description: If enabled, the credential issuance and event handling operations log and report (as custom
+#    attributes) the durations of their stages, see `credentials.apps.core.timing` and the `report_stage_timings`
+#    management command.
+# .. toggle_use_cases: opt_in
+# .. toggle_creation_date: 2026-10-19
+# .. toggle_target_removal_date: NA
+# .. toggle_warning: Adds a log line per operation.
+STAGE_TIMING_ENABLED = False
 ALLOWED_EMAIL_HTML_TAGS = {
     "a",
     "b",
@@ -576,6 +645,21 @@ BADGES_CONFIG = {
             "course.end",
         ],
     },
+    # repeated events skipping (time-to-live values in seconds, 0 disables coalescing):
+    "deduplication": {
+        "DUPLICATE_TTL": 60 * 60,
+        "COALESCE_TTL": 60,
+    },
+    # badge templates synchronization (number of concurrent provider requests):
+    "sync": {
+        "MAX_WORKERS": 4,
+    },
+    # badge providers API clients (shared HTTP connections pools and retries):
+    "clients": {
+        "POOL_SIZE": 10,
+        "RETRIES": 3,
+        "BACKOFF_FACTOR": 0.5,
+    },
 }
 
 # Event Bus Settings
@@ -2,9 +2,10 @@ import os
 from pathlib import Path as path
 
 from edx_django_utils.plugins import add_plugins
+
+from credentials.apps.plugins.constants import PROJECT_TYPE, SettingsType
 from credentials.settings.base import *
 from credentials.settings.utils import get_logger_config
-from credentials.apps.plugins.constants import PROJECT_TYPE, SettingsType
 
 INSTALLED_APPS += [
     "credentials.apps.edx_credentials_extensions",
@@ -24,6 +25,19 @@ DATABASES = {
         "PORT": os.environ.get("DB_PORT", ""),
         "CONN_MAX_AGE": int(os.environ.get("CONN_MAX_AGE", 0)),
     },
+    # a separate database rather than a test mirror of the default one, so that the tests can tell which one the
+    # reads are routed to (the routing is enabled by the tests overriding READ_REPLICA_DATABASE). Its tables are
+    # created from the models, as some data migrations don't run on another database than the default one.
+    "replica": {
+        "ENGINE": os.environ.get("DB_ENGINE", "django.db.backends.sqlite3"),
+        "NAME": os.environ.get("REPLICA_DB_NAME", ":memory:"),
+        "USER": os.environ.get("DB_USER", ""),
+        "PASSWORD": os.environ.get("DB_PASSWORD", ""),
+        "HOST": os.environ.get("DB_HOST", ""),
+        "PORT": os.environ.get("DB_PORT", ""),
+        "CONN_MAX_AGE": int(os.environ.get("CONN_MAX_AGE", 0)),
+        "TEST": {"MIGRATE": False},
+    },
 }
 
 CACHES = {
@@ -79,9 +93,12 @@ VERIFIABLE_CREDENTIALS = {
         "ID": "test-issuer-did",
         "KEY": "test-issuer-key",
         "NAME": "test-issuer-name",
-    }
+    },
 }
 
+# Segment events are never uploaded from tests
+SEGMENT_CLIENT_CONFIG = {**SEGMENT_CLIENT_CONFIG, "SEND": False}
+
 LEARNER_RECORD_MFE_RECORDS_PAGE_URL = "http://learner-record-mfe"
 add_plugins(__name__, PROJECT_TYPE, SettingsType.TEST)
 